@@ -20,6 +20,7 @@ if str(BASE_DIR) not in sys.path:
 # ------------------------------------------------------------------
 from sqlmodel import SQLModel                     # <-- Core
 from app.models.user import User                  # <-- Your table
+from app.models import Base                       # <-- SQLAlchemy tables (registers all)
 # from app.models.role import Role
 # from app.models.product import Product
 # ... import ALL SQLModel tables here ...
@@ -42,12 +43,12 @@ if config.config_file_name is not None:
 # ------------------------------------------------------------------
 # 5. Override sqlalchemy.url with SYNC URL (psycopg)
 # ------------------------------------------------------------------
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", settings.DATABASE_URL_SYNC)
 
 # ------------------------------------------------------------------
 # 6. target_metadata – all tables
 # ------------------------------------------------------------------
-target_metadata = SQLModel.metadata
+target_metadata = [SQLModel.metadata, Base.metadata]
 
 # ------------------------------------------------------------------
 # 7. Offline mode
@@ -0,0 +1,45 @@
+"""create purchase_requisitions
+
+Revision ID: 3c9e1b7d2a40
+Revises: f4a2baaced8b
+Create Date: 2026-10-17 10:12:04.118532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1b7d2a40'
+down_revision: Union[str, None] = 'f4a2baaced8b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'purchase_requisitions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('pr_number', sa.String(), nullable=True),
+        sa.Column('user', sa.String(), nullable=True),
+        sa.Column('dept', sa.String(), nullable=True),
+        sa.Column('amount', sa.Float(), nullable=True),
+        sa.Column('items', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Enum('pending', 'approved', 'rejected', name='prstatus'), nullable=True),
+        sa.Column('created_at', sa.Date(), server_default=sa.text('CURRENT_DATE'), nullable=True),
+        sa.Column('is_deleted', sa.Boolean(), server_default=sa.false(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_purchase_requisitions_id'), 'purchase_requisitions', ['id'], unique=False)
+    op.create_index(op.f('ix_purchase_requisitions_pr_number'), 'purchase_requisitions', ['pr_number'], unique=True)
+    op.create_index(op.f('ix_purchase_requisitions_user'), 'purchase_requisitions', ['user'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_purchase_requisitions_user'), table_name='purchase_requisitions')
+    op.drop_index(op.f('ix_purchase_requisitions_pr_number'), table_name='purchase_requisitions')
+    op.drop_index(op.f('ix_purchase_requisitions_id'), table_name='purchase_requisitions')
+    op.drop_table('purchase_requisitions')
+    sa.Enum(name='prstatus').drop(op.get_bind(), checkfirst=True)
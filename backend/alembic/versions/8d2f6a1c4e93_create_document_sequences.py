@@ -0,0 +1,33 @@
+"""create document_sequences
+
+Revision ID: 8d2f6a1c4e93
+Revises: 3c9e1b7d2a40
+Create Date: 2026-10-17 11:02:47.530214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6a1c4e93'
+down_revision: Union[str, None] = '3c9e1b7d2a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'document_sequences',
+        sa.Column('doc_type', sa.String(length=16), nullable=False),
+        sa.Column('branch', sa.String(length=16), nullable=False),
+        sa.Column('year', sa.Integer(), nullable=False),
+        sa.Column('next_value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('doc_type', 'branch', 'year'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('document_sequences')
@@ -0,0 +1,33 @@
+"""add queued tax return status
+
+Revision ID: a4c8e2f6b390
+Revises: f7d3b9e1a485
+Create Date: 2026-10-24 11:02:44.381905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e2f6b390'
+down_revision: Union[str, None] = 'f7d3b9e1a485'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A new enum value cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE taxreturnstatus ADD VALUE IF NOT EXISTS 'queued' BEFORE 'running'")
+    # Returns a restart left behind: nothing writes them any more
+    op.execute(
+        "UPDATE tax_returns SET status = 'failed', error = 'Interrupted by a restart', completed_at = now() "
+        "WHERE status = 'running'"
+    )
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; queued returns just become failed ones
+    op.execute("UPDATE tax_returns SET status = 'failed', error = 'Queued at downgrade' WHERE status = 'queued'")
@@ -0,0 +1,68 @@
+"""create invoice tax lines and tax returns
+
+Revision ID: a7c3e5d9f218
+Revises: f1b8d2c7e350
+Create Date: 2026-10-17 22:04:37.318250
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5d9f218'
+down_revision: Union[str, None] = 'f1b8d2c7e350'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'invoice_tax_lines',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('open_item_id', sa.Integer(), nullable=False),
+        sa.Column('tax_code', sa.String(length=16), nullable=False),
+        sa.Column('rate', sa.Numeric(precision=7, scale=4), nullable=False),
+        sa.Column('place_of_supply', sa.String(length=8), nullable=False),
+        sa.Column('hsn_code', sa.String(length=16), nullable=True),
+        sa.Column('taxable_amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('tax_amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['open_item_id'], ['open_items.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_invoice_tax_lines_item', 'invoice_tax_lines', ['open_item_id', 'id'], unique=False)
+    op.create_index('ix_open_items_issue_date', 'open_items', ['issue_date'], unique=False)
+
+    op.create_table(
+        'tax_returns',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('from_date', sa.Date(), nullable=False),
+        sa.Column('to_date', sa.Date(), nullable=False),
+        sa.Column('format', sa.Enum('json', 'csv', name='returnformat'), nullable=False),
+        sa.Column('status', sa.Enum('running', 'completed', 'failed', name='taxreturnstatus'), nullable=False),
+        sa.Column('file_path', sa.String(), nullable=True),
+        sa.Column('lines', sa.BigInteger(), nullable=False),
+        sa.Column('documents', sa.BigInteger(), nullable=False),
+        sa.Column('output_taxable', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('output_tax', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('input_taxable', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('input_tax', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_tax_returns_id'), 'tax_returns', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tax_returns_id'), table_name='tax_returns')
+    op.drop_table('tax_returns')
+    op.drop_index('ix_open_items_issue_date', table_name='open_items')
+    op.drop_index('ix_invoice_tax_lines_item', table_name='invoice_tax_lines')
+    op.drop_table('invoice_tax_lines')
+    sa.Enum(name='taxreturnstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='returnformat').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,89 @@
+"""create sales orders and credit exposure
+
+Revision ID: a9d2e4b7c163
+Revises: e7a3c9d5f102
+Create Date: 2026-10-18 09:12:47.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d2e4b7c163'
+down_revision: Union[str, None] = 'e7a3c9d5f102'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('customers', sa.Column('credit_limit', sa.Numeric(precision=18, scale=2), nullable=True))
+
+    op.create_table(
+        'sales_orders',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('order_number', sa.String(length=32), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('order_date', sa.Date(), nullable=False),
+        sa.Column('status', sa.Enum(
+            'open', 'credit_hold', 'delivered', 'invoiced', 'cancelled', name='salesorderstatus',
+        ), nullable=False),
+        sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_sales_orders_id'), 'sales_orders', ['id'], unique=False)
+    op.create_index(op.f('ix_sales_orders_order_number'), 'sales_orders', ['order_number'], unique=True)
+    op.create_index(
+        'ix_sales_orders_status_customer', 'sales_orders', ['status', 'customer_id', 'id'], unique=False,
+    )
+
+    op.create_table(
+        'sales_order_lines',
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('line_no', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.Column('unit_price', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['order_id'], ['sales_orders.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id']),
+        sa.PrimaryKeyConstraint('order_id', 'line_no'),
+    )
+
+    op.create_table(
+        'credit_exposures',
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('open_orders', sa.Numeric(precision=18, scale=2), server_default='0', nullable=False),
+        sa.Column('open_receivables', sa.Numeric(precision=18, scale=2), server_default='0', nullable=False),
+        sa.Column('payments', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('avg_payment_days', sa.Float(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('customer_id'),
+    )
+    # One exposure row per existing customer, receivables from the unpaid AR items
+    op.execute("""
+        INSERT INTO credit_exposures (customer_id, open_receivables)
+        SELECT c.id, COALESCE(SUM(o.balance), 0)
+        FROM customers c
+        LEFT JOIN open_items o
+            ON o.party_code = c.code AND o.ledger = 'ar' AND o.status <> 'paid'
+        GROUP BY c.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('credit_exposures')
+    op.drop_table('sales_order_lines')
+    op.drop_index('ix_sales_orders_status_customer', table_name='sales_orders')
+    op.drop_index(op.f('ix_sales_orders_order_number'), table_name='sales_orders')
+    op.drop_index(op.f('ix_sales_orders_id'), table_name='sales_orders')
+    op.drop_table('sales_orders')
+    sa.Enum(name='salesorderstatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_column('customers', 'credit_limit')
@@ -0,0 +1,82 @@
+"""create output conditions and jobs
+
+Revision ID: a9e3c5b7d210
+Revises: f2c7a91d4e58
+Create Date: 2026-10-21 09:12:47.508311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9e3c5b7d210'
+down_revision: Union[str, None] = 'f2c7a91d4e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Shared by both tables – create the types once, not per table
+    postgresql.ENUM('order_confirmation', 'invoice', name='outputtype').create(op.get_bind(), checkfirst=True)
+    postgresql.ENUM('email', 'file', name='outputchannel').create(op.get_bind(), checkfirst=True)
+    output_type = postgresql.ENUM('order_confirmation', 'invoice', name='outputtype', create_type=False)
+    channel = postgresql.ENUM('email', 'file', name='outputchannel', create_type=False)
+
+    op.create_table(
+        'output_conditions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('output_type', output_type, nullable=False),
+        sa.Column('channel', channel, nullable=False),
+        sa.Column('recipient', sa.String(), nullable=True),
+        sa.Column('customer_ids', sa.JSON(), nullable=False),
+        sa.Column('customer_groups', sa.JSON(), nullable=False),
+        sa.Column('regions', sa.JSON(), nullable=False),
+        sa.Column('min_amount', sa.Numeric(precision=18, scale=2), nullable=True),
+        sa.Column('priority', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_output_conditions_id'), 'output_conditions', ['id'], unique=False)
+
+    op.create_table(
+        'output_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('output_type', output_type, nullable=False),
+        sa.Column('channel', channel, nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('recipient', sa.String(), nullable=True),
+        sa.Column('condition_id', sa.Integer(), nullable=True),
+        sa.Column('dedup_key', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.Enum(
+            'queued', 'sending', 'retry', 'sent', 'failed', name='outputjobstatus',
+        ), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('next_attempt_at', sa.DateTime(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('sent_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('dedup_key'),
+    )
+    op.create_index(op.f('ix_output_jobs_id'), 'output_jobs', ['id'], unique=False)
+    op.create_index('ix_output_jobs_status_updated', 'output_jobs', ['status', 'updated_at'], unique=False)
+    op.create_index('ix_output_jobs_document', 'output_jobs', ['output_type', 'document_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_output_jobs_document', table_name='output_jobs')
+    op.drop_index('ix_output_jobs_status_updated', table_name='output_jobs')
+    op.drop_index(op.f('ix_output_jobs_id'), table_name='output_jobs')
+    op.drop_table('output_jobs')
+    op.drop_index(op.f('ix_output_conditions_id'), table_name='output_conditions')
+    op.drop_table('output_conditions')
+    sa.Enum(name='outputjobstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='outputchannel').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='outputtype').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,53 @@
+"""create budgets and budget lines
+
+Revision ID: b2d6f8a1c394
+Revises: a7c3e5d9f218
+Create Date: 2026-10-17 23:12:05.774301
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d6f8a1c394'
+down_revision: Union[str, None] = 'a7c3e5d9f218'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'budgets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('from_period', sa.Integer(), nullable=False),
+        sa.Column('to_period', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('name'),
+    )
+    op.create_index(op.f('ix_budgets_id'), 'budgets', ['id'], unique=False)
+
+    op.create_table(
+        'budget_lines',
+        sa.Column('budget_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('cost_center', sa.String(length=32), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['budget_id'], ['budgets.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('budget_id', 'account_id', 'cost_center', 'period'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('budget_lines')
+    op.drop_index(op.f('ix_budgets_id'), table_name='budgets')
+    op.drop_table('budgets')
@@ -0,0 +1,94 @@
+"""create general ledger tables
+
+Revision ID: b71c4e2f9a05
+Revises: 8d2f6a1c4e93
+Create Date: 2026-10-17 14:20:11.804532
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71c4e2f9a05'
+down_revision: Union[str, None] = '8d2f6a1c4e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'gl_accounts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('type', sa.Enum('asset', 'liability', 'equity', 'income', 'expense', 'bank', 'cash', name='accounttype'), nullable=False),
+        sa.Column('opening', sa.Numeric(precision=18, scale=2), server_default='0', nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_gl_accounts_id'), 'gl_accounts', ['id'], unique=False)
+    op.create_index(op.f('ix_gl_accounts_code'), 'gl_accounts', ['code'], unique=True)
+
+    op.create_table(
+        'journal_entries',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('entry_number', sa.String(), nullable=False),
+        sa.Column('entry_date', sa.Date(), nullable=False),
+        sa.Column('reference', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('status', sa.Enum('draft', 'posted', 'void', name='journalstatus'), nullable=False),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('posted_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_journal_entries_id'), 'journal_entries', ['id'], unique=False)
+    op.create_index(op.f('ix_journal_entries_entry_number'), 'journal_entries', ['entry_number'], unique=True)
+    op.create_index(op.f('ix_journal_entries_entry_date'), 'journal_entries', ['entry_date'], unique=False)
+
+    op.create_table(
+        'journal_lines',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('debit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('credit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('cost_center', sa.String(length=32), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(['entry_id'], ['journal_entries.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_journal_lines_entry_id'), 'journal_lines', ['entry_id'], unique=False)
+    op.create_index('ix_journal_lines_account_entry', 'journal_lines', ['account_id', 'entry_id'], unique=False)
+
+    op.create_table(
+        'gl_period_balances',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False),
+        sa.Column('debit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('credit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('closing_debit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('closing_credit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('account_id', 'period'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('gl_period_balances')
+    op.drop_index('ix_journal_lines_account_entry', table_name='journal_lines')
+    op.drop_index(op.f('ix_journal_lines_entry_id'), table_name='journal_lines')
+    op.drop_table('journal_lines')
+    op.drop_index(op.f('ix_journal_entries_entry_date'), table_name='journal_entries')
+    op.drop_index(op.f('ix_journal_entries_entry_number'), table_name='journal_entries')
+    op.drop_index(op.f('ix_journal_entries_id'), table_name='journal_entries')
+    op.drop_table('journal_entries')
+    op.drop_index(op.f('ix_gl_accounts_code'), table_name='gl_accounts')
+    op.drop_index(op.f('ix_gl_accounts_id'), table_name='gl_accounts')
+    op.drop_table('gl_accounts')
+    sa.Enum(name='journalstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='accounttype').drop(op.get_bind(), checkfirst=True)
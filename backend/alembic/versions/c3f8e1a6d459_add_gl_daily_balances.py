@@ -0,0 +1,42 @@
+"""add gl daily balances
+
+Revision ID: c3f8e1a6d459
+Revises: a9e3c5b7d210
+Create Date: 2026-10-22 08:37:15.226904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8e1a6d459'
+down_revision: Union[str, None] = 'a9e3c5b7d210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'gl_daily_balances',
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('debit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('credit', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('account_id', 'day'),
+    )
+    # Backfill from the posted lines already in the ledger
+    op.execute(
+        "INSERT INTO gl_daily_balances (account_id, day, debit, credit) "
+        "SELECT l.account_id, e.entry_date, SUM(l.debit), SUM(l.credit) "
+        "FROM journal_lines l JOIN journal_entries e ON e.id = l.entry_id "
+        "WHERE e.status = 'posted' "
+        "GROUP BY l.account_id, e.entry_date"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('gl_daily_balances')
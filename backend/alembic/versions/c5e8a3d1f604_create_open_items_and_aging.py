@@ -0,0 +1,81 @@
+"""create open items and aging snapshots
+
+Revision ID: c5e8a3d1f604
+Revises: b71c4e2f9a05
+Create Date: 2026-10-17 16:05:38.117420
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e8a3d1f604'
+down_revision: Union[str, None] = 'b71c4e2f9a05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Shared by three tables – create the type once, not per table
+    postgresql.ENUM('ar', 'ap', name='subledger').create(op.get_bind(), checkfirst=True)
+    subledger = postgresql.ENUM('ar', 'ap', name='subledger', create_type=False)
+
+    op.create_table(
+        'open_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ledger', subledger, nullable=False),
+        sa.Column('party_code', sa.String(length=32), nullable=False),
+        sa.Column('party_name', sa.String(), nullable=True),
+        sa.Column('document_number', sa.String(), nullable=False),
+        sa.Column('issue_date', sa.Date(), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('balance', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('status', sa.Enum('open', 'partial', 'paid', name='openitemstatus'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_open_items_id'), 'open_items', ['id'], unique=False)
+    op.create_index('ix_open_items_ledger_document', 'open_items', ['ledger', 'document_number'], unique=True)
+    op.create_index('ix_open_items_ledger_party', 'open_items', ['ledger', 'party_code'], unique=False)
+    op.create_index('ix_open_items_ledger_updated', 'open_items', ['ledger', 'updated_at'], unique=False)
+
+    op.create_table(
+        'aging_snapshots',
+        sa.Column('ledger', subledger, nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('party_code', sa.String(length=32), nullable=False),
+        sa.Column('items', sa.Integer(), nullable=False),
+        sa.Column('current', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('days_1_30', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('days_31_60', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('days_61_90', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('days_90_plus', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.PrimaryKeyConstraint('ledger', 'as_of', 'party_code'),
+    )
+
+    op.create_table(
+        'aging_snapshot_runs',
+        sa.Column('ledger', subledger, nullable=False),
+        sa.Column('as_of', sa.Date(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.Column('full_run_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('ledger', 'as_of'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('aging_snapshot_runs')
+    op.drop_table('aging_snapshots')
+    op.drop_index('ix_open_items_ledger_updated', table_name='open_items')
+    op.drop_index('ix_open_items_ledger_party', table_name='open_items')
+    op.drop_index('ix_open_items_ledger_document', table_name='open_items')
+    op.drop_index(op.f('ix_open_items_id'), table_name='open_items')
+    op.drop_table('open_items')
+    sa.Enum(name='openitemstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='subledger').drop(op.get_bind(), checkfirst=True)
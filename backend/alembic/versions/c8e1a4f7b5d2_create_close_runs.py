@@ -0,0 +1,58 @@
+"""create close runs and close run steps
+
+Revision ID: c8e1a4f7b5d2
+Revises: b2d6f8a1c394
+Create Date: 2026-10-18 09:26:41.502817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e1a4f7b5d2'
+down_revision: Union[str, None] = 'b2d6f8a1c394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'close_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False),
+        sa.Column('status', sa.Enum('queued', 'running', 'completed', 'failed', name='closestatus'), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('period'),
+    )
+    op.create_index(op.f('ix_close_runs_id'), 'close_runs', ['id'], unique=False)
+
+    op.create_table(
+        'close_run_steps',
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('step', sa.String(length=32), nullable=False),
+        sa.Column('status', sa.Enum('pending', 'running', 'completed', 'failed', name='closestepstatus'), nullable=False),
+        sa.Column('result', sa.Text(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('seconds', sa.Float(), nullable=True),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['close_runs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('run_id', 'step'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('close_run_steps')
+    op.drop_index(op.f('ix_close_runs_id'), table_name='close_runs')
+    op.drop_table('close_runs')
+    sa.Enum(name='closestepstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='closestatus').drop(op.get_bind(), checkfirst=True)
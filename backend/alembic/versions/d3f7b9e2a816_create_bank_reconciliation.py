@@ -0,0 +1,96 @@
+"""create bank statements and reconciliation matches
+
+Revision ID: d3f7b9e2a816
+Revises: c5e8a3d1f604
+Create Date: 2026-10-17 17:42:09.531176
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3f7b9e2a816'
+down_revision: Union[str, None] = 'c5e8a3d1f604'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'bank_statements',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('format', sa.Enum('csv', 'mt940', 'camt', name='statementformat'), nullable=False),
+        sa.Column('filename', sa.String(), nullable=True),
+        sa.Column('line_count', sa.Integer(), nullable=False),
+        sa.Column('imported_by', sa.String(), nullable=True),
+        sa.Column('imported_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_bank_statements_id'), 'bank_statements', ['id'], unique=False)
+    op.create_index(op.f('ix_bank_statements_account_id'), 'bank_statements', ['account_id'], unique=False)
+
+    op.create_table(
+        'bank_matches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('rule', sa.String(length=32), nullable=False),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_bank_matches_id'), 'bank_matches', ['id'], unique=False)
+    op.create_index(op.f('ix_bank_matches_account_id'), 'bank_matches', ['account_id'], unique=False)
+
+    op.create_table(
+        'bank_statement_lines',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('statement_id', sa.Integer(), nullable=False),
+        sa.Column('account_id', sa.Integer(), nullable=False),
+        sa.Column('booking_date', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('reference', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('match_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['statement_id'], ['bank_statements.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['account_id'], ['gl_accounts.id']),
+        sa.ForeignKeyConstraint(['match_id'], ['bank_matches.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_bank_statement_lines_statement_id'), 'bank_statement_lines', ['statement_id'], unique=False)
+    op.create_index(op.f('ix_bank_statement_lines_match_id'), 'bank_statement_lines', ['match_id'], unique=False)
+    op.create_index(
+        'ix_bank_statement_lines_account_match_date', 'bank_statement_lines',
+        ['account_id', 'match_id', 'booking_date'], unique=False,
+    )
+
+    op.create_table(
+        'bank_match_journal_lines',
+        sa.Column('journal_line_id', sa.BigInteger(), nullable=False),
+        sa.Column('match_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['journal_line_id'], ['journal_lines.id']),
+        sa.ForeignKeyConstraint(['match_id'], ['bank_matches.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('journal_line_id'),
+    )
+    op.create_index(op.f('ix_bank_match_journal_lines_match_id'), 'bank_match_journal_lines', ['match_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_bank_match_journal_lines_match_id'), table_name='bank_match_journal_lines')
+    op.drop_table('bank_match_journal_lines')
+    op.drop_index('ix_bank_statement_lines_account_match_date', table_name='bank_statement_lines')
+    op.drop_index(op.f('ix_bank_statement_lines_match_id'), table_name='bank_statement_lines')
+    op.drop_index(op.f('ix_bank_statement_lines_statement_id'), table_name='bank_statement_lines')
+    op.drop_table('bank_statement_lines')
+    op.drop_index(op.f('ix_bank_matches_account_id'), table_name='bank_matches')
+    op.drop_index(op.f('ix_bank_matches_id'), table_name='bank_matches')
+    op.drop_table('bank_matches')
+    op.drop_index(op.f('ix_bank_statements_account_id'), table_name='bank_statements')
+    op.drop_index(op.f('ix_bank_statements_id'), table_name='bank_statements')
+    op.drop_table('bank_statements')
+    sa.Enum(name='statementformat').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,124 @@
+"""create customers, products and pricing conditions
+
+Revision ID: d4f9b2c6e817
+Revises: c8e1a4f7b5d2
+Create Date: 2026-10-18 01:27:43.518920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f9b2c6e817'
+down_revision: Union[str, None] = 'c8e1a4f7b5d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'customers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('customer_group', sa.String(length=32), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_customers_id'), 'customers', ['id'], unique=False)
+    op.create_index(op.f('ix_customers_code'), 'customers', ['code'], unique=True)
+
+    op.create_table(
+        'products',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sku', sa.String(length=64), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('list_price', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_products_id'), 'products', ['id'], unique=False)
+    op.create_index(op.f('ix_products_sku'), 'products', ['sku'], unique=True)
+
+    op.create_table(
+        'pricing_rules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('rule_type', sa.Enum(
+            'fixed_price', 'percentage_discount', 'fixed_discount', 'tiered_pricing', 'bundle_pricing',
+            name='pricingruletype',
+        ), nullable=False),
+        sa.Column('value', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.Column('tiers', sa.JSON(), nullable=False),
+        sa.Column('customer_groups', sa.JSON(), nullable=False),
+        sa.Column('product_ids', sa.JSON(), nullable=False),
+        sa.Column('min_quantity', sa.Numeric(precision=18, scale=4), nullable=True),
+        sa.Column('max_quantity', sa.Numeric(precision=18, scale=4), nullable=True),
+        sa.Column('valid_from', sa.Date(), nullable=False),
+        sa.Column('valid_to', sa.Date(), nullable=False),
+        sa.Column('priority', sa.Integer(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_pricing_rules_id'), 'pricing_rules', ['id'], unique=False)
+    op.create_index(op.f('ix_pricing_rules_code'), 'pricing_rules', ['code'], unique=True)
+
+    op.create_table(
+        'discount_schemes',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('discount_type', sa.Enum(
+            'percentage', 'fixed_amount', 'buy_x_get_y', 'volume_discount', name='discounttype',
+        ), nullable=False),
+        sa.Column('value', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.Column('buy_quantity', sa.Integer(), nullable=True),
+        sa.Column('get_quantity', sa.Integer(), nullable=True),
+        sa.Column('tiers', sa.JSON(), nullable=False),
+        sa.Column('customer_groups', sa.JSON(), nullable=False),
+        sa.Column('product_ids', sa.JSON(), nullable=False),
+        sa.Column('min_quantity', sa.Numeric(precision=18, scale=4), nullable=True),
+        sa.Column('min_order_value', sa.Numeric(precision=18, scale=2), nullable=True),
+        sa.Column('valid_from', sa.Date(), nullable=False),
+        sa.Column('valid_to', sa.Date(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_discount_schemes_id'), 'discount_schemes', ['id'], unique=False)
+    op.create_index(op.f('ix_discount_schemes_code'), 'discount_schemes', ['code'], unique=True)
+
+    op.create_table(
+        'pricing_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('pricing_versions')
+    op.drop_index(op.f('ix_discount_schemes_code'), table_name='discount_schemes')
+    op.drop_index(op.f('ix_discount_schemes_id'), table_name='discount_schemes')
+    op.drop_table('discount_schemes')
+    op.drop_index(op.f('ix_pricing_rules_code'), table_name='pricing_rules')
+    op.drop_index(op.f('ix_pricing_rules_id'), table_name='pricing_rules')
+    op.drop_table('pricing_rules')
+    op.drop_index(op.f('ix_products_sku'), table_name='products')
+    op.drop_index(op.f('ix_products_id'), table_name='products')
+    op.drop_table('products')
+    op.drop_index(op.f('ix_customers_code'), table_name='customers')
+    op.drop_index(op.f('ix_customers_id'), table_name='customers')
+    op.drop_table('customers')
+    sa.Enum(name='discounttype').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='pricingruletype').drop(op.get_bind(), checkfirst=True)
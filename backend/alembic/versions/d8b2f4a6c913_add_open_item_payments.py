@@ -0,0 +1,47 @@
+"""add open item payments
+
+Revision ID: d8b2f4a6c913
+Revises: c3f8e1a6d459
+Create Date: 2026-10-23 09:12:41.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b2f4a6c913'
+down_revision: Union[str, None] = 'c3f8e1a6d459'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'open_item_payments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('open_item_id', sa.Integer(), nullable=False),
+        sa.Column('paid_on', sa.Date(), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['open_item_id'], ['open_items.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_open_item_payments_id'), 'open_item_payments', ['id'], unique=False)
+    op.create_index(
+        'ix_open_item_payments_item_paid_on', 'open_item_payments', ['open_item_id', 'paid_on'], unique=False
+    )
+    # Payments so far only exist as the balance they left behind: record
+    # them as one payment on the day the item last changed
+    op.execute(
+        "INSERT INTO open_item_payments (open_item_id, paid_on, amount) "
+        "SELECT id, CAST(updated_at AS DATE), amount - balance "
+        "FROM open_items WHERE amount > balance"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_open_item_payments_item_paid_on', table_name='open_item_payments')
+    op.drop_index(op.f('ix_open_item_payments_id'), table_name='open_item_payments')
+    op.drop_table('open_item_payments')
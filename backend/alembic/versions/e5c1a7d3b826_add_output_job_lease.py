@@ -0,0 +1,28 @@
+"""add output job lease
+
+Revision ID: e5c1a7d3b826
+Revises: d8b2f4a6c913
+Create Date: 2026-10-23 14:05:19.331742
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c1a7d3b826'
+down_revision: Union[str, None] = 'd8b2f4a6c913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('output_jobs', sa.Column('claimed_until', sa.DateTime(), nullable=True))
+    # Claims taken before leases existed expire at once and are swept
+    op.execute("UPDATE output_jobs SET claimed_until = updated_at WHERE status = 'sending'")
+
+
+def downgrade() -> None:
+    op.drop_column('output_jobs', 'claimed_until')
@@ -0,0 +1,49 @@
+"""create stock movements
+
+Revision ID: e7a3c9d5f102
+Revises: d4f9b2c6e817
+Create Date: 2026-10-18 02:41:19.206357
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3c9d5f102'
+down_revision: Union[str, None] = 'd4f9b2c6e817'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'stock_movements',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('movement_type', sa.Enum(
+            'receipt', 'issue', 'reservation', 'planned_receipt', name='movementtype',
+        ), nullable=False),
+        sa.Column('source', sa.Enum(
+            'purchase_order', 'work_order', 'sales_order', 'adjustment', name='movementsource',
+        ), nullable=True),
+        sa.Column('reference', sa.String(length=64), nullable=True),
+        sa.Column('quantity', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_stock_movements_id'), 'stock_movements', ['id'], unique=False)
+    op.create_index('ix_stock_movements_product', 'stock_movements', ['product_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stock_movements_product', table_name='stock_movements')
+    op.drop_index(op.f('ix_stock_movements_id'), table_name='stock_movements')
+    op.drop_table('stock_movements')
+    sa.Enum(name='movementsource').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='movementtype').drop(op.get_bind(), checkfirst=True)
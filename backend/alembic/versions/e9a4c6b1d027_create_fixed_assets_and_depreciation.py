@@ -0,0 +1,101 @@
+"""create fixed asset register and depreciation runs
+
+Revision ID: e9a4c6b1d027
+Revises: d3f7b9e2a816
+Create Date: 2026-10-17 19:08:44.270315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a4c6b1d027'
+down_revision: Union[str, None] = 'd3f7b9e2a816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'fixed_assets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('asset_code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('category', sa.String(), nullable=True),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('cost_center', sa.String(length=32), nullable=True),
+        sa.Column('cost', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('salvage_value', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('in_service_date', sa.Date(), nullable=False),
+        sa.Column(
+            'method',
+            sa.Enum('straight_line', 'declining_balance', 'units_of_production', name='depreciationmethod'),
+            nullable=False,
+        ),
+        sa.Column('useful_life_months', sa.Integer(), nullable=False),
+        sa.Column('declining_rate', sa.Numeric(precision=6, scale=4), nullable=True),
+        sa.Column('total_units', sa.Numeric(precision=18, scale=2), nullable=True),
+        sa.Column('expense_account_id', sa.Integer(), nullable=False),
+        sa.Column('accumulated_account_id', sa.Integer(), nullable=False),
+        sa.Column('accumulated_depreciation', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('last_period', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Enum('active', 'fully_depreciated', 'disposed', name='assetstatus'), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['expense_account_id'], ['gl_accounts.id']),
+        sa.ForeignKeyConstraint(['accumulated_account_id'], ['gl_accounts.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_fixed_assets_id'), 'fixed_assets', ['id'], unique=False)
+    op.create_index(op.f('ix_fixed_assets_asset_code'), 'fixed_assets', ['asset_code'], unique=True)
+    op.create_index(op.f('ix_fixed_assets_status'), 'fixed_assets', ['status'], unique=False)
+
+    op.create_table(
+        'asset_usage',
+        sa.Column('asset_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False),
+        sa.Column('units', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['asset_id'], ['fixed_assets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('asset_id', 'period'),
+    )
+
+    op.create_table(
+        'depreciation_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.Integer(), nullable=False),
+        sa.Column('entry_id', sa.Integer(), nullable=True),
+        sa.Column('asset_count', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('compute_seconds', sa.Float(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['entry_id'], ['journal_entries.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('period', name='uq_depreciation_runs_period'),
+    )
+    op.create_index(op.f('ix_depreciation_runs_id'), 'depreciation_runs', ['id'], unique=False)
+
+    op.create_table(
+        'depreciation_run_lines',
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('asset_id', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['run_id'], ['depreciation_runs.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['asset_id'], ['fixed_assets.id']),
+        sa.PrimaryKeyConstraint('run_id', 'asset_id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('depreciation_run_lines')
+    op.drop_index(op.f('ix_depreciation_runs_id'), table_name='depreciation_runs')
+    op.drop_table('depreciation_runs')
+    op.drop_table('asset_usage')
+    op.drop_index(op.f('ix_fixed_assets_status'), table_name='fixed_assets')
+    op.drop_index(op.f('ix_fixed_assets_asset_code'), table_name='fixed_assets')
+    op.drop_index(op.f('ix_fixed_assets_id'), table_name='fixed_assets')
+    op.drop_table('fixed_assets')
+    sa.Enum(name='assetstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='depreciationmethod').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,59 @@
+"""create cost centres and allocation drivers
+
+Revision ID: f1b8d2c7e350
+Revises: e9a4c6b1d027
+Create Date: 2026-10-17 20:31:12.604918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b8d2c7e350'
+down_revision: Union[str, None] = 'e9a4c6b1d027'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cost_centers',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('code', sa.String(length=32), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('kind', sa.Enum('service', 'production', name='costcenterkind'), nullable=False),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.true(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_cost_centers_id'), 'cost_centers', ['id'], unique=False)
+    op.create_index(op.f('ix_cost_centers_code'), 'cost_centers', ['code'], unique=True)
+
+    op.create_table(
+        'allocation_drivers',
+        sa.Column('sender_id', sa.Integer(), nullable=False),
+        sa.Column('receiver_id', sa.Integer(), nullable=False),
+        sa.Column('quantity', sa.Numeric(precision=18, scale=4), nullable=False),
+        sa.ForeignKeyConstraint(['sender_id'], ['cost_centers.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['receiver_id'], ['cost_centers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('sender_id', 'receiver_id'),
+    )
+
+    op.create_table(
+        'allocation_driver_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('changed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('allocation_driver_versions')
+    op.drop_table('allocation_drivers')
+    op.drop_index(op.f('ix_cost_centers_code'), table_name='cost_centers')
+    op.drop_index(op.f('ix_cost_centers_id'), table_name='cost_centers')
+    op.drop_table('cost_centers')
+    sa.Enum(name='costcenterkind').drop(op.get_bind(), checkfirst=True)
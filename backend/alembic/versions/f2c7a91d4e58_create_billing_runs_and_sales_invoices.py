@@ -0,0 +1,75 @@
+"""create billing runs and sales invoices
+
+Revision ID: f2c7a91d4e58
+Revises: d4b8f1e6a237
+Create Date: 2026-10-20 10:41:09.317624
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a91d4e58'
+down_revision: Union[str, None] = 'd4b8f1e6a237'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'billing_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('billing_date', sa.Date(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=True),
+        sa.Column('output', sa.Enum('zip', 'files', name='billingoutput'), nullable=False),
+        sa.Column('status', sa.Enum(
+            'running', 'rendering', 'completed', 'failed', name='billingrunstatus',
+        ), nullable=False),
+        sa.Column('invoices', sa.Integer(), nullable=False),
+        sa.Column('documents', sa.Integer(), nullable=False),
+        sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('output_path', sa.String(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_by', sa.String(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('invoiced_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_billing_runs_id'), 'billing_runs', ['id'], unique=False)
+
+    op.create_table(
+        'sales_invoices',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('invoice_number', sa.String(length=32), nullable=False),
+        sa.Column('run_id', sa.Integer(), nullable=False),
+        sa.Column('order_id', sa.Integer(), nullable=False),
+        sa.Column('customer_id', sa.Integer(), nullable=False),
+        sa.Column('issue_date', sa.Date(), nullable=False),
+        sa.Column('due_date', sa.Date(), nullable=False),
+        sa.Column('total', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['run_id'], ['billing_runs.id']),
+        sa.ForeignKeyConstraint(['order_id'], ['sales_orders.id']),
+        sa.ForeignKeyConstraint(['customer_id'], ['customers.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('order_id'),
+    )
+    op.create_index(op.f('ix_sales_invoices_id'), 'sales_invoices', ['id'], unique=False)
+    op.create_index(op.f('ix_sales_invoices_invoice_number'), 'sales_invoices', ['invoice_number'], unique=True)
+    op.create_index('ix_sales_invoices_run', 'sales_invoices', ['run_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sales_invoices_run', table_name='sales_invoices')
+    op.drop_index(op.f('ix_sales_invoices_invoice_number'), table_name='sales_invoices')
+    op.drop_index(op.f('ix_sales_invoices_id'), table_name='sales_invoices')
+    op.drop_table('sales_invoices')
+    op.drop_index(op.f('ix_billing_runs_id'), table_name='billing_runs')
+    op.drop_table('billing_runs')
+    sa.Enum(name='billingrunstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='billingoutput').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,33 @@
+"""add queued billing run status
+
+Revision ID: f7d3b9e1a485
+Revises: e5c1a7d3b826
+Create Date: 2026-10-24 10:21:06.718230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d3b9e1a485'
+down_revision: Union[str, None] = 'e5c1a7d3b826'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A new enum value cannot be used in the transaction that adds it
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE billingrunstatus ADD VALUE IF NOT EXISTS 'queued' BEFORE 'running'")
+    # Runs a restart left behind: nothing runs them any more
+    op.execute(
+        "UPDATE billing_runs SET status = 'failed', error = 'Interrupted by a restart', completed_at = now() "
+        "WHERE status IN ('running', 'rendering')"
+    )
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop an enum value; queued runs just become failed ones
+    op.execute("UPDATE billing_runs SET status = 'failed', error = 'Queued at downgrade' WHERE status = 'queued'")
@@ -1,15 +1,14 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlmodel import select
 from app.db.session import get_db
 from app.models.user import User
 from app.core.config import settings
 from app.constants.roles import ROLES
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.redis import get_redis  
+from app.core.principal_cache import load_principal
 from redis.asyncio import Redis
-import json
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
@@ -31,24 +30,13 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    # Cache Key
-    cache_key = f"user:{user_id}"
-
-    # Try Redis first
-    cached = await redis.get(cache_key)
-    if cached:
-        user_data = json.loads(cached)
-        return User(**user_data)  # Convert dict to User model
-
-    # Correct async query
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalars().first()
+    user = await load_principal(user_id, db, redis)
     if user is None:
         raise credentials_exception
-    
-    # Cache user data for 30 minutes
-    user_dict = user.dict()
-    await redis.setex(cache_key, 1800, json.dumps(user_dict))
+    # RBACMiddleware authorized from the token's role claim: a token issued
+    # before a role change must not outlive it
+    if payload.get("role") != int(user.role):
+        raise credentials_exception
     return user
 
 async def get_current_superadmin(
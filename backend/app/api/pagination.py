@@ -0,0 +1,147 @@
+# app/api/pagination.py
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.db.session import ReadSessionLocal
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+STREAM_BATCH_SIZE = 1000
+
+
+# ------------------------------------------------------------------
+# 1. Opaque cursors
+# ------------------------------------------------------------------
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+# ------------------------------------------------------------------
+# 2. Dependency
+# ------------------------------------------------------------------
+@dataclass
+class PageParams:
+    cursor: Optional[str]
+    limit: int
+    stream: bool
+
+
+def page_params(
+    cursor: Optional[str] = Query(None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    stream: bool = Query(False, description="Stream every remaining row as one JSON array"),
+) -> PageParams:
+    return PageParams(cursor=cursor, limit=limit, stream=stream)
+
+
+# ------------------------------------------------------------------
+# 3. Keyset query
+# ------------------------------------------------------------------
+def _from_json(key, value: Any) -> Any:
+    """Undo json.dumps(default=str) for dates, datetimes and decimals."""
+    try:
+        python_type = key.type.python_type
+    except NotImplementedError:
+        return value
+    if not isinstance(value, str) or python_type is str:
+        return value
+    parse = getattr(python_type, "fromisoformat", python_type)
+    try:
+        return parse(value)
+    except (TypeError, ValueError, ArithmeticError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset(stmt: Select, sort_keys: Sequence, cursor: Optional[str], descending: bool) -> Select:
+    """
+    ORDER BY the sort keys and start after the cursor. The last key must be
+    unique (normally the primary key) so the order is total and stable.
+    """
+    if cursor:
+        values = tuple_(*(
+            literal(_from_json(key, value), key.type)
+            for key, value in zip(sort_keys, decode_cursor(cursor, len(sort_keys)))
+        ))
+        row = tuple_(*sort_keys)
+        stmt = stmt.where(row < values if descending else row > values)
+    return stmt.order_by(*(key.desc() if descending else key.asc() for key in sort_keys))
+
+
+def _cursor_for(obj: Any, sort_keys: Sequence) -> str:
+    return encode_cursor([getattr(obj, key.key) for key in sort_keys])
+
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    sort_keys: Sequence,
+    params: PageParams,
+    response: Response,
+    descending: bool = False,
+) -> list:
+    """One keyset page; sets the next cursor header when more rows exist."""
+    result = await db.execute(_keyset(stmt, sort_keys, params.cursor, descending).limit(params.limit + 1))
+    rows = list(result.scalars().all())
+    if len(rows) > params.limit:
+        rows = rows[: params.limit]
+        response.headers[NEXT_CURSOR_HEADER] = _cursor_for(rows[-1], sort_keys)
+    return rows
+
+
+# ------------------------------------------------------------------
+# 4. Streaming mode
+# ------------------------------------------------------------------
+def stream_json(
+    stmt: Select,
+    sort_keys: Sequence,
+    params: PageParams,
+    serialize: Callable[[Any], str],
+    descending: bool = False,
+    session_factory=ReadSessionLocal,
+) -> StreamingResponse:
+    """
+    Stream every row after the cursor as a JSON array, read through a
+    server-side cursor in batches – memory stays flat however many rows.
+
+    Opens its own session: request-scoped ones are closed before the body
+    is sent.
+    """
+    query = _keyset(stmt, sort_keys, params.cursor, descending).execution_options(
+        yield_per=STREAM_BATCH_SIZE
+    )
+
+    async def body():
+        async with session_factory() as db:
+            result = await db.stream(query)
+            yield "["
+            first = True
+            async for batch in result.scalars().partitions():
+                chunk = ",".join(serialize(obj) for obj in batch)
+                yield chunk if first else "," + chunk
+                first = False
+                db.expunge_all()
+            yield "]"
+
+    return StreamingResponse(body(), media_type="application/json")
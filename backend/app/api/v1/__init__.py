@@ -1,6 +1,47 @@
 # app/api/v1/__init__.py
 from fastapi import APIRouter
 from .users import router as users_router
+from .metrics import router as metrics_router
+from .finance.ledger import router as ledger_router
+from .finance.reports import router as finance_reports_router
+from .finance.open_items import ar_router, ap_router
+from .finance.bank import router as bank_router
+from .finance.assets import router as assets_router
+from .finance.cost_allocation import router as cost_allocation_router
+from .finance.tax import router as tax_router
+from .finance.budget import router as budget_router
+from .finance.close import router as close_router
+from .sales.master import customers_router, products_router
+from .sales.pricing import router as pricing_router
+from .sales.atp import movements_router, router as atp_router
+from .sales.orders import router as orders_router
+from .sales.credit import router as credit_router
+from .sales.analytics import router as sales_analytics_router
+from .sales.billing import router as billing_router
+from .sales.output import router as output_router
+from .procurment.pr import router as pr_router
 
 router = APIRouter()
-router.include_router(users_router)
\ No newline at end of file
+router.include_router(users_router)
+router.include_router(metrics_router)
+router.include_router(ledger_router)
+router.include_router(finance_reports_router)
+router.include_router(ar_router)
+router.include_router(ap_router)
+router.include_router(bank_router)
+router.include_router(assets_router)
+router.include_router(cost_allocation_router)
+router.include_router(tax_router)
+router.include_router(budget_router)
+router.include_router(close_router)
+router.include_router(customers_router)
+router.include_router(products_router)
+router.include_router(pricing_router)
+router.include_router(movements_router)
+router.include_router(atp_router)
+router.include_router(orders_router)
+router.include_router(credit_router)
+router.include_router(sales_analytics_router)
+router.include_router(billing_router)
+router.include_router(output_router)
+router.include_router(pr_router)
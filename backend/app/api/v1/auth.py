@@ -7,38 +7,16 @@ from datetime import timedelta
 
 from app.db.session import get_db          # <-- Use get_db (async generator)
 from app.models.user import User
-from app.core.security import verify_password, create_access_token
+from app.core.security import create_access_token
+from app.utils.hashing import password_hasher
 from app.core.config import settings
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from app.core.redis import get_redis
-from redis.asyncio import Redis
-from fastapi.responses import JSONResponse
+from app.core.rate_limit import rate_limiter, client_ip
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-limiter = Limiter(key_func=get_remote_address, storage_uri="redis://localhost:6379/1")
-
-# Override default handler
-async def custom_rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
-    # 15 minutes = 900 seconds
-    retry_after = 900
-
-    # Custom response
-    response = JSONResponse(
-        status_code=429,
-        content={
-            "detail": "Too many login attempts. Please try again after 15 minutes.",
-            "retry_after_minutes": 15
-        },
-        headers={"Retry-After": str(retry_after)}
-    )
-    return response
-
 # Export for main.py
-__all__ = ["router", "limiter", "custom_rate_limit_exceeded_handler"]
+__all__ = ["router"]
 
 
 @router.post(
@@ -47,29 +25,41 @@ __all__ = ["router", "limiter", "custom_rate_limit_exceeded_handler"]
     responses={
         200: {"description": "Token returned"},
         401: {"description": "Invalid credentials"},
+        429: {"description": "Too many login attempts"},
     },
 )
-@limiter.limit("5/15minutes")
 async def login(
     request: Request,
     form: Annotated[OAuth2PasswordRequestForm, Depends()],
     db: Annotated[AsyncSession, Depends(get_db)],
-    redis: Redis = Depends(get_redis)   
 ):
     """
     OAuth2 password flow – username = email.
     """
+    # --- Per-account + per-IP sliding window (429 + Retry-After) ---
+    await rate_limiter.hit("login", ip=client_ip(request), account=form.username)
+
     # --- Correct async query ---
     result = await db.execute(select(User).where(User.email == form.username))
     user = result.scalars().first()
 
-    if not user or not verify_password(form.password, user.hashed_password):
+    if user:
+        # bcrypt runs in the bounded pool – 503 + Retry-After when saturated
+        verified, new_hash = await password_hasher.verify_and_update(
+            form.password, user.hashed_password
+        )
+    if not user or not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # --- Upgrade hashes made with fewer rounds than BCRYPT_ROUNDS ---
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     # --- Create JWT ---
     access_token = create_access_token(
         data={"sub": str(user.id), "role": user.role},
@@ -0,0 +1,110 @@
+# app/api/v1/finance/assets.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.finance.assets as crud
+import app.services.finance.depreciation as depreciation
+from app.crud.finance.ledger import LedgerError
+from app.services.finance.depreciation import DepreciationError
+from app.schemas.finance.assets import (
+    AssetSchedule, DepreciationRunCreate, DepreciationRunOut, FixedAssetCreate, FixedAssetOut, UsageIn,
+)
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.services.finance.statements import invalidate_for_posting
+from redis.asyncio import Redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.assets import AssetStatus, DepreciationMethod, DepreciationRun, FixedAsset
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/fam", tags=["Fixed Assets"])
+
+
+# ------------------------------------------------------------------
+# Asset register
+# ------------------------------------------------------------------
+@router.post("/assets", response_model=FixedAssetOut, status_code=status.HTTP_201_CREATED)
+async def create_asset(
+    asset_in: FixedAssetCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_asset(db, asset_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Asset code already exists or account not found")
+
+
+@router.get("/assets", response_model=List[FixedAssetOut])
+async def list_assets(
+    response: Response,
+    asset_status: Optional[AssetStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.asset_list_query(asset_status), [FixedAsset.id], page, response)
+
+
+@router.put("/assets/{asset_id}/usage", status_code=status.HTTP_204_NO_CONTENT)
+async def record_usage(
+    asset_id: int,
+    usage: UsageIn,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    asset = await crud.asset_repo.get(db, asset_id)
+    if not asset:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    if asset.method != DepreciationMethod.units_of_production:
+        raise HTTPException(status_code=400, detail="Usage applies to units-of-production assets only")
+    await crud.record_usage(db, asset_id, usage)
+
+
+@router.get("/assets/{asset_id}/schedule", response_model=AssetSchedule)
+async def get_schedule(
+    asset_id: int,
+    months: int = Query(12, ge=1, le=600),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    asset = await crud.asset_repo.get(db, asset_id)
+    if not asset:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return await depreciation.asset_schedule(db, asset, months)
+
+
+# ------------------------------------------------------------------
+# Depreciation runs
+# ------------------------------------------------------------------
+@router.post("/depreciation-runs", response_model=DepreciationRunOut, status_code=status.HTTP_201_CREATED)
+async def run_depreciation(
+    run_in: DepreciationRunCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        run = await depreciation.run_depreciation(db, run_in.period, user=current_user.name or current_user.email)
+    except (DepreciationError, LedgerError) as exc:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="A run for this period already exists")
+    if run.entry_id:
+        await invalidate_for_posting(redis, depreciation.period_end(run.period))
+    return run
+
+
+@router.get("/depreciation-runs", response_model=List[DepreciationRunOut])
+async def list_runs(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.run_list_query(), [DepreciationRun.id], page, response, descending=True)
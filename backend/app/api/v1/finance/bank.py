@@ -0,0 +1,118 @@
+# app/api/v1/finance/bank.py
+import datetime
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.finance.bank as crud
+import app.services.finance.reconciliation as reconciliation
+from app.crud.finance.bank import BankReconciliationError
+from app.services.finance.bank_statements import detect_format
+from app.schemas.finance.bank import (
+    ManualMatchIn, MatchOut, ReconciliationResult, ReconciliationRules, StatementOut, UnmatchedResidue,
+)
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.bank import BankStatement, StatementFormat
+from app.api.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/bank", tags=["Bank Reconciliation"])
+
+
+async def _bank_account(db: AsyncSession, account_id: int):
+    try:
+        account = await crud.get_bank_account(db, account_id)
+    except BankReconciliationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not account:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return account
+
+
+# ------------------------------------------------------------------
+# Statements
+# ------------------------------------------------------------------
+@router.post("/accounts/{account_id}/statements", response_model=StatementOut, status_code=status.HTTP_201_CREATED)
+async def import_statement(
+    account_id: int,
+    file: UploadFile = File(...),
+    fmt: Optional[StatementFormat] = Query(None, alias="format"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    await _bank_account(db, account_id)
+    if fmt is None:
+        fmt = detect_format(file.filename, await file.read(512))
+        await file.seek(0)
+    try:
+        return await crud.import_statement(
+            db, account_id, fmt, file.filename, file.file, user=current_user.name or current_user.email
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.get("/accounts/{account_id}/statements", response_model=List[StatementOut])
+async def list_statements(
+    account_id: int,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.statement_list_query(account_id), [BankStatement.id], page, response)
+
+
+# ------------------------------------------------------------------
+# Reconciliation
+# ------------------------------------------------------------------
+@router.post("/accounts/{account_id}/reconcile", response_model=ReconciliationResult)
+async def reconcile(
+    account_id: int,
+    rules: ReconciliationRules,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        result = await reconciliation.reconcile(db, account_id, rules, user=current_user.name or current_user.email)
+    except BankReconciliationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not result:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return result
+
+
+@router.get("/accounts/{account_id}/unmatched", response_model=UnmatchedResidue)
+async def get_unmatched(
+    account_id: int,
+    from_date: Optional[datetime.date] = None,
+    to_date: Optional[datetime.date] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Lines listed per side, oldest first"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Open lines of both sides; narrow the dates to list past the first ``limit``."""
+    await _bank_account(db, account_id)
+    rules = ReconciliationRules(from_date=from_date, to_date=to_date)
+    return await reconciliation.unmatched_residue(db, account_id, rules, limit)
+
+
+@router.post("/matches", response_model=MatchOut, status_code=status.HTTP_201_CREATED)
+async def create_match(
+    match_in: ManualMatchIn,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        match = await crud.create_manual_match(db, match_in, user=current_user.name or current_user.email)
+    except BankReconciliationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not match:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return match
+
+
+@router.delete("/matches/{match_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_match(match_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if not await crud.delete_match(db, match_id):
+        raise HTTPException(status_code=404, detail="Match not found")
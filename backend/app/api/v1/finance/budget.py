@@ -0,0 +1,108 @@
+# app/api/v1/finance/budget.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.finance.budget as crud
+import app.services.finance.budgeting as budgeting
+from app.crud.finance.budget import BudgetError
+from app.core.report_cache import report_cache
+from app.schemas.finance.budget import (
+    BudgetCreate, BudgetGrouping, BudgetLinesIn, BudgetOut, ScenarioIn, ScenarioResult, VarianceReport,
+)
+from app.schemas.finance.assets import check_period
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.budget import Budget
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/bf", tags=["Budgets & Forecasting"])
+
+
+async def _budget(db: AsyncSession, budget_id: int) -> Budget:
+    budget = await crud.get_budget(db, budget_id)
+    if not budget:
+        raise HTTPException(status_code=404, detail="Budget not found")
+    return budget
+
+
+# ------------------------------------------------------------------
+# Budgets
+# ------------------------------------------------------------------
+@router.post("/budgets", response_model=BudgetOut, status_code=status.HTTP_201_CREATED)
+async def create_budget(
+    budget_in: BudgetCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_budget(db, budget_in, user=current_user.name or current_user.email)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Budget name already exists")
+
+
+@router.get("/budgets", response_model=List[BudgetOut])
+async def list_budgets(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.budget_list_query(), [Budget.id], page, response)
+
+
+@router.put("/budgets/{budget_id}/lines", response_model=BudgetOut)
+async def set_budget_lines(
+    budget_id: int,
+    lines_in: BudgetLinesIn,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        budget = await crud.set_lines(db, budget_id, lines_in)
+    except BudgetError as exc:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not budget:
+        raise HTTPException(status_code=404, detail="Budget not found")
+    # Scenarios of the old version can no longer be hit – free them now
+    await report_cache.invalidate(redis, [f"budget:{budget_id}"])
+    return budget
+
+
+# ------------------------------------------------------------------
+# Budget vs. actual and scenarios
+# ------------------------------------------------------------------
+@router.get("/budgets/{budget_id}/variance", response_model=VarianceReport)
+async def get_variance(
+    budget_id: int,
+    cutoff: Optional[int] = Query(None, description="Last month of actuals (YYYYMM); default: last closed month"),
+    group_by: BudgetGrouping = BudgetGrouping.account,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    if cutoff is not None:
+        try:
+            check_period(cutoff)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    return await budgeting.variance_report(db, await _budget(db, budget_id), cutoff, group_by)
+
+
+@router.post("/budgets/{budget_id}/scenarios", response_model=ScenarioResult)
+async def run_scenario(
+    budget_id: int,
+    params: ScenarioIn,
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """What-if forecast; identical parameters are answered from the memo."""
+    body = await budgeting.scenario_json(db, redis, await _budget(db, budget_id), params)
+    # Cached body is already serialized – skip response_model re-encoding
+    return Response(content=body, media_type="application/json")
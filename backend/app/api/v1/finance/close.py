@@ -0,0 +1,133 @@
+# app/api/v1/finance/close.py
+import json
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.finance.close as crud
+import app.services.finance.period_close as period_close
+from app.services.finance.period_close import CloseError
+from app.schemas.finance.close import CloseRunCreate, CloseRunDetail, CloseRunOut
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.close import CloseRun, CloseStatus
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/close", tags=["Period Close"])
+
+FINISHED = {CloseStatus.completed.value, CloseStatus.failed.value}
+# Longest silence on the event stream; proxies drop idle connections
+EVENT_KEEPALIVE_MS = 15_000
+
+
+@router.post("/runs", response_model=CloseRunOut, status_code=status.HTTP_202_ACCEPTED)
+async def create_run(
+    run_in: CloseRunCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Queues the close for the worker; follow it on ``/events`` or poll the run."""
+    try:
+        period_close.check_closable(run_in.period)
+        run = await crud.create_run(
+            db, run_in, [step.name for step in period_close.STEPS], user=current_user.name or current_user.email
+        )
+    except CloseError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="A close for this period already exists – resume it instead")
+    await period_close.enqueue(redis, run.id)
+    return run
+
+
+@router.get("/runs", response_model=List[CloseRunOut])
+async def list_runs(
+    response: Response,
+    run_status: Optional[CloseStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.run_list_query(run_status), [CloseRun.id], page, response, descending=True)
+
+
+@router.get("/runs/{run_id}", response_model=CloseRunDetail)
+async def get_run(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    run = await crud.run_repo.get(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Close run not found")
+    return await period_close.run_detail(db, run)
+
+
+@router.post("/runs/{run_id}/resume", response_model=CloseRunOut, status_code=status.HTTP_202_ACCEPTED)
+async def resume_run(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Re-queue a failed or interrupted run; completed steps are not repeated."""
+    run = await crud.run_repo.get(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Close run not found")
+    if run.status == CloseStatus.completed:
+        raise HTTPException(status_code=409, detail="Close run is already completed")
+    if await period_close.is_running(redis, run_id):
+        raise HTTPException(status_code=409, detail="Close run is being processed by a worker")
+    run = await crud.requeue(db, run)
+    await period_close.enqueue(redis, run.id)
+    return run
+
+
+@router.get("/runs/{run_id}/events")
+async def stream_events(
+    run_id: int,
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Server-sent events: ``run`` and ``step`` progress, replayed from the
+    start (or after ``Last-Event-ID`` on reconnect). Ends once the run
+    is completed or failed.
+    """
+    run = await crud.run_repo.get(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Close run not found")
+    finished_run = run.status.value in FINISHED and not await redis.exists(period_close.events_key(run_id))
+    snapshot = (await period_close.run_detail(db, run)).model_dump_json() if finished_run else None
+
+    async def body():
+        if snapshot:
+            # Events expired: one summary from the checkpoints
+            yield f"event: run\ndata: {snapshot}\n\n"
+            return
+        after = last_event_id or "0"
+        while not await request.is_disconnected():
+            events = await period_close.read_events(redis, run_id, after, EVENT_KEEPALIVE_MS)
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            for event_id, event, data in events:
+                yield f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+            after, event, data = events[-1]
+            # A failed run may have been resumed since: stop only at the latest event
+            if event == "run" and json.loads(data)["status"] in FINISHED:
+                if not await period_close.read_events(redis, run_id, after):
+                    return
+
+    return StreamingResponse(
+        body(), media_type="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
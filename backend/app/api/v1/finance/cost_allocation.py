@@ -0,0 +1,95 @@
+# app/api/v1/finance/cost_allocation.py
+from fastapi import APIRouter, Depends, HTTPException, Path, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.finance.cost_allocation as crud
+import app.services.finance.cost_allocation as allocation
+from app.crud.finance.cost_allocation import CostAllocationError
+from app.schemas.finance.cost_allocation import (
+    AllocationResult, CostCenterCreate, CostCenterOut, DriverOut, DriverSet, DriverVersion,
+)
+from app.schemas.finance.assets import check_period
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.cost_allocation import CostCenter, CostCenterKind
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/co", tags=["Cost Accounting"])
+
+
+# ------------------------------------------------------------------
+# Cost centres
+# ------------------------------------------------------------------
+@router.post("/cost-centers", response_model=CostCenterOut, status_code=status.HTTP_201_CREATED)
+async def create_cost_center(
+    center_in: CostCenterCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_cost_center(db, center_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Cost centre code already exists")
+
+
+@router.get("/cost-centers", response_model=List[CostCenterOut])
+async def list_cost_centers(
+    response: Response,
+    kind: Optional[CostCenterKind] = None,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.cost_center_list_query(kind), [CostCenter.id], page, response)
+
+
+# ------------------------------------------------------------------
+# Drivers
+# ------------------------------------------------------------------
+@router.put("/drivers/{sender_code}", response_model=DriverVersion)
+async def set_drivers(
+    sender_code: str,
+    driver_set: DriverSet,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        version = await crud.set_drivers(db, sender_code, driver_set)
+    except CostAllocationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if version is None:
+        raise HTTPException(status_code=404, detail="Cost centre not found")
+    return DriverVersion(version=version)
+
+
+@router.get("/drivers", response_model=List[DriverOut])
+async def list_drivers(
+    sender: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await crud.list_drivers(db, sender)
+
+
+# ------------------------------------------------------------------
+# Allocation
+# ------------------------------------------------------------------
+@router.get("/allocations/{period}", response_model=AllocationResult)
+async def get_allocation(
+    period: int = Path(..., ge=190001, le=999912),
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        check_period(period)
+        body = await allocation.allocation_json(db, redis, period)
+    except ValueError as exc:  # bad period or CostAllocationError
+        raise HTTPException(status_code=400, detail=str(exc))
+    # Cached body is already serialized – skip response_model re-encoding
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,141 @@
+# app/api/v1/finance/ledger.py
+import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.finance.ledger as crud
+from app.crud.finance.ledger import LedgerError
+from app.schemas.finance.ledger import (
+    AccountCreate, AccountOut, JournalEntryCreate, JournalEntryOut, JournalEntrySummary, TrialBalance,
+)
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.services.finance.statements import invalidate_for_accounts, invalidate_for_posting
+from redis.asyncio import Redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.ledger import Account, JournalEntry, JournalStatus
+from app.api.pagination import PageParams, page_params, paginate, stream_json
+
+router = APIRouter(prefix="/finance/ledger", tags=["General Ledger"])
+
+
+def _entry_json(entry: JournalEntry) -> str:
+    return JournalEntrySummary.model_validate(entry).model_dump_json()
+
+
+# ------------------------------------------------------------------
+# Chart of accounts
+# ------------------------------------------------------------------
+@router.get("/accounts", response_model=List[AccountOut])
+async def list_accounts(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.account_list_query(), [Account.id], page, response)
+
+
+@router.post("/accounts", response_model=AccountOut, status_code=status.HTTP_201_CREATED)
+async def create_account(
+    account_in: AccountCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        account = await crud.create_account(db, account_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Account code already exists")
+    await invalidate_for_accounts(redis)
+    return account
+
+
+# ------------------------------------------------------------------
+# Journal entries
+# ------------------------------------------------------------------
+@router.post("/entries", response_model=JournalEntryOut, status_code=status.HTTP_201_CREATED)
+async def create_entry(
+    entry_in: JournalEntryCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        entry = await crud.create_entry(db, entry_in, user=current_user.name or current_user.email)
+    except LedgerError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if entry.status == JournalStatus.posted:
+        await invalidate_for_posting(redis, entry.entry_date)
+    return entry
+
+
+@router.get("/entries", response_model=List[JournalEntrySummary])
+async def list_entries(
+    response: Response,
+    entry_status: Optional[JournalStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = crud.entry_list_query(entry_status)
+    if page.stream:
+        return stream_json(query, [JournalEntry.id], page, _entry_json, descending=True)
+    return await paginate(db, query, [JournalEntry.id], page, response, descending=True)
+
+
+@router.get("/entries/{entry_id}", response_model=JournalEntryOut)
+async def get_entry(entry_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    entry = await crud.get_entry(db, entry_id)
+    if not entry:
+        raise HTTPException(status_code=404, detail="Journal entry not found")
+    return entry
+
+
+@router.post("/entries/{entry_id}/post", response_model=JournalEntryOut)
+async def post_entry(
+    entry_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        entry = await crud.post_entry(db, entry_id)
+    except LedgerError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not entry:
+        raise HTTPException(status_code=404, detail="Journal entry not found")
+    await invalidate_for_posting(redis, entry.entry_date)
+    return entry
+
+
+@router.post("/entries/{entry_id}/void", response_model=JournalEntryOut)
+async def void_entry(
+    entry_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        entry = await crud.void_entry(db, entry_id)
+    except LedgerError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not entry:
+        raise HTTPException(status_code=404, detail="Journal entry not found")
+    await invalidate_for_posting(redis, entry.entry_date)
+    return entry
+
+
+# ------------------------------------------------------------------
+# Balances
+# ------------------------------------------------------------------
+@router.get("/trial-balance", response_model=TrialBalance)
+async def get_trial_balance(
+    as_of: Optional[datetime.date] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await crud.trial_balance(db, as_of or datetime.date.today())
@@ -0,0 +1,105 @@
+# app/api/v1/finance/open_items.py
+import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.finance.open_items as crud
+import app.services.finance.aging as aging
+from app.crud.finance.open_items import OpenItemError
+from app.services.finance.aging import AgingError
+from app.schemas.finance.open_items import AgingSummary, OpenItemCreate, OpenItemOut, PartyAging, PaymentIn
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.open_items import AgingSnapshot, OpenItem, OpenItemStatus, Subledger
+from app.api.pagination import PageParams, page_params, paginate
+
+
+def _subledger_router(ledger: Subledger, tag: str) -> APIRouter:
+    """Same endpoints for receivables and payables, under their RBAC module prefix."""
+    router = APIRouter(prefix=f"/finance/{ledger.value}", tags=[tag])
+
+    @router.post("/items", response_model=OpenItemOut, status_code=status.HTTP_201_CREATED)
+    async def create_item(
+        item_in: OpenItemCreate,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        try:
+            return await crud.create_item(db, ledger, item_in)
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="Document number already exists")
+
+    @router.get("/items", response_model=List[OpenItemOut])
+    async def list_items(
+        response: Response,
+        item_status: Optional[OpenItemStatus] = Query(None, alias="status"),
+        page: PageParams = Depends(page_params),
+        db: AsyncSession = Depends(get_read_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        return await paginate(db, crud.list_query(ledger, item_status), [OpenItem.id], page, response)
+
+    @router.post("/items/{item_id}/payments", response_model=OpenItemOut)
+    async def apply_payment(
+        item_id: int,
+        payment: PaymentIn,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        try:
+            item = await crud.apply_payment(db, ledger, item_id, payment.amount)
+        except OpenItemError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        return item
+
+    # Reads serve the snapshot the nightly job or POST /aging/snapshot took,
+    # brought up to date incrementally on the primary if items changed since
+    @router.get("/aging", response_model=AgingSummary)
+    async def get_aging(
+        as_of: Optional[datetime.date] = None,
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        as_of = as_of or datetime.date.today()
+        try:
+            await aging.current_run(db, ledger, as_of)
+            return await aging.aging_summary(db, ledger, as_of)
+        except AgingError as exc:
+            raise HTTPException(status_code=404, detail=str(exc))
+
+    @router.get("/aging/parties", response_model=List[PartyAging])
+    async def get_party_aging(
+        response: Response,
+        as_of: Optional[datetime.date] = None,
+        page: PageParams = Depends(page_params),
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        as_of = as_of or datetime.date.today()
+        try:
+            await aging.current_run(db, ledger, as_of)
+        except AgingError as exc:
+            raise HTTPException(status_code=404, detail=str(exc))
+        return await paginate(db, aging.party_aging_query(ledger, as_of), [AgingSnapshot.party_code], page, response)
+
+    @router.post("/aging/snapshot", response_model=AgingSummary)
+    async def rebuild_aging_snapshot(
+        as_of: Optional[datetime.date] = None,
+        full: bool = Query(True, description="Recompute every party, not just those changed since the last run"),
+        db: AsyncSession = Depends(get_db),
+        current_user: User = Depends(get_current_user)
+    ):
+        as_of = as_of or datetime.date.today()
+        await aging.refresh_snapshot(db, ledger, as_of, full=full)
+        return await aging.aging_summary(db, ledger, as_of)
+
+    return router
+
+
+ar_router = _subledger_router(Subledger.ar, "Accounts Receivable")
+ap_router = _subledger_router(Subledger.ap, "Accounts Payable")
@@ -0,0 +1,71 @@
+# app/api/v1/finance/reports.py
+import datetime
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.services.finance.statements as statements
+from app.schemas.finance.statements import BalanceSheet, CashFlow, ProfitAndLoss
+from app.db.session import get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+
+router = APIRouter(prefix="/finance/reports", tags=["Financial Statements"])
+
+
+def _json(body: str) -> Response:
+    # Cached bodies are already serialized – skip response_model re-encoding
+    return Response(content=body, media_type="application/json")
+
+
+def _check_range(from_date: datetime.date, to_date: datetime.date) -> None:
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from_date must not be after to_date")
+
+
+@router.get("/profit-and-loss", response_model=ProfitAndLoss)
+async def get_profit_and_loss(
+    from_date: datetime.date,
+    to_date: datetime.date,
+    cost_center: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    _check_range(from_date, to_date)
+    return _json(await statements.profit_and_loss_json(db, redis, from_date, to_date, cost_center))
+
+
+@router.get("/profit-and-loss/cost-centers", response_model=List[ProfitAndLoss])
+async def get_profit_and_loss_by_cost_center(
+    from_date: datetime.date,
+    to_date: datetime.date,
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    _check_range(from_date, to_date)
+    return _json(await statements.profit_and_loss_by_cost_center_json(db, redis, from_date, to_date))
+
+
+@router.get("/balance-sheet", response_model=BalanceSheet)
+async def get_balance_sheet(
+    as_of: Optional[datetime.date] = None,
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    return _json(await statements.balance_sheet_json(db, redis, as_of or datetime.date.today()))
+
+
+@router.get("/cash-flow", response_model=CashFlow)
+async def get_cash_flow(
+    from_date: datetime.date,
+    to_date: datetime.date,
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    _check_range(from_date, to_date)
+    return _json(await statements.cash_flow_json(db, redis, from_date, to_date))
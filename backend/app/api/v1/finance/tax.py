@@ -0,0 +1,90 @@
+# app/api/v1/finance/tax.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.finance.tax as crud
+import app.services.finance.tax_returns as tax_returns
+from app.crud.finance.tax import TaxReturnError
+from app.schemas.finance.tax import TaxReturnCreate, TaxReturnOut
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.finance.tax import TaxReturn, TaxReturnStatus
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/finance/taxcomp", tags=["Taxation & Compliance"])
+
+
+@router.post("/returns", response_model=TaxReturnOut, status_code=status.HTTP_202_ACCEPTED)
+async def create_return(
+    return_in: TaxReturnCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Queues the return for the tax return worker; poll until ``completed``."""
+    tax_return = await crud.create_return(db, return_in, user=current_user.name or current_user.email)
+    await tax_returns.enqueue(redis, tax_return.id)
+    return tax_return
+
+
+@router.get("/returns", response_model=List[TaxReturnOut])
+async def list_returns(
+    response: Response,
+    return_status: Optional[TaxReturnStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.return_list_query(return_status), [TaxReturn.id], page, response)
+
+
+@router.get("/returns/{return_id}", response_model=TaxReturnOut)
+async def get_return(
+    return_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    tax_return = await crud.return_repo.get(db, return_id)
+    if not tax_return:
+        raise HTTPException(status_code=404, detail="Tax return not found")
+    return tax_return
+
+
+@router.post("/returns/{return_id}/retry", response_model=TaxReturnOut, status_code=status.HTTP_202_ACCEPTED)
+async def retry_return(
+    return_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Writes a failed return again."""
+    tax_return = await crud.return_repo.get(db, return_id)
+    if not tax_return:
+        raise HTTPException(status_code=404, detail="Tax return not found")
+    try:
+        tax_return = await crud.retry_return(db, tax_return)
+    except TaxReturnError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    await tax_returns.enqueue(redis, tax_return.id)
+    return tax_return
+
+
+@router.get("/returns/{return_id}/file")
+async def download_return(
+    return_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    tax_return = await crud.return_repo.get(db, return_id)
+    if not tax_return:
+        raise HTTPException(status_code=404, detail="Tax return not found")
+    if tax_return.status != TaxReturnStatus.completed:
+        raise HTTPException(status_code=409, detail=f"Tax return is {tax_return.status.value}")
+    path = tax_returns.return_path(tax_return)
+    if not path.exists():
+        raise HTTPException(status_code=410, detail="Tax return file is no longer available")
+    return FileResponse(path, media_type=tax_returns.MEDIA_TYPES[tax_return.format], filename=path.name)
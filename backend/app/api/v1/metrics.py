@@ -0,0 +1,106 @@
+# app/api/v1/metrics.py
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_superadmin
+from app.core.principal_cache import principal_cache
+from app.core.startup import startup_timer
+from app.core.rate_limit import rate_limiter
+from app.core.report_cache import report_cache
+from app.db.session import pool_stats
+from app.services.finance.budgeting import cubes as budget_cubes
+from app.services.finance.cost_allocation import solver as allocation_solver
+from app.services.sales.analytics import analytics_cache
+from app.services.sales.atp import timelines as atp_timelines
+from app.services.sales.pricing import books as price_books
+from app.models.user import User
+from app.utils.hashing import password_hasher
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/principal-cache")
+async def principal_cache_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Hit/miss counters of this worker's in-process principal cache."""
+    return principal_cache.stats()
+
+
+@router.get("/password-hasher")
+async def password_hasher_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Occupancy and rejection counters of the bcrypt worker pool."""
+    return password_hasher.stats()
+
+
+@router.get("/startup")
+async def startup_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Per-phase startup timings of this worker."""
+    return startup_timer.stats()
+
+
+@router.get("/db-pool")
+async def db_pool_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Checked-out/overflow connections and checkout wait times per engine."""
+    return pool_stats()
+
+
+@router.get("/rate-limit")
+async def rate_limit_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Allowed/denied decisions per policy and local-fallback usage."""
+    return rate_limiter.stats()
+
+
+@router.get("/report-cache")
+async def report_cache_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Hit/miss and tag-invalidation counters of the financial report cache."""
+    return report_cache.stats()
+
+
+@router.get("/cost-allocation")
+async def cost_allocation_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Full inversions vs. rank-one updates of the reciprocal allocation solver."""
+    return allocation_solver.stats()
+
+
+@router.get("/budget-cubes")
+async def budget_cube_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Loads vs. reuses of this worker's in-memory budget cubes."""
+    return budget_cubes.stats()
+
+
+@router.get("/price-books")
+async def price_book_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Compiled price books of this worker and their resolution reuse."""
+    return price_books.stats()
+
+
+@router.get("/atp-timelines")
+async def atp_timeline_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Loaded stock timelines of this worker and the movements applied to them in place."""
+    return atp_timelines.stats()
+
+
+@router.get("/sales-analytics-cache")
+async def sales_analytics_cache_stats(
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Hit/miss and month-tag invalidation counters of the cached sales dashboards."""
+    return analytics_cache.stats()
@@ -1,46 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import app.crud.procurment.pr as crud
 from app.schemas.procurment.pr import PRCreate, PRResponse
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.procurment.pr import PurchaseRequisition
+from app.api.pagination import PageParams, page_params, paginate, stream_json
 
-router = APIRouter(prefix="/api/pr", tags=["Purchase Requisition"])
+router = APIRouter(prefix="/procurement/pr", tags=["Purchase Requisition"])
+
+def _pr_json(pr: PurchaseRequisition) -> str:
+    return PRResponse.model_validate(pr).model_dump_json()
 
 @router.post("/", response_model=PRResponse, status_code=status.HTTP_201_CREATED)
-def raise_pr(
+async def raise_pr(
     pr: PRCreate,
-    db: Session = Depends(get_db),
-    current_user: str = "Rahul"  # Replace with auth later
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
 ):
-    return crud.create_pr(db=db, pr=pr, user=current_user)
+    return await crud.create_pr(db=db, pr=pr, user=current_user.name or current_user.email)
 
 @router.get("/", response_model=List[PRResponse])
-def get_all_prs(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db)
+async def get_all_prs(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
 ):
-    prs = crud.get_prs(db, skip=skip, limit=limit)
-    return prs
+    if page.stream:
+        return stream_json(crud.list_query(), [PurchaseRequisition.id], page, _pr_json)
+    return await paginate(db, crud.list_query(), [PurchaseRequisition.id], page, response)
 
 @router.get("/{pr_id}", response_model=PRResponse)
-def get_pr(pr_id: int, db: Session = Depends(get_db)):
-    pr = crud.get_pr_by_id(db, pr_id)
+async def get_pr(pr_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    pr = await crud.get_pr_by_id(db, pr_id)
     if not pr:
         raise HTTPException(status_code=404, detail="PR not found")
     return pr
 
 @router.patch("/{pr_id}/approve")
-def approve_pr(pr_id: int, db: Session = Depends(get_db)):
-    pr = crud.update_pr_status(db, pr_id, "approved")
+async def approve_pr(pr_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    pr = await crud.update_pr_status(db, pr_id, "approved")
     if not pr:
         raise HTTPException(status_code=404, detail="PR not found")
-    return {"message": "PR approved", "pr": pr}
+    return {"message": "PR approved", "pr": PRResponse.model_validate(pr)}
 
 @router.patch("/{pr_id}/reject")
-def reject_pr(pr_id: int, db: Session = Depends(get_db)):
-    pr = crud.update_pr_status(db, pr_id, "rejected")
+async def reject_pr(pr_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    pr = await crud.update_pr_status(db, pr_id, "rejected")
     if not pr:
         raise HTTPException(status_code=404, detail="PR not found")
-    return {"message": "PR rejected", "pr": pr}
\ No newline at end of file
+    return {"message": "PR rejected", "pr": PRResponse.model_validate(pr)}
+
+@router.delete("/{pr_id}")
+async def delete_pr(pr_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if not await crud.delete_pr(db, pr_id):
+        raise HTTPException(status_code=404, detail="PR not found")
+    return {"detail": "PR deleted successfully"}
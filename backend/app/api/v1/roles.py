@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.role import RoleCreate, RoleOut
 from app.crud import role as role_crud
 from app.db.session import get_db
@@ -7,9 +8,9 @@ from app.dependencies.auth import get_current_superadmin
 router = APIRouter(prefix="/roles", tags=["roles"])
 
 @router.post("/", response_model=RoleOut)
-def create_role(
+async def create_role(
     role_in: RoleCreate,
-    db = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     _: dict = Depends(get_current_superadmin)
 ):
-    return role_crud.create(db, obj_in=role_in)
+    return await role_crud.create_role(db, role_in)
@@ -0,0 +1,52 @@
+# app/api/v1/sales/analytics.py
+import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from redis.asyncio import Redis
+import app.crud.sales.analytics as crud
+import app.services.sales.analytics as analytics
+from app.services.sales.analytics import Scope
+from app.schemas.sales.analytics import RollupRebuild, SalesDashboard
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_superadmin, get_current_user
+from app.models.user import User
+
+router = APIRouter(prefix="/sales/analytics", tags=["Sales Analytics"])
+
+
+@router.get("/dashboard", response_model=SalesDashboard)
+async def get_dashboard(
+    from_date: Optional[datetime.date] = None,
+    to_date: Optional[datetime.date] = None,
+    region: Optional[str] = Query(None, max_length=32),
+    customer_id: Optional[int] = None,
+    product_id: Optional[int] = None,
+    top: int = Query(8, ge=1, le=50),
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Metrics, monthly series, rankings and distributions of the sales analytics page (default: last 12 months)."""
+    to_date = to_date or datetime.date.today()
+    from_date = from_date or (to_date - datetime.timedelta(days=365))
+    if from_date > to_date:
+        raise HTTPException(status_code=400, detail="from_date must not be after to_date")
+    body = await analytics.dashboard_json(
+        db, redis, from_date, to_date, Scope(region=region, customer_id=customer_id, product_id=product_id), top
+    )
+    # Cached bodies are already serialized – skip response_model re-encoding
+    return Response(content=body, media_type="application/json")
+
+
+@router.post("/rollups/rebuild", response_model=RollupRebuild)
+async def rebuild_rollups(
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Recompute the rollups from the orders (first load / repair)."""
+    orders = await crud.rebuild(db)
+    await analytics.invalidate(redis)
+    return RollupRebuild(orders=orders)
@@ -0,0 +1,84 @@
+# app/api/v1/sales/atp.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.sales.stock as crud
+import app.services.sales.atp as atp
+from app.crud.sales.stock import StockError
+from app.services.sales.atp import ATPError
+from app.schemas.sales.stock import (
+    ATPCheckIn, ATPOrderIn, ATPOrderOut, ATPResult, ReservationCreate, StockMovementCreate, StockMovementOut,
+)
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.stock import MovementType, StockMovement
+from app.api.pagination import PageParams, page_params, paginate
+
+# Stock ledger under inventory, promising under sales (RBAC modules)
+movements_router = APIRouter(prefix="/inventory/stock", tags=["Stock Movements"])
+router = APIRouter(prefix="/sales/atp", tags=["Available to Promise"])
+
+
+@movements_router.post("/movements", response_model=StockMovementOut, status_code=status.HTTP_201_CREATED)
+async def create_movement(
+    movement_in: StockMovementCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_movement(db, movement_in, user=current_user.name or current_user.email)
+    except StockError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@movements_router.get("/movements", response_model=List[StockMovementOut])
+async def list_movements(
+    response: Response,
+    product_id: Optional[int] = Query(None),
+    movement_type: Optional[MovementType] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = crud.movement_list_query(product_id, movement_type)
+    return await paginate(db, query, [StockMovement.id], page, response, descending=True)
+
+
+# Checks read the primary: a reservation just made must count
+@router.post("/check", response_model=ATPResult)
+async def check(
+    check_in: ATPCheckIn,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await atp.check(db, check_in)
+    except ATPError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/check-order", response_model=ATPOrderOut)
+async def check_order(
+    order_in: ATPOrderIn,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Every line of an order against the same timelines, with the date the whole order can ship."""
+    try:
+        return await atp.check_order(db, order_in)
+    except ATPError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/reservations", response_model=StockMovementOut, status_code=status.HTTP_201_CREATED)
+async def reserve(
+    reservation_in: ReservationCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Commit stock to an order on its promise date."""
+    try:
+        return await crud.create_reservation(db, reservation_in, user=current_user.name or current_user.email)
+    except StockError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
@@ -0,0 +1,123 @@
+# app/api/v1/sales/billing.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.sales.billing as crud
+import app.services.sales.billing as billing
+from app.crud.sales.billing import BillingError
+from app.schemas.sales.billing import BillingRunCreate, BillingRunOut, SalesInvoiceOut
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.billing import BillingOutput, BillingRun, BillingRunStatus, SalesInvoice
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/sales/invoice", tags=["Sales Invoicing"])
+
+
+async def _run(db: AsyncSession, run_id: int) -> BillingRun:
+    run = await crud.run_repo.get(db, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Billing run not found")
+    return run
+
+
+@router.post("/runs", response_model=BillingRunOut, status_code=status.HTTP_202_ACCEPTED)
+async def create_run(
+    run_in: BillingRunCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Queues a run billing every open/delivered order up to ``billing_date``; poll until ``completed``."""
+    try:
+        run = await crud.create_run(db, run_in, user=current_user.name or current_user.email)
+    except BillingError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    await billing.enqueue(redis, run.id)
+    return run
+
+
+@router.get("/runs", response_model=List[BillingRunOut])
+async def list_runs(
+    response: Response,
+    run_status: Optional[BillingRunStatus] = Query(None, alias="status"),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.run_list_query(run_status), [BillingRun.id], page, response, descending=True)
+
+
+@router.get("/runs/{run_id}", response_model=BillingRunOut)
+async def get_run(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await _run(db, run_id)
+
+
+@router.post("/runs/{run_id}/retry", response_model=BillingRunOut, status_code=status.HTTP_202_ACCEPTED)
+async def retry_run(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """A failed run bills again if its billing rolled back, otherwise only renders again."""
+    try:
+        run = await crud.retry_run(db, await _run(db, run_id))
+    except BillingError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    await billing.enqueue(redis, run.id)
+    return run
+
+
+@router.get("/runs/{run_id}/invoices", response_model=List[SalesInvoiceOut])
+async def list_run_invoices(
+    run_id: int,
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.invoice_list_query(run_id), [SalesInvoice.id], page, response)
+
+
+@router.get("/runs/{run_id}/archive")
+async def download_archive(
+    run_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Every invoice PDF of a completed ``zip`` run, streamed from local storage."""
+    run = await _run(db, run_id)
+    if run.status != BillingRunStatus.completed:
+        raise HTTPException(status_code=409, detail=f"Billing run is {run.status.value}")
+    if run.output != BillingOutput.zip:
+        raise HTTPException(status_code=409, detail=f"Billing run wrote files to {run.output_path}")
+    path = billing.run_path(run)
+    if not path.exists():
+        raise HTTPException(status_code=410, detail="Billing run archive is no longer available")
+    return FileResponse(path, media_type="application/zip", filename=path.name)
+
+
+@router.get("/invoices/{invoice_id}/pdf")
+async def get_invoice_pdf(
+    invoice_id: int,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """One invoice rendered on request (reprints; same template as the runs)."""
+    rendered = await billing.render_invoice(db, invoice_id)
+    if rendered is None:
+        raise HTTPException(status_code=404, detail="Invoice not found")
+    number, pdf = rendered
+    return Response(
+        content=pdf, media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{number}.pdf"'},
+    )
@@ -0,0 +1,114 @@
+# app/api/v1/sales/credit.py
+from decimal import Decimal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.sales.master as master_crud
+import app.services.sales.analytics as analytics
+import app.services.sales.credit as credit
+import app.services.sales.output as output
+from app.services.sales.credit import CreditError
+from app.schemas.sales.credit import (
+    CreditCheck, CreditLimitIn, CreditPosition, CreditSummary, RebuildResult, ReleaseResult,
+)
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_superadmin, get_current_user
+from app.models.user import User
+from app.models.sales.credit import CreditExposure
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/sales/credit", tags=["Credit Management"])
+
+
+@router.get("/summary", response_model=CreditSummary)
+async def get_summary(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Overview tiles of the credit page, from the exposure table."""
+    return await credit.summary(db)
+
+
+@router.get("/exposures", response_model=List[CreditPosition])
+async def list_exposures(
+    response: Response,
+    over_limit: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    rows = await paginate(
+        db, credit.exposure_list_query(over_limit), [CreditExposure.customer_id], page, response
+    )
+    return await credit.positions(db, rows)
+
+
+@router.get("/customers/{customer_id}", response_model=CreditPosition)
+async def get_position(
+    customer_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Exposure, rolling payment days and risk score of one customer."""
+    try:
+        return await credit.position(db, customer_id)
+    except CreditError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+@router.get("/customers/{customer_id}/check", response_model=CreditCheck)
+async def check_credit(
+    customer_id: int,
+    amount: Decimal = Query(..., ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await credit.check_credit(db, customer_id, amount)
+    except CreditError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
+@router.put("/customers/{customer_id}/limit", response_model=CreditPosition)
+async def set_credit_limit(
+    customer_id: int,
+    limit_in: CreditLimitIn,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """New limit; held orders of the customer that now fit are released right away."""
+    customer = await master_crud.customer_repo.get(db, customer_id)
+    if not customer:
+        raise HTTPException(status_code=404, detail="Customer not found")
+    await master_crud.update_credit_limit(db, customer, limit_in.credit_limit)
+    if (await credit.release_blocked(db, [customer_id])).released:
+        await analytics.invalidate(redis)
+        await output.enqueue_scheduled(redis, db)
+    return await credit.position(db, customer_id)
+
+
+@router.post("/release", response_model=ReleaseResult)
+async def release_blocked(
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Bulk job: release every held order that fits its customer's headroom, oldest first."""
+    result = await credit.release_blocked(db)
+    if result.released:
+        # Status counts change in every month the released orders fall in
+        await analytics.invalidate(redis)
+        await output.enqueue_scheduled(redis, db)
+    return result
+
+
+@router.post("/exposures/rebuild", response_model=RebuildResult)
+async def rebuild_exposures(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_superadmin)
+):
+    """Recompute open orders and receivables from the documents (repair / first load)."""
+    return await credit.rebuild_exposures(db)
@@ -0,0 +1,63 @@
+# app/api/v1/sales/master.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.sales.master as crud
+from app.schemas.sales.master import CustomerCreate, CustomerOut, ProductCreate, ProductOut
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.master import Customer, Product
+from app.api.pagination import PageParams, page_params, paginate
+
+# Each under the RBAC module that maintains it
+customers_router = APIRouter(prefix="/sales/cm", tags=["Customers"])
+products_router = APIRouter(prefix="/inventory", tags=["Products"])
+
+
+@customers_router.post("/customers", response_model=CustomerOut, status_code=status.HTTP_201_CREATED)
+async def create_customer(
+    customer_in: CustomerCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_customer(db, customer_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Customer code already exists")
+
+
+@customers_router.get("/customers", response_model=List[CustomerOut])
+async def list_customers(
+    response: Response,
+    customer_group: Optional[str] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.customer_list_query(customer_group), [Customer.id], page, response)
+
+
+@products_router.post("/products", response_model=ProductOut, status_code=status.HTTP_201_CREATED)
+async def create_product(
+    product_in: ProductCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_product(db, product_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Product SKU already exists")
+
+
+@products_router.get("/products", response_model=List[ProductOut])
+async def list_products(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.product_list_query(), [Product.id], page, response)
@@ -0,0 +1,85 @@
+# app/api/v1/sales/orders.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.sales.orders as crud
+import app.services.sales.analytics as analytics
+import app.services.sales.output as output
+from app.crud.sales.orders import OrderError
+from app.schemas.sales.orders import SalesOrderCreate, SalesOrderDetail, SalesOrderOut
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.orders import SalesOrder, SalesOrderStatus
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/sales/orders", tags=["Sales Orders"])
+
+
+@router.post("", response_model=SalesOrderOut, status_code=status.HTTP_201_CREATED)
+async def create_order(
+    order_in: SalesOrderCreate,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Saved ``open``, or ``credit_hold`` when it would exceed the customer's
+    credit limit. The order confirmation is only queued; the output worker
+    sends it.
+    """
+    try:
+        order = await crud.create_order(db, order_in, user=current_user.name or current_user.email)
+    except OrderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    await analytics.invalidate(redis, [order.order_date])
+    await output.enqueue_scheduled(redis, db)
+    return order
+
+
+@router.get("", response_model=List[SalesOrderOut])
+async def list_orders(
+    response: Response,
+    order_status: Optional[SalesOrderStatus] = Query(None, alias="status"),
+    customer_id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = crud.order_list_query(order_status, customer_id)
+    return await paginate(db, query, [SalesOrder.id], page, response, descending=True)
+
+
+@router.get("/{order_id}", response_model=SalesOrderDetail)
+async def get_order(
+    order_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    order = await crud.order_repo.get(db, order_id)
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    return SalesOrderDetail(
+        **SalesOrderOut.model_validate(order).model_dump(),
+        lines=await crud.get_lines(db, order_id),
+    )
+
+
+@router.post("/{order_id}/cancel", response_model=SalesOrderOut)
+async def cancel_order(
+    order_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        order = await crud.cancel_order(db, order_id)
+    except OrderError as exc:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(exc))
+    if not order:
+        raise HTTPException(status_code=404, detail="Order not found")
+    await analytics.invalidate(redis, [order.order_date])
+    return order
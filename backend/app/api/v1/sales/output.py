@@ -0,0 +1,112 @@
+# app/api/v1/sales/output.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from redis.asyncio import Redis
+import app.crud.sales.output as crud
+import app.services.sales.output as output
+from app.crud.sales.output import OutputError
+from app.schemas.sales.output import OutputConditionCreate, OutputConditionOut, OutputJobOut, OutputQueueStats
+from app.db.session import get_db, get_read_db
+from app.core.redis import get_redis
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.output import OutputCondition, OutputJob, OutputJobStatus, OutputType
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/sales/output", tags=["Output Determination"])
+
+
+# ------------------------------------------------------------------
+# Conditions
+# ------------------------------------------------------------------
+@router.post("/conditions", response_model=OutputConditionOut, status_code=status.HTTP_201_CREATED)
+async def create_condition(
+    condition_in: OutputConditionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Applies to documents saved from now on; existing documents keep their jobs."""
+    return await crud.create_condition(db, condition_in)
+
+
+@router.get("/conditions", response_model=List[OutputConditionOut])
+async def list_conditions(
+    response: Response,
+    output_type: Optional[OutputType] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = crud.condition_list_query(output_type, is_active)
+    return await paginate(db, query, [OutputCondition.id], page, response)
+
+
+@router.put("/conditions/{condition_id}", response_model=OutputConditionOut)
+async def update_condition(
+    condition_id: int,
+    condition_in: OutputConditionCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    condition = await crud.update_condition(db, condition_id, condition_in)
+    if not condition:
+        raise HTTPException(status_code=404, detail="Output condition not found")
+    return condition
+
+
+@router.delete("/conditions/{condition_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_condition(
+    condition_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    if not await crud.delete_condition(db, condition_id):
+        raise HTTPException(status_code=404, detail="Output condition not found")
+
+
+# ------------------------------------------------------------------
+# Jobs
+# ------------------------------------------------------------------
+@router.get("/jobs", response_model=List[OutputJobOut])
+async def list_jobs(
+    response: Response,
+    job_status: Optional[OutputJobStatus] = Query(None, alias="status"),
+    output_type: Optional[OutputType] = Query(None),
+    document_id: Optional[int] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    query = crud.job_list_query(job_status, output_type, document_id)
+    return await paginate(db, query, [OutputJob.id], page, response, descending=True)
+
+
+@router.post("/jobs/{job_id}/retry", response_model=OutputJobOut, status_code=status.HTTP_202_ACCEPTED)
+async def retry_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """A failed job goes back on the queue with a fresh set of attempts."""
+    job = await crud.job_repo.get(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Output job not found")
+    try:
+        job = await crud.retry_job(db, job)
+    except OutputError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    await output.enqueue(redis, [job.id])
+    return job
+
+
+@router.get("/queue", response_model=OutputQueueStats)
+async def get_queue(
+    db: AsyncSession = Depends(get_read_db),
+    redis: Redis = Depends(get_redis),
+    current_user: User = Depends(get_current_user)
+):
+    """Queue length, pending retries and jobs by status."""
+    return await output.queue_stats(db, redis)
@@ -0,0 +1,145 @@
+# app/api/v1/sales/pricing.py
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+import app.crud.sales.pricing as crud
+import app.services.sales.pricing as pricing
+from app.services.sales.pricing import PricingError
+from app.schemas.sales.pricing import (
+    DiscountSchemeCreate, DiscountSchemeOut, PricingRuleCreate, PricingRuleOut, Quote, QuoteIn, SimulationIn,
+    SimulationOut,
+)
+from app.db.session import get_db, get_read_db
+from app.api.deps import get_current_user
+from app.models.user import User
+from app.models.sales.pricing import DiscountScheme, PricingRule
+from app.api.pagination import PageParams, page_params, paginate
+
+router = APIRouter(prefix="/sales/pricing", tags=["Pricing"])
+
+
+# ------------------------------------------------------------------
+# Pricing rules
+# ------------------------------------------------------------------
+@router.post("/rules", response_model=PricingRuleOut, status_code=status.HTTP_201_CREATED)
+async def create_rule(
+    rule_in: PricingRuleCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_rule(db, rule_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Pricing rule code already exists")
+
+
+@router.get("/rules", response_model=List[PricingRuleOut])
+async def list_rules(
+    response: Response,
+    is_active: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.rule_list_query(is_active), [PricingRule.id], page, response)
+
+
+@router.put("/rules/{rule_id}", response_model=PricingRuleOut)
+async def update_rule(
+    rule_id: int,
+    rule_in: PricingRuleCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        rule = await crud.update_rule(db, rule_id, rule_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Pricing rule code already exists")
+    if not rule:
+        raise HTTPException(status_code=404, detail="Pricing rule not found")
+    return rule
+
+
+@router.delete("/rules/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_rule(rule_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if not await crud.delete_rule(db, rule_id):
+        raise HTTPException(status_code=404, detail="Pricing rule not found")
+
+
+# ------------------------------------------------------------------
+# Discount schemes
+# ------------------------------------------------------------------
+@router.post("/schemes", response_model=DiscountSchemeOut, status_code=status.HTTP_201_CREATED)
+async def create_scheme(
+    scheme_in: DiscountSchemeCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        return await crud.create_scheme(db, scheme_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Discount scheme code already exists")
+
+
+@router.get("/schemes", response_model=List[DiscountSchemeOut])
+async def list_schemes(
+    response: Response,
+    is_active: Optional[bool] = Query(None),
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    return await paginate(db, crud.scheme_list_query(is_active), [DiscountScheme.id], page, response)
+
+
+@router.put("/schemes/{scheme_id}", response_model=DiscountSchemeOut)
+async def update_scheme(
+    scheme_id: int,
+    scheme_in: DiscountSchemeCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    try:
+        scheme = await crud.update_scheme(db, scheme_id, scheme_in)
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Discount scheme code already exists")
+    if not scheme:
+        raise HTTPException(status_code=404, detail="Discount scheme not found")
+    return scheme
+
+
+@router.delete("/schemes/{scheme_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_scheme(scheme_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    if not await crud.delete_scheme(db, scheme_id):
+        raise HTTPException(status_code=404, detail="Discount scheme not found")
+
+
+# ------------------------------------------------------------------
+# Quotes and simulation
+# ------------------------------------------------------------------
+@router.post("/quote", response_model=Quote)
+async def quote(
+    quote_in: QuoteIn,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Net prices of a whole order: winning rule, then stacked discounts, per line."""
+    try:
+        return await pricing.quote(db, quote_in)
+    except PricingError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+@router.post("/simulate", response_model=SimulationOut)
+async def simulate(
+    simulation_in: SimulationIn,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Independent cases in one call; a bad case carries an ``error`` instead of failing the batch."""
+    return await pricing.simulate(db, simulation_in)
@@ -1,27 +1,36 @@
-from fastapi import APIRouter, Depends
-from sqlmodel import select
-from app.models.user import User, UserCreate
-from app.db.session import get_session
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas.user import UserCreate
+from app.crud import user as user_crud
+from app.db.session import get_db, get_read_db
 from app.services.rbac import enforce_access
 from app.api.deps import get_current_user
-from app.core.security import get_password_hash
+from app.utils.hashing import password_hasher
+from app.api.pagination import PageParams, page_params, paginate, stream_json
+from app.models.user import User
+from app.schemas.user import UserOut
 
 router = APIRouter(prefix="/settings", tags=["settings"])
 
 @router.get("/users")
-def list_users(db=Depends(get_session), user=Depends(get_current_user)):
+async def list_users(
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
+    user=Depends(get_current_user),
+):
     enforce_access(user.role, "/settings")
-    return db.exec(select(User)).all()
+    if page.stream:
+        return stream_json(
+            user_crud.list_query(), [User.id], page,
+            lambda u: UserOut.model_validate(u).model_dump_json(),
+        )
+    return await paginate(db, user_crud.list_query(), [User.id], page, response)
 
 @router.post("/users")
-def create_user(user_in: UserCreate, db=Depends(get_session), user=Depends(get_current_user)):
+async def create_user(user_in: UserCreate, db: AsyncSession = Depends(get_db), user=Depends(get_current_user)):
     enforce_access(user.role, "/settings")
-    existing = db.exec(select(User).where(User.email == user_in.email)).first()
-    if existing:
+    if await user_crud.get_by_email(db, user_in.email):
         raise HTTPException(status_code=400, detail="Email already exists")
-    hashed = get_password_hash(user_in.password)
-    new_user = User(**user_in.dict(exclude={"password"}), hashed_password=hashed)
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
\ No newline at end of file
+    hashed = await password_hasher.hash(user_in.password)
+    return await user_crud.create(db, user_in, hashed)
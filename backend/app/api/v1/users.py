@@ -1,30 +1,37 @@
 # app/api/v1/users.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.session import get_db  # <-- Use get_db, NOT get_session
+from app.db.session import get_db, get_read_db  # <-- Use get_db, NOT get_session
 from app.api.deps import get_current_user ,get_current_superadmin # <-- Must be async
 from app.models.user import User
 from app.schemas.user import UserOut, UserCreate, UserUpdate
 from typing import List
-from sqlalchemy import select
-from passlib.context import CryptContext
-from app.constants.roles import ROLES
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.crud import user as user_crud
+from app.api.pagination import PageParams, page_params, paginate, stream_json
+from app.core.redis import get_redis
+from app.core.principal_cache import invalidate_principal
+from app.utils.hashing import password_hasher
+from redis.asyncio import Redis
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+def _user_json(user: User) -> str:
+    return UserOut.model_validate(user).model_dump_json()
+
 @router.get("/me",response_model=UserOut)
 async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
         
 @router.get("/", response_model=List[UserOut])
 async def get_all_users(
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_superadmin)
 ):
-    result = await db.execute(select(User))
-    return result.scalars().all()
+    if page.stream:
+        return stream_json(user_crud.list_query(), [User.id], page, _user_json)
+    return await paginate(db, user_crud.list_query(), [User.id], page, response)
 
 @router.post("/", response_model=UserOut)
 async def create_user(
@@ -33,65 +40,46 @@ async def create_user(
     current_user: User = Depends(get_current_superadmin)
 ):
     # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_in.email))
-    if result.scalar_one_or_none():
+    if await user_crud.get_by_email(db, user_in.email):
         raise HTTPException(400, "Email already registered")
 
-    hashed_password = pwd_context.hash(user_in.password)
-    new_user = User(
-        email=user_in.email,
-        name=user_in.name,
-        hashed_password=hashed_password,
-        role=ROLES(user_in.role),
-        is_superadmin=user_in.is_superadmin
-    )
-    db.add(new_user)
-    await db.commit()
-    await db.refresh(new_user)
-    return new_user
+    hashed_password = await password_hasher.hash(user_in.password)
+    return await user_crud.create(db, user_in, hashed_password)
 
 @router.put("/{user_id}", response_model=UserOut)
 async def update_user(
     user_id: int,
     user_in: UserUpdate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user: User = Depends(get_current_superadmin)
 ):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await user_crud.get(db, user_id)
     if not user:
         raise HTTPException(404, "User not found")
 
-    # Update fields
-    if user_in.name is not None:
-        user.name = user_in.name
-    if user_in.email is not None:
-        user.email = user_in.email
-    if user_in.role is not None:
-        user.role = ROLES(user_in.role)  # ← Convert int to Enum
+    hashed_password = None
     if user_in.password is not None:
-        user.hashed_password = pwd_context.hash(user_in.password)
-    if user_in.is_superadmin is not None:
-        user.is_superadmin = user_in.is_superadmin
+        hashed_password = await password_hasher.hash(user_in.password)
 
-    await db.commit()
-    await db.refresh(user)
+    user = await user_crud.update_user(db, user, user_in, hashed_password)
+    await invalidate_principal(redis, user_id)
     return user
 
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: int,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
     current_user: User = Depends(get_current_superadmin)
 ):
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    user = await user_crud.get(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     if user.id == current_user.id:
         raise HTTPException(status_code=400, detail="You cannot delete yourself!")
 
-    await db.delete(user)
-    await db.commit()
+    await user_crud.delete(db, user)
+    await invalidate_principal(redis, user_id)
     return {"detail": "User deleted successfully"}    
\ No newline at end of file
@@ -11,11 +11,16 @@ MODULE_ACCESS = {
     "/inventory/suppliers": [ROLES.SUPER_ADMIN, ROLES.INVENTORY_MANAGER],
     "/inventory/reports": [ROLES.SUPER_ADMIN, ROLES.INVENTORY_MANAGER],
     "/sales/cm": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
+    "/sales/pricing": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
+    "/sales/pricing/quote": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER, ROLES.SALES_REP],
     "/sales/orders": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER, ROLES.SALES_REP],
+    "/sales/atp": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER, ROLES.SALES_REP],
     "/sales/shipping": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
     "/sales/invoice": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
     "/sales/analytics": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
+    "/sales/credit": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER, ROLES.FINANCE_MANAGER],
     "/sales/returns": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_REP],
+    "/sales/output": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.SALES_MANAGER],
     "/crm/cm": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.CRM_MANAGER],
     "/crm/leads": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.CRM_MANAGER, ROLES.SALES_REP],
     "/crm/customer-support": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.CRM_MANAGER],
@@ -30,12 +35,14 @@ MODULE_ACCESS = {
     "/finance/ledger": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/ap": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/ar": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
+    "/finance/bank": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/fam": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/bf": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/co": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/fscm": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/taxcomp": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/finance/reports": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
+    "/finance/close": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.FINANCE_MANAGER],
     "/quality/iqc": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.QUALITY_MANAGER],
     "/quality/ipqc": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.QUALITY_MANAGER],
     "/quality/fqc": [ROLES.SUPER_ADMIN, ROLES.ADMIN, ROLES.QUALITY_MANAGER],
@@ -1,7 +1,7 @@
 # app/core/config.py
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import Literal
+from typing import Literal, Optional
 
 class Settings(BaseSettings):
     # ──────────────────────────────────────────────────────────────
@@ -24,19 +24,248 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
 
     # Optional: Use async driver
-    DATABASE_DRIVER: Literal["psycopg"] 
+    DATABASE_DRIVER: Literal["psycopg", "asyncpg"]
+
+    # Full SQLAlchemy URL that replaces the POSTGRES_* settings
+    # (e.g. sqlite+aiosqlite:///bench.db for the benchmark stand-in)
+    DATABASE_URL_OVERRIDE: Optional[str] = None
+
+    # Read replica for list/report endpoints (unset → primary)
+    POSTGRES_READ_HOST: Optional[str] = None
+    POSTGRES_READ_PORT: Optional[int] = None
+
+    # ──────────────────────────────────────────────────────────────
+    # Connection pools
+    # ──────────────────────────────────────────────────────────────
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_READ_POOL_SIZE: int = 10
+    DB_READ_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Prepared statements cached per connection; 0 disables them
+    # (required behind PgBouncer in transaction mode)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # psycopg only: executions of a query before it gets prepared
+    DB_PREPARE_THRESHOLD: int = 5
+
+    # ──────────────────────────────────────────────────────────────
+    # Startup
+    # ──────────────────────────────────────────────────────────────
+    # check: verify Alembic head only | create: create missing tables
+    # recreate: drop + create everything (local dev only)
+    STARTUP_SCHEMA_MODE: Literal["check", "create", "recreate"] = "check"
+    SEED_DEFAULT_USERS: bool = True
+
+    # ──────────────────────────────────────────────────────────────
+    # Principal cache (get_current_user hot path)
+    # ──────────────────────────────────────────────────────────────
+    # Redis tier: serialized user under "user:{id}"
+    USER_CACHE_TTL_SECONDS: int = 1800
+    # In-process tier: 0 disables it (every request goes to Redis)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    PRINCIPAL_INVALIDATION_CHANNEL: str = "user:invalidate"
+
+    # ──────────────────────────────────────────────────────────────
+    # Password hashing (bcrypt off the event loop)
+    # ──────────────────────────────────────────────────────────────
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    # Requests allowed to wait for a worker before we answer 503
+    PASSWORD_HASH_QUEUE_DEPTH: int = 64
+    PASSWORD_HASH_RETRY_AFTER_SECONDS: int = 2
+
+    # ──────────────────────────────────────────────────────────────
+    # Redis
+    # ──────────────────────────────────────────────────────────────
+    REDIS_HOST: str = "localhost"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_CONNECT_TIMEOUT_SECONDS: float = 0.5
+
+    # ──────────────────────────────────────────────────────────────
+    # Rate limiting (sliding window in Redis, local token bucket fallback)
+    # ──────────────────────────────────────────────────────────────
+    # Disable only for load tests
+    RATE_LIMIT_ENABLED: bool = True
+    # Give up on Redis after this long and decide locally
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.05
+    # After a Redis failure, stay on the local bucket this long
+    RATE_LIMIT_FALLBACK_SECONDS: float = 5
+    # /auth/login: per (account, IP) pair, per account (email) and per client IP
+    LOGIN_RATE_LIMIT_PER_ACCOUNT_IP: int = 5
+    LOGIN_RATE_LIMIT_PER_ACCOUNT: int = 50
+    LOGIN_RATE_LIMIT_PER_IP: int = 100
+    LOGIN_RATE_LIMIT_WINDOW_SECONDS: int = 900
+
+    # ──────────────────────────────────────────────────────────────
+    # Document numbering (PR/PO/GRN/INV/JE)
+    # ──────────────────────────────────────────────────────────────
+    # Numbers reserved per worker per round trip; unused ones are skipped
+    DOCUMENT_NUMBER_BLOCK_SIZE: int = 20
+
+    # ──────────────────────────────────────────────────────────────
+    # Report cache (financial statements of closed periods)
+    # ──────────────────────────────────────────────────────────────
+    # Entries are dropped by tag on back-dated postings; the TTL only
+    # bounds staleness if an invalidation is missed
+    REPORT_CACHE_TTL_SECONDS: int = 86_400
+
+    # ──────────────────────────────────────────────────────────────
+    # AR/AP aging
+    # ──────────────────────────────────────────────────────────────
+    # Nightly snapshots older than this are pruned
+    AGING_SNAPSHOT_RETENTION_DAYS: int = 90
+
+    # ──────────────────────────────────────────────────────────────
+    # Depreciation runs (fixed asset register)
+    # ──────────────────────────────────────────────────────────────
+    # Registers up to this many assets are computed in-process; larger
+    # ones are split into chunks of this size across the process pool
+    DEPRECIATION_CHUNK_SIZE: int = 50_000
+    DEPRECIATION_WORKERS: int = 4
+
+    # ──────────────────────────────────────────────────────────────
+    # Tax returns (GST/VAT files; worker: python -m app.services.finance.tax_returns)
+    # ──────────────────────────────────────────────────────────────
+    # Generated files; relative paths resolve against the working directory
+    TAX_RETURN_DIR: str = "var/tax_returns"
+    # Invoice tax lines fetched per server-side cursor round trip
+    TAX_RETURN_BATCH_SIZE: int = 5000
+    # Lock held by the worker on a return, renewed every third of this; a
+    # return left running without it is failed by the sweep and can be retried
+    TAX_RETURN_LOCK_TTL_SECONDS: int = 60
+    TAX_RETURN_SWEEP_SECONDS: int = 60
+
+    # ──────────────────────────────────────────────────────────────
+    # Budgets & forecasting
+    # ──────────────────────────────────────────────────────────────
+    # Actuals loaded before a budget's first month for the forecasts
+    BUDGET_HISTORY_MONTHS: int = 12
+    # Budget cubes (NumPy matrices) kept in memory per worker
+    BUDGET_CUBE_CACHE_SIZE: int = 8
+
+    # ──────────────────────────────────────────────────────────────
+    # Period close (worker: python -m app.services.finance.period_close)
+    # ──────────────────────────────────────────────────────────────
+    # Run lock held by the worker; renewed every third of this while
+    # running, so a crashed worker frees the run for a resume this fast
+    CLOSE_LOCK_TTL_SECONDS: int = 60
+    # Progress events (Redis stream per run) are kept this long
+    CLOSE_EVENT_TTL_SECONDS: int = 604_800
+
+    # ──────────────────────────────────────────────────────────────
+    # Pricing (compiled price books)
+    # ──────────────────────────────────────────────────────────────
+    # Books kept per worker, one per (pricing version, pricing date)
+    PRICE_BOOK_CACHE_SIZE: int = 4
+    # Resolved (customer group, product, list price) slots per book
+    PRICE_RESOLUTION_CACHE_SIZE: int = 100_000
+
+    # ──────────────────────────────────────────────────────────────
+    # Available to promise (stock timelines)
+    # ──────────────────────────────────────────────────────────────
+    # Product timelines kept in memory per worker
+    ATP_TIMELINE_CACHE_SIZE: int = 50_000
+    # Movement ids skipped by the ledger (still uncommitted, or rolled
+    # back) are looked for again this long
+    ATP_GAP_RETRY_SECONDS: float = 60
+
+    # ──────────────────────────────────────────────────────────────
+    # Credit management
+    # ──────────────────────────────────────────────────────────────
+    # Average payment days: plain mean over a customer's first payments,
+    # then an exponential average spanning about this many payments
+    CREDIT_PAYMENT_DAYS_WINDOW: int = 20
+
+    # ──────────────────────────────────────────────────────────────
+    # Sales analytics (dashboard over the order rollups)
+    # ──────────────────────────────────────────────────────────────
+    # Cached dashboards are dropped by month tag when orders post; the
+    # TTL only bounds staleness if an invalidation is missed
+    SALES_ANALYTICS_CACHE_TTL_SECONDS: int = 3600
+
+    # ──────────────────────────────────────────────────────────────
+    # Billing runs (worker: python -m app.services.sales.billing)
+    # ──────────────────────────────────────────────────────────────
+    # Run archives / directories; relative paths resolve against the working directory
+    BILLING_OUTPUT_DIR: str = "var/invoices"
+    BILLING_PAYMENT_TERMS_DAYS: int = 30
+    # Orders per insert / status update statement
+    BILLING_BATCH_SIZE: int = 5000
+    # Invoices per pool task; runs up to this size render in-process
+    BILLING_RENDER_CHUNK: int = 500
+    BILLING_WORKERS: int = 4
+    # Letterhead printed on every invoice
+    BILLING_COMPANY_NAME: str = "NextGen LEDGER"
+    BILLING_COMPANY_ADDRESS: str = ""
+    # Run lock held by the worker, renewed every third of this; a run
+    # left running without it is failed by the sweep (retry resumes it)
+    BILLING_LOCK_TTL_SECONDS: int = 60
+    BILLING_SWEEP_SECONDS: int = 60
+
+    # ──────────────────────────────────────────────────────────────
+    # Document output (worker: python -m app.services.sales.output)
+    # ──────────────────────────────────────────────────────────────
+    # Files channel and the local mail sink write below this directory
+    OUTPUT_DIR: str = "var/output"
+    # smtp: send via OUTPUT_SMTP_*; file: write .eml files to OUTPUT_DIR/mail (local testing)
+    OUTPUT_EMAIL_SINK: Literal["smtp", "file"] = "file"
+    OUTPUT_SMTP_HOST: str = "localhost"
+    OUTPUT_SMTP_PORT: int = 1025
+    OUTPUT_SMTP_USER: Optional[str] = None
+    OUTPUT_SMTP_PASSWORD: Optional[str] = None
+    OUTPUT_SMTP_STARTTLS: bool = False
+    OUTPUT_SENDER: str = "noreply@nextgen-ledger.local"
+    # Jobs taken from the queue per batch (one SMTP connection each)
+    OUTPUT_BATCH_SIZE: int = 100
+    # Failed sends are retried after 30s, 60s, 120s … up to this many attempts
+    OUTPUT_MAX_ATTEMPTS: int = 5
+    OUTPUT_RETRY_BASE_SECONDS: int = 30
+    # Jobs queued longer than this and missing from the queue are pushed
+    # again (lost queue entries); the worker checks this often
+    OUTPUT_SWEEP_SECONDS: int = 300
+    # A worker's claim on a batch; renewed every third of it while the
+    # batch runs, so only a crashed or hung worker's jobs expire and are swept
+    OUTPUT_LEASE_SECONDS: int = 120
 
     # ──────────────────────────────────────────────────────────────
     # Computed SQLAlchemy URL (SQLModel uses this name)
     # ──────────────────────────────────────────────────────────────
-    @property
-    def DATABASE_URL(self) -> str:
+    def _postgres_url(self, driver: str, host: str, port: int) -> str:
         return (
-            f"postgresql+{self.DATABASE_DRIVER}://"
+            f"postgresql+{driver}://"
             f"{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"
-            f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+            f"@{host}:{port}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def DATABASE_URL(self) -> str:
+        if self.DATABASE_URL_OVERRIDE:
+            return self.DATABASE_URL_OVERRIDE
+        return self._postgres_url(self.DATABASE_DRIVER, self.POSTGRES_HOST, self.POSTGRES_PORT)
+
+    @property
+    def READ_DATABASE_URL(self) -> str:
+        if self.DATABASE_URL_OVERRIDE:
+            return self.DATABASE_URL_OVERRIDE
+        return self._postgres_url(
+            self.DATABASE_DRIVER,
+            self.POSTGRES_READ_HOST or self.POSTGRES_HOST,
+            self.POSTGRES_READ_PORT or self.POSTGRES_PORT,
+        )
+
+    @property
+    def HAS_READ_REPLICA(self) -> bool:
+        return self.READ_DATABASE_URL != self.DATABASE_URL
+
+    # Alembic runs synchronously – psycopg works for both, asyncpg does not
+    @property
+    def DATABASE_URL_SYNC(self) -> str:
+        return self._postgres_url("psycopg", self.POSTGRES_HOST, self.POSTGRES_PORT)
+
     class Config:
         env_file = ".env"
         case_sensitive = False
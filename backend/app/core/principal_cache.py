@@ -0,0 +1,223 @@
+# app/core/principal_cache.py
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def user_version_key(user_id: int) -> str:
+    return f"user:{user_id}:v"
+
+
+# Write the Redis copy only if no invalidation bumped the version since the
+# loader read it; otherwise a slow load would restore the pre-update user.
+SET_IF_CURRENT_LUA = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('SETEX', KEYS[1], ARGV[2], ARGV[3])
+return 1
+"""
+
+
+# ------------------------------------------------------------------
+# 1. In-process LRU/TTL tier
+# ------------------------------------------------------------------
+class PrincipalCache:
+    """
+    Per-process cache of authenticated users, in front of Redis.
+
+    Entries expire after ``ttl_seconds`` even without an invalidation
+    message, so a missed pub/sub event only leaves a bounded stale window.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple[float, Any]]" = OrderedDict()
+        # Bumped on every invalidation; a load that started before an
+        # invalidation must not repopulate the cache with its stale result.
+        self._version = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.redis_hits = 0
+        self.db_loads = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, user_id: int) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(user_id)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, principal = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(user_id, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return principal
+
+    def set(self, user_id: int, principal: Any, version: int) -> None:
+        if not self.enabled or version != self._version:
+            return
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, principal)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, user_id: int) -> None:
+        self._version += 1
+        self.invalidations += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._version += 1
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "redis_hits": self.redis_hits,
+            "db_loads": self.db_loads,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+# ------------------------------------------------------------------
+# 2. Loading through both tiers
+# ------------------------------------------------------------------
+async def load_principal(user_id: int, db: AsyncSession, redis: Redis) -> Optional[User]:
+    """
+    Resolve a user from the in-process tier, then Redis, then the database.
+
+    Both tiers are filled only if no invalidation happened since the
+    lookup started, so a concurrent update is never overwritten.
+    """
+    cached_user = principal_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+    version = principal_cache.version
+
+    cache_key, version_key = user_cache_key(user_id), user_version_key(user_id)
+    cached, redis_version = await redis.mget(cache_key, version_key)
+    if cached:
+        principal_cache.redis_hits += 1
+        user = User(**json.loads(cached))
+        principal_cache.set(user_id, user, version)
+        return user
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalars().first()
+    if user is None:
+        return None
+    principal_cache.db_loads += 1
+
+    user_dict = user.dict()
+    await redis.eval(
+        SET_IF_CURRENT_LUA, 2, cache_key, version_key,
+        redis_version or "0", settings.USER_CACHE_TTL_SECONDS, json.dumps(user_dict),
+    )
+    principal_cache.set(user_id, User(**user_dict), version)
+    return user
+
+
+# ------------------------------------------------------------------
+# 3. Cluster-wide invalidation (Redis pub/sub)
+# ------------------------------------------------------------------
+async def invalidate_principal(redis: Redis, user_id: int) -> None:
+    """Drop a user from every tier on every worker (call after update/delete)."""
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.incr(user_version_key(user_id))
+        pipe.delete(user_cache_key(user_id))
+        await pipe.execute()
+    principal_cache.invalidate(user_id)
+    await redis.publish(settings.PRINCIPAL_INVALIDATION_CHANNEL, str(user_id))
+
+
+async def _listen_for_invalidations(redis: Redis) -> None:
+    channel = settings.PRINCIPAL_INVALIDATION_CHANNEL
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(channel)
+            # Messages published while we were not subscribed are lost
+            principal_cache.clear()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                try:
+                    principal_cache.invalidate(int(message["data"]))
+                except (TypeError, ValueError):
+                    principal_cache.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Principal invalidation listener dropped: %s", exc)
+            principal_cache.clear()
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+_listener_task: Optional[asyncio.Task] = None
+
+
+def start_invalidation_listener(redis: Redis) -> None:
+    global _listener_task
+    if principal_cache.enabled and _listener_task is None:
+        _listener_task = asyncio.create_task(_listen_for_invalidations(redis))
+
+
+async def stop_invalidation_listener() -> None:
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    try:
+        await _listener_task
+    except asyncio.CancelledError:
+        pass
+    _listener_task = None
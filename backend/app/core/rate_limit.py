@@ -0,0 +1,240 @@
+# app/core/rate_limit.py
+import asyncio
+import itertools
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal, Optional, Sequence
+
+from fastapi import Depends, Request
+from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+KeyBy = Literal["ip", "account", "ip+account"]
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    key_by: KeyBy
+    limit: int
+    window_seconds: int
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, policy: str, retry_after: int):
+        super().__init__(f"Rate limit '{policy}' exceeded")
+        self.policy = policy
+        self.retry_after = retry_after
+
+
+# ------------------------------------------------------------------
+# 1. Redis: atomic sliding-window log, every rule in one round trip
+# ------------------------------------------------------------------
+# KEYS: one sorted set per rule
+# ARGV: now_ms, member, then limit and window_ms for each key
+# Returns 0 when allowed (and records the hit under every key), otherwise
+# the milliseconds until the tightest window frees a slot.
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[1 + i * 2])
+    local window = tonumber(ARGV[2 + i * 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    if redis.call('ZCARD', key) >= limit then
+        local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+        local wait = tonumber(oldest[2]) + window - now
+        if wait > retry_after then retry_after = wait end
+    end
+end
+if retry_after > 0 then
+    return retry_after
+end
+for i, key in ipairs(KEYS) do
+    redis.call('ZADD', key, now, ARGV[2])
+    redis.call('PEXPIRE', key, ARGV[2 + i * 2])
+end
+return 0
+"""
+
+
+# ------------------------------------------------------------------
+# 2. Local fallback: token bucket per key
+# ------------------------------------------------------------------
+class _TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, capacity: float, now: float):
+        self.tokens = capacity
+        self.updated = now
+
+
+class RateLimiter:
+    """
+    Per-route policies, each a list of rules keyed by IP, account or both.
+
+    Decisions are made in Redis (shared by all workers). If Redis errors or
+    takes longer than ``redis_timeout``, the limiter switches to in-process
+    token buckets for ``fallback_seconds`` – limits then apply per worker.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, Sequence[RateLimitRule]],
+        enabled: bool = True,
+        redis_timeout: float = 0.05,
+        fallback_seconds: float = 5,
+        max_local_keys: int = 100_000,
+    ):
+        self.policies = policies
+        self.enabled = enabled
+        self.redis_timeout = redis_timeout
+        self.fallback_seconds = fallback_seconds
+        self.max_local_keys = max_local_keys
+        self._script = None
+        self._members = itertools.count()
+        self._buckets: "OrderedDict[str, _TokenBucket]" = OrderedDict()
+        self._fallback_until = 0.0
+
+        self.allowed = {name: 0 for name in policies}
+        self.denied = {name: 0 for name in policies}
+        self.local_decisions = 0
+        self.redis_errors = 0
+
+    def _keyed_rules(
+        self, policy: str, ip: str, account: Optional[str]
+    ) -> list[tuple[str, RateLimitRule]]:
+        keyed = []
+        for rule in self.policies[policy]:
+            if rule.key_by == "ip":
+                ident = ip
+            elif account is None:
+                continue
+            elif rule.key_by == "account":
+                ident = account.lower()
+            else:
+                ident = f"{ip}|{account.lower()}"
+            keyed.append((f"rl:{policy}:{rule.key_by}:{ident}", rule))
+        return keyed
+
+    async def _check_redis(self, keyed: list[tuple[str, RateLimitRule]]) -> float:
+        redis = await get_redis()
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_LUA)
+        now_ms = int(time.time() * 1000)
+        args: list = [now_ms, f"{now_ms}:{os.getpid()}:{next(self._members)}"]
+        for _, rule in keyed:
+            args += [rule.limit, rule.window_seconds * 1000]
+        retry_ms = await self._script(keys=[key for key, _ in keyed], args=args)
+        return int(retry_ms) / 1000
+
+    def _check_local(self, keyed: list[tuple[str, RateLimitRule]]) -> float:
+        now = time.monotonic()
+        buckets = []
+        retry_after = 0.0
+        for key, rule in keyed:
+            rate = rule.limit / rule.window_seconds
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _TokenBucket(rule.limit, now)
+                if len(self._buckets) > self.max_local_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+                bucket.tokens = min(rule.limit, bucket.tokens + (now - bucket.updated) * rate)
+                bucket.updated = now
+            if bucket.tokens < 1:
+                retry_after = max(retry_after, (1 - bucket.tokens) / rate)
+            buckets.append(bucket)
+        if retry_after == 0:
+            for bucket in buckets:
+                bucket.tokens -= 1
+        return retry_after
+
+    async def hit(self, policy: str, *, ip: str, account: Optional[str] = None) -> None:
+        """Count one request; raises RateLimitExceeded if any rule is exhausted."""
+        if not self.enabled:
+            return
+        keyed = self._keyed_rules(policy, ip, account)
+        retry_after = None
+        if time.monotonic() >= self._fallback_until:
+            try:
+                retry_after = await asyncio.wait_for(self._check_redis(keyed), self.redis_timeout)
+            except (RedisError, OSError, RuntimeError, asyncio.TimeoutError) as exc:
+                self.redis_errors += 1
+                now = time.monotonic()
+                if now >= self._fallback_until:  # concurrent failures log once
+                    logger.warning("Rate limiter using local buckets for %ss: %r", self.fallback_seconds, exc)
+                self._fallback_until = now + self.fallback_seconds
+        if retry_after is None:
+            self.local_decisions += 1
+            retry_after = self._check_local(keyed)
+
+        if retry_after > 0:
+            self.denied[policy] += 1
+            raise RateLimitExceeded(policy, max(1, math.ceil(retry_after)))
+        self.allowed[policy] += 1
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "backend": "local" if time.monotonic() < self._fallback_until else "redis",
+            "allowed": self.allowed,
+            "denied": self.denied,
+            "local_decisions": self.local_decisions,
+            "redis_errors": self.redis_errors,
+            "local_keys": len(self._buckets),
+        }
+
+
+# ------------------------------------------------------------------
+# 3. Policies, dependency and 429 handler
+# ------------------------------------------------------------------
+RATE_LIMIT_POLICIES: dict[str, list[RateLimitRule]] = {
+    # A whole plant may share one NAT address, so the IP rule is loose. The
+    # strict rule is per (account, IP), so guessing from one address cannot
+    # lock the owner out from theirs; the loose account-wide cap still
+    # bounds a distributed attack on one user.
+    "login": [
+        RateLimitRule("ip+account", settings.LOGIN_RATE_LIMIT_PER_ACCOUNT_IP, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+        RateLimitRule("account", settings.LOGIN_RATE_LIMIT_PER_ACCOUNT, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+        RateLimitRule("ip", settings.LOGIN_RATE_LIMIT_PER_IP, settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS),
+    ],
+}
+
+rate_limiter = RateLimiter(
+    RATE_LIMIT_POLICIES,
+    enabled=settings.RATE_LIMIT_ENABLED,
+    redis_timeout=settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+    fallback_seconds=settings.RATE_LIMIT_FALLBACK_SECONDS,
+)
+
+
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit(policy: str):
+    """Dependency for IP-keyed policies: ``Depends(rate_limit("export"))``."""
+    async def dependency(request: Request) -> None:
+        await rate_limiter.hit(policy, ip=client_ip(request))
+    return Depends(dependency)
+
+
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    return JSONResponse(
+        status_code=429,
+        content={
+            "detail": f"Too many requests. Please try again in {exc.retry_after} seconds.",
+            "retry_after_seconds": exc.retry_after,
+        },
+        headers={"Retry-After": str(exc.retry_after)},
+    )
@@ -1,13 +1,26 @@
 from redis.asyncio import Redis
 from fastapi import Depends
+from app.core.config import settings
 
 redis_client: Redis | None = None
 
 async def init_redis():
     global redis_client
-    redis_client = Redis(host='localhost', port=6379, db=0, decode_responses=True)
+    redis_client = Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        decode_responses=True,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT_SECONDS,
+    )
 
 async def get_redis() -> Redis:
     if redis_client is None:
         raise RuntimeError("Redis client not initialized")
-    return redis_client
\ No newline at end of file
+    return redis_client
+
+async def close_redis():
+    global redis_client
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
@@ -0,0 +1,176 @@
+# app/core/report_cache.py
+import logging
+from typing import Awaitable, Callable, Iterable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# KEYS: n tag sets, then their n generation counters. Bumps each
+# generation, deletes every key listed in the sets, then the sets
+# themselves; returns the number of cached entries dropped. One script so
+# an entry written while we invalidate cannot survive with a lost tag.
+INVALIDATE_TAGS_LUA = """
+local n = #KEYS / 2
+local dropped = 0
+for t = 1, n do
+    redis.call('INCR', KEYS[n + t])
+    local members = redis.call('SMEMBERS', KEYS[t])
+    for i = 1, #members, 500 do
+        dropped = dropped + redis.call('DEL', unpack(members, i, math.min(i + 499, #members)))
+    end
+    redis.call('DEL', KEYS[t])
+end
+return dropped
+"""
+
+# KEYS: the entry, n tag sets, their n generation counters
+# ARGV: value, ttl, then the n generations read before the value was built
+# Stores nothing (returns 0) if any tag was invalidated in the meantime.
+SET_IF_CURRENT_LUA = """
+local n = (#KEYS - 1) / 2
+for t = 1, n do
+    if (redis.call('GET', KEYS[1 + n + t]) or '0') ~= ARGV[2 + t] then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+for t = 1, n do
+    redis.call('SADD', KEYS[1 + t], KEYS[1])
+    redis.call('EXPIRE', KEYS[1 + t], ARGV[2])
+end
+return 1
+"""
+
+
+class TaggedCache:
+    """
+    JSON results in Redis under ``<namespace>:<key>``, each registered in
+    one or more tag sets so a write can drop every result it affects.
+
+    Every tag has a generation counter that invalidation bumps. A result
+    is stored only if the generations of its tags are the ones read before
+    it was built, so a build that raced a posting never lands.
+
+    The cache is best-effort: Redis errors are logged and the caller just
+    recomputes. Entries expire after ``ttl_seconds`` regardless.
+    """
+
+    def __init__(self, namespace: str, ttl_seconds: int):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._script = None
+        self._set_script = None
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def _generation(self, tag: str) -> str:
+        return f"{self.namespace}:gen:{tag}"
+
+    async def get(self, redis: Redis, key: str) -> Optional[str]:
+        try:
+            value = await redis.get(self._key(key))
+        except RedisError as exc:
+            self.errors += 1
+            logger.warning("Report cache read failed: %s", exc)
+            return None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(
+        self, redis: Redis, key: str, value: str, tags: Iterable[str], generations: list[Optional[str]]
+    ) -> bool:
+        """Store ``value`` unless a tag moved past the ``generations`` read before building it."""
+        tags = list(tags)
+        if self._set_script is None:
+            self._set_script = redis.register_script(SET_IF_CURRENT_LUA)
+        try:
+            stored = await self._set_script(
+                keys=[self._key(key), *map(self._tag, tags), *map(self._generation, tags)],
+                args=[value, self.ttl_seconds, *(generation or "0" for generation in generations)],
+                client=redis,
+            )
+        except RedisError as exc:
+            self.errors += 1
+            logger.warning("Report cache write failed: %s", exc)
+            return False
+        return bool(stored)
+
+    async def get_or_set(
+        self, redis: Redis, key: str, tags: Iterable[str], build: Callable[[AsyncSession], Awaitable[str]]
+    ) -> str:
+        """
+        The cached value, or ``build`` run on a primary session and stored.
+        A fill outlives the request, so it never reads a replica that may
+        not have the latest posting yet.
+        """
+        tags = list(tags)
+        generations = None
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.get(self._key(key))
+                pipe.mget([self._generation(tag) for tag in tags])
+                value, generations = await pipe.execute()
+        except RedisError as exc:
+            self.errors += 1
+            logger.warning("Report cache read failed: %s", exc)
+            value = None
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        async with AsyncSessionLocal() as db:
+            value = await build(db)
+        if generations is not None:
+            await self.set(redis, key, value, tags, generations)
+        return value
+
+    async def invalidate(self, redis: Redis, tags: Iterable[str]) -> int:
+        tags = list(tags)
+        if not tags:
+            return 0
+        if self._script is None:
+            self._script = redis.register_script(INVALIDATE_TAGS_LUA)
+        try:
+            dropped = int(await self._script(
+                keys=[*map(self._tag, tags), *map(self._generation, tags)], client=redis,
+            ))
+        except RedisError as exc:
+            self.errors += 1
+            logger.error("Report cache invalidation failed (stale for up to %ss): %s", self.ttl_seconds, exc)
+            return 0
+        self.invalidated += dropped
+        return dropped
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "namespace": self.namespace,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidated": self.invalidated,
+            "errors": self.errors,
+        }
+
+
+report_cache = TaggedCache("report", ttl_seconds=settings.REPORT_CACHE_TTL_SECONDS)
@@ -0,0 +1,59 @@
+# app/core/run_lock.py
+"""
+Redis lock a background worker holds on the one job it is running
+(period close, billing run, tax return). The holder renews it while it
+works, so the lock of a crashed worker expires and its job can be
+recognised as abandoned.
+"""
+import asyncio
+import logging
+import uuid
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+# KEYS: lock, ARGV: token, ttl – renews the lock only while we own it
+RENEW_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS: lock, ARGV: token
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+async def acquire(redis: Redis, key: str, ttl: int) -> Optional[str]:
+    """Our token, or ``None`` when another worker holds the lock."""
+    token = uuid.uuid4().hex
+    return token if await redis.set(key, token, nx=True, ex=ttl) else None
+
+
+async def hold(redis: Redis, key: str, token: str, ttl: int, lost: asyncio.Event) -> None:
+    """Renew every third of ``ttl`` until cancelled; sets ``lost`` once the lock is someone else's."""
+    while True:
+        await asyncio.sleep(ttl / 3)
+        try:
+            renewed = await redis.eval(RENEW_LOCK_LUA, 1, key, token, ttl)
+        except RedisError as exc:
+            logger.warning("Lock %s renewal failed: %s", key, exc)
+            continue
+        if not renewed:
+            lost.set()
+            return
+
+
+async def release(redis: Redis, key: str, token: str, ttl: int) -> None:
+    try:
+        await redis.eval(RELEASE_LOCK_LUA, 1, key, token)
+    except RedisError as exc:
+        logger.warning("Lock %s release failed (expires in %ss): %s", key, ttl, exc)
@@ -21,7 +21,13 @@ oauth2_scheme = OAuth2PasswordBearer(
 # ------------------------------------------------------------------
 # Password context
 # ------------------------------------------------------------------
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto",bcrypt__rounds=12,)
+# Hashes below BCRYPT_ROUNDS are flagged for rehash (see verify_and_update)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+)
 
 # JWT settings
 SECRET_KEY = settings.SECRET_KEY
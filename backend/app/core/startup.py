@@ -0,0 +1,38 @@
+# app/core/startup.py
+import logging
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Wall-clock duration of each startup phase of this worker."""
+
+    def __init__(self):
+        self._started = time.perf_counter()
+        self.phases: dict[str, float] = {}
+        self.total_ms: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - started) * 1000, 2)
+
+    def finish(self) -> None:
+        self.total_ms = round((time.perf_counter() - self._started) * 1000, 2)
+        logger.info(
+            "Startup finished in %.1f ms (%s)",
+            self.total_ms,
+            ", ".join(f"{name}={ms:.1f}ms" for name, ms in self.phases.items()),
+        )
+
+    def stats(self) -> dict:
+        return {"ready": self.total_ms is not None, "total_ms": self.total_ms, "phases": self.phases}
+
+
+startup_timer = StartupTimer()
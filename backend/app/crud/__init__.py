@@ -1,11 +1,14 @@
 # app/crud/__init__.py
-from .user import get_by_username, create, get_all
-from .role import get_role, create_role as create_role
+from .base import AsyncRepository
+from .user import get_by_email, create, get_all
+from .role import get_role, get_by_name, create_role as create_role
 
 __all__ = [
-    "get_by_username",
+    "AsyncRepository",
+    "get_by_email",
     "create",
     "get_all",
+    "get_role",
     "get_by_name",
     "create_role",
-]
\ No newline at end of file
+]
@@ -0,0 +1,120 @@
+# app/crud/base.py
+from typing import Any, Generic, Iterable, List, Optional, Sequence, Type, TypeVar
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+ModelT = TypeVar("ModelT")
+
+
+class AsyncRepository(Generic[ModelT]):
+    """
+    Async CRUD for one mapped table, built on SQLAlchemy 2.0 statements.
+
+    Methods only flush – the caller owns the transaction and commits, so
+    several repository calls can share one unit of work.
+
+    ``soft_delete`` names a column and the value that marks a row deleted,
+    e.g. ``("is_deleted", True)``. Such rows are hidden from ``get``/``list``
+    unless ``include_deleted=True``.
+    """
+
+    def __init__(self, model: Type[ModelT], soft_delete: Optional[tuple[str, Any]] = None):
+        self.model = model
+        self.soft_delete_column = soft_delete
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    def _filtered(self, stmt, filters: Optional[dict], where: Sequence, include_deleted: bool):
+        for name, value in (filters or {}).items():
+            stmt = stmt.where(getattr(self.model, name) == value)
+        if where:
+            stmt = stmt.where(*where)
+        if self.soft_delete_column and not include_deleted:
+            name, deleted = self.soft_delete_column
+            stmt = stmt.where(getattr(self.model, name) != deleted)
+        return stmt
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def query(
+        self, *, filters: Optional[dict] = None, where: Sequence = (), include_deleted: bool = False
+    ) -> Select:
+        """Filtered SELECT for callers that page or stream it themselves."""
+        return self._filtered(select(self.model), filters, where, include_deleted)
+
+    async def get(self, db: AsyncSession, id: Any, include_deleted: bool = False) -> Optional[ModelT]:
+        stmt = self._filtered(select(self.model), {"id": id}, (), include_deleted)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    async def get_by(self, db: AsyncSession, **filters) -> Optional[ModelT]:
+        stmt = self._filtered(select(self.model), filters, (), False).limit(1)
+        result = await db.execute(stmt)
+        return result.scalars().first()
+
+    async def list(
+        self,
+        db: AsyncSession,
+        *,
+        filters: Optional[dict] = None,
+        where: Sequence = (),
+        order_by: Sequence = (),
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        include_deleted: bool = False,
+    ) -> List[ModelT]:
+        stmt = self._filtered(select(self.model), filters, where, include_deleted)
+        stmt = stmt.order_by(*(order_by or (self.model.id,))).offset(skip)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    async def create(self, db: AsyncSession, values: dict) -> ModelT:
+        obj = self.model(**values)
+        db.add(obj)
+        await db.flush()
+        return obj
+
+    async def bulk_insert(self, db: AsyncSession, rows: Iterable[dict]) -> List[ModelT]:
+        """INSERT ... RETURNING in batched statements; returns the new objects."""
+        rows = list(rows)
+        if not rows:
+            return []
+        result = await db.scalars(insert(self.model).returning(self.model), rows)
+        return list(result.all())
+
+    async def update(self, db: AsyncSession, obj: ModelT, values: dict) -> ModelT:
+        for name, value in values.items():
+            setattr(obj, name, value)
+        await db.flush()
+        return obj
+
+    async def bulk_update(self, db: AsyncSession, rows: Iterable[dict]) -> None:
+        """ORM bulk UPDATE by primary key – every dict must contain ``id``."""
+        rows = list(rows)
+        if rows:
+            await db.execute(update(self.model), rows)
+
+    async def update_where(self, db: AsyncSession, values: dict, *where) -> int:
+        result = await db.execute(
+            update(self.model).where(*where).values(**values).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def soft_delete(self, db: AsyncSession, ids: Iterable[Any]) -> int:
+        if not self.soft_delete_column:
+            raise TypeError(f"{self.model.__name__} has no soft delete column")
+        name, deleted = self.soft_delete_column
+        return await self.update_where(db, {name: deleted}, self.model.id.in_(list(ids)))
+
+    async def delete(self, db: AsyncSession, obj: ModelT) -> None:
+        await db.delete(obj)
+        await db.flush()
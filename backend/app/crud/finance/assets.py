@@ -0,0 +1,41 @@
+# app/crud/finance/assets.py
+from typing import Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.finance.assets import AssetStatus, AssetUsage, DepreciationRun, FixedAsset
+from app.schemas.finance.assets import FixedAssetCreate, UsageIn
+
+asset_repo = AsyncRepository(FixedAsset)
+run_repo = AsyncRepository(DepreciationRun)
+
+
+async def create_asset(db: AsyncSession, asset_in: FixedAssetCreate) -> FixedAsset:
+    asset = await asset_repo.create(db, {
+        **asset_in.model_dump(),
+        "accumulated_depreciation": 0,
+        "status": AssetStatus.active,
+    })
+    await db.commit()
+    await db.refresh(asset)
+    return asset
+
+
+def asset_list_query(status: Optional[AssetStatus] = None):
+    return asset_repo.query(filters={"status": status} if status else None)
+
+
+async def record_usage(db: AsyncSession, asset_id: int, usage: UsageIn) -> None:
+    """Set (not add) the units an asset produced in a month."""
+    insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    stmt = insert(AssetUsage).values(asset_id=asset_id, period=usage.period, units=usage.units)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["asset_id", "period"], set_={"units": stmt.excluded.units}
+    ))
+    await db.commit()
+
+
+def run_list_query():
+    return run_repo.query()
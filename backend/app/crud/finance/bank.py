@@ -0,0 +1,195 @@
+# app/crud/finance/bank.py
+from decimal import Decimal
+from typing import BinaryIO, Iterable, Optional
+
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.finance.bank import (
+    BankMatchedJournalLine, BankReconciliationMatch, BankStatement, BankStatementLine, StatementFormat,
+)
+from app.models.finance.ledger import Account, AccountType, JournalEntry, JournalLine, JournalStatus
+from app.schemas.finance.bank import ManualMatchIn, MatchOut
+from app.services.finance.bank_statements import PARSERS
+
+statement_repo = AsyncRepository(BankStatement)
+line_repo = AsyncRepository(BankStatementLine)
+match_repo = AsyncRepository(BankReconciliationMatch)
+
+# Statement lines per INSERT round trip
+IMPORT_BATCH_SIZE = 1000
+BANK_ACCOUNT_TYPES = (AccountType.bank, AccountType.cash)
+
+
+class BankReconciliationError(ValueError):
+    """Wrong account type, lines already matched, or match amounts differ."""
+
+
+async def get_bank_account(db: AsyncSession, account_id: int, *, for_update: bool = False) -> Optional[Account]:
+    stmt = select(Account).where(Account.id == account_id)
+    if for_update:
+        # Serializes reconciliation runs and manual matches per account
+        stmt = stmt.with_for_update()
+    account = (await db.execute(stmt)).scalars().first()
+    if account and account.type not in BANK_ACCOUNT_TYPES:
+        raise BankReconciliationError(f"Account {account.code} is not a bank or cash account")
+    return account
+
+
+def unmatched_gl_lines(account_id: int):
+    """Posted journal lines on the account that no match has claimed yet."""
+    claimed = exists().where(BankMatchedJournalLine.journal_line_id == JournalLine.id)
+    return (
+        select(
+            JournalLine.id,
+            JournalLine.entry_id,
+            JournalEntry.entry_date,
+            (JournalLine.debit - JournalLine.credit).label("amount"),
+            JournalEntry.reference,
+            JournalLine.description,
+        )
+        .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+        .where(
+            JournalLine.account_id == account_id,
+            JournalEntry.status == JournalStatus.posted,
+            ~claimed,
+        )
+    )
+
+
+# ------------------------------------------------------------------
+# 1. Statement import
+# ------------------------------------------------------------------
+async def import_statement(
+    db: AsyncSession,
+    account_id: int,
+    fmt: StatementFormat,
+    filename: Optional[str],
+    stream: BinaryIO,
+    user: str,
+) -> BankStatement:
+    """
+    Parse ``stream`` record by record and insert the lines in batches, so
+    a large file never sits in memory as a whole. A parse error anywhere
+    rolls back the entire statement.
+    """
+    statement = await statement_repo.create(db, {
+        "account_id": account_id,
+        "format": fmt,
+        "filename": filename,
+        "line_count": 0,
+        "imported_by": user,
+    })
+    count = 0
+    batch: list[dict] = []
+    try:
+        for record in PARSERS[fmt](stream):
+            batch.append({
+                "statement_id": statement.id,
+                "account_id": account_id,
+                "booking_date": record.booking_date,
+                "amount": record.amount,
+                "reference": record.reference,
+                "description": record.description,
+            })
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await db.execute(insert(BankStatementLine), batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            await db.execute(insert(BankStatementLine), batch)
+            count += len(batch)
+    except ValueError:
+        await db.rollback()
+        raise
+    statement.line_count = count
+    await db.commit()
+    await db.refresh(statement)
+    return statement
+
+
+def statement_list_query(account_id: int):
+    return statement_repo.query(filters={"account_id": account_id})
+
+
+# ------------------------------------------------------------------
+# 2. Matches
+# ------------------------------------------------------------------
+async def save_matches(
+    db: AsyncSession,
+    account_id: int,
+    matches: Iterable[tuple[str, list[int], list[int]]],
+    user: str,
+) -> list[int]:
+    """Persist (rule, bank line ids, journal line ids) groups; flushes only."""
+    matches = list(matches)
+    if not matches:
+        return []
+    result = await db.execute(
+        insert(BankReconciliationMatch).returning(BankReconciliationMatch.id, sort_by_parameter_order=True),
+        [{"account_id": account_id, "rule": rule, "created_by": user} for rule, _, _ in matches],
+    )
+    match_ids = list(result.scalars().all())
+    await line_repo.bulk_update(db, [
+        {"id": line_id, "match_id": match_id}
+        for match_id, (_, bank_ids, _) in zip(match_ids, matches)
+        for line_id in bank_ids
+    ])
+    await db.execute(insert(BankMatchedJournalLine), [
+        {"journal_line_id": line_id, "match_id": match_id}
+        for match_id, (_, _, gl_ids) in zip(match_ids, matches)
+        for line_id in gl_ids
+    ])
+    return match_ids
+
+
+async def create_manual_match(db: AsyncSession, match_in: ManualMatchIn, user: str) -> Optional[MatchOut]:
+    if not await get_bank_account(db, match_in.account_id, for_update=True):
+        return None
+    bank_ids, gl_ids = sorted(set(match_in.bank_line_ids)), sorted(set(match_in.journal_line_ids))
+
+    bank_rows = (await db.execute(
+        select(BankStatementLine.id, BankStatementLine.amount).where(
+            BankStatementLine.id.in_(bank_ids),
+            BankStatementLine.account_id == match_in.account_id,
+            BankStatementLine.match_id.is_(None),
+        )
+    )).all()
+    if len(bank_rows) != len(bank_ids):
+        found = {row.id for row in bank_rows}
+        raise BankReconciliationError(
+            f"Bank lines not open on this account: {[i for i in bank_ids if i not in found]}"
+        )
+
+    gl_query = unmatched_gl_lines(match_in.account_id).where(JournalLine.id.in_(gl_ids))
+    gl_rows = (await db.execute(gl_query)).all()
+    if len(gl_rows) != len(gl_ids):
+        found = {row.id for row in gl_rows}
+        raise BankReconciliationError(
+            f"Journal lines not open on this account: {[i for i in gl_ids if i not in found]}"
+        )
+
+    bank_total = sum((Decimal(row.amount) for row in bank_rows), Decimal("0"))
+    gl_total = sum((Decimal(row.amount) for row in gl_rows), Decimal("0"))
+    if bank_total != gl_total:
+        raise BankReconciliationError(f"Bank total {bank_total} does not equal GL total {gl_total}")
+
+    [match_id] = await save_matches(db, match_in.account_id, [("manual", bank_ids, gl_ids)], user)
+    await db.commit()
+    return MatchOut(
+        id=match_id, account_id=match_in.account_id, rule="manual",
+        bank_line_ids=bank_ids, journal_line_ids=gl_ids, created_by=user,
+    )
+
+
+async def delete_match(db: AsyncSession, match_id: int) -> bool:
+    """Undo a match; its bank and journal lines go back to the residue."""
+    match = await match_repo.get(db, match_id)
+    if not match:
+        return False
+    await line_repo.update_where(db, {"match_id": None}, BankStatementLine.match_id == match_id)
+    await db.execute(delete(BankMatchedJournalLine).where(BankMatchedJournalLine.match_id == match_id))
+    await match_repo.delete(db, match)
+    await db.commit()
+    return True
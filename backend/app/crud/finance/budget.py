@@ -0,0 +1,76 @@
+# app/crud/finance/budget.py
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.finance.budget import Budget, BudgetLine
+from app.models.finance.ledger import Account
+from app.schemas.finance.budget import BudgetCreate, BudgetLinesIn
+
+budget_repo = AsyncRepository(Budget)
+
+
+class BudgetError(ValueError):
+    """Budget line outside the budget's months or on an unknown account."""
+
+
+async def create_budget(db: AsyncSession, budget_in: BudgetCreate, user: str) -> Budget:
+    budget = await budget_repo.create(db, {**budget_in.model_dump(), "version": 1, "created_by": user})
+    await db.commit()
+    await db.refresh(budget)
+    return budget
+
+
+def budget_list_query():
+    return budget_repo.query()
+
+
+async def get_budget(db: AsyncSession, budget_id: int, *, for_update: bool = False) -> Optional[Budget]:
+    stmt = select(Budget).where(Budget.id == budget_id)
+    if for_update:
+        stmt = stmt.with_for_update()
+    return (await db.execute(stmt)).scalars().first()
+
+
+async def set_lines(db: AsyncSession, budget_id: int, lines_in: BudgetLinesIn) -> Optional[Budget]:
+    """Upsert lines by (account, cost centre, period) and bump the budget version."""
+    # Row lock: concurrent edits of one budget get distinct versions
+    budget = await get_budget(db, budget_id, for_update=True)
+    if not budget:
+        return None
+    outside = sorted({
+        line.period for line in lines_in.lines
+        if not budget.from_period <= line.period <= budget.to_period
+    })
+    if outside:
+        raise BudgetError(f"Periods outside {budget.from_period}-{budget.to_period}: {outside}")
+    account_ids = {line.account_id for line in lines_in.lines}
+    found = set((await db.execute(select(Account.id).where(Account.id.in_(account_ids)))).scalars())
+    missing = sorted(account_ids - found)
+    if missing:
+        raise BudgetError(f"Unknown accounts: {missing}")
+
+    # Last one wins for repeated keys (one statement cannot update a row twice)
+    rows = {
+        (line.account_id, line.cost_center, line.period): {**line.model_dump(), "budget_id": budget_id}
+        for line in lines_in.lines
+    }
+    insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    stmt = insert(BudgetLine)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["budget_id", "account_id", "cost_center", "period"],
+            set_={"amount": stmt.excluded.amount},
+        ),
+        list(rows.values()),
+    )
+    await db.execute(
+        update(Budget).where(Budget.id == budget_id).values(version=Budget.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await db.refresh(budget)
+    return budget
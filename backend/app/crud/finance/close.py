@@ -0,0 +1,47 @@
+# app/crud/finance/close.py
+from typing import Iterable, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.finance.close import CloseRun, CloseRunStep, CloseStatus, CloseStepStatus
+from app.schemas.finance.close import CloseRunCreate
+
+run_repo = AsyncRepository(CloseRun)
+
+
+async def create_run(db: AsyncSession, run_in: CloseRunCreate, steps: Iterable[str], user: str) -> CloseRun:
+    """Register a queued run with one pending checkpoint per step."""
+    run = await run_repo.create(db, {
+        **run_in.model_dump(),
+        "status": CloseStatus.queued,
+        "attempts": 0,
+        "created_by": user,
+    })
+    await db.execute(insert(CloseRunStep), [
+        {"run_id": run.id, "step": step, "status": CloseStepStatus.pending} for step in steps
+    ])
+    await db.commit()
+    await db.refresh(run)
+    return run
+
+
+def run_list_query(status: Optional[CloseStatus] = None):
+    return run_repo.query(filters={"status": status} if status else None)
+
+
+async def get_steps(db: AsyncSession, run_id: int) -> dict[str, CloseRunStep]:
+    result = await db.execute(select(CloseRunStep).where(CloseRunStep.run_id == run_id))
+    return {row.step: row for row in result.scalars()}
+
+
+async def requeue(db: AsyncSession, run: CloseRun) -> CloseRun:
+    """Back to ``queued``; checkpoints are kept so the worker resumes."""
+    await db.execute(
+        update(CloseRun).where(CloseRun.id == run.id).values(status=CloseStatus.queued, error=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    await db.refresh(run)
+    return run
@@ -0,0 +1,106 @@
+# app/crud/finance/cost_allocation.py
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.crud.base import AsyncRepository
+from app.models.finance.cost_allocation import (
+    AllocationDriver, AllocationDriverVersion, CostCenter, CostCenterKind,
+)
+from app.schemas.finance.cost_allocation import CostCenterCreate, DriverOut, DriverSet
+
+cost_center_repo = AsyncRepository(CostCenter)
+
+
+class CostAllocationError(ValueError):
+    """Driver set rejected, or the drivers form a loop with no way out."""
+
+
+async def driver_version(db: AsyncSession) -> int:
+    version = (await db.execute(select(AllocationDriverVersion.version).where(AllocationDriverVersion.id == 1))).scalar()
+    return version or 0
+
+
+async def _bump_version(db: AsyncSession) -> int:
+    insert_ = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    stmt = (
+        insert_(AllocationDriverVersion)
+        .values(id=1, version=1)
+        .on_conflict_do_update(
+            index_elements=["id"],
+            set_={"version": AllocationDriverVersion.version + 1, "changed_at": func.now()},
+        )
+        .returning(AllocationDriverVersion.version)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
+async def create_cost_center(db: AsyncSession, center_in: CostCenterCreate) -> CostCenter:
+    center = await cost_center_repo.create(db, {**center_in.model_dump(), "is_active": True})
+    # New centres change the allocation matrix too
+    await _bump_version(db)
+    await db.commit()
+    return center
+
+
+def cost_center_list_query(kind: Optional[CostCenterKind] = None):
+    return cost_center_repo.query(filters={"kind": kind} if kind else None)
+
+
+# ------------------------------------------------------------------
+# Drivers
+# ------------------------------------------------------------------
+async def set_drivers(db: AsyncSession, sender_code: str, driver_set: DriverSet) -> Optional[int]:
+    """Replace one service centre's drivers; returns the new driver version."""
+    sender = await cost_center_repo.get_by(db, code=sender_code)
+    if not sender:
+        return None
+    if sender.kind != CostCenterKind.service:
+        raise CostAllocationError(f"{sender_code} is a production cost centre and cannot allocate")
+    if sender_code in driver_set.receivers:
+        raise CostAllocationError("A cost centre cannot allocate to itself")
+
+    result = await db.execute(
+        select(CostCenter.code, CostCenter.id).where(CostCenter.code.in_(list(driver_set.receivers)))
+    )
+    receivers = dict(result.all())
+    missing = sorted(set(driver_set.receivers) - set(receivers))
+    if missing:
+        raise CostAllocationError(f"Unknown cost centres: {missing}")
+
+    # Version first: the row lock serializes concurrent driver edits
+    version = await _bump_version(db)
+    await db.execute(delete(AllocationDriver).where(AllocationDriver.sender_id == sender.id))
+    await db.execute(insert(AllocationDriver), [
+        {"sender_id": sender.id, "receiver_id": receivers[code], "quantity": quantity}
+        for code, quantity in driver_set.receivers.items()
+    ])
+    await db.commit()
+    return version
+
+
+async def list_drivers(db: AsyncSession, sender_code: Optional[str] = None) -> list[DriverOut]:
+    Sender, Receiver = aliased(CostCenter), aliased(CostCenter)
+    stmt = (
+        select(Sender.code, Receiver.code, AllocationDriver.quantity)
+        .join(Sender, Sender.id == AllocationDriver.sender_id)
+        .join(Receiver, Receiver.id == AllocationDriver.receiver_id)
+        .order_by(Sender.code, Receiver.code)
+    )
+    if sender_code:
+        stmt = stmt.where(Sender.code == sender_code)
+    rows = (await db.execute(stmt)).all()
+    totals: dict[str, Decimal] = {}
+    for sender, _, quantity in rows:
+        totals[sender] = totals.get(sender, Decimal("0")) + quantity
+    return [
+        DriverOut(
+            sender=sender, receiver=receiver, quantity=quantity,
+            share=(quantity / totals[sender]).quantize(Decimal("0.000001")),
+        )
+        for sender, receiver, quantity in rows
+    ]
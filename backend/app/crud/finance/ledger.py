@@ -0,0 +1,282 @@
+# app/crud/finance/ledger.py
+import calendar
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.crud.base import AsyncRepository
+from app.models.finance.ledger import (
+    Account, AccountDailyBalance, AccountPeriodBalance, JournalEntry, JournalLine, JournalStatus,
+)
+from app.schemas.finance.ledger import AccountCreate, JournalEntryCreate, TrialBalance, TrialBalanceRow
+from app.services.numbering import document_numbers
+
+account_repo = AsyncRepository(Account)
+entry_repo = AsyncRepository(JournalEntry)
+
+ZERO = Decimal("0")
+CENT = Decimal("0.01")
+
+
+class LedgerError(ValueError):
+    """Posting rejected (unbalanced, unknown/inactive account, wrong status)."""
+
+
+def period_of(day: datetime.date) -> int:
+    return day.year * 100 + day.month
+
+
+# ------------------------------------------------------------------
+# 1. Accounts
+# ------------------------------------------------------------------
+async def create_account(db: AsyncSession, account_in: AccountCreate) -> Account:
+    account = await account_repo.create(db, account_in.model_dump())
+    await db.commit()
+    return account
+
+
+def account_list_query():
+    return account_repo.query()
+
+
+# ------------------------------------------------------------------
+# 2. Posting
+# ------------------------------------------------------------------
+def _movements(lines: Iterable[JournalLine]) -> dict[int, list[Decimal]]:
+    """Lines folded into one [debit, credit] per account; rejects unbalanced sets."""
+    movements: dict[int, list[Decimal]] = defaultdict(lambda: [ZERO, ZERO])
+    total_debit = total_credit = ZERO
+    for line in lines:
+        debit, credit = Decimal(line.debit or 0), Decimal(line.credit or 0)
+        if debit < 0 or credit < 0:
+            raise LedgerError("Line amounts cannot be negative")
+        movements[line.account_id][0] += debit
+        movements[line.account_id][1] += credit
+        total_debit += debit
+        total_credit += credit
+    if not movements or total_debit == ZERO:
+        raise LedgerError("Entry has no amounts")
+    if total_debit.quantize(CENT) != total_credit.quantize(CENT):
+        raise LedgerError(f"Entry is not balanced: debit {total_debit} != credit {total_credit}")
+    return movements
+
+
+async def _apply(db: AsyncSession, entry_date: datetime.date, movements: dict[int, list[Decimal]], sign: int) -> None:
+    """Add (sign=1) or remove (sign=-1) movements to the period and daily balance tables."""
+    account_ids = sorted(movements)
+    # Row locks in id order: postings touching the same account serialize
+    # here, so running totals never miss a concurrent backdated posting.
+    result = await db.execute(
+        select(Account.id, Account.is_active)
+        .where(Account.id.in_(account_ids))
+        .order_by(Account.id)
+        .with_for_update()
+    )
+    found = dict(result.all())
+    missing = [account_id for account_id in account_ids if account_id not in found]
+    if missing:
+        raise LedgerError(f"Unknown accounts: {missing}")
+    if sign > 0:
+        inactive = [account_id for account_id, active in found.items() if not active]
+        if inactive:
+            raise LedgerError(f"Inactive accounts: {inactive}")
+
+    period = period_of(entry_date)
+    insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    B, D = AccountPeriodBalance, AccountDailyBalance
+    for account_id in account_ids:
+        debit, credit = (amount * sign for amount in movements[account_id])
+        previous = (
+            select(B)
+            .where(B.account_id == account_id, B.period < period)
+            .order_by(B.period.desc())
+            .limit(1)
+            .subquery()
+        )
+        stmt = insert(B).values(
+            account_id=account_id,
+            period=period,
+            debit=debit,
+            credit=credit,
+            closing_debit=func.coalesce(select(previous.c.closing_debit).scalar_subquery(), 0) + debit,
+            closing_credit=func.coalesce(select(previous.c.closing_credit).scalar_subquery(), 0) + credit,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["account_id", "period"],
+            set_={
+                "debit": B.debit + stmt.excluded.debit,
+                "credit": B.credit + stmt.excluded.credit,
+                "closing_debit": B.closing_debit + stmt.excluded.debit,
+                "closing_credit": B.closing_credit + stmt.excluded.credit,
+            },
+        )
+        await db.execute(stmt)
+        # Backdated posting: later months carry it in their running totals
+        await db.execute(
+            update(B)
+            .where(B.account_id == account_id, B.period > period)
+            .values(closing_debit=B.closing_debit + debit, closing_credit=B.closing_credit + credit)
+            .execution_options(synchronize_session=False)
+        )
+        daily = insert(D).values(account_id=account_id, day=entry_date, debit=debit, credit=credit)
+        await db.execute(daily.on_conflict_do_update(
+            index_elements=["account_id", "day"],
+            set_={"debit": D.debit + daily.excluded.debit, "credit": D.credit + daily.excluded.credit},
+        ))
+
+
+async def _post(db: AsyncSession, entry: JournalEntry) -> None:
+    if entry.status != JournalStatus.draft:
+        raise LedgerError(f"Only draft entries can be posted (entry is {entry.status.value})")
+    await _apply(db, entry.entry_date, _movements(entry.lines), sign=1)
+    entry.status = JournalStatus.posted
+    entry.posted_at = datetime.datetime.utcnow()
+
+
+async def create_entry(
+    db: AsyncSession,
+    entry_in: JournalEntryCreate,
+    user: str,
+    *,
+    commit: bool = True,
+) -> JournalEntry:
+    """
+    Insert an entry with its lines and, unless ``entry_in.post`` is False,
+    post it – lines and balances land in one transaction or not at all.
+    Pass ``commit=False`` to include the entry in a larger unit of work.
+    """
+    entry = JournalEntry(
+        entry_number=await document_numbers.next_number("JE", year=entry_in.entry_date.year),
+        entry_date=entry_in.entry_date,
+        reference=entry_in.reference,
+        description=entry_in.description,
+        status=JournalStatus.draft,
+        created_by=user,
+        lines=[JournalLine(**line.model_dump()) for line in entry_in.lines],
+    )
+    db.add(entry)
+    try:
+        if entry_in.post:
+            await _post(db, entry)
+        await db.flush()
+        if commit:
+            await db.commit()
+    except LedgerError:
+        if commit:
+            await db.rollback()
+        raise
+    return entry
+
+
+async def get_entry(db: AsyncSession, entry_id: int, *, for_update: bool = False) -> Optional[JournalEntry]:
+    stmt = select(JournalEntry).where(JournalEntry.id == entry_id).options(selectinload(JournalEntry.lines))
+    if for_update:
+        stmt = stmt.with_for_update(of=JournalEntry)
+    return (await db.execute(stmt)).scalars().first()
+
+
+def entry_list_query(status: Optional[JournalStatus] = None):
+    filters = {"status": status} if status else None
+    return entry_repo.query(filters=filters)
+
+
+async def post_entry(db: AsyncSession, entry_id: int) -> Optional[JournalEntry]:
+    entry = await get_entry(db, entry_id, for_update=True)
+    if not entry:
+        return None
+    try:
+        await _post(db, entry)
+        await db.commit()
+    except LedgerError:
+        await db.rollback()
+        raise
+    return entry
+
+
+async def void_entry(db: AsyncSession, entry_id: int) -> Optional[JournalEntry]:
+    """Reverse a posted entry's effect on the balances and mark it void."""
+    entry = await get_entry(db, entry_id, for_update=True)
+    if not entry:
+        return None
+    try:
+        if entry.status != JournalStatus.posted:
+            raise LedgerError(f"Only posted entries can be voided (entry is {entry.status.value})")
+        await _apply(db, entry.entry_date, _movements(entry.lines), sign=-1)
+        entry.status = JournalStatus.void
+        await db.commit()
+    except LedgerError:
+        await db.rollback()
+        raise
+    return entry
+
+
+# ------------------------------------------------------------------
+# 3. Balances
+# ------------------------------------------------------------------
+async def account_balances(db: AsyncSession, as_of: datetime.date) -> list[tuple[Account, Decimal]]:
+    """
+    Net (debit - credit) balance per account as of ``as_of``, opening included.
+
+    One running-total row per account (the last month closed on or before
+    ``as_of``) plus, when ``as_of`` is not a month end, the daily balance
+    rows of its own month up to that day.
+    """
+    B = AccountPeriodBalance
+    month_end = calendar.monthrange(as_of.year, as_of.month)[1] == as_of.day
+    upto = period_of(as_of) if month_end else period_of(as_of.replace(day=1) - datetime.timedelta(days=1))
+
+    # Correlated subquery → one index probe on (account_id, period) per account
+    closing = (
+        select(B.closing_debit - B.closing_credit)
+        .where(B.account_id == Account.id, B.period <= upto)
+        .order_by(B.period.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    stmt = select(Account, func.coalesce(closing, 0)).order_by(Account.code)
+
+    if not month_end:
+        D = AccountDailyBalance
+        partial = (
+            select(D.account_id, func.sum(D.debit - D.credit).label("net"))
+            .where(D.day.between(as_of.replace(day=1), as_of))
+            .group_by(D.account_id)
+            .subquery()
+        )
+        stmt = (
+            select(Account, func.coalesce(closing, 0) + func.coalesce(partial.c.net, 0))
+            .outerjoin(partial, partial.c.account_id == Account.id)
+            .order_by(Account.code)
+        )
+
+    result = await db.execute(stmt)
+    return [
+        (account, (Decimal(account.opening or 0) + Decimal(net)).quantize(CENT))
+        for account, net in result.all()
+    ]
+
+
+async def trial_balance(db: AsyncSession, as_of: datetime.date) -> TrialBalance:
+    rows = []
+    total_debit = total_credit = ZERO
+    for account, balance in await account_balances(db, as_of):
+        debit, credit = (balance, ZERO) if balance > 0 else (ZERO, -balance)
+        total_debit += debit
+        total_credit += credit
+        rows.append(TrialBalanceRow(
+            account_id=account.id, code=account.code, name=account.name,
+            type=account.type, debit=debit, credit=credit,
+        ))
+    return TrialBalance(
+        as_of=as_of,
+        rows=rows,
+        total_debit=total_debit,
+        total_credit=total_credit,
+        is_balanced=total_debit == total_credit,
+    )
@@ -0,0 +1,67 @@
+# app/crud/finance/open_items.py
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.crud.sales import credit
+from app.models.finance.open_items import OpenItem, OpenItemPayment, OpenItemStatus, Subledger
+from app.models.finance.tax import InvoiceTaxLine
+from app.schemas.finance.open_items import OpenItemCreate
+
+open_item_repo = AsyncRepository(OpenItem)
+
+
+class OpenItemError(ValueError):
+    """Payment larger than the open balance, or applied to a paid item."""
+
+
+async def create_item(db: AsyncSession, ledger: Subledger, item_in: OpenItemCreate) -> OpenItem:
+    item = await open_item_repo.create(db, {
+        **item_in.model_dump(exclude={"tax_lines"}),
+        "ledger": ledger,
+        "balance": item_in.amount,
+        "status": OpenItemStatus.open,
+    })
+    if item_in.tax_lines:
+        await db.execute(insert(InvoiceTaxLine), [
+            {**line.model_dump(), "open_item_id": item.id} for line in item_in.tax_lines
+        ])
+    if ledger == Subledger.ar:
+        await credit.add_receivable(db, item.party_code, item.amount)
+    await db.commit()
+    await db.refresh(item)
+    return item
+
+
+def list_query(ledger: Subledger, status: Optional[OpenItemStatus] = None):
+    filters = {"ledger": ledger}
+    if status:
+        filters["status"] = status
+    return open_item_repo.query(filters=filters)
+
+
+async def apply_payment(db: AsyncSession, ledger: Subledger, item_id: int, amount: Decimal) -> Optional[OpenItem]:
+    result = await db.execute(
+        select(OpenItem).where(OpenItem.id == item_id, OpenItem.ledger == ledger).with_for_update()
+    )
+    item = result.scalars().first()
+    if not item:
+        return None
+    if amount > item.balance:
+        raise OpenItemError(f"Payment {amount} exceeds open balance {item.balance}")
+    balance = item.balance - amount
+    paid_on = datetime.date.today()
+    await open_item_repo.update(db, item, {
+        "balance": balance,
+        "status": OpenItemStatus.paid if balance == 0 else OpenItemStatus.partial,
+    })
+    db.add(OpenItemPayment(open_item_id=item.id, paid_on=paid_on, amount=amount))
+    if ledger == Subledger.ar:
+        await credit.receive_payment(db, item.party_code, amount, item.due_date, paid_on)
+    await db.commit()
+    await db.refresh(item)
+    return item
@@ -0,0 +1,39 @@
+# app/crud/finance/tax.py
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.finance.tax import TaxReturn, TaxReturnStatus
+from app.schemas.finance.tax import TaxReturnCreate
+
+return_repo = AsyncRepository(TaxReturn)
+
+
+class TaxReturnError(ValueError):
+    """Retry of a return that has not failed."""
+
+
+async def create_return(db: AsyncSession, return_in: TaxReturnCreate, user: str) -> TaxReturn:
+    """Register a ``queued`` return; the tax return worker writes the file."""
+    tax_return = await return_repo.create(db, {
+        **return_in.model_dump(),
+        "status": TaxReturnStatus.queued,
+        "created_by": user,
+    })
+    await db.commit()
+    await db.refresh(tax_return)
+    return tax_return
+
+
+async def retry_return(db: AsyncSession, tax_return: TaxReturn) -> TaxReturn:
+    """Queue a failed return again; its file is written from scratch."""
+    if tax_return.status != TaxReturnStatus.failed:
+        raise TaxReturnError(f"Tax return {tax_return.id} is {tax_return.status.value}")
+    await return_repo.update(db, tax_return, {"status": TaxReturnStatus.queued, "error": None, "completed_at": None})
+    await db.commit()
+    return tax_return
+
+
+def return_list_query(status: Optional[TaxReturnStatus] = None):
+    return return_repo.query(filters={"status": status} if status else None)
@@ -1,44 +1,45 @@
 # backend/crud/pr.py
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud.base import AsyncRepository
 from app.models.procurment.pr import PurchaseRequisition, PRStatus
 from app.schemas.procurment.pr import PRCreate
-import datetime
+from app.services.numbering import document_numbers
 
-def generate_pr_number(db: Session):
-    today = datetime.date.today()
-    count = db.query(PurchaseRequisition).filter(
-        PurchaseRequisition.created_at == today
-    ).count() + 1
-    return f"PR-{today.year}-{str(count).zfill(4)}"
+pr_repo = AsyncRepository(PurchaseRequisition, soft_delete=("is_deleted", True))
 
-def create_pr(db: Session, pr: PRCreate, user: str):
-    pr_number = generate_pr_number(db)
+async def create_pr(db: AsyncSession, pr: PRCreate, user: str):
+    pr_number = await document_numbers.next_number("PR")
     total_amount = sum(item.qty * item.price for item in pr.items)
-    
-    db_pr = PurchaseRequisition(
-        pr_number=pr_number,
-        user=user,
-        dept=pr.dept,
-        amount=total_amount,
-        items=len(pr.items),
-        status=PRStatus.pending
-    )
-    db.add(db_pr)
-    db.commit()
-    db.refresh(db_pr)
+
+    db_pr = await pr_repo.create(db, {
+        "pr_number": pr_number,
+        "user": user,
+        "dept": pr.dept,
+        "amount": total_amount,
+        "items": len(pr.items),
+        "status": PRStatus.pending,
+    })
+    await db.commit()
+    await db.refresh(db_pr)
     return db_pr
 
-def get_prs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(PurchaseRequisition).offset(skip).limit(limit).all()
+def list_query():
+    return pr_repo.query()
 
-def get_pr_by_id(db: Session, pr_id: int):
-    return db.query(PurchaseRequisition).filter(PurchaseRequisition.id == pr_id).first()
+async def get_pr_by_id(db: AsyncSession, pr_id: int) -> Optional[PurchaseRequisition]:
+    return await pr_repo.get(db, pr_id)
 
-def update_pr_status(db: Session, pr_id: int, status: str):
-    pr = get_pr_by_id(db, pr_id)
+async def update_pr_status(db: AsyncSession, pr_id: int, status: str):
+    pr = await get_pr_by_id(db, pr_id)
     if not pr:
         return None
-    pr.status = PRStatus(status)
-    db.commit()
-    db.refresh(pr)
-    return pr
\ No newline at end of file
+    await pr_repo.update(db, pr, {"status": PRStatus(status)})
+    await db.commit()
+    await db.refresh(pr)
+    return pr
+
+async def delete_pr(db: AsyncSession, pr_id: int) -> bool:
+    deleted = await pr_repo.soft_delete(db, [pr_id])
+    await db.commit()
+    return bool(deleted)
@@ -1,17 +1,22 @@
 # app/crud/role.py
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud.base import AsyncRepository
 from app.models.role import Role
 from app.schemas.role import RoleCreate
 
-def create_role(db: Session, role_in: RoleCreate) -> Role:
-    db_role = Role(name=role_in.name, description=role_in.description)
-    db.add(db_role)
-    db.commit()
-    db.refresh(db_role)
+role_repo = AsyncRepository(Role)
+
+async def create_role(db: AsyncSession, role_in: RoleCreate) -> Role:
+    db_role = await role_repo.create(db, {"name": role_in.name, "description": role_in.description})
+    await db.commit()
     return db_role
 
-def get_role(db: Session, role_id: int):
-    return db.query(Role).filter(Role.id == role_id).first()
+async def get_role(db: AsyncSession, role_id: int) -> Optional[Role]:
+    return await role_repo.get(db, role_id)
+
+async def get_by_name(db: AsyncSession, name: str) -> Optional[Role]:
+    return await role_repo.get_by(db, name=name)
 
-def list_roles(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Role).offset(skip).limit(limit).all()
+async def list_roles(db: AsyncSession, skip: int = 0, limit: int = 100):
+    return await role_repo.list(db, skip=skip, limit=limit)
@@ -0,0 +1,134 @@
+# app/crud/sales/analytics.py
+"""
+Sales rollup postings. Orders are folded into the rollups inside the
+transaction that saves or changes them: ``post_orders(ids, -1)`` before a
+status change takes the old state out, ``post_orders(ids, +1)`` after it
+puts the new one in.
+
+Each posting is one INSERT ... SELECT per rollup table: the orders are
+grouped once, every level (day/month/year × customer/ALL [× hour/ALL_HOURS])
+is a UNION ALL branch over that group, and ON CONFLICT adds the result
+to the existing rows – the same two statements for one order or a batch.
+The rows are inserted in conflict-key order, so concurrent postings that
+touch the same rollup rows (the ALL levels always do) lock them in the
+same order and queue instead of deadlocking.
+"""
+from typing import Sequence
+
+from sqlalchemy import Date, Integer, cast, delete, extract, func, literal, select, text, union_all
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.sales.analytics import ALL, ALL_HOURS, RollupGrain, SalesOrderRollup, SalesRollup
+from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+
+# Order ids per posting statement
+POST_BATCH_SIZE = 5000
+
+
+def _period(db: AsyncSession, grain: RollupGrain, day):
+    if grain == RollupGrain.day:
+        return day
+    if db.bind.dialect.name == "sqlite":
+        return func.date(day, f"start of {grain.value}")
+    return cast(func.date_trunc(grain.value, day), Date)
+
+
+def _levels(db: AsyncSession, base, keys: list[str], measures: list[str], hourly: bool, sign: int):
+    """One grouped SELECT per rollup level over the grouped orders ``base``."""
+    grain_type = SalesRollup.__table__.c.grain.type
+    branches = []
+    for grain in RollupGrain:
+        period = _period(db, grain, base.c.day)
+        for per_customer in (True, False):
+            for per_hour in ((True, False) if hourly else (False,)):
+                group = [period, base.c.region, *[base.c[key] for key in keys]]
+                group += [base.c.customer_id] if per_customer else []
+                group += [base.c.hour] if per_hour else []
+                columns = [
+                    (base.c.customer_id if per_customer else literal(ALL)).label("customer_id"),
+                    cast(literal(grain.value), grain_type).label("grain"),
+                    period.label("period"),
+                    base.c.region.label("region"),
+                    *[base.c[key].label(key) for key in keys],
+                ]
+                if hourly:
+                    columns.append((base.c.hour if per_hour else literal(ALL_HOURS)).label("hour"))
+                columns += [(func.sum(base.c[measure]) * sign).label(measure) for measure in measures]
+                branches.append(select(*columns).group_by(*group))
+    return union_all(*branches).subquery()
+
+
+async def _upsert(db: AsyncSession, model, levels, keys: list[str], measures: list[str]) -> None:
+    insert_ = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    columns = keys + measures
+    # WHERE keeps SQLite from reading ON CONFLICT as a join constraint
+    rows = (
+        select(*[levels.c[name] for name in columns])
+        .where(levels.c[measures[0]].is_not(None))
+        .order_by(*[levels.c[key] for key in keys])
+    )
+    stmt = insert_(model).from_select(columns, rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={measure: getattr(model, measure) + getattr(stmt.excluded, measure) for measure in measures},
+    )
+    await db.execute(stmt)
+
+
+async def _post_batch(db: AsyncSession, order_ids: Sequence[int], sign: int) -> None:
+    region = func.coalesce(SalesOrder.region, "")
+    hour = cast(extract("hour", SalesOrder.created_at), Integer)
+    orders = (
+        select(
+            SalesOrder.order_date.label("day"), hour.label("hour"), SalesOrder.customer_id,
+            region.label("region"), SalesOrder.status,
+            func.count().label("orders"), func.sum(SalesOrder.total).label("revenue"),
+        )
+        .where(SalesOrder.id.in_(order_ids))
+        .group_by(SalesOrder.order_date, hour, SalesOrder.customer_id, region, SalesOrder.status)
+        .cte("orders")
+    )
+    await _upsert(
+        db, SalesOrderRollup, _levels(db, orders, ["status"], ["orders", "revenue"], hourly=True, sign=sign),
+        ["hour", "grain", "customer_id", "period", "region", "status"], ["orders", "revenue"],
+    )
+
+    lines = (
+        select(
+            SalesOrder.order_date.label("day"), SalesOrder.customer_id, region.label("region"),
+            SalesOrderLine.product_id,
+            func.sum(SalesOrderLine.amount).label("revenue"), func.sum(SalesOrderLine.quantity).label("quantity"),
+            func.count(SalesOrderLine.order_id.distinct()).label("orders"),
+        )
+        .join(SalesOrderLine, SalesOrderLine.order_id == SalesOrder.id)
+        .where(SalesOrder.id.in_(order_ids), SalesOrder.status != SalesOrderStatus.cancelled)
+        .group_by(SalesOrder.order_date, SalesOrder.customer_id, region, SalesOrderLine.product_id)
+        .cte("lines")
+    )
+    await _upsert(
+        db, SalesRollup, _levels(db, lines, ["product_id"], ["revenue", "quantity", "orders"], hourly=False, sign=sign),
+        ["customer_id", "grain", "period", "product_id", "region"], ["revenue", "quantity", "orders"],
+    )
+
+
+async def post_orders(db: AsyncSession, order_ids: Sequence[int], sign: int = 1) -> None:
+    """Add (sign 1) or remove (sign -1) the orders' current state to/from the rollups."""
+    for offset in range(0, len(order_ids), POST_BATCH_SIZE):
+        await _post_batch(db, order_ids[offset:offset + POST_BATCH_SIZE], sign)
+
+
+async def rebuild(db: AsyncSession) -> int:
+    """Recompute every rollup from the orders (first load / repair)."""
+    if db.bind.dialect.name != "sqlite":  # SQLite writers are serialized anyway
+        # Waits for postings in flight; new ones wait for our commit and then
+        # add their orders on top, since the rebuild cannot see them yet
+        await db.execute(text(
+            f"LOCK TABLE {SalesOrderRollup.__tablename__}, {SalesRollup.__tablename__} IN EXCLUSIVE MODE"
+        ))
+    await db.execute(delete(SalesOrderRollup))
+    await db.execute(delete(SalesRollup))
+    order_ids = list((await db.execute(select(SalesOrder.id).order_by(SalesOrder.id))).scalars())
+    await post_orders(db, order_ids)
+    await db.commit()
+    return len(order_ids)
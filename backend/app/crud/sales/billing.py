@@ -0,0 +1,52 @@
+# app/crud/sales/billing.py
+import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.sales.billing import BillingRun, BillingRunStatus, SalesInvoice
+from app.models.sales.master import Customer
+from app.schemas.sales.billing import BillingRunCreate
+
+run_repo = AsyncRepository(BillingRun)
+invoice_repo = AsyncRepository(SalesInvoice)
+
+
+class BillingError(ValueError):
+    """Unknown customer, or a retry of a run that has not failed."""
+
+
+async def create_run(db: AsyncSession, run_in: BillingRunCreate, user: str) -> BillingRun:
+    """Register a ``queued`` run; the billing worker bills it and writes the documents."""
+    if run_in.customer_id is not None and await db.get(Customer, run_in.customer_id) is None:
+        raise BillingError(f"Unknown customer {run_in.customer_id}")
+    run = await run_repo.create(db, {
+        **run_in.model_dump(),
+        "billing_date": run_in.billing_date or datetime.date.today(),
+        "status": BillingRunStatus.queued,
+        "created_by": user,
+    })
+    await db.commit()
+    await db.refresh(run)
+    return run
+
+
+async def retry_run(db: AsyncSession, run: BillingRun) -> BillingRun:
+    """
+    Queue a failed run again: billing rolled back as a whole, so a run
+    without invoices bills again; one with invoices only renders again.
+    """
+    if run.status != BillingRunStatus.failed:
+        raise BillingError(f"Billing run {run.id} is {run.status.value}")
+    await run_repo.update(db, run, {"status": BillingRunStatus.queued, "error": None, "completed_at": None})
+    await db.commit()
+    return run
+
+
+def run_list_query(status: Optional[BillingRunStatus] = None):
+    return run_repo.query(filters={"status": status} if status else None)
+
+
+def invoice_list_query(run_id: int):
+    return invoice_repo.query(filters={"run_id": run_id})
@@ -0,0 +1,79 @@
+# app/crud/sales/credit.py
+"""
+Credit exposure postings. Each is a single UPDATE of the customer's
+exposure row, issued inside the caller's transaction so the exposure
+commits or rolls back with the document that moved it.
+"""
+import datetime
+from decimal import Decimal
+
+from sqlalchemy import case, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.base import AsyncRepository
+from app.models.sales.credit import CreditExposure
+from app.models.sales.master import Customer
+
+exposure_repo = AsyncRepository(CreditExposure)
+
+
+async def open_exposure(db: AsyncSession, customer_id: int) -> None:
+    await db.execute(insert(CreditExposure).values(customer_id=customer_id))
+
+
+async def reserve_order(db: AsyncSession, customer_id: int, amount: Decimal) -> bool:
+    """
+    Add an order to open orders if it fits the credit limit. Check and
+    increment are one statement, so concurrent orders cannot both take
+    the last of the headroom.
+    """
+    limit = select(Customer.credit_limit).where(Customer.id == customer_id).scalar_subquery()
+    result = await db.execute(
+        update(CreditExposure)
+        .where(
+            CreditExposure.customer_id == customer_id,
+            or_(limit.is_(None), CreditExposure.open_orders + CreditExposure.open_receivables + amount <= limit),
+        )
+        .values(open_orders=CreditExposure.open_orders + amount)
+        .returning(CreditExposure.customer_id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.first() is not None
+
+
+async def shift_orders(db: AsyncSession, customer_id: int, amount: Decimal) -> None:
+    """Open orders ± ``amount`` without a limit check (release, cancel, invoice)."""
+    await exposure_repo.update_where(
+        db, {"open_orders": CreditExposure.open_orders + amount}, CreditExposure.customer_id == customer_id
+    )
+
+
+def _by_party(party_code: str):
+    # AR items carry the customer code; unknown codes have no exposure row
+    return CreditExposure.customer_id == select(Customer.id).where(Customer.code == party_code).scalar_subquery()
+
+
+async def add_receivable(db: AsyncSession, party_code: str, amount: Decimal) -> None:
+    await exposure_repo.update_where(
+        db, {"open_receivables": CreditExposure.open_receivables + amount}, _by_party(party_code)
+    )
+
+
+async def receive_payment(
+    db: AsyncSession, party_code: str, amount: Decimal, due_date: datetime.date, paid_on: datetime.date
+) -> None:
+    """Lower receivables and fold the payment's days past due into the rolling average."""
+    days = max(0, (paid_on - due_date).days)
+    # Plain mean over the first payments, then an exponential average over about a window
+    window = settings.CREDIT_PAYMENT_DAYS_WINDOW
+    weight = case(
+        (CreditExposure.payments < window, 1.0 / (CreditExposure.payments + 1)),
+        else_=2.0 / (window + 1),
+    )
+    await exposure_repo.update_where(db, {
+        "open_receivables": CreditExposure.open_receivables - amount,
+        "payments": CreditExposure.payments + 1,
+        "avg_payment_days": CreditExposure.avg_payment_days + (days - CreditExposure.avg_payment_days) * weight,
+    }, _by_party(party_code))
+
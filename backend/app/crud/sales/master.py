@@ -0,0 +1,43 @@
+# app/crud/sales/master.py
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.crud.sales.credit import open_exposure
+from app.models.sales.master import Customer, Product
+from app.schemas.sales.master import CustomerCreate, ProductCreate
+
+customer_repo = AsyncRepository(Customer)
+product_repo = AsyncRepository(Product)
+
+
+async def create_customer(db: AsyncSession, customer_in: CustomerCreate) -> Customer:
+    customer = await customer_repo.create(db, {**customer_in.model_dump(), "is_active": True})
+    await open_exposure(db, customer.id)
+    await db.commit()
+    await db.refresh(customer)
+    return customer
+
+
+async def update_credit_limit(db: AsyncSession, customer: Customer, credit_limit: Optional[Decimal]) -> Customer:
+    await customer_repo.update(db, customer, {"credit_limit": credit_limit})
+    await db.commit()
+    await db.refresh(customer)
+    return customer
+
+
+def customer_list_query(customer_group: Optional[str] = None):
+    return customer_repo.query(filters={"customer_group": customer_group} if customer_group else None)
+
+
+async def create_product(db: AsyncSession, product_in: ProductCreate) -> Product:
+    product = await product_repo.create(db, {**product_in.model_dump(), "is_active": True})
+    await db.commit()
+    await db.refresh(product)
+    return product
+
+
+def product_list_query():
+    return product_repo.query()
@@ -0,0 +1,102 @@
+# app/crud/sales/orders.py
+import datetime
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.crud.finance.ledger import CENT, ZERO
+from app.crud.sales import analytics, credit, output
+from app.crud.sales.output import OutputSubject
+from app.models.sales.master import Customer, Product
+from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+from app.models.sales.output import OutputType
+from app.schemas.sales.orders import SalesOrderCreate
+from app.services.numbering import document_numbers
+
+order_repo = AsyncRepository(SalesOrder)
+
+# Orders whose value is part of the customer's open orders
+EXPOSED = (SalesOrderStatus.open, SalesOrderStatus.delivered)
+
+
+class OrderError(ValueError):
+    """Unknown customer or product, or a status change the order does not allow."""
+
+
+async def create_order(db: AsyncSession, order_in: SalesOrderCreate, user: str) -> SalesOrder:
+    """
+    Save the order; over the credit limit it is kept on credit hold instead
+    of opened. An open order gets its confirmation output scheduled; the
+    caller pushes it to the output worker after this commit.
+    """
+    customer = await db.get(Customer, order_in.customer_id)
+    if customer is None or not customer.is_active:
+        raise OrderError(f"Unknown customer {order_in.customer_id}")
+    product_ids = {line.product_id for line in order_in.lines}
+    found = set((await db.execute(
+        select(Product.id).where(Product.id.in_(product_ids), Product.is_active.is_(True))
+    )).scalars())
+    if found != product_ids:
+        raise OrderError(f"Unknown or inactive products: {sorted(product_ids - found)}")
+
+    amounts = [(line.quantity * line.unit_price).quantize(CENT) for line in order_in.lines]
+    total = sum(amounts, ZERO)
+    # Numbers come from their own transaction: draw one before this one writes
+    order_number = await document_numbers.next_number("SO")
+    within_limit = await credit.reserve_order(db, customer.id, total)
+    order = await order_repo.create(db, {
+        "order_number": order_number,
+        "customer_id": customer.id,
+        "order_date": order_in.order_date or datetime.date.today(),
+        "region": customer.region,
+        "status": SalesOrderStatus.open if within_limit else SalesOrderStatus.credit_hold,
+        "total": total,
+        "created_by": user,
+    })
+    await db.execute(insert(SalesOrderLine), [
+        {**line.model_dump(), "order_id": order.id, "line_no": n, "amount": amount}
+        for n, (line, amount) in enumerate(zip(order_in.lines, amounts), start=1)
+    ])
+    await analytics.post_orders(db, [order.id])
+    if within_limit:
+        await output.schedule(db, OutputType.order_confirmation, [
+            OutputSubject(order.id, customer.id, customer.customer_group, customer.region, total),
+        ])
+    await db.commit()
+    await db.refresh(order)
+    return order
+
+
+def order_list_query(status: Optional[SalesOrderStatus] = None, customer_id: Optional[int] = None):
+    filters = {}
+    if status:
+        filters["status"] = status
+    if customer_id is not None:
+        filters["customer_id"] = customer_id
+    return order_repo.query(filters=filters or None)
+
+
+async def get_lines(db: AsyncSession, order_id: int) -> list[SalesOrderLine]:
+    result = await db.execute(
+        select(SalesOrderLine).where(SalesOrderLine.order_id == order_id).order_by(SalesOrderLine.line_no)
+    )
+    return list(result.scalars())
+
+
+async def cancel_order(db: AsyncSession, order_id: int) -> Optional[SalesOrder]:
+    result = await db.execute(select(SalesOrder).where(SalesOrder.id == order_id).with_for_update())
+    order = result.scalars().first()
+    if not order:
+        return None
+    if order.status in (SalesOrderStatus.invoiced, SalesOrderStatus.cancelled):
+        raise OrderError(f"Order {order.order_number} is {order.status.value}")
+    if order.status in EXPOSED:
+        await credit.shift_orders(db, order.customer_id, -order.total)
+    await analytics.post_orders(db, [order.id], -1)
+    await order_repo.update(db, order, {"status": SalesOrderStatus.cancelled})
+    await analytics.post_orders(db, [order.id])
+    await db.commit()
+    await db.refresh(order)
+    return order
@@ -0,0 +1,180 @@
+# app/crud/sales/output.py
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.sales.output import OutputChannel, OutputCondition, OutputJob, OutputJobStatus, OutputType
+from app.schemas.sales.output import OutputConditionCreate
+
+condition_repo = AsyncRepository(OutputCondition)
+job_repo = AsyncRepository(OutputJob)
+
+# Session.info key: job ids scheduled in the open transaction, pushed to the queue after commit
+SCHEDULED = "output_jobs"
+# Documents per id lookup (bound parameters stay under the driver limits)
+ID_BATCH_SIZE = 5000
+
+
+class OutputError(ValueError):
+    """A job retried that has not failed."""
+
+
+# ------------------------------------------------------------------
+# 1. Conditions
+# ------------------------------------------------------------------
+async def create_condition(db: AsyncSession, condition_in: OutputConditionCreate) -> OutputCondition:
+    condition = await condition_repo.create(db, condition_in.model_dump())
+    await db.commit()
+    await db.refresh(condition)
+    return condition
+
+
+async def update_condition(
+    db: AsyncSession, condition_id: int, condition_in: OutputConditionCreate
+) -> Optional[OutputCondition]:
+    condition = await condition_repo.get(db, condition_id)
+    if not condition:
+        return None
+    await condition_repo.update(db, condition, condition_in.model_dump())
+    await db.commit()
+    await db.refresh(condition)
+    return condition
+
+
+async def delete_condition(db: AsyncSession, condition_id: int) -> bool:
+    condition = await condition_repo.get(db, condition_id)
+    if not condition:
+        return False
+    await condition_repo.delete(db, condition)
+    await db.commit()
+    return True
+
+
+def condition_list_query(output_type: Optional[OutputType] = None, is_active: Optional[bool] = None):
+    filters = {}
+    if output_type:
+        filters["output_type"] = output_type
+    if is_active is not None:
+        filters["is_active"] = is_active
+    return condition_repo.query(filters=filters or None)
+
+
+# ------------------------------------------------------------------
+# 2. Determination
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class OutputSubject:
+    """The document attributes conditions select on."""
+    document_id: int
+    customer_id: int
+    customer_group: str
+    region: Optional[str]
+    amount: Decimal
+
+
+def _specificity(condition: OutputCondition) -> tuple:
+    return (
+        not condition.customer_ids, not condition.customer_groups, not condition.regions,
+        condition.priority, condition.id,
+    )
+
+
+def _matches(condition: OutputCondition, subject: OutputSubject) -> bool:
+    return (
+        (not condition.customer_ids or subject.customer_id in condition.customer_ids)
+        and (not condition.customer_groups or subject.customer_group in condition.customer_groups)
+        and (not condition.regions or subject.region in condition.regions)
+        and (condition.min_amount is None or subject.amount >= condition.min_amount)
+    )
+
+
+def dedup_key(output_type: OutputType, document_id: int, channel: OutputChannel) -> str:
+    return f"{output_type.value}:{document_id}:{channel.value}"
+
+
+async def schedule(db: AsyncSession, output_type: OutputType, subjects: Iterable[OutputSubject]) -> int:
+    """
+    Determine the outputs of a document event and add their jobs to the
+    caller's transaction; returns the number of jobs to queue. The conditions
+    of the type are read once per event, however many documents it has.
+    Per document and channel the most specific matching condition wins.
+    A job that exists already (the event repeated) is not created again.
+    Rendering and sending happen in the output worker: the caller hands
+    the ids over with ``app.services.sales.output.enqueue_scheduled``
+    after committing.
+    """
+    subjects = list(subjects)
+    if not subjects:
+        return 0
+    conditions = sorted((await db.execute(
+        select(OutputCondition).where(OutputCondition.output_type == output_type, OutputCondition.is_active.is_(True))
+    )).scalars(), key=_specificity)
+    if not conditions:
+        return 0
+
+    rows = []
+    for subject in subjects:
+        channels = set()
+        for condition in conditions:
+            if condition.channel in channels or not _matches(condition, subject):
+                continue
+            channels.add(condition.channel)
+            rows.append({
+                "output_type": output_type, "channel": condition.channel, "document_id": subject.document_id,
+                "recipient": condition.recipient, "condition_id": condition.id,
+                "dedup_key": dedup_key(output_type, subject.document_id, condition.channel),
+                "status": OutputJobStatus.queued, "attempts": 0,
+            })
+    if not rows:
+        return 0
+    insert_ = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    # One cached executemany; RETURNING would go row by row with ON CONFLICT
+    await db.execute(insert_(OutputJob.__table__).on_conflict_do_nothing(index_elements=["dedup_key"]), rows)
+    document_ids = sorted({row["document_id"] for row in rows})
+    job_ids = []
+    for offset in range(0, len(document_ids), ID_BATCH_SIZE):
+        # Jobs of an earlier event still waiting are pushed again too: the queue skips them
+        job_ids += (await db.execute(
+            select(OutputJob.id).where(
+                OutputJob.output_type == output_type,
+                OutputJob.document_id.in_(document_ids[offset:offset + ID_BATCH_SIZE]),
+                OutputJob.status == OutputJobStatus.queued,
+            )
+        )).scalars()
+    db.info.setdefault(SCHEDULED, []).extend(job_ids)
+    return len(job_ids)
+
+
+# ------------------------------------------------------------------
+# 3. Jobs
+# ------------------------------------------------------------------
+def job_list_query(
+    job_status: Optional[OutputJobStatus] = None,
+    output_type: Optional[OutputType] = None,
+    document_id: Optional[int] = None,
+):
+    filters = {}
+    if job_status:
+        filters["status"] = job_status
+    if output_type:
+        filters["output_type"] = output_type
+    if document_id is not None:
+        filters["document_id"] = document_id
+    return job_repo.query(filters=filters or None)
+
+
+async def retry_job(db: AsyncSession, job: OutputJob) -> OutputJob:
+    """A failed job gets a fresh set of attempts."""
+    if job.status != OutputJobStatus.failed:
+        raise OutputError(f"Output job {job.id} is {job.status.value}")
+    await job_repo.update(db, job, {
+        "status": OutputJobStatus.queued, "attempts": 0, "error": None, "next_attempt_at": None,
+    })
+    await db.commit()
+    await db.refresh(job)
+    return job
@@ -0,0 +1,106 @@
+# app/crud/sales/pricing.py
+from typing import Optional, Union
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.sales.pricing import DiscountScheme, PricingRule, PricingVersion
+from app.schemas.sales.pricing import DiscountSchemeCreate, PricingRuleCreate
+
+rule_repo = AsyncRepository(PricingRule)
+scheme_repo = AsyncRepository(DiscountScheme)
+
+ConditionIn = Union[PricingRuleCreate, DiscountSchemeCreate]
+
+
+async def pricing_version(db: AsyncSession) -> int:
+    version = (await db.execute(select(PricingVersion.version).where(PricingVersion.id == 1))).scalar()
+    return version or 0
+
+
+async def _bump_version(db: AsyncSession) -> int:
+    insert_ = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    stmt = (
+        insert_(PricingVersion)
+        .values(id=1, version=1)
+        .on_conflict_do_update(
+            index_elements=["id"],
+            set_={"version": PricingVersion.version + 1, "changed_at": func.now()},
+        )
+        .returning(PricingVersion.version)
+    )
+    return (await db.execute(stmt)).scalar_one()
+
+
+def _values(condition_in: ConditionIn) -> dict:
+    # JSON column: tier bounds and discounts as decimal strings
+    return {**condition_in.model_dump(), "tiers": [tier.model_dump(mode="json") for tier in condition_in.tiers]}
+
+
+async def _create(db: AsyncSession, repo: AsyncRepository, condition_in: ConditionIn):
+    condition = await repo.create(db, _values(condition_in))
+    await _bump_version(db)
+    await db.commit()
+    await db.refresh(condition)
+    return condition
+
+
+async def _update(db: AsyncSession, repo: AsyncRepository, condition_id: int, condition_in: ConditionIn):
+    condition = await repo.get(db, condition_id)
+    if not condition:
+        return None
+    await repo.update(db, condition, _values(condition_in))
+    await _bump_version(db)
+    await db.commit()
+    await db.refresh(condition)
+    return condition
+
+
+async def _delete(db: AsyncSession, repo: AsyncRepository, condition_id: int) -> bool:
+    condition = await repo.get(db, condition_id)
+    if not condition:
+        return False
+    await repo.delete(db, condition)
+    await _bump_version(db)
+    await db.commit()
+    return True
+
+
+# ------------------------------------------------------------------
+# Pricing rules
+# ------------------------------------------------------------------
+async def create_rule(db: AsyncSession, rule_in: PricingRuleCreate) -> PricingRule:
+    return await _create(db, rule_repo, rule_in)
+
+
+async def update_rule(db: AsyncSession, rule_id: int, rule_in: PricingRuleCreate) -> Optional[PricingRule]:
+    return await _update(db, rule_repo, rule_id, rule_in)
+
+
+async def delete_rule(db: AsyncSession, rule_id: int) -> bool:
+    return await _delete(db, rule_repo, rule_id)
+
+
+def rule_list_query(is_active: Optional[bool] = None):
+    return rule_repo.query(filters={"is_active": is_active} if is_active is not None else None)
+
+
+# ------------------------------------------------------------------
+# Discount schemes
+# ------------------------------------------------------------------
+async def create_scheme(db: AsyncSession, scheme_in: DiscountSchemeCreate) -> DiscountScheme:
+    return await _create(db, scheme_repo, scheme_in)
+
+
+async def update_scheme(db: AsyncSession, scheme_id: int, scheme_in: DiscountSchemeCreate) -> Optional[DiscountScheme]:
+    return await _update(db, scheme_repo, scheme_id, scheme_in)
+
+
+async def delete_scheme(db: AsyncSession, scheme_id: int) -> bool:
+    return await _delete(db, scheme_repo, scheme_id)
+
+
+def scheme_list_query(is_active: Optional[bool] = None):
+    return scheme_repo.query(filters={"is_active": is_active} if is_active is not None else None)
@@ -0,0 +1,51 @@
+# app/crud/sales/stock.py
+import datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import AsyncRepository
+from app.models.sales.master import Product
+from app.models.sales.stock import MovementSource, MovementType, StockMovement
+from app.schemas.sales.stock import ReservationCreate, StockMovementCreate
+
+movement_repo = AsyncRepository(StockMovement)
+
+
+class StockError(ValueError):
+    """Movement for an unknown or inactive product."""
+
+
+async def create_movement(db: AsyncSession, movement_in: StockMovementCreate, user: str) -> StockMovement:
+    """Append to the stock ledger; ATP timelines pick it up on their next sync."""
+    product = await db.get(Product, movement_in.product_id)
+    if product is None or not product.is_active:
+        raise StockError(f"Unknown product {movement_in.product_id}")
+    movement = await movement_repo.create(db, {
+        **movement_in.model_dump(),
+        "due_date": movement_in.due_date or datetime.date.today(),
+        "created_by": user,
+    })
+    await db.commit()
+    await db.refresh(movement)
+    return movement
+
+
+async def create_reservation(db: AsyncSession, reservation_in: ReservationCreate, user: str) -> StockMovement:
+    return await create_movement(db, StockMovementCreate(
+        product_id=reservation_in.product_id,
+        movement_type=MovementType.reservation,
+        source=MovementSource.sales_order,
+        reference=reservation_in.reference,
+        quantity=reservation_in.quantity,
+        due_date=reservation_in.promise_date,
+    ), user=user)
+
+
+def movement_list_query(product_id: Optional[int] = None, movement_type: Optional[MovementType] = None):
+    filters = {}
+    if product_id is not None:
+        filters["product_id"] = product_id
+    if movement_type:
+        filters["movement_type"] = movement_type
+    return movement_repo.query(filters=filters or None)
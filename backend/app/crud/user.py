@@ -1,36 +1,54 @@
 # app/crud/user.py
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud.base import AsyncRepository
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
-
-# GET USER BY USERNAME
-def get_by_username(db: Session, username: str):
-    return db.query(User).filter(User.username == username).first()
-
-# CREATE USER
-def create(db: Session, obj_in: UserCreate):
-    hashed_password = get_password_hash(obj_in.password)
-    db_user = User(
-        username=obj_in.username,
-        email=obj_in.email,
-        hashed_password=hashed_password,
-        full_name=obj_in.full_name,
-        role_id=obj_in.role_id,
-        is_superadmin=obj_in.is_superadmin or False
-    )
-    db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+from app.constants.roles import ROLES
+
+user_repo = AsyncRepository(User)
+
+# GET USER BY ID / EMAIL
+async def get(db: AsyncSession, user_id: int) -> Optional[User]:
+    return await user_repo.get(db, user_id)
+
+async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
+    return await user_repo.get_by(db, email=email)
+
+# CREATE USER (password already hashed by the caller, off the event loop)
+async def create(db: AsyncSession, obj_in: UserCreate, hashed_password: str) -> User:
+    db_user = await user_repo.create(db, {
+        "email": obj_in.email,
+        "name": obj_in.name,
+        "hashed_password": hashed_password,
+        "role": ROLES(obj_in.role),
+        "is_superadmin": obj_in.is_superadmin or False,
+    })
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
+# LIST QUERY (for keyset pages / streaming)
+def list_query():
+    return user_repo.query()
+
 # GET ALL USERS
-def get_all(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(User).offset(skip).limit(limit).all()
-
-def list_users(db:Session, skip: int = 0):
-    pass
-def update_user(db:Session, skip: int = 0):
-    pass
-def assign_role_to_user():
-    pass
\ No newline at end of file
+async def get_all(db: AsyncSession, skip: int = 0, limit: Optional[int] = 100):
+    return await user_repo.list(db, skip=skip, limit=limit)
+
+# UPDATE USER (only fields that were sent)
+async def update_user(db: AsyncSession, user: User, obj_in: UserUpdate, hashed_password: Optional[str] = None) -> User:
+    values = obj_in.model_dump(exclude_unset=True, exclude_none=True, exclude={"password"})
+    if "role" in values:
+        values["role"] = ROLES(values["role"])  # ← Convert int to Enum
+    if hashed_password is not None:
+        values["hashed_password"] = hashed_password
+    await user_repo.update(db, user, values)
+    await db.commit()
+    await db.refresh(user)
+    return user
+
+# DELETE USER
+async def delete(db: AsyncSession, user: User) -> None:
+    await user_repo.delete(db, user)
+    await db.commit()
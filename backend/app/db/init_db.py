@@ -1,26 +1,70 @@
-from app.db.session import get_db
-from app.crud import user as user_crud, role as role_crud
-from app.core.security import get_password_hash
-from app.models.role import Role
+# app/db/init_db.py
+import asyncio
 
-def init_superadmin():
-    db = next(get_db())
-    if user_crud.get_by_username(db, "superadmin"):
-        return
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import select
 
-    # Create SuperAdmin Role
-    super_role = role_crud.get_by_name(db, "superadmin")
-    if not super_role:
-        super_role = role_crud.create(db, RoleCreate(name="superadmin", description="Full Access"))
+from app.constants.roles import ROLES
+from app.models.user import User
+from app.utils.hashing import password_hasher
 
-    # Create SuperAdmin User
-    hashed = get_password_hash("admin123")
-    user_crud.create(db, {
-        "username": "superadmin",
-        "email": "admin@erp.com",
-        "hashed_password": hashed,
-        "full_name": "Super Admin",
-        "role_id": super_role.id,
-        "is_superadmin": True
-    })
-    print("SuperAdmin created: superadmin / admin123")
+DEFAULT_USERS = [
+    {
+        "name": "Super Admin",
+        "email": "admin@nextgen.com",
+        "password": "admin123",
+        "role": ROLES.SUPER_ADMIN,
+    },
+    {
+        "name": "Sales Manager",
+        "email": "sales@nextgen.com",
+        "password": "sales123",
+        "role": ROLES.SALES_MANAGER,
+    },
+    {
+        "name": "Regular User",
+        "email": "user@nextgen.com",
+        "password": "user123",
+        "role": ROLES.USER,
+    },
+]
+
+
+async def seed_default_users(db: AsyncSession) -> int:
+    """
+    Create the default users that do not exist yet.
+
+    One query finds the existing emails; bcrypt only runs for missing
+    users, so a restart against a seeded database hashes nothing. The
+    insert skips emails that appeared in the meantime, so workers booting
+    together do not fail on the unique index.
+    """
+    emails = [d["email"] for d in DEFAULT_USERS]
+    result = await db.execute(select(User.email).where(User.email.in_(emails)))
+    existing = set(result.scalars().all())
+    missing = [d for d in DEFAULT_USERS if d["email"] not in existing]
+    if not missing:
+        return 0
+
+    hashes = await asyncio.gather(*(password_hasher.hash(d["password"]) for d in missing))
+    insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    stmt = (
+        insert(User.__table__)
+        .values([
+            {
+                "name": d["name"],
+                "email": d["email"],
+                "hashed_password": hashed_password,
+                "role": d["role"],
+                "is_active": True,
+                "is_superadmin": d["role"] == ROLES.SUPER_ADMIN,
+            }
+            for d, hashed_password in zip(missing, hashes)
+        ])
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.__table__.c.id)
+    )
+    created = len((await db.execute(stmt)).all())
+    await db.commit()
+    return created
@@ -0,0 +1,57 @@
+# app/db/schema.py
+from pathlib import Path
+from typing import Literal
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+from app.db.session import engine, create_db_and_tables, drop_db_and_tables
+
+BASE_DIR = Path(__file__).resolve().parents[2]
+
+SchemaMode = Literal["check", "create", "recreate"]
+
+
+# ------------------------------------------------------------------
+# Alembic revisions
+# ------------------------------------------------------------------
+def alembic_heads() -> set[str]:
+    """Head revision(s) of the migration scripts shipped with this code."""
+    config = Config(str(BASE_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BASE_DIR / "alembic"))
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+async def database_revisions() -> set[str]:
+    """Revision(s) recorded in the database's alembic_version table."""
+    async with engine.connect() as conn:
+        try:
+            result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+        except ProgrammingError:  # table missing → never migrated
+            return set()
+        return set(result.scalars().all())
+
+
+# ------------------------------------------------------------------
+# Startup entry point
+# ------------------------------------------------------------------
+async def prepare_schema(mode: SchemaMode) -> None:
+    """
+    check    – only verify the database is at the Alembic head (production)
+    create   – create missing tables, keep data
+    recreate – drop and create every table (local development only)
+    """
+    if mode == "recreate":
+        await drop_db_and_tables()
+        await create_db_and_tables()
+    elif mode == "create":
+        await create_db_and_tables()
+    else:
+        expected, current = alembic_heads(), await database_revisions()
+        if current != expected:
+            raise RuntimeError(
+                f"Database schema is at {sorted(current) or 'no revision'}, "
+                f"code expects {sorted(expected)}. Run `alembic upgrade head`."
+            )
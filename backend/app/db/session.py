@@ -1,18 +1,95 @@
 # app/db/session.py
+import time
 from contextlib import asynccontextmanager
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
 from app.models import Base  # SQLModel Base
+from sqlmodel import SQLModel
 from typing import AsyncGenerator
 
 # ------------------------------------------------------------------
-# Engine
+# Pool with checkout wait-time accounting
 # ------------------------------------------------------------------
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    future=True,
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long checkouts wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited_ms = (time.perf_counter() - started) * 1000
+            self.checkouts += 1
+            self.wait_total_ms += waited_ms
+            self.wait_max_ms = max(self.wait_max_ms, waited_ms)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(0, self.overflow()),
+            "max_overflow": self._max_overflow,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total_ms / self.checkouts, 3) if self.checkouts else 0.0,
+            "wait_max_ms": round(self.wait_max_ms, 3),
+        }
+
+
+# ------------------------------------------------------------------
+# Engines (primary + optional read replica)
+# ------------------------------------------------------------------
+def _driver_connect_args(url: str) -> dict:
+    if url.startswith("postgresql+asyncpg"):
+        return {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    if url.startswith("postgresql+psycopg"):
+        # None disables server-side prepared statements
+        return {
+            "prepare_threshold": settings.DB_PREPARE_THRESHOLD if settings.DB_STATEMENT_CACHE_SIZE else None
+        }
+    return {}
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    new_engine = create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_driver_connect_args(url),
+    )
+    if url.startswith("postgresql+psycopg") and settings.DB_STATEMENT_CACHE_SIZE:
+        @event.listens_for(new_engine.sync_engine, "connect")
+        def _set_prepared_max(dbapi_connection, connection_record):
+            dbapi_connection.driver_connection.prepared_max = settings.DB_STATEMENT_CACHE_SIZE
+    return new_engine
+
+
+engine = _create_engine(settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
+read_engine = (
+    _create_engine(settings.READ_DATABASE_URL, settings.DB_READ_POOL_SIZE, settings.DB_READ_MAX_OVERFLOW)
+    if settings.HAS_READ_REPLICA
+    else engine
 )
 
 # ------------------------------------------------------------------
@@ -24,6 +101,12 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 
+ReadSessionLocal = sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 # ------------------------------------------------------------------
 # Async context manager (used internally)
 # ------------------------------------------------------------------
@@ -44,13 +127,40 @@ async def get_db():
         finally:
             await session.close()
 
+
+# Read-only session on the replica (may lag the primary slightly).
+# Use for list and report endpoints, never for read-then-write.
+async def get_read_db():
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+# ------------------------------------------------------------------
+# Pool stats / dispose
+# ------------------------------------------------------------------
+def pool_stats() -> dict:
+    stats = {"primary": engine.pool.stats()}
+    stats["read"] = read_engine.pool.stats() if read_engine is not engine else "primary"
+    return stats
+
+
+async def dispose_engines():
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
+
 # ------------------------------------------------------------------
 # DB init / drop
 # ------------------------------------------------------------------
+# User lives in SQLModel.metadata, the SQLAlchemy models in Base.metadata
 async def create_db_and_tables():
     async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
         await conn.run_sync(Base.metadata.create_all)
 
 async def drop_db_and_tables():
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
\ No newline at end of file
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.drop_all)
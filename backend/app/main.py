@@ -1,20 +1,27 @@
 # app/main.py
 from fastapi import FastAPI
 from fastapi.security import OAuth2PasswordBearer
-from sqlmodel import select
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.core.startup import startup_timer
 from app.core.config import settings
-from app.api.v1 import auth, users, router as api_router
-from app.db.session import create_db_and_tables, get_db, engine, drop_db_and_tables  
-from app.models.user import User
-from app.core.security import get_password_hash
-from app.constants.roles import ROLES
-from app.core.redis import init_redis,redis_client
 
-from app.api.v1.auth import limiter, custom_rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
+with startup_timer.phase("router_import"):
+    from app.api.v1 import auth, users, router as api_router
+
+from app.db.session import get_db, dispose_engines
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.services.rbac import RBACMiddleware
+from app.db.schema import prepare_schema
+from app.db.init_db import seed_default_users
+from app.core.redis import init_redis, close_redis, get_redis
+from app.core.principal_cache import start_invalidation_listener, stop_invalidation_listener
+
+from app.core.rate_limit import RateLimitExceeded, rate_limit_exceeded_handler
+from app.utils.hashing import PasswordHashingBusy, password_hashing_busy_handler, password_hasher
+from app.services.finance.depreciation import shutdown_pool as shutdown_depreciation_pool
+from app.services.sales.billing import shutdown_pool as shutdown_billing_pool
 
 # ----------------------------------------------------------------------
 # 1. OAuth2 scheme
@@ -34,8 +41,11 @@ app = FastAPI(
 )
 
 # Custom error handler
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, custom_rate_limit_exceeded_handler)
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+app.add_exception_handler(PasswordHashingBusy, password_hashing_busy_handler)
+
+# Module access (MODULE_ACCESS) from the JWT role claim; CORS stays outermost
+app.add_middleware(RBACMiddleware, prefix=settings.API_V1_STR)
 
 # Configure CORS
 app.add_middleware(
@@ -44,61 +54,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
 
 # ----------------------------------------------------------------------
-# 3. Startup: create tables + seed users
+# 3. Startup: verify schema + seed missing users (each phase timed)
 # ----------------------------------------------------------------------
 @app.on_event("startup")
 async def on_startup() -> None:
-    await init_redis()
-    await drop_db_and_tables()
-    await create_db_and_tables()
-
-    async for db in get_db():  # Fixed: get_db() with parentheses
-        defaults = [
-            {
-                "name": "Super Admin",
-                "email": "admin@nextgen.com",
-                "password": "admin123",
-                "role": ROLES.SUPER_ADMIN,
-            },
-            {
-                "name": "Sales Manager",
-                "email": "sales@nextgen.com",
-                "password": "sales123",
-                "role": ROLES.SALES_MANAGER,
-            },
-            {
-                "name": "Regular User",
-                "email": "user@nextgen.com",
-                "password": "user123",
-                "role": ROLES.USER,
-            },
-        ]
-
-        for d in defaults:
-            # Check if user already exists
-            result = await db.execute(select(User).where(User.email == d["email"]))
-            if result.scalars().first():
-                continue  # Skip if exists
-
-            # Create new user
-            user = User(
-                name=d["name"],
-                email=d["email"],
-                hashed_password=get_password_hash(d["password"]),
-                role = d["role"],
-                is_active=True,
-                is_superadmin=(d["role"] == ROLES.SUPER_ADMIN),
-            )
-            db.add(user)
-
-        await db.commit()
-        break  # Only run once
+    with startup_timer.phase("redis_init"):
+        await init_redis()
+        start_invalidation_listener(await get_redis())
+
+    with startup_timer.phase("db_check"):
+        await prepare_schema(settings.STARTUP_SCHEMA_MODE)
+
+    if settings.SEED_DEFAULT_USERS:
+        with startup_timer.phase("seed"):
+            async for db in get_db():
+                await seed_default_users(db)
+                break  # Only run once
+
+    startup_timer.finish()
 
 
 # ----------------------------------------------------------------------
@@ -106,9 +86,12 @@ async def on_startup() -> None:
 # ----------------------------------------------------------------------
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
-    if redis_client:
-        await redis_client.close()
-    await engine.dispose()  # Properly close all connections
+    await stop_invalidation_listener()
+    await close_redis()
+    password_hasher.shutdown()
+    shutdown_depreciation_pool()
+    shutdown_billing_pool()
+    await dispose_engines()  # Properly close all connections
 
 
 # ----------------------------------------------------------------------
@@ -122,5 +105,5 @@ app.include_router(api_router, prefix=settings.API_V1_STR, tags=["users"])
 # 6. Root endpoint
 # ----------------------------------------------------------------------
 @app.get("/", tags=["root"])
-def root() -> dict:
+async def root() -> dict:
     return {"message": "NextGen LEDGER API – Running!"}
\ No newline at end of file
@@ -1,3 +1,9 @@
 from sqlalchemy.ext.declarative import declarative_base
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+# Register every table on Base.metadata (create_all / Alembic)
+from app.models import numbering  # noqa: E402,F401
+from app.models.procurment import pr  # noqa: E402,F401
+from app.models.finance import ledger, open_items, bank, assets, cost_allocation, tax, budget, close  # noqa: E402,F401
+from app.models.sales import master, pricing, stock, orders, credit, analytics, billing, output  # noqa: E402,F401
@@ -0,0 +1,78 @@
+from sqlalchemy import (
+    Column, Integer, String, Date, DateTime, Enum, Float, ForeignKey, Numeric, UniqueConstraint,
+)
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+
+class DepreciationMethod(str, enum.Enum):
+    straight_line = "straight_line"
+    declining_balance = "declining_balance"
+    units_of_production = "units_of_production"
+
+
+class AssetStatus(str, enum.Enum):
+    active = "active"
+    fully_depreciated = "fully_depreciated"
+    disposed = "disposed"
+
+
+class FixedAsset(Base):
+    __tablename__ = "fixed_assets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    asset_code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    category = Column(String, nullable=True)
+    location = Column(String, nullable=True)
+    cost_center = Column(String(32), nullable=True)
+    cost = Column(MONEY, nullable=False)
+    salvage_value = Column(MONEY, nullable=False, default=0)
+    in_service_date = Column(Date, nullable=False)
+    method = Column(Enum(DepreciationMethod), nullable=False)
+    useful_life_months = Column(Integer, nullable=False)
+    # Annual rate for declining balance; NULL = double declining (2 / life in years)
+    declining_rate = Column(Numeric(6, 4), nullable=True)
+    # Lifetime output for units of production
+    total_units = Column(Numeric(18, 2), nullable=True)
+    expense_account_id = Column(Integer, ForeignKey("gl_accounts.id"), nullable=False)
+    accumulated_account_id = Column(Integer, ForeignKey("gl_accounts.id"), nullable=False)
+    accumulated_depreciation = Column(MONEY, nullable=False, default=0)
+    last_period = Column(Integer, nullable=True)  # YYYYMM of the last run that included it
+    status = Column(Enum(AssetStatus), nullable=False, default=AssetStatus.active, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class AssetUsage(Base):
+    """Units produced per asset and month (units-of-production input)."""
+    __tablename__ = "asset_usage"
+
+    asset_id = Column(Integer, ForeignKey("fixed_assets.id", ondelete="CASCADE"), primary_key=True)
+    period = Column(Integer, primary_key=True)  # YYYYMM
+    units = Column(Numeric(18, 2), nullable=False)
+
+
+class DepreciationRun(Base):
+    """One monthly run over the whole register; runs are strictly sequential."""
+    __tablename__ = "depreciation_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    period = Column(Integer, nullable=False)  # YYYYMM
+    entry_id = Column(Integer, ForeignKey("journal_entries.id"), nullable=True)
+    asset_count = Column(Integer, nullable=False)
+    total = Column(MONEY, nullable=False)
+    compute_seconds = Column(Float, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (UniqueConstraint("period", name="uq_depreciation_runs_period"),)
+
+
+class DepreciationRunLine(Base):
+    __tablename__ = "depreciation_run_lines"
+
+    run_id = Column(Integer, ForeignKey("depreciation_runs.id", ondelete="CASCADE"), primary_key=True)
+    asset_id = Column(Integer, ForeignKey("fixed_assets.id"), primary_key=True)
+    amount = Column(MONEY, nullable=False)
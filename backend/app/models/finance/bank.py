@@ -0,0 +1,65 @@
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Date, DateTime, Enum, ForeignKey, Index,
+)
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+ID = BigInteger().with_variant(Integer, "sqlite")
+
+
+class StatementFormat(str, enum.Enum):
+    csv = "csv"
+    mt940 = "mt940"
+    camt = "camt"  # camt.053
+
+
+class BankStatement(Base):
+    """One imported statement file for a bank GL account."""
+    __tablename__ = "bank_statements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), index=True, nullable=False)
+    format = Column(Enum(StatementFormat), nullable=False)
+    filename = Column(String, nullable=True)
+    line_count = Column(Integer, nullable=False, default=0)
+    imported_by = Column(String, nullable=True)
+    imported_at = Column(DateTime, server_default=func.now())
+
+
+class BankReconciliationMatch(Base):
+    """A group of bank lines and GL lines accepted as the same cash movement."""
+    __tablename__ = "bank_matches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), index=True, nullable=False)
+    rule = Column(String(32), nullable=False)  # reference / amount_date / tolerance / many_to_one / manual
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class BankStatementLine(Base):
+    __tablename__ = "bank_statement_lines"
+
+    id = Column(ID, primary_key=True)
+    statement_id = Column(Integer, ForeignKey("bank_statements.id", ondelete="CASCADE"), index=True, nullable=False)
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), nullable=False)
+    booking_date = Column(Date, nullable=False)
+    amount = Column(MONEY, nullable=False)  # signed: + money in, - money out
+    reference = Column(String, nullable=True)
+    description = Column(String, nullable=True)
+    match_id = Column(Integer, ForeignKey("bank_matches.id", ondelete="SET NULL"), index=True, nullable=True)
+
+    __table_args__ = (
+        # Unmatched residue per account, in date order
+        Index("ix_bank_statement_lines_account_match_date", "account_id", "match_id", "booking_date"),
+    )
+
+
+class BankMatchedJournalLine(Base):
+    """GL side of a match; a journal line can be reconciled only once."""
+    __tablename__ = "bank_match_journal_lines"
+
+    journal_line_id = Column(ID, ForeignKey("journal_lines.id"), primary_key=True)
+    match_id = Column(Integer, ForeignKey("bank_matches.id", ondelete="CASCADE"), index=True, nullable=False)
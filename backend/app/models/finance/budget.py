@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+
+
+class Budget(Base):
+    """A budget version covering ``from_period``..``to_period`` (YYYYMM)."""
+    __tablename__ = "budgets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    from_period = Column(Integer, nullable=False)
+    to_period = Column(Integer, nullable=False)
+    # Bumped with every line change (cache key component)
+    version = Column(Integer, nullable=False, default=1)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class BudgetLine(Base):
+    """Budgeted amount per account, cost centre and month, in the account's natural sign."""
+    __tablename__ = "budget_lines"
+
+    budget_id = Column(Integer, ForeignKey("budgets.id", ondelete="CASCADE"), primary_key=True)
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), primary_key=True)
+    cost_center = Column(String(32), primary_key=True, default="")  # "" = no cost centre
+    period = Column(Integer, primary_key=True)
+    amount = Column(MONEY, nullable=False)
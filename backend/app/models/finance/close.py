@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Float, ForeignKey
+from sqlalchemy.sql import func
+from app.models import Base
+import enum
+
+
+class CloseStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class CloseStepStatus(str, enum.Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class CloseRun(Base):
+    """Month-end close of one period (YYYYMM); a failed run is resumed, not repeated."""
+    __tablename__ = "close_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    period = Column(Integer, unique=True, nullable=False)
+    status = Column(Enum(CloseStatus), nullable=False, default=CloseStatus.queued)
+    # Times the run was picked up by a worker (1 + resumes)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class CloseRunStep(Base):
+    """Checkpoint of one pipeline step; completed steps are skipped on resume."""
+    __tablename__ = "close_run_steps"
+
+    run_id = Column(Integer, ForeignKey("close_runs.id", ondelete="CASCADE"), primary_key=True)
+    step = Column(String(32), primary_key=True)
+    status = Column(Enum(CloseStepStatus), nullable=False, default=CloseStepStatus.pending)
+    result = Column(Text, nullable=True)  # JSON summary returned by the step
+    error = Column(Text, nullable=True)
+    seconds = Column(Float, nullable=True)
+    started_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,38 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum, ForeignKey, Numeric
+from sqlalchemy.sql import func, true
+from app.models import Base
+import enum
+
+
+class CostCenterKind(str, enum.Enum):
+    service = "service"        # allocates its cost onwards (IT, HR, maintenance)
+    production = "production"  # final cost object
+
+
+class CostCenter(Base):
+    """Cost centre master; ``code`` is what journal lines carry in cost_center."""
+    __tablename__ = "cost_centers"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    kind = Column(Enum(CostCenterKind), nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+
+
+class AllocationDriver(Base):
+    """Driver quantity (hours, m², headcount …) a service centre delivers to a receiver."""
+    __tablename__ = "allocation_drivers"
+
+    sender_id = Column(Integer, ForeignKey("cost_centers.id", ondelete="CASCADE"), primary_key=True)
+    receiver_id = Column(Integer, ForeignKey("cost_centers.id", ondelete="CASCADE"), primary_key=True)
+    quantity = Column(Numeric(18, 4), nullable=False)
+
+
+class AllocationDriverVersion(Base):
+    """Single-row counter bumped with every driver change (cache key component)."""
+    __tablename__ = "allocation_driver_versions"
+
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(Integer, nullable=False, default=0)
+    changed_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,109 @@
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Date, DateTime, Enum, Boolean, Numeric, ForeignKey, Index,
+)
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func, true
+from app.models import Base
+import enum
+
+# Money columns: exact decimals, never Float
+MONEY = Numeric(18, 2)
+
+
+class AccountType(str, enum.Enum):
+    asset = "asset"
+    liability = "liability"
+    equity = "equity"
+    income = "income"
+    expense = "expense"
+    bank = "bank"
+    cash = "cash"
+
+
+class JournalStatus(str, enum.Enum):
+    draft = "draft"
+    posted = "posted"
+    void = "void"
+
+
+class Account(Base):
+    """Chart of accounts."""
+    __tablename__ = "gl_accounts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    type = Column(Enum(AccountType), nullable=False)
+    opening = Column(MONEY, nullable=False, default=0, server_default="0")
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+
+
+class JournalEntry(Base):
+    __tablename__ = "journal_entries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entry_number = Column(String, unique=True, index=True, nullable=False)
+    entry_date = Column(Date, index=True, nullable=False)
+    reference = Column(String, nullable=True)
+    description = Column(String, nullable=True)
+    status = Column(Enum(JournalStatus), nullable=False, default=JournalStatus.draft)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    posted_at = Column(DateTime, nullable=True)
+
+    # Load explicitly (selectinload) – never lazily inside async code
+    lines = relationship(
+        "JournalLine", back_populates="entry", cascade="all, delete-orphan",
+        order_by="JournalLine.id", lazy="raise",
+    )
+
+
+class JournalLine(Base):
+    __tablename__ = "journal_lines"
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    entry_id = Column(Integer, ForeignKey("journal_entries.id", ondelete="CASCADE"), index=True, nullable=False)
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), nullable=False)
+    debit = Column(MONEY, nullable=False, default=0)
+    credit = Column(MONEY, nullable=False, default=0)
+    cost_center = Column(String(32), nullable=True)
+    description = Column(String, nullable=True)
+
+    entry = relationship("JournalEntry", back_populates="lines")
+
+    __table_args__ = (
+        Index("ix_journal_lines_account_entry", "account_id", "entry_id"),
+    )
+
+
+class AccountPeriodBalance(Base):
+    """
+    Posted totals per account and month, maintained by the posting code in
+    the same transaction as the journal lines.
+
+    ``debit``/``credit`` are the movement within ``period`` (YYYYMM);
+    ``closing_*`` are running totals from the first posting up to the end of
+    ``period``, so a balance as of any month end is a single row read.
+    """
+    __tablename__ = "gl_period_balances"
+
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), primary_key=True)
+    period = Column(Integer, primary_key=True)
+    debit = Column(MONEY, nullable=False, default=0)
+    credit = Column(MONEY, nullable=False, default=0)
+    closing_debit = Column(MONEY, nullable=False, default=0)
+    closing_credit = Column(MONEY, nullable=False, default=0)
+
+
+class AccountDailyBalance(Base):
+    """
+    Posted movement per account and day, maintained next to the period
+    balances. A balance as of a day inside a month is the month's opening
+    running total plus at most 31 of these rows, however many lines posted.
+    """
+    __tablename__ = "gl_daily_balances"
+
+    account_id = Column(Integer, ForeignKey("gl_accounts.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    debit = Column(MONEY, nullable=False, default=0)
+    credit = Column(MONEY, nullable=False, default=0)
@@ -0,0 +1,82 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Enum, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+
+class Subledger(str, enum.Enum):
+    ar = "ar"  # customer invoices
+    ap = "ap"  # vendor invoices
+
+
+class OpenItemStatus(str, enum.Enum):
+    open = "open"
+    partial = "partial"
+    paid = "paid"
+
+
+class OpenItem(Base):
+    """AR/AP invoice with its outstanding balance (the aging input)."""
+    __tablename__ = "open_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    ledger = Column(Enum(Subledger), nullable=False)
+    party_code = Column(String(32), nullable=False)  # customer / vendor code
+    party_name = Column(String, nullable=True)
+    document_number = Column(String, nullable=False)
+    issue_date = Column(Date, nullable=False)
+    due_date = Column(Date, nullable=False)
+    amount = Column(MONEY, nullable=False)
+    balance = Column(MONEY, nullable=False)
+    status = Column(Enum(OpenItemStatus), nullable=False, default=OpenItemStatus.open)
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_open_items_ledger_document", "ledger", "document_number", unique=True),
+        Index("ix_open_items_ledger_party", "ledger", "party_code"),
+        # Intraday aging refresh: "what changed since the snapshot"
+        Index("ix_open_items_ledger_updated", "ledger", "updated_at"),
+        # Tax returns: every invoice issued in the period
+        Index("ix_open_items_issue_date", "issue_date"),
+    )
+
+
+class OpenItemPayment(Base):
+    """One payment against an open item; aging for a past date replays these."""
+    __tablename__ = "open_item_payments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    open_item_id = Column(Integer, ForeignKey("open_items.id"), nullable=False)
+    paid_on = Column(Date, nullable=False)
+    amount = Column(MONEY, nullable=False)
+
+    __table_args__ = (
+        Index("ix_open_item_payments_item_paid_on", "open_item_id", "paid_on"),
+    )
+
+
+class AgingSnapshot(Base):
+    """Per-party bucket totals for one ledger and as-of date."""
+    __tablename__ = "aging_snapshots"
+
+    ledger = Column(Enum(Subledger), primary_key=True)
+    as_of = Column(Date, primary_key=True)
+    party_code = Column(String(32), primary_key=True)
+    items = Column(Integer, nullable=False, default=0)
+    current = Column(MONEY, nullable=False, default=0)
+    days_1_30 = Column(MONEY, nullable=False, default=0)
+    days_31_60 = Column(MONEY, nullable=False, default=0)
+    days_61_90 = Column(MONEY, nullable=False, default=0)
+    days_90_plus = Column(MONEY, nullable=False, default=0)
+    total = Column(MONEY, nullable=False, default=0)
+
+
+class AgingSnapshotRun(Base):
+    """When a snapshot was last (re)computed – the intraday refresh watermark."""
+    __tablename__ = "aging_snapshot_runs"
+
+    ledger = Column(Enum(Subledger), primary_key=True)
+    as_of = Column(Date, primary_key=True)
+    computed_at = Column(DateTime, nullable=False)
+    full_run_at = Column(DateTime, nullable=False)
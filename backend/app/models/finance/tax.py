@@ -0,0 +1,62 @@
+from sqlalchemy import (
+    Column, Integer, BigInteger, String, Text, Date, DateTime, Enum, ForeignKey, Index, Numeric,
+)
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+ID = BigInteger().with_variant(Integer, "sqlite")
+
+
+class ReturnFormat(str, enum.Enum):
+    json = "json"
+    csv = "csv"
+
+
+class TaxReturnStatus(str, enum.Enum):
+    queued = "queued"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+
+
+class InvoiceTaxLine(Base):
+    """Taxable line of an AR (sales) or AP (purchase) invoice."""
+    __tablename__ = "invoice_tax_lines"
+
+    id = Column(ID, primary_key=True)
+    open_item_id = Column(Integer, ForeignKey("open_items.id", ondelete="CASCADE"), nullable=False)
+    tax_code = Column(String(16), nullable=False)        # GST18, IGST12, VAT5 …
+    rate = Column(Numeric(7, 4), nullable=False)         # percent
+    place_of_supply = Column(String(8), nullable=False)  # state / region code
+    hsn_code = Column(String(16), nullable=True)
+    taxable_amount = Column(MONEY, nullable=False)
+    tax_amount = Column(MONEY, nullable=False)
+
+    __table_args__ = (
+        # Return generation walks the lines invoice by invoice
+        Index("ix_invoice_tax_lines_item", "open_item_id", "id"),
+    )
+
+
+class TaxReturn(Base):
+    """A generated return file and the totals written into it."""
+    __tablename__ = "tax_returns"
+
+    id = Column(Integer, primary_key=True, index=True)
+    from_date = Column(Date, nullable=False)
+    to_date = Column(Date, nullable=False)
+    format = Column(Enum(ReturnFormat), nullable=False)
+    status = Column(Enum(TaxReturnStatus), nullable=False, default=TaxReturnStatus.queued)
+    file_path = Column(String, nullable=True)
+    lines = Column(BigInteger, nullable=False, default=0)
+    documents = Column(BigInteger, nullable=False, default=0)
+    output_taxable = Column(MONEY, nullable=False, default=0)
+    output_tax = Column(MONEY, nullable=False, default=0)
+    input_taxable = Column(MONEY, nullable=False, default=0)
+    input_tax = Column(MONEY, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    completed_at = Column(DateTime, nullable=True)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, BigInteger
+from app.models import Base
+
+class DocumentSequence(Base):
+    """Next free number per document type / branch / year (counter table)."""
+    __tablename__ = "document_sequences"
+
+    doc_type = Column(String(16), primary_key=True)
+    branch = Column(String(16), primary_key=True, default="")  # "" = company-wide
+    year = Column(Integer, primary_key=True)
+    next_value = Column(BigInteger, nullable=False, default=1)
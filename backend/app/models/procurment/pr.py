@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Integer, String, Float, Date, Enum
-from sqlalchemy.sql import func
-from database import Base
+from sqlalchemy import Column, Integer, String, Float, Date, Enum, Boolean
+from sqlalchemy.sql import func, false
+from app.models import Base
 import enum
 
-class PRStatus(enum.Enum):
+class PRStatus(str, enum.Enum):
     pending = "pending"
     approved = "approved"
     rejected = "rejected"
@@ -18,4 +18,5 @@ class PurchaseRequisition(Base):
     amount = Column(Float)
     items = Column(Integer)  # number of items
     status = Column(Enum(PRStatus), default=PRStatus.pending)
-    created_at = Column(Date, server_default=func.now())
\ No newline at end of file
+    created_at = Column(Date, server_default=func.current_date())
+    is_deleted = Column(Boolean, nullable=False, default=False, server_default=false())
@@ -0,0 +1,62 @@
+from sqlalchemy import Column, Integer, String, Date, Enum, Index, Numeric
+from app.models import Base
+from app.models.finance.ledger import MONEY
+from app.models.sales.orders import SalesOrderStatus
+import enum
+
+# product_id / customer_id of rows summed over every product / customer
+ALL = 0
+# hour of rows summed over the whole day
+ALL_HOURS = -1
+
+
+class RollupGrain(str, enum.Enum):
+    day = "day"
+    month = "month"  # period is the first of the month
+    year = "year"    # period is January 1st
+
+
+class SalesRollup(Base):
+    """
+    Booked (not cancelled) order lines by period × product × customer ×
+    region, kept per day, month and year at two levels: each customer, and
+    every customer (customer_id = ALL). Maintained in the order's own
+    transaction by ``app.crud.sales.analytics``.
+    """
+    __tablename__ = "sales_rollups"
+
+    customer_id = Column(Integer, primary_key=True)
+    grain = Column(Enum(RollupGrain), primary_key=True)
+    period = Column(Date, primary_key=True)
+    product_id = Column(Integer, primary_key=True)
+    region = Column(String(32), primary_key=True)  # "" = no region
+    revenue = Column(MONEY, nullable=False, default=0)
+    quantity = Column(Numeric(18, 4), nullable=False, default=0)
+    orders = Column(Integer, nullable=False, default=0)  # orders with the product
+
+    __table_args__ = (
+        # Product filter: one product across customers and periods
+        Index("ix_sales_rollups_product", "product_id", "customer_id", "grain", "period"),
+    )
+
+
+class SalesOrderRollup(Base):
+    """
+    Orders by period × customer × region × status × hour of entry, at four
+    levels: each or every customer (ALL) by each or every hour (ALL_HOURS).
+    """
+    __tablename__ = "sales_order_rollups"
+
+    hour = Column(Integer, primary_key=True)
+    grain = Column(Enum(RollupGrain), primary_key=True)
+    customer_id = Column(Integer, primary_key=True)
+    period = Column(Date, primary_key=True)
+    region = Column(String(32), primary_key=True)
+    status = Column(Enum(SalesOrderStatus), primary_key=True)
+    orders = Column(Integer, nullable=False, default=0)
+    revenue = Column(MONEY, nullable=False, default=0)
+
+    __table_args__ = (
+        # Every customer's rows of a period range (distinct customers, rankings)
+        Index("ix_sales_order_rollups_period", "hour", "grain", "period"),
+    )
@@ -0,0 +1,58 @@
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Enum, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+
+class BillingOutput(str, enum.Enum):
+    zip = "zip"      # one archive of every invoice PDF (downloadable)
+    files = "files"  # one PDF per invoice under the run's directory
+
+
+class BillingRunStatus(str, enum.Enum):
+    queued = "queued"        # waiting for the billing worker
+    running = "running"
+    rendering = "rendering"  # invoices committed, documents being written
+    completed = "completed"
+    failed = "failed"
+
+
+class BillingRun(Base):
+    """One billing run: every billable order up to ``billing_date`` invoiced together."""
+    __tablename__ = "billing_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    billing_date = Column(Date, nullable=False)
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=True)  # None = every customer
+    output = Column(Enum(BillingOutput), nullable=False, default=BillingOutput.zip)
+    status = Column(Enum(BillingRunStatus), nullable=False, default=BillingRunStatus.queued)
+    invoices = Column(Integer, nullable=False, default=0)
+    documents = Column(Integer, nullable=False, default=0)
+    total = Column(MONEY, nullable=False, default=0)
+    output_path = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    invoiced_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+
+
+class SalesInvoice(Base):
+    """Invoice of one sales order; its lines are the order's lines."""
+    __tablename__ = "sales_invoices"
+
+    id = Column(Integer, primary_key=True, index=True)
+    invoice_number = Column(String(32), unique=True, index=True, nullable=False)
+    run_id = Column(Integer, ForeignKey("billing_runs.id"), nullable=False)
+    order_id = Column(Integer, ForeignKey("sales_orders.id"), unique=True, nullable=False)
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)
+    issue_date = Column(Date, nullable=False)
+    due_date = Column(Date, nullable=False)
+    total = Column(MONEY, nullable=False)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        # Rendering walks a run's invoices in number order
+        Index("ix_sales_invoices_run", "run_id", "id"),
+    )
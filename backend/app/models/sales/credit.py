@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+
+
+class CreditExposure(Base):
+    """
+    A customer's credit position, updated in the same transaction as every
+    order, AR invoice and payment that moves it, so a credit check is one
+    primary-key read.
+    """
+    __tablename__ = "credit_exposures"
+
+    customer_id = Column(Integer, ForeignKey("customers.id", ondelete="CASCADE"), primary_key=True)
+    open_orders = Column(MONEY, nullable=False, default=0, server_default="0")       # open + delivered
+    open_receivables = Column(MONEY, nullable=False, default=0, server_default="0")  # AR balances
+    payments = Column(Integer, nullable=False, default=0, server_default="0")
+    avg_payment_days = Column(Float, nullable=False, default=0, server_default="0")  # rolling, days past due
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
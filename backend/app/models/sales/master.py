@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy.sql import func, true
+from app.models import Base
+from app.models.finance.ledger import MONEY
+
+
+class Customer(Base):
+    """Customer master; ``customer_group`` is the tier pricing conditions select on."""
+    __tablename__ = "customers"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    customer_group = Column(String(32), nullable=False)  # Basic, Standard, Premium, Enterprise
+    credit_limit = Column(MONEY, nullable=True)  # None = no credit check
+    region = Column(String(32), nullable=True)   # sales region (analytics)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+    created_at = Column(DateTime, server_default=func.now())
+
+
+class Product(Base):
+    """Sellable product with its list (base) price."""
+    __tablename__ = "products"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sku = Column(String(64), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    list_price = Column(MONEY, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+    created_at = Column(DateTime, server_default=func.now())
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Enum, ForeignKey, Index, Numeric
+from sqlalchemy.sql import func
+from app.models import Base
+from app.models.finance.ledger import MONEY
+import enum
+
+
+class SalesOrderStatus(str, enum.Enum):
+    open = "open"                # counts toward the customer's credit exposure
+    credit_hold = "credit_hold"  # over the credit limit when saved; released by the credit job
+    delivered = "delivered"      # shipped, ready to bill
+    invoiced = "invoiced"        # exposure moved to open receivables
+    cancelled = "cancelled"
+
+
+class SalesOrder(Base):
+    __tablename__ = "sales_orders"
+
+    id = Column(Integer, primary_key=True, index=True)
+    order_number = Column(String(32), unique=True, index=True, nullable=False)
+    customer_id = Column(Integer, ForeignKey("customers.id"), nullable=False)
+    order_date = Column(Date, nullable=False)
+    region = Column(String(32), nullable=True)  # the customer's region when the order was saved
+    status = Column(Enum(SalesOrderStatus), nullable=False, default=SalesOrderStatus.open)
+    total = Column(MONEY, nullable=False)
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Credit release job: held orders per customer, oldest first
+        Index("ix_sales_orders_status_customer", "status", "customer_id", "id"),
+    )
+
+
+class SalesOrderLine(Base):
+    __tablename__ = "sales_order_lines"
+
+    order_id = Column(Integer, ForeignKey("sales_orders.id", ondelete="CASCADE"), primary_key=True)
+    line_no = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    quantity = Column(Numeric(18, 4), nullable=False)
+    unit_price = Column(Numeric(18, 4), nullable=False)
+    amount = Column(MONEY, nullable=False)
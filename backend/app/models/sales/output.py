@@ -0,0 +1,72 @@
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Enum, Index, JSON, Numeric
+from sqlalchemy.sql import func, true
+from app.models import Base
+import enum
+
+
+class OutputType(str, enum.Enum):
+    order_confirmation = "order_confirmation"  # order saved open / released from credit hold
+    invoice = "invoice"                        # invoice created by a billing run
+
+
+class OutputChannel(str, enum.Enum):
+    email = "email"  # message to ``recipient`` (SMTP, or .eml files for local testing)
+    file = "file"    # document dropped into a folder (print / archive pickup)
+
+
+class OutputJobStatus(str, enum.Enum):
+    queued = "queued"
+    sending = "sending"  # claimed by a worker until claimed_until
+    retry = "retry"      # failed, queued again at next_attempt_at
+    sent = "sent"
+    failed = "failed"    # out of attempts
+
+
+# Condition scopes as in pricing: an empty list matches every customer /
+# group / region. Per document and channel the most specific matching
+# record wins (customers > groups > regions), then the lowest priority.
+class OutputCondition(Base):
+    """Output condition record: which document goes out over which channel to whom."""
+    __tablename__ = "output_conditions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    output_type = Column(Enum(OutputType), nullable=False)
+    channel = Column(Enum(OutputChannel), nullable=False)
+    recipient = Column(String, nullable=True)  # email address; folder name for files
+    customer_ids = Column(JSON, nullable=False, default=list)
+    customer_groups = Column(JSON, nullable=False, default=list)
+    regions = Column(JSON, nullable=False, default=list)
+    min_amount = Column(Numeric(18, 2), nullable=True)
+    priority = Column(Integer, nullable=False, default=100)  # tie-break: lower wins
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class OutputJob(Base):
+    """One determined output of one document, rendered and dispatched by the output worker."""
+    __tablename__ = "output_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    output_type = Column(Enum(OutputType), nullable=False)
+    channel = Column(Enum(OutputChannel), nullable=False)
+    document_id = Column(Integer, nullable=False)  # sales order id / sales invoice id
+    recipient = Column(String, nullable=True)
+    condition_id = Column(Integer, nullable=True)
+    # One job per document, output type and channel however often the event repeats
+    dedup_key = Column(String(64), nullable=False, unique=True)
+    status = Column(Enum(OutputJobStatus), nullable=False, default=OutputJobStatus.queued)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=True)
+    # Lease of the worker sending the job; renewed while the batch runs
+    claimed_until = Column(DateTime, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Worker sweep: jobs left queued past the sweep interval, expired leases
+        Index("ix_output_jobs_status_updated", "status", "updated_at"),
+        Index("ix_output_jobs_document", "output_type", "document_id"),
+    )
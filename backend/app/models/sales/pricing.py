@@ -0,0 +1,78 @@
+from sqlalchemy import (
+    Column, Integer, String, Boolean, Date, DateTime, Enum, JSON, Numeric,
+)
+from sqlalchemy.sql import func, true
+from app.models import Base
+import enum
+
+
+class PricingRuleType(str, enum.Enum):
+    fixed_price = "fixed_price"                  # value = unit price
+    percentage_discount = "percentage_discount"  # value = % off list
+    fixed_discount = "fixed_discount"            # value = amount off list per unit
+    tiered_pricing = "tiered_pricing"            # tiers: % off list per quantity band
+    bundle_pricing = "bundle_pricing"            # value = % off list
+
+
+class DiscountType(str, enum.Enum):
+    percentage = "percentage"            # value = % off the rule price
+    fixed_amount = "fixed_amount"        # value = amount off per unit
+    buy_x_get_y = "buy_x_get_y"          # get_quantity free per buy_quantity + get_quantity
+    volume_discount = "volume_discount"  # tiers: % off by quantity
+
+
+# Condition scopes: an empty ``customer_groups``/``product_ids`` list
+# matches every group/product. ``tiers`` is a list of
+# {"min_qty", "max_qty", "discount"} bands (max_qty null = open-ended).
+class PricingRule(Base):
+    """Price condition: the lowest price among the applicable rules wins."""
+    __tablename__ = "pricing_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    rule_type = Column(Enum(PricingRuleType), nullable=False)
+    value = Column(Numeric(18, 4), nullable=False, default=0)
+    tiers = Column(JSON, nullable=False, default=list)
+    customer_groups = Column(JSON, nullable=False, default=list)
+    product_ids = Column(JSON, nullable=False, default=list)
+    min_quantity = Column(Numeric(18, 4), nullable=True)
+    max_quantity = Column(Numeric(18, 4), nullable=True)
+    valid_from = Column(Date, nullable=False)
+    valid_to = Column(Date, nullable=False)
+    priority = Column(Integer, nullable=False, default=100)  # tie-break: lower wins
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class DiscountScheme(Base):
+    """Discount applied on top of the rule price; every applicable scheme stacks."""
+    __tablename__ = "discount_schemes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    code = Column(String(32), unique=True, index=True, nullable=False)
+    name = Column(String, nullable=False)
+    discount_type = Column(Enum(DiscountType), nullable=False)
+    value = Column(Numeric(18, 4), nullable=False, default=0)
+    buy_quantity = Column(Integer, nullable=True)
+    get_quantity = Column(Integer, nullable=True)
+    tiers = Column(JSON, nullable=False, default=list)
+    customer_groups = Column(JSON, nullable=False, default=list)
+    product_ids = Column(JSON, nullable=False, default=list)
+    min_quantity = Column(Numeric(18, 4), nullable=True)
+    min_order_value = Column(Numeric(18, 2), nullable=True)
+    valid_from = Column(Date, nullable=False)
+    valid_to = Column(Date, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=True, server_default=true())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class PricingVersion(Base):
+    """Single-row counter bumped with every rule or scheme change (price book key)."""
+    __tablename__ = "pricing_versions"
+
+    id = Column(Integer, primary_key=True, default=1)
+    version = Column(Integer, nullable=False, default=0)
+    changed_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Enum, ForeignKey, Index, Numeric
+from sqlalchemy.sql import func
+from app.models import Base
+import enum
+
+
+class MovementType(str, enum.Enum):
+    receipt = "receipt"                  # into stock (on hand)
+    issue = "issue"                      # out of stock (on hand)
+    reservation = "reservation"          # demand on due_date (sales order)
+    planned_receipt = "planned_receipt"  # supply on due_date (purchase / work order)
+
+
+class MovementSource(str, enum.Enum):
+    purchase_order = "purchase_order"
+    work_order = "work_order"
+    sales_order = "sales_order"
+    adjustment = "adjustment"
+
+
+class StockMovement(Base):
+    """
+    Append-only stock ledger, the input of available-to-promise. Movements
+    are never edited: a negative quantity reverses (releases a reservation,
+    cancels a planned receipt once it is received).
+    """
+    __tablename__ = "stock_movements"
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    movement_type = Column(Enum(MovementType), nullable=False)
+    source = Column(Enum(MovementSource), nullable=True)
+    reference = Column(String(64), nullable=True)  # PO / WO / SO number
+    quantity = Column(Numeric(18, 4), nullable=False)
+    due_date = Column(Date, nullable=False)  # posting, required or expected date
+    created_by = Column(String, nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        # Timeline load of one product
+        Index("ix_stock_movements_product", "product_id", "id"),
+    )
@@ -0,0 +1,95 @@
+# app/schemas/finance/assets.py
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.finance.assets import AssetStatus, DepreciationMethod
+
+Money = Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]
+
+
+def check_period(value: int) -> int:
+    if not 1 <= value % 100 <= 12:
+        raise ValueError("period must be YYYYMM")
+    return value
+
+
+# ------------------------------------------------------------------
+# 1. Asset register
+# ------------------------------------------------------------------
+class FixedAssetCreate(BaseModel):
+    asset_code: str = Field(..., max_length=32)
+    name: str
+    category: Optional[str] = None
+    location: Optional[str] = None
+    cost_center: Optional[str] = Field(None, max_length=32)
+    cost: Money
+    salvage_value: Money = Decimal("0")
+    in_service_date: date
+    method: DepreciationMethod = DepreciationMethod.straight_line
+    useful_life_months: int = Field(..., gt=0, le=1200)
+    declining_rate: Optional[Annotated[Decimal, Field(gt=0, le=1, decimal_places=4)]] = None
+    total_units: Optional[Annotated[Decimal, Field(gt=0, max_digits=18, decimal_places=2)]] = None
+    expense_account_id: int
+    accumulated_account_id: int
+
+    @model_validator(mode="after")
+    def method_inputs(self):
+        if self.salvage_value > self.cost:
+            raise ValueError("salvage_value cannot exceed cost")
+        if self.method == DepreciationMethod.units_of_production and not self.total_units:
+            raise ValueError("total_units is required for units of production")
+        return self
+
+
+class FixedAssetOut(FixedAssetCreate):
+    id: int
+    accumulated_depreciation: Decimal
+    last_period: Optional[int] = None
+    status: AssetStatus
+
+    class Config:
+        from_attributes = True
+
+
+class UsageIn(BaseModel):
+    period: int
+    units: Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]
+
+    _period = field_validator("period")(check_period)
+
+
+class ScheduleRow(BaseModel):
+    period: int
+    depreciation: Decimal
+    accumulated: Decimal
+    book_value: Decimal
+
+
+# ------------------------------------------------------------------
+# 2. Depreciation runs
+# ------------------------------------------------------------------
+class DepreciationRunCreate(BaseModel):
+    period: int
+
+    _period = field_validator("period")(check_period)
+
+
+class DepreciationRunOut(BaseModel):
+    id: int
+    period: int
+    entry_id: Optional[int] = None
+    asset_count: int
+    total: Decimal
+    compute_seconds: Optional[float] = None
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class AssetSchedule(BaseModel):
+    asset_id: int
+    method: DepreciationMethod
+    rows: List[ScheduleRow]
@@ -0,0 +1,94 @@
+# app/schemas/finance/bank.py
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Dict, List, Optional
+from app.models.finance.bank import StatementFormat
+
+
+# ------------------------------------------------------------------
+# 1. Statement import
+# ------------------------------------------------------------------
+class StatementOut(BaseModel):
+    id: int
+    account_id: int
+    format: StatementFormat
+    filename: Optional[str] = None
+    line_count: int
+    imported_by: Optional[str] = None
+    imported_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BankLineOut(BaseModel):
+    id: int
+    statement_id: int
+    booking_date: date
+    amount: Decimal
+    reference: Optional[str] = None
+    description: Optional[str] = None
+    match_id: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------------------------------------------------------
+# 2. Reconciliation
+# ------------------------------------------------------------------
+class ReconciliationRules(BaseModel):
+    # Bank and GL dates may differ by this many days (clearing delay)
+    date_window_days: int = Field(3, ge=0, le=60)
+    # Largest accepted difference for the tolerance pass (bank charges, FX rounding)
+    amount_tolerance: Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)] = Decimal("0")
+    use_reference: bool = True
+    # One bank line settling several GL lines (or the reverse)
+    many_to_one: bool = True
+    max_group_size: int = Field(20, ge=2, le=200)
+    from_date: Optional[date] = None
+    to_date: Optional[date] = None
+
+
+class GLLineOut(BaseModel):
+    id: int
+    entry_id: int
+    entry_date: date
+    amount: Decimal  # debit - credit on the bank account
+    reference: Optional[str] = None
+    description: Optional[str] = None
+
+
+class UnmatchedResidue(BaseModel):
+    account_id: int
+    # Oldest lines first, at most the requested limit of each side
+    bank_lines: List[BankLineOut]
+    gl_lines: List[GLLineOut]
+    # Counts and totals cover the whole residue
+    bank_count: int
+    gl_count: int
+    bank_total: Decimal
+    gl_total: Decimal
+
+
+class ReconciliationResult(UnmatchedResidue):
+    matches: int
+    matched_by_rule: Dict[str, int]
+    bank_lines_matched: int
+    gl_lines_matched: int
+
+
+class ManualMatchIn(BaseModel):
+    account_id: int
+    bank_line_ids: List[int] = Field(..., min_length=1)
+    journal_line_ids: List[int] = Field(..., min_length=1)
+
+
+class MatchOut(BaseModel):
+    id: int
+    account_id: int
+    rule: str
+    bank_line_ids: List[int]
+    journal_line_ids: List[int]
+    created_by: Optional[str] = None
@@ -0,0 +1,153 @@
+# app/schemas/finance/budget.py
+from pydantic import BaseModel, Field, field_validator, model_validator
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.finance.ledger import AccountType
+from app.schemas.finance.assets import check_period
+import enum
+
+# Longest budget accepted (months)
+MAX_BUDGET_MONTHS = 60
+
+
+def months_between(from_period: int, to_period: int) -> int:
+    """Inclusive month count from one YYYYMM to another."""
+    return (to_period // 100 - from_period // 100) * 12 + to_period % 100 - from_period % 100 + 1
+
+
+class BudgetGrouping(str, enum.Enum):
+    account = "account"
+    cost_center = "cost_center"
+    account_cost_center = "account_cost_center"
+
+
+class ForecastMethod(str, enum.Enum):
+    moving_average = "moving_average"
+    exponential_smoothing = "exponential_smoothing"
+
+
+# ------------------------------------------------------------------
+# 1. Budgets and lines
+# ------------------------------------------------------------------
+class BudgetCreate(BaseModel):
+    name: str
+    from_period: int
+    to_period: int
+
+    _periods = field_validator("from_period", "to_period")(check_period)
+
+    @model_validator(mode="after")
+    def check_range(self):
+        months = months_between(self.from_period, self.to_period)
+        if months < 1:
+            raise ValueError("to_period must not be before from_period")
+        if months > MAX_BUDGET_MONTHS:
+            raise ValueError(f"A budget covers at most {MAX_BUDGET_MONTHS} months")
+        return self
+
+
+class BudgetOut(BudgetCreate):
+    id: int
+    version: int
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class BudgetLineIn(BaseModel):
+    account_id: int
+    cost_center: str = Field("", max_length=32)  # "" = no cost centre
+    period: int
+    # Natural sign of the account: income and expense budgets are both positive
+    amount: Annotated[Decimal, Field(max_digits=18, decimal_places=2)]
+
+    _period = field_validator("period")(check_period)
+
+
+class BudgetLinesIn(BaseModel):
+    # Upserted by (account, cost centre, period)
+    lines: List[BudgetLineIn] = Field(..., min_length=1)
+
+
+# ------------------------------------------------------------------
+# 2. Budget vs. actual
+# ------------------------------------------------------------------
+class BudgetKey(BaseModel):
+    type: AccountType
+    account_id: Optional[int] = None
+    account_code: Optional[str] = None
+    account_name: Optional[str] = None
+    cost_center: Optional[str] = None
+
+
+class VarianceRow(BudgetKey):
+    budget: Decimal           # whole budget
+    budget_to_date: Decimal   # budget months up to the cutoff
+    actual_to_date: Decimal
+    variance: Decimal         # actual_to_date - budget_to_date
+    variance_pct: Optional[Decimal] = None
+
+
+class VarianceReport(BaseModel):
+    budget_id: int
+    version: int
+    cutoff: int
+    group_by: BudgetGrouping
+    rows: List[VarianceRow]
+
+
+# ------------------------------------------------------------------
+# 3. Forecast scenarios
+# ------------------------------------------------------------------
+class ScenarioAdjustment(BaseModel):
+    """Scales the forecast of matching rows; unset filters match everything."""
+    account_id: Optional[int] = None
+    cost_center: Optional[str] = Field(None, max_length=32)
+    percent: float = Field(..., ge=-100, le=1000)
+
+
+class ScenarioIn(BaseModel):
+    # Last month of actuals; later months are forecast (default: last closed month)
+    cutoff: Optional[int] = None
+    method: ForecastMethod = ForecastMethod.moving_average
+    window: int = Field(3, ge=1, le=24)               # moving average
+    alpha: float = Field(0.5, gt=0, le=1)             # exponential smoothing
+    growth_percent: float = Field(0, ge=-100, le=100)  # compounded per forecast month
+    adjustments: List[ScenarioAdjustment] = Field(default_factory=list, max_length=200)
+    group_by: BudgetGrouping = BudgetGrouping.account
+
+    @field_validator("cutoff")
+    @classmethod
+    def cutoff_period(cls, value: Optional[int]) -> Optional[int]:
+        return value if value is None else check_period(value)
+
+
+class ScenarioRow(BudgetKey):
+    budget: Decimal
+    actual_to_date: Decimal
+    forecast: Decimal         # months after the cutoff
+    outlook: Decimal          # actual_to_date + forecast
+    variance: Decimal         # outlook - budget
+    variance_pct: Optional[Decimal] = None
+
+
+class ScenarioMonth(BaseModel):
+    type: AccountType
+    period: int
+    budget: Decimal
+    actual: Optional[Decimal] = None  # None after the cutoff
+    outlook: Decimal
+
+
+class ScenarioResult(BaseModel):
+    budget_id: int
+    version: int
+    scenario: str             # parameter hash
+    cutoff: int
+    params: ScenarioIn
+    rows: List[ScenarioRow]
+    months: List[ScenarioMonth]
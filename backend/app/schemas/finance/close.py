@@ -0,0 +1,45 @@
+# app/schemas/finance/close.py
+from pydantic import BaseModel, field_validator
+from datetime import datetime
+from typing import Any, List, Optional
+from app.models.finance.close import CloseStatus, CloseStepStatus
+from app.schemas.finance.assets import check_period
+
+
+class CloseRunCreate(BaseModel):
+    period: int
+
+    _period = field_validator("period")(check_period)
+
+
+class CloseStepOut(BaseModel):
+    step: str
+    title: str
+    requires: List[str]
+    status: CloseStepStatus
+    result: Optional[Any] = None  # step summary (parsed JSON)
+    error: Optional[str] = None
+    seconds: Optional[float] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+
+class CloseRunOut(BaseModel):
+    id: int
+    period: int
+    status: CloseStatus
+    attempts: int
+    error: Optional[str] = None
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CloseRunDetail(CloseRunOut):
+    done: int
+    total: int
+    steps: List[CloseStepOut]
@@ -0,0 +1,63 @@
+# app/schemas/finance/cost_allocation.py
+from pydantic import BaseModel, Field
+from decimal import Decimal
+from typing import Annotated, Dict, List
+from app.models.finance.cost_allocation import CostCenterKind
+
+Quantity = Annotated[Decimal, Field(gt=0, max_digits=18, decimal_places=4)]
+
+
+# ------------------------------------------------------------------
+# 1. Cost centres and drivers
+# ------------------------------------------------------------------
+class CostCenterCreate(BaseModel):
+    code: str = Field(..., max_length=32)
+    name: str
+    kind: CostCenterKind
+
+
+class CostCenterOut(CostCenterCreate):
+    id: int
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+class DriverSet(BaseModel):
+    # receiver code → driver quantity; replaces the sender's whole row
+    receivers: Dict[str, Quantity] = Field(..., min_length=1)
+
+
+class DriverOut(BaseModel):
+    sender: str
+    receiver: str
+    quantity: Decimal
+    share: Decimal
+
+
+class DriverVersion(BaseModel):
+    version: int
+
+
+# ------------------------------------------------------------------
+# 2. Allocation result
+# ------------------------------------------------------------------
+class AllocationRow(BaseModel):
+    code: str
+    name: str
+    kind: CostCenterKind
+    direct: Decimal       # expenses posted to the centre in the period
+    received: Decimal     # from service centres (reciprocal)
+    allocated_out: Decimal
+    final: Decimal        # production: fully absorbed cost; service: 0
+
+
+class AllocationResult(BaseModel):
+    period: int
+    driver_version: int
+    rows: List[AllocationRow]
+    total_direct: Decimal
+    total_final: Decimal
+    # Expenses on cost centre codes that are not in the master
+    unassigned: Decimal
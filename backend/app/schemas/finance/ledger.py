@@ -0,0 +1,109 @@
+# app/schemas/finance/ledger.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.finance.ledger import AccountType, JournalStatus
+
+Money = Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]
+
+
+# ------------------------------------------------------------------
+# 1. Chart of accounts
+# ------------------------------------------------------------------
+class AccountCreate(BaseModel):
+    code: str = Field(..., max_length=32)
+    name: str
+    type: AccountType
+    opening: Annotated[Decimal, Field(max_digits=18, decimal_places=2)] = Decimal("0")
+
+
+class AccountOut(AccountCreate):
+    id: int
+    is_active: bool
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------------------------------------------------------
+# 2. Journal entries
+# ------------------------------------------------------------------
+class JournalLineIn(BaseModel):
+    account_id: int
+    debit: Money = Decimal("0")
+    credit: Money = Decimal("0")
+    cost_center: Optional[str] = None
+    description: Optional[str] = None
+
+    @model_validator(mode="after")
+    def one_side(self):
+        if (self.debit > 0) == (self.credit > 0):
+            raise ValueError("A line needs either a debit or a credit amount")
+        return self
+
+
+class JournalEntryCreate(BaseModel):
+    entry_date: date
+    reference: Optional[str] = None
+    description: Optional[str] = "Journal Entry"
+    lines: List[JournalLineIn] = Field(..., min_length=2)
+    post: bool = True  # False keeps the entry as a draft
+
+    @model_validator(mode="after")
+    def balanced(self):
+        debit = sum(line.debit for line in self.lines)
+        credit = sum(line.credit for line in self.lines)
+        if debit != credit:
+            raise ValueError(f"Entry is not balanced: debit {debit} != credit {credit}")
+        return self
+
+
+class JournalLineOut(BaseModel):
+    id: int
+    account_id: int
+    debit: Decimal
+    credit: Decimal
+    cost_center: Optional[str] = None
+    description: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class JournalEntrySummary(BaseModel):
+    id: int
+    entry_number: str
+    entry_date: date
+    reference: Optional[str] = None
+    description: Optional[str] = None
+    status: JournalStatus
+    created_by: Optional[str] = None
+    posted_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class JournalEntryOut(JournalEntrySummary):
+    lines: List[JournalLineOut]
+
+
+# ------------------------------------------------------------------
+# 3. Trial balance
+# ------------------------------------------------------------------
+class TrialBalanceRow(BaseModel):
+    account_id: int
+    code: str
+    name: str
+    type: AccountType
+    debit: Decimal
+    credit: Decimal
+
+
+class TrialBalance(BaseModel):
+    as_of: date
+    rows: List[TrialBalanceRow]
+    total_debit: Decimal
+    total_credit: Decimal
+    is_balanced: bool
@@ -0,0 +1,78 @@
+# app/schemas/finance/open_items.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.finance.open_items import OpenItemStatus, Subledger
+from app.schemas.finance.tax import TaxLineIn
+
+PositiveMoney = Annotated[Decimal, Field(gt=0, max_digits=18, decimal_places=2)]
+
+
+# ------------------------------------------------------------------
+# 1. Open items (AR/AP invoices)
+# ------------------------------------------------------------------
+class OpenItemCreate(BaseModel):
+    party_code: str = Field(..., max_length=32)
+    party_name: Optional[str] = None
+    document_number: str
+    issue_date: date
+    due_date: date
+    amount: PositiveMoney
+    # GST/VAT lines for the tax return; optional for non-taxable items
+    tax_lines: List[TaxLineIn] = []
+
+    @model_validator(mode="after")
+    def due_after_issue(self):
+        if self.due_date < self.issue_date:
+            raise ValueError("due_date cannot be before issue_date")
+        return self
+
+
+class OpenItemOut(BaseModel):
+    id: int
+    ledger: Subledger
+    party_code: str
+    party_name: Optional[str] = None
+    document_number: str
+    issue_date: date
+    due_date: date
+    amount: Decimal
+    balance: Decimal
+    status: OpenItemStatus
+
+    class Config:
+        from_attributes = True
+
+
+class PaymentIn(BaseModel):
+    amount: PositiveMoney
+
+
+# ------------------------------------------------------------------
+# 2. Aging
+# ------------------------------------------------------------------
+class AgingBuckets(BaseModel):
+    current: Decimal
+    days_1_30: Decimal
+    days_31_60: Decimal
+    days_61_90: Decimal
+    days_90_plus: Decimal
+    total: Decimal
+
+
+class PartyAging(AgingBuckets):
+    party_code: str
+    items: int
+
+    class Config:
+        from_attributes = True
+
+
+class AgingSummary(BaseModel):
+    ledger: Subledger
+    as_of: date
+    computed_at: datetime
+    parties: int
+    items: int
+    buckets: AgingBuckets
@@ -0,0 +1,65 @@
+# app/schemas/finance/statements.py
+from pydantic import BaseModel
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from app.models.finance.ledger import AccountType
+
+
+class StatementLine(BaseModel):
+    account_id: int
+    code: str
+    name: str
+    type: AccountType
+    amount: Decimal
+
+
+# ------------------------------------------------------------------
+# 1. Profit & loss (income: credit-positive, expense: debit-positive)
+# ------------------------------------------------------------------
+class ProfitAndLoss(BaseModel):
+    from_date: date
+    to_date: date
+    cost_center: Optional[str] = None
+    revenue: List[StatementLine]
+    expenses: List[StatementLine]
+    total_revenue: Decimal
+    total_expenses: Decimal
+    net_profit: Decimal
+    margin: Decimal  # net profit as % of revenue
+
+
+# ------------------------------------------------------------------
+# 2. Balance sheet (liabilities/equity shown credit-positive)
+# ------------------------------------------------------------------
+class BalanceSheet(BaseModel):
+    as_of: date
+    assets: List[StatementLine]  # incl. bank and cash accounts
+    liabilities: List[StatementLine]
+    equity: List[StatementLine]
+    retained_earnings: Decimal  # income - expenses to date, not yet closed to equity
+    total_assets: Decimal
+    total_liabilities: Decimal
+    total_equity: Decimal
+    is_balanced: bool
+
+
+# ------------------------------------------------------------------
+# 3. Cash flow (movements on bank and cash accounts)
+# ------------------------------------------------------------------
+class CashFlowLine(BaseModel):
+    account_id: int
+    code: str
+    name: str
+    inflow: Decimal
+    outflow: Decimal
+    net: Decimal
+
+
+class CashFlow(BaseModel):
+    from_date: date
+    to_date: date
+    accounts: List[CashFlowLine]
+    total_inflow: Decimal
+    total_outflow: Decimal
+    net_cash_flow: Decimal
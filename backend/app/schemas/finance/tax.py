@@ -0,0 +1,64 @@
+# app/schemas/finance/tax.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, Optional
+from app.models.finance.tax import ReturnFormat, TaxReturnStatus
+
+Money = Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]
+
+
+# ------------------------------------------------------------------
+# 1. Invoice tax lines
+# ------------------------------------------------------------------
+class TaxLineIn(BaseModel):
+    tax_code: str = Field(..., max_length=16)
+    rate: Annotated[Decimal, Field(ge=0, le=100, decimal_places=4)]
+    place_of_supply: str = Field(..., max_length=8)
+    hsn_code: Optional[str] = Field(None, max_length=16)
+    taxable_amount: Money
+    tax_amount: Money
+
+
+class TaxLineOut(TaxLineIn):
+    id: int
+    open_item_id: int
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------------------------------------------------------
+# 2. Returns
+# ------------------------------------------------------------------
+class TaxReturnCreate(BaseModel):
+    from_date: date
+    to_date: date
+    format: ReturnFormat = ReturnFormat.json
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.from_date > self.to_date:
+            raise ValueError("from_date must not be after to_date")
+        return self
+
+
+class TaxReturnOut(BaseModel):
+    id: int
+    from_date: date
+    to_date: date
+    format: ReturnFormat
+    status: TaxReturnStatus
+    lines: int
+    documents: int
+    output_taxable: Decimal
+    output_tax: Decimal
+    input_taxable: Decimal
+    input_tax: Decimal
+    error: Optional[str] = None
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,10 +1,10 @@
 # app/schemas/role_schema.py
 from pydantic import BaseModel
 from typing import Optional, List
-from app.schemas.permission import PermissionOut
 
 class RoleCreate(BaseModel):
-    pass
+    name: str
+    description: Optional[str] = None
 
 class ModuleOut(BaseModel):
     id: int
@@ -0,0 +1,74 @@
+# app/schemas/sales/analytics.py
+from pydantic import BaseModel
+from datetime import date
+from decimal import Decimal
+from typing import List, Optional
+from app.models.sales.orders import SalesOrderStatus
+
+
+class SalesMetrics(BaseModel):
+    total_revenue: Decimal          # booked orders (not cancelled)
+    total_orders: int               # every status; with a product filter, booked orders with the product
+    average_order_value: Decimal
+    unique_customers: int
+    repeat_customers: int           # more than one booked order in the range
+    recent_revenue: Decimal         # last 30 days up to to_date
+    revenue_trend: float            # % vs. the 30 days before
+    order_trend: float
+
+
+class MonthlySales(BaseModel):
+    month: date
+    revenue: Decimal
+    orders: int
+    customers: int
+    aov: Decimal
+
+
+class ProductSales(BaseModel):
+    product_id: int
+    sku: str
+    name: str
+    revenue: Decimal
+    quantity: Decimal
+    orders: int
+    avg_price: Decimal
+
+
+class CustomerSales(BaseModel):
+    customer_id: int
+    code: str
+    name: str
+    revenue: Decimal
+    orders: int
+    aov: Decimal
+
+
+class StatusSales(BaseModel):
+    status: SalesOrderStatus
+    orders: int
+    revenue: Decimal
+
+
+class HourlySales(BaseModel):
+    hour: int
+    orders: int
+    revenue: Decimal
+
+
+class SalesDashboard(BaseModel):
+    from_date: date
+    to_date: date
+    region: Optional[str] = None
+    customer_id: Optional[int] = None
+    product_id: Optional[int] = None
+    metrics: SalesMetrics
+    monthly: List[MonthlySales]     # last 12 months of the range
+    top_products: List[ProductSales]
+    top_customers: List[CustomerSales]
+    status: List[StatusSales]       # order level: not narrowed by product
+    hourly: List[HourlySales]       # booked orders by hour of entry; order level too
+
+
+class RollupRebuild(BaseModel):
+    orders: int
@@ -0,0 +1,46 @@
+# app/schemas/sales/billing.py
+from pydantic import BaseModel
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from app.models.sales.billing import BillingOutput, BillingRunStatus
+
+
+class BillingRunCreate(BaseModel):
+    billing_date: Optional[date] = None  # default: today; orders dated up to it are billed
+    customer_id: Optional[int] = None    # None = every customer
+    output: BillingOutput = BillingOutput.zip
+
+
+class BillingRunOut(BaseModel):
+    id: int
+    billing_date: date
+    customer_id: Optional[int] = None
+    output: BillingOutput
+    status: BillingRunStatus
+    invoices: int
+    documents: int
+    total: Decimal
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    invoiced_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SalesInvoiceOut(BaseModel):
+    id: int
+    invoice_number: str
+    run_id: int
+    order_id: int
+    customer_id: int
+    issue_date: date
+    due_date: date
+    total: Decimal
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,60 @@
+# app/schemas/sales/credit.py
+from pydantic import BaseModel
+from decimal import Decimal
+from typing import List, Literal, Optional
+from app.schemas.sales.master import Money
+
+RiskLevel = Literal["Low", "Medium", "High"]
+
+
+class CreditLimitIn(BaseModel):
+    credit_limit: Optional[Money] = None  # None = no credit check
+
+
+class CreditCheck(BaseModel):
+    customer_id: int
+    amount: Decimal
+    allowed: bool
+    credit_limit: Optional[Decimal] = None
+    exposure: Decimal                    # open orders + open receivables
+    available_credit: Optional[Decimal] = None
+    reason: Optional[str] = None
+
+
+class CreditPosition(BaseModel):
+    customer_id: int
+    code: str
+    name: str
+    credit_limit: Optional[Decimal] = None
+    open_orders: Decimal
+    open_receivables: Decimal
+    exposure: Decimal
+    available_credit: Optional[Decimal] = None
+    utilization: Decimal  # % of the limit
+    payments: int
+    avg_payment_days: float
+    risk_score: int
+    risk_level: RiskLevel
+
+
+class CreditSummary(BaseModel):
+    customers: int
+    total_credit_limit: Decimal
+    total_exposure: Decimal
+    total_receivables: Decimal
+    utilization_rate: Decimal
+    high_risk_customers: int  # exposure above 80% of the limit
+    over_limit_customers: int
+    held_orders: int
+    held_amount: Decimal
+
+
+class ReleaseResult(BaseModel):
+    released: int
+    released_amount: Decimal
+    order_numbers: List[str]
+    still_held: int
+
+
+class RebuildResult(BaseModel):
+    customers: int
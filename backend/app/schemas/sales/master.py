@@ -0,0 +1,39 @@
+# app/schemas/sales/master.py
+from pydantic import BaseModel, Field
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Optional
+
+Money = Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]
+
+
+class CustomerCreate(BaseModel):
+    code: str = Field(..., max_length=32)
+    name: str
+    customer_group: str = Field(..., max_length=32)
+    credit_limit: Optional[Money] = None  # None = no credit check
+    region: Optional[str] = Field(None, max_length=32)
+
+
+class CustomerOut(CustomerCreate):
+    id: int
+    is_active: bool
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ProductCreate(BaseModel):
+    sku: str = Field(..., max_length=64)
+    name: str
+    list_price: Money
+
+
+class ProductOut(ProductCreate):
+    id: int
+    is_active: bool
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
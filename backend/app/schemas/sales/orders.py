@@ -0,0 +1,48 @@
+# app/schemas/sales/orders.py
+from pydantic import BaseModel, Field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.sales.orders import SalesOrderStatus
+from app.schemas.sales.pricing import Quantity
+
+MAX_ORDER_LINES = 2000
+
+
+class SalesOrderLineIn(BaseModel):
+    product_id: int
+    quantity: Quantity
+    unit_price: Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=4)]
+
+
+class SalesOrderCreate(BaseModel):
+    customer_id: int
+    order_date: Optional[date] = None  # default: today
+    lines: List[SalesOrderLineIn] = Field(..., min_length=1, max_length=MAX_ORDER_LINES)
+
+
+class SalesOrderLineOut(SalesOrderLineIn):
+    line_no: int
+    amount: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class SalesOrderOut(BaseModel):
+    id: int
+    order_number: str
+    customer_id: int
+    order_date: date
+    region: Optional[str] = None
+    status: SalesOrderStatus
+    total: Decimal
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class SalesOrderDetail(SalesOrderOut):
+    lines: List[SalesOrderLineOut]
@@ -0,0 +1,64 @@
+# app/schemas/sales/output.py
+import re
+from pydantic import BaseModel, Field, model_validator
+from datetime import datetime
+from decimal import Decimal
+from typing import Annotated, Dict, List, Optional
+from app.models.sales.output import OutputChannel, OutputJobStatus, OutputType
+
+FOLDER = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+class OutputConditionCreate(BaseModel):
+    output_type: OutputType
+    channel: OutputChannel
+    # Email address; for files a folder name below OUTPUT_DIR/files (default "print")
+    recipient: Optional[str] = Field(None, max_length=254)
+    customer_ids: List[int] = []                                      # empty = every customer
+    customer_groups: List[Annotated[str, Field(max_length=32)]] = []  # empty = every group
+    regions: List[Annotated[str, Field(max_length=32)]] = []          # empty = every region
+    min_amount: Optional[Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]] = None
+    priority: int = 100
+    is_active: bool = True
+
+    @model_validator(mode="after")
+    def check_recipient(self):
+        if self.channel == OutputChannel.email and not self.recipient:
+            raise ValueError("email output needs a recipient")
+        if self.channel == OutputChannel.file and self.recipient and not FOLDER.fullmatch(self.recipient):
+            raise ValueError("file output recipient must be a folder name (letters, digits, - and _)")
+        return self
+
+
+class OutputConditionOut(OutputConditionCreate):
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OutputJobOut(BaseModel):
+    id: int
+    output_type: OutputType
+    channel: OutputChannel
+    document_id: int
+    recipient: Optional[str] = None
+    condition_id: Optional[int] = None
+    status: OutputJobStatus
+    attempts: int
+    next_attempt_at: Optional[datetime] = None
+    error: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    sent_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OutputQueueStats(BaseModel):
+    queued: int    # ids waiting on the Redis queue
+    retrying: int  # ids waiting for their next attempt
+    jobs: Dict[OutputJobStatus, int]
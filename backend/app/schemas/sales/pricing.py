@@ -0,0 +1,186 @@
+# app/schemas/sales/pricing.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from app.models.sales.pricing import DiscountType, PricingRuleType
+
+Quantity = Annotated[Decimal, Field(gt=0, max_digits=18, decimal_places=4)]
+Percent = Annotated[Decimal, Field(ge=0, le=100, decimal_places=4)]
+
+PERCENT_RULES = (PricingRuleType.percentage_discount, PricingRuleType.bundle_pricing)
+
+# Lines per quote and cases per simulation
+MAX_QUOTE_LINES = 2000
+MAX_SIMULATION_CASES = 10_000
+
+
+class Tier(BaseModel):
+    min_qty: Annotated[Decimal, Field(ge=0, decimal_places=4)] = Decimal("0")
+    max_qty: Optional[Annotated[Decimal, Field(ge=0, decimal_places=4)]] = None  # None = open-ended
+    discount: Percent
+
+    @model_validator(mode="after")
+    def check_band(self):
+        if self.max_qty is not None and self.max_qty < self.min_qty:
+            raise ValueError("max_qty must not be below min_qty")
+        return self
+
+
+class _Scope(BaseModel):
+    customer_groups: List[Annotated[str, Field(max_length=32)]] = []  # empty = every group
+    product_ids: List[int] = []                                        # empty = every product
+    valid_from: date
+    valid_to: date
+    is_active: bool = True
+
+    @model_validator(mode="after")
+    def check_validity(self):
+        if self.valid_from > self.valid_to:
+            raise ValueError("valid_from must not be after valid_to")
+        return self
+
+
+# ------------------------------------------------------------------
+# 1. Conditions
+# ------------------------------------------------------------------
+class PricingRuleCreate(_Scope):
+    code: str = Field(..., max_length=32)
+    name: str
+    rule_type: PricingRuleType
+    value: Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=4)] = Decimal("0")
+    tiers: List[Tier] = []
+    min_quantity: Optional[Quantity] = None
+    max_quantity: Optional[Quantity] = None
+    priority: int = 100
+
+    @model_validator(mode="after")
+    def check_rule(self):
+        if self.rule_type == PricingRuleType.tiered_pricing and not self.tiers:
+            raise ValueError("tiered_pricing needs tiers")
+        if self.rule_type in PERCENT_RULES and self.value > 100:
+            raise ValueError("A percentage cannot exceed 100")
+        if self.min_quantity and self.max_quantity and self.max_quantity < self.min_quantity:
+            raise ValueError("max_quantity must not be below min_quantity")
+        return self
+
+
+class PricingRuleOut(PricingRuleCreate):
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DiscountSchemeCreate(_Scope):
+    code: str = Field(..., max_length=32)
+    name: str
+    discount_type: DiscountType
+    value: Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=4)] = Decimal("0")
+    buy_quantity: Optional[int] = Field(None, gt=0)
+    get_quantity: Optional[int] = Field(None, gt=0)
+    tiers: List[Tier] = []
+    min_quantity: Optional[Quantity] = None
+    min_order_value: Optional[Annotated[Decimal, Field(ge=0, max_digits=18, decimal_places=2)]] = None
+
+    @model_validator(mode="after")
+    def check_scheme(self):
+        if self.discount_type == DiscountType.buy_x_get_y and not (self.buy_quantity and self.get_quantity):
+            raise ValueError("buy_x_get_y needs buy_quantity and get_quantity")
+        if self.discount_type == DiscountType.volume_discount and not self.tiers:
+            raise ValueError("volume_discount needs tiers")
+        if self.discount_type == DiscountType.percentage and self.value > 100:
+            raise ValueError("A percentage cannot exceed 100")
+        return self
+
+
+class DiscountSchemeOut(DiscountSchemeCreate):
+    id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------------------------------------------------------
+# 2. Order quote
+# ------------------------------------------------------------------
+class QuoteLineIn(BaseModel):
+    product_id: int
+    quantity: Quantity
+
+
+class QuoteIn(BaseModel):
+    customer_id: int
+    pricing_date: Optional[date] = None  # default: today
+    lines: List[QuoteLineIn] = Field(..., min_length=1, max_length=MAX_QUOTE_LINES)
+
+
+class AppliedDiscount(BaseModel):
+    code: str
+    discount_type: DiscountType
+    amount: Decimal  # off the line
+
+
+class QuoteLine(BaseModel):
+    product_id: int
+    sku: str
+    quantity: Decimal
+    list_price: Decimal
+    rule_code: Optional[str] = None  # winning pricing rule
+    rule_price: Decimal              # unit price after the rule
+    discounts: List[AppliedDiscount]
+    unit_price: Decimal              # net
+    amount: Decimal
+    savings: Decimal                 # list amount - amount
+
+
+class Quote(BaseModel):
+    customer_id: int
+    customer_group: str
+    pricing_date: date
+    pricing_version: int
+    lines: List[QuoteLine]
+    list_total: Decimal
+    order_value: Decimal  # after rules, before discounts (min_order_value basis)
+    discount_total: Decimal
+    total: Decimal
+
+
+# ------------------------------------------------------------------
+# 3. Bulk simulation (Pricing page)
+# ------------------------------------------------------------------
+class SimulationCase(BaseModel):
+    product_id: int
+    quantity: Quantity
+    customer_id: Optional[int] = None
+    customer_group: Optional[str] = Field(None, max_length=32)  # when no customer_id
+    # Order value for min_order_value checks (default: this line's value after rules)
+    order_value: Optional[Annotated[Decimal, Field(ge=0)]] = None
+
+
+class SimulationIn(BaseModel):
+    pricing_date: Optional[date] = None
+    cases: List[SimulationCase] = Field(..., min_length=1, max_length=MAX_SIMULATION_CASES)
+
+
+class SimulationResult(BaseModel):
+    product_id: int
+    customer_group: Optional[str] = None
+    quantity: Decimal
+    list_price: Decimal
+    final_price: Decimal  # net unit price
+    rule_code: Optional[str] = None
+    discount_codes: List[str]
+    savings: Decimal      # per unit
+    discount_percent: Decimal
+    error: Optional[str] = None  # unknown product or customer
+
+
+class SimulationOut(BaseModel):
+    pricing_date: date
+    pricing_version: int
+    results: List[SimulationResult]
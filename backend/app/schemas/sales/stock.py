@@ -0,0 +1,97 @@
+# app/schemas/sales/stock.py
+from pydantic import BaseModel, Field, model_validator
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Annotated, List, Literal, Optional
+from app.models.sales.stock import MovementSource, MovementType
+from app.schemas.sales.pricing import Quantity
+
+# Lines per order check
+MAX_ATP_LINES = 2000
+
+
+# ------------------------------------------------------------------
+# 1. Stock movements
+# ------------------------------------------------------------------
+class StockMovementCreate(BaseModel):
+    product_id: int
+    movement_type: MovementType
+    source: Optional[MovementSource] = None
+    reference: Optional[str] = Field(None, max_length=64)
+    # Negative reverses an earlier movement of the same type
+    quantity: Annotated[Decimal, Field(max_digits=18, decimal_places=4)]
+    due_date: Optional[date] = None  # default: today
+
+    @model_validator(mode="after")
+    def check_quantity(self):
+        if self.quantity == 0:
+            raise ValueError("quantity cannot be zero")
+        return self
+
+
+class ReservationCreate(BaseModel):
+    product_id: int
+    quantity: Quantity
+    promise_date: date
+    reference: Optional[str] = Field(None, max_length=64)  # sales order number
+
+
+class StockMovementOut(BaseModel):
+    id: int
+    product_id: int
+    movement_type: MovementType
+    source: Optional[MovementSource] = None
+    reference: Optional[str] = None
+    quantity: Decimal
+    due_date: date
+    created_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# ------------------------------------------------------------------
+# 2. Available to promise
+# ------------------------------------------------------------------
+ATPStatus = Literal["Available", "Backorder"]
+
+
+class ATPCheckIn(BaseModel):
+    product_id: int
+    quantity: Quantity
+    required_date: date
+
+
+class ATPResult(BaseModel):
+    product_id: int
+    requested_quantity: Decimal
+    required_date: date
+    on_hand: Decimal
+    committed: Decimal          # open reservations, every date
+    planned_receipts: Decimal   # expected up to required_date
+    atp_quantity: Decimal       # promisable on required_date without breaking later reservations
+    can_fulfill: bool
+    shortfall: Decimal
+    promised_date: Optional[date] = None  # None: not covered by any planned receipt
+    status: ATPStatus
+
+
+class ATPOrderLine(BaseModel):
+    product_id: int
+    quantity: Quantity
+
+
+class ATPOrderIn(BaseModel):
+    required_date: date
+    lines: List[ATPOrderLine] = Field(..., min_length=1, max_length=MAX_ATP_LINES)
+
+
+class ATPOrderOut(BaseModel):
+    # Lines of the same product draw on the same timeline, in line order
+    results: List[ATPResult]
+    overall_status: Literal["Available", "Partial", "Backorder"]
+    total_requested: Decimal
+    total_available: Decimal
+    total_backorder: Decimal
+    complete_date: Optional[date] = None  # whole order deliverable; None if a line cannot be promised
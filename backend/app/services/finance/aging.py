@@ -0,0 +1,215 @@
+# app/services/finance/aging.py
+"""
+AR/AP aging: open balances bucketed by days past due, per party.
+
+Snapshots are built by the nightly job and POST .../aging/snapshot;
+a read of a snapshot older than the latest change to the ledger first
+applies the incremental refresh, so it never serves stale balances.
+
+Nightly (cron):  python -m app.services.finance.aging
+"""
+import asyncio
+import datetime
+import logging
+from typing import Optional, Sequence
+
+from sqlalchemy import and_, case, delete, distinct, func, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.finance.open_items import (
+    AgingSnapshot, AgingSnapshotRun, OpenItem, OpenItemPayment, OpenItemStatus, Subledger,
+)
+from app.schemas.finance.open_items import AgingBuckets, AgingSummary
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = ("current", "days_1_30", "days_31_60", "days_61_90", "days_90_plus")
+# Last day past due (inclusive) of each bucket except the open-ended one
+BUCKET_LIMITS = (0, 30, 60, 90)
+# A change committed by a transaction that started before our watermark can
+# become visible after it; re-examine that much history on every refresh.
+CHANGE_OVERLAP = datetime.timedelta(minutes=5)
+PARTY_CHUNK = 5000
+
+
+class AgingError(ValueError):
+    """No snapshot has been taken for the requested ledger and date."""
+
+
+# ------------------------------------------------------------------
+# 1. One-pass bucketing in the database
+# ------------------------------------------------------------------
+def _balance(as_of: datetime.date):
+    """
+    What was open on ``as_of``. Up to today that is just the balance
+    column; for an earlier date the payments made after it are added back.
+    """
+    if as_of >= datetime.date.today():
+        return OpenItem.balance
+    paid = (
+        select(func.coalesce(func.sum(OpenItemPayment.amount), 0))
+        .where(OpenItemPayment.open_item_id == OpenItem.id, OpenItemPayment.paid_on <= as_of)
+        .scalar_subquery()
+    )
+    return OpenItem.amount - paid
+
+
+def _bucket_columns(as_of: datetime.date, balance) -> list:
+    """
+    SUM(CASE ...) per bucket: every open item is read once and lands in
+    exactly one bucket. Boundaries are dates computed here, so the
+    comparison is a plain date compare on any dialect.
+    """
+    due = OpenItem.due_date
+    bounds = [as_of - datetime.timedelta(days=limit) for limit in BUCKET_LIMITS]
+    conditions = [due >= bounds[0]]
+    conditions += [and_(due < upper, due >= lower) for upper, lower in zip(bounds, bounds[1:])]
+    conditions.append(due < bounds[-1])
+    return [
+        func.coalesce(func.sum(case((condition, balance), else_=0)), 0).label(name)
+        for condition, name in zip(conditions, BUCKETS)
+    ]
+
+
+def _open_items(ledger: Subledger, as_of: datetime.date, balance):
+    conditions = [OpenItem.ledger == ledger, balance > 0, OpenItem.issue_date <= as_of]
+    if balance is OpenItem.balance:
+        conditions.append(OpenItem.status != OpenItemStatus.paid)
+    return and_(*conditions)
+
+
+def _party_aging(ledger: Subledger, as_of: datetime.date, parties: Optional[Sequence[str]] = None):
+    balance = _balance(as_of)
+    stmt = select(
+        literal(ledger, AgingSnapshot.ledger.type),
+        literal(as_of, AgingSnapshot.as_of.type),
+        OpenItem.party_code,
+        func.count(),
+        *_bucket_columns(as_of, balance),
+        func.sum(balance),
+    ).where(_open_items(ledger, as_of, balance))
+    if parties is not None:
+        stmt = stmt.where(OpenItem.party_code.in_(parties))
+    return stmt.group_by(OpenItem.party_code)
+
+
+def _insert_snapshot(ledger: Subledger, as_of: datetime.date, parties: Optional[Sequence[str]] = None):
+    """INSERT ... SELECT – the aggregate goes straight into the snapshot table."""
+    columns = ["ledger", "as_of", "party_code", "items", *BUCKETS, "total"]
+    return insert(AgingSnapshot).from_select(columns, _party_aging(ledger, as_of, parties))
+
+
+# ------------------------------------------------------------------
+# 2. Snapshots: full nightly run, intraday refresh of changed parties
+# ------------------------------------------------------------------
+async def refresh_snapshot(
+    db: AsyncSession, ledger: Subledger, as_of: datetime.date, full: bool = False
+) -> AgingSnapshotRun:
+    """
+    Bring the snapshot for ``ledger``/``as_of`` up to date and commit.
+
+    Without a previous run (or with ``full``) every party is recomputed;
+    otherwise only parties with items changed since the last run are.
+    Concurrent refreshes of the same snapshot serialize on its run row,
+    which the first one creates with ON CONFLICT DO NOTHING.
+    """
+    started = (await db.execute(select(func.now()))).scalar_one()
+    if isinstance(started, str):  # SQLite returns CURRENT_TIMESTAMP as text
+        started = datetime.datetime.fromisoformat(started)
+    upsert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+    created = (await db.execute(
+        upsert(AgingSnapshotRun)
+        .values(ledger=ledger, as_of=as_of, computed_at=started, full_run_at=started)
+        .on_conflict_do_nothing(index_elements=["ledger", "as_of"])
+        .returning(AgingSnapshotRun.as_of)
+    )).first() is not None
+    run = await db.get(AgingSnapshotRun, (ledger, as_of), with_for_update=True)
+
+    snapshot = and_(AgingSnapshot.ledger == ledger, AgingSnapshot.as_of == as_of)
+    if created or full:
+        await db.execute(delete(AgingSnapshot).where(snapshot))
+        await db.execute(_insert_snapshot(ledger, as_of))
+        run.full_run_at = started
+    else:
+        changed = await db.execute(
+            select(distinct(OpenItem.party_code)).where(
+                OpenItem.ledger == ledger,
+                OpenItem.updated_at > run.computed_at - CHANGE_OVERLAP,
+            )
+        )
+        parties = list(changed.scalars())
+        for start in range(0, len(parties), PARTY_CHUNK):
+            chunk = parties[start:start + PARTY_CHUNK]
+            await db.execute(delete(AgingSnapshot).where(snapshot, AgingSnapshot.party_code.in_(chunk)))
+            await db.execute(_insert_snapshot(ledger, as_of, chunk))
+    run.computed_at = started
+    await db.commit()
+    return run
+
+
+async def snapshot_run(db: AsyncSession, ledger: Subledger, as_of: datetime.date) -> AgingSnapshotRun:
+    run = await db.get(AgingSnapshotRun, (ledger, as_of))
+    if run is None:
+        raise AgingError(f"No {ledger.value.upper()} aging snapshot for {as_of}")
+    return run
+
+
+async def current_run(db: AsyncSession, ledger: Subledger, as_of: datetime.date) -> AgingSnapshotRun:
+    """
+    The run for ``as_of``, refreshed first (changed parties only) when an
+    item of the ledger changed at or after it was computed. Needs the
+    primary: the refresh writes. Never takes a first snapshot.
+    """
+    run = await snapshot_run(db, ledger, as_of)
+    latest = (await db.execute(
+        select(func.max(OpenItem.updated_at)).where(OpenItem.ledger == ledger)
+    )).scalar_one()
+    if latest is not None and latest >= run.computed_at:
+        run = await refresh_snapshot(db, ledger, as_of)
+    return run
+
+
+async def aging_summary(db: AsyncSession, ledger: Subledger, as_of: datetime.date) -> AgingSummary:
+    """Totals of the snapshot for ``as_of`` as it stands; never computes one."""
+    run = await snapshot_run(db, ledger, as_of)
+    S = AgingSnapshot
+    row = (await db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(S.items), 0),
+            *(func.coalesce(func.sum(getattr(S, name)), 0) for name in (*BUCKETS, "total")),
+        ).where(S.ledger == ledger, S.as_of == as_of)
+    )).one()
+    return AgingSummary(
+        ledger=ledger,
+        as_of=as_of,
+        computed_at=run.computed_at,
+        parties=row[0],
+        items=row[1],
+        buckets=AgingBuckets(**dict(zip((*BUCKETS, "total"), row[2:]))),
+    )
+
+
+def party_aging_query(ledger: Subledger, as_of: datetime.date):
+    return select(AgingSnapshot).where(AgingSnapshot.ledger == ledger, AgingSnapshot.as_of == as_of)
+
+
+async def nightly_snapshot(as_of: Optional[datetime.date] = None) -> None:
+    from app.db.session import AsyncSessionLocal
+
+    as_of = as_of or datetime.date.today()
+    async with AsyncSessionLocal() as db:
+        for ledger in Subledger:
+            await refresh_snapshot(db, ledger, as_of, full=True)
+            logger.info("Aging snapshot %s %s rebuilt", ledger.value, as_of)
+        cutoff = as_of - datetime.timedelta(days=settings.AGING_SNAPSHOT_RETENTION_DAYS)
+        await db.execute(delete(AgingSnapshot).where(AgingSnapshot.as_of < cutoff))
+        await db.execute(delete(AgingSnapshotRun).where(AgingSnapshotRun.as_of < cutoff))
+        await db.commit()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(nightly_snapshot())
@@ -0,0 +1,253 @@
+# app/services/finance/bank_statements.py
+"""
+Streaming parsers for bank statement files. Each yields one record per
+booked line and never holds the whole file in memory.
+"""
+import csv
+import datetime
+import io
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Callable, Iterator, Optional
+
+from app.models.finance.bank import StatementFormat
+
+
+@dataclass
+class StatementRecord:
+    booking_date: datetime.date
+    amount: Decimal  # + money in, - money out
+    reference: Optional[str]
+    description: Optional[str]
+
+
+class StatementParseError(ValueError):
+    def __init__(self, message: str, line: Optional[int] = None):
+        super().__init__(f"line {line}: {message}" if line else message)
+
+
+def _decimal(text: str) -> Decimal:
+    """
+    1,234.50 / 1.234,50 / 1234,50 / 1,23,456.50: the last separator is the
+    decimal one unless it repeats (1,234,567), the other groups digits.
+    """
+    cleaned = re.sub(r"[^\d.,\-]", "", text or "")
+    point = max(cleaned.rfind("."), cleaned.rfind(","))
+    if point >= 0:
+        if cleaned.count(cleaned[point]) > 1:
+            cleaned = re.sub(r"[.,]", "", cleaned)
+        else:
+            cleaned = re.sub(r"[.,]", "", cleaned[:point]) + "." + cleaned[point + 1:]
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        raise ValueError(f"invalid amount {text!r}")
+
+
+# ------------------------------------------------------------------
+# 1. CSV (bank exports: one header row, flexible column names)
+# ------------------------------------------------------------------
+CSV_COLUMNS = {
+    "date": ("date", "booking date", "booking_date", "transaction date", "txn date", "value date"),
+    "amount": ("amount",),
+    "debit": ("debit", "withdrawal", "withdrawal amt.", "withdrawal amount", "dr"),
+    "credit": ("credit", "deposit", "deposit amt.", "deposit amount", "cr"),
+    "reference": ("reference", "ref", "ref no.", "ref no./cheque no.", "cheque no", "check number", "utr"),
+    "description": ("description", "narration", "details", "particulars", "memo"),
+}
+CSV_DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d/%m/%y", "%d-%b-%Y", "%d %b %Y")
+
+
+def _csv_date(text: str) -> datetime.date:
+    text = text.strip()
+    for fmt in CSV_DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"invalid date {text!r}")
+
+
+def parse_csv(stream: BinaryIO) -> Iterator[StatementRecord]:
+    reader = csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline=""))
+    header = [name.strip().lower() for name in next(reader, [])]
+    columns = {
+        field: next((header.index(alias) for alias in aliases if alias in header), None)
+        for field, aliases in CSV_COLUMNS.items()
+    }
+    if columns["date"] is None or (columns["amount"] is None and columns["credit"] is None):
+        raise StatementParseError("CSV needs a date column and an amount or debit/credit columns", 1)
+
+    def cell(row: list, field: str) -> str:
+        index = columns[field]
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    for line_no, row in enumerate(reader, start=2):
+        if not any(value.strip() for value in row):
+            continue
+        try:
+            if columns["amount"] is not None:
+                amount = _decimal(cell(row, "amount"))
+            else:
+                amount = _decimal(cell(row, "credit") or "0") - _decimal(cell(row, "debit") or "0")
+            yield StatementRecord(
+                booking_date=_csv_date(cell(row, "date")),
+                amount=amount,
+                reference=cell(row, "reference") or None,
+                description=cell(row, "description") or None,
+            )
+        except ValueError as exc:
+            raise StatementParseError(str(exc), line_no)
+
+
+# ------------------------------------------------------------------
+# 2. SWIFT MT940 (:61: statement line, :86: information to owner)
+# ------------------------------------------------------------------
+MT940_LINE = re.compile(
+    r"^(?P<value>\d{6})(?P<entry>\d{4})?(?P<mark>R?[CD])[A-Z]?(?P<amount>\d+,\d*)"
+    r"[NFS][A-Z0-9]{3}(?P<customer_ref>[^/]*?)(?://(?P<bank_ref>.*))?$"
+)
+
+
+def _mt940_record(field: str, info: Optional[str]) -> StatementRecord:
+    match = MT940_LINE.match(field.split("\n", 1)[0])
+    if not match:
+        raise ValueError(f"unreadable :61: field {field[:40]!r}")
+    value_date = datetime.datetime.strptime(match["value"], "%y%m%d").date()
+    booking_date = value_date
+    if match["entry"]:
+        booking_date = datetime.date(value_date.year, int(match["entry"][:2]), int(match["entry"][2:]))
+        # Entry date in January for a December value date (or vice versa)
+        if (booking_date - value_date).days > 180:
+            booking_date = booking_date.replace(year=value_date.year - 1)
+        elif (value_date - booking_date).days > 180:
+            booking_date = booking_date.replace(year=value_date.year + 1)
+    amount = _decimal(match["amount"])
+    if match["mark"] in ("D", "RC"):
+        amount = -amount
+    reference = match["customer_ref"].strip()
+    if not reference or reference.upper() == "NONREF":
+        reference = (match["bank_ref"] or "").strip()
+    return StatementRecord(booking_date, amount, reference or None, info)
+
+
+def parse_mt940(stream: BinaryIO) -> Iterator[StatementRecord]:
+    tag, value, line_start = None, [], 0
+    pending: Optional[tuple[str, int]] = None  # :61: waiting for its :86:
+
+    def flush_field():
+        nonlocal pending
+        if tag == "61":
+            if pending:
+                yield pending_record(None)
+            pending = ("\n".join(value), line_start)
+        elif tag == "86" and pending:
+            yield pending_record(" ".join(part.strip() for part in value))
+
+    def pending_record(info: Optional[str]) -> StatementRecord:
+        nonlocal pending
+        field, line_no = pending
+        pending = None
+        try:
+            return _mt940_record(field, info)
+        except ValueError as exc:
+            raise StatementParseError(str(exc), line_no)
+
+    for line_no, raw in enumerate(io.TextIOWrapper(stream, encoding="latin-1"), start=1):
+        line = raw.rstrip("\r\n")
+        started = re.match(r"^:(\d{2}[A-Z]?):(.*)$", line)
+        if started or line.startswith("-}") or line == "-":
+            yield from flush_field()
+            tag, value, line_start = (started[1], [started[2]], line_no) if started else (None, [], line_no)
+        elif tag:
+            value.append(line)
+    yield from flush_field()
+    if pending:
+        yield pending_record(None)
+
+
+# ------------------------------------------------------------------
+# 3. ISO 20022 camt.053 (<Ntry> elements, any namespace version)
+# ------------------------------------------------------------------
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _find(elem: ET.Element, *path: str) -> Optional[ET.Element]:
+    for name in path:
+        elem = next((child for child in elem if _local(child.tag) == name), None)
+        if elem is None:
+            return None
+    return elem
+
+
+def _text(elem: ET.Element, *path: str) -> Optional[str]:
+    found = _find(elem, *path)
+    return found.text.strip() if found is not None and found.text else None
+
+
+def _camt_record(entry: ET.Element) -> StatementRecord:
+    amount = _decimal(_text(entry, "Amt") or "")
+    if _text(entry, "CdtDbtInd") == "DBIT":
+        amount = -amount
+    day = _text(entry, "BookgDt", "Dt") or (_text(entry, "BookgDt", "DtTm") or "")[:10] or _text(entry, "ValDt", "Dt")
+    if not day:
+        raise ValueError("entry without booking date")
+
+    tx = _find(entry, "NtryDtls", "TxDtls")
+    reference = None
+    if tx is not None:
+        end_to_end = _text(tx, "Refs", "EndToEndId")
+        if end_to_end and end_to_end != "NOTPROVIDED":
+            reference = end_to_end
+    reference = reference or _text(entry, "AcctSvcrRef") or _text(entry, "NtryRef")
+
+    remittance = []
+    if tx is not None:
+        info = _find(tx, "RmtInf")
+        if info is not None:
+            remittance = [child.text.strip() for child in info if _local(child.tag) == "Ustrd" and child.text]
+    description = " ".join(remittance) or _text(entry, "AddtlNtryInf")
+    return StatementRecord(datetime.date.fromisoformat(day), amount, reference, description)
+
+
+def parse_camt(stream: BinaryIO) -> Iterator[StatementRecord]:
+    parents: list[ET.Element] = []
+    count = 0
+    try:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                parents.append(elem)
+                continue
+            parents.pop()
+            if _local(elem.tag) != "Ntry":
+                continue
+            count += 1
+            try:
+                yield _camt_record(elem)
+            except ValueError as exc:
+                raise StatementParseError(f"entry {count}: {exc}")
+            # Drop parsed entries so memory stays flat on large files
+            if parents:
+                parents[-1].remove(elem)
+    except ET.ParseError as exc:
+        raise StatementParseError(f"invalid XML: {exc}")
+
+
+PARSERS: dict[StatementFormat, Callable[[BinaryIO], Iterator[StatementRecord]]] = {
+    StatementFormat.csv: parse_csv,
+    StatementFormat.mt940: parse_mt940,
+    StatementFormat.camt: parse_camt,
+}
+
+
+def detect_format(filename: Optional[str], head: bytes) -> StatementFormat:
+    name = (filename or "").lower()
+    stripped = head.lstrip()
+    if name.endswith(".xml") or stripped.startswith(b"<"):
+        return StatementFormat.camt
+    if name.endswith((".sta", ".mt940", ".940")) or b":20:" in head or b":61:" in head:
+        return StatementFormat.mt940
+    return StatementFormat.csv
@@ -0,0 +1,386 @@
+# app/services/finance/budgeting.py
+"""
+Budget vs. actual and rolling forecasts on NumPy matrices.
+
+A budget is loaded once into two (row × month) matrices, a row being an
+(account, cost centre) pair: the budget and the posted actuals, both in
+the account's natural sign, with BUDGET_HISTORY_MONTHS of actuals before
+the first budget month for the forecasts to look back on. Variances,
+forecasts and what-if adjustments are then whole-matrix operations, and
+each scenario result is memoized under a hash of its parameters.
+
+A loaded cube stays valid while the budget version and the ledger stamp
+(posted and voided entry counts over its months) are unchanged: every
+posting raises the first count, every void the second.
+"""
+import bisect
+import datetime
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+from redis.asyncio import Redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.report_cache import report_cache
+from app.crud.finance.ledger import period_of
+from app.models.finance.budget import Budget, BudgetLine
+from app.models.finance.ledger import Account, AccountType, JournalEntry, JournalLine, JournalStatus
+from app.schemas.finance.budget import (
+    BudgetGrouping, ForecastMethod, ScenarioIn, ScenarioMonth, ScenarioResult, ScenarioRow,
+    VarianceReport, VarianceRow, months_between,
+)
+from app.services.finance.cost_allocation import period_range
+
+CREDIT_NORMAL = (AccountType.liability, AccountType.equity, AccountType.income)
+
+
+def add_months(period: int, months: int) -> int:
+    year, month = divmod(period // 100 * 12 + period % 100 - 1 + months, 12)
+    return year * 100 + month + 1
+
+
+def last_closed_period() -> int:
+    return period_of(datetime.date.today().replace(day=1) - datetime.timedelta(days=1))
+
+
+# Whole columns are rounded at once and formatted as strings; the schemas
+# parse those into Decimal (far cheaper than one Decimal per value here)
+def _cents(values: np.ndarray) -> list[str]:
+    return ["%.2f" % value for value in (np.round(values, 2) + 0.0).tolist()]  # + 0.0: no "-0.00"
+
+
+def _pcts(part: np.ndarray, whole: np.ndarray) -> list[Optional[str]]:
+    ratio = np.divide(100 * part, np.abs(whole), out=np.zeros_like(part), where=whole != 0)
+    return [pct if base else None for pct, base in zip(_cents(ratio), (whole != 0).tolist())]
+
+
+# ------------------------------------------------------------------
+# 1. Cube
+# ------------------------------------------------------------------
+@dataclass
+class BudgetCube:
+    budget_id: int
+    version: int
+    stamp: tuple
+    periods: list[int]          # history months, then budget months
+    first: int                  # index of the first budget month
+    account_ids: np.ndarray     # per row
+    cost_centers: np.ndarray    # per row ("" = none)
+    accounts: dict[int, tuple]  # id → (code, name, type)
+    budget: np.ndarray          # rows × months
+    actual: np.ndarray          # rows × months
+    _groupings: dict = field(default_factory=dict)
+
+    def cutoff_index(self, cutoff: int) -> int:
+        """Number of leading months that carry actuals."""
+        return bisect.bisect_right(self.periods, cutoff)
+
+    def grouping(self, group_by: BudgetGrouping) -> tuple[np.ndarray, list[tuple]]:
+        """Group id per row and the (type, account_id, cost_center) key per group."""
+        if group_by not in self._groupings:
+            keys: dict[tuple, int] = {}
+            ids = np.empty(len(self.cost_centers), dtype=np.intp)
+            for row, (account_id, cost_center) in enumerate(zip(self.account_ids.tolist(), self.cost_centers.tolist())):
+                account_type = self.accounts[account_id][2]
+                if group_by == BudgetGrouping.account:
+                    key = (account_type, account_id, None)
+                elif group_by == BudgetGrouping.cost_center:
+                    key = (account_type, None, cost_center)
+                else:
+                    key = (account_type, account_id, cost_center)
+                ids[row] = keys.setdefault(key, len(keys))
+            self._groupings[group_by] = (ids, list(keys))
+        return self._groupings[group_by]
+
+    def grouped(self, group_by: BudgetGrouping, *vectors: np.ndarray) -> list[np.ndarray]:
+        ids, keys = self.grouping(group_by)
+        return [np.bincount(ids, weights=vector, minlength=len(keys)) for vector in vectors]
+
+    def key_fields(self, key: tuple) -> dict:
+        account_type, account_id, cost_center = key
+        fields = {"type": account_type, "cost_center": cost_center}
+        if account_id is not None:
+            code, name, _ = self.accounts[account_id]
+            fields.update(account_id=account_id, account_code=code, account_name=name)
+        return fields
+
+
+class CubeCache:
+    """Most recently used cubes, at most one per budget."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._cubes: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.loads = 0
+        self.load_seconds = 0.0
+
+    def get(self, budget_id: int, version: int, stamp: tuple) -> Optional[BudgetCube]:
+        cube = self._cubes.get(budget_id)
+        if cube is None or (cube.version, cube.stamp) != (version, stamp):
+            return None
+        self._cubes.move_to_end(budget_id)
+        self.hits += 1
+        return cube
+
+    def put(self, cube: BudgetCube) -> None:
+        self._cubes[cube.budget_id] = cube
+        self._cubes.move_to_end(cube.budget_id)
+        while len(self._cubes) > self.size:
+            self._cubes.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "cubes": len(self._cubes),
+            "size": self.size,
+            "hits": self.hits,
+            "loads": self.loads,
+            "load_seconds_avg": round(self.load_seconds / self.loads, 4) if self.loads else 0.0,
+        }
+
+
+cubes = CubeCache(settings.BUDGET_CUBE_CACHE_SIZE)
+
+
+async def ledger_stamp(db: AsyncSession, from_period: int, to_period: int) -> tuple[int, int]:
+    """(posted, void) entry counts dated in the range – changes with every post or void."""
+    result = await db.execute(
+        select(
+            func.count().filter(JournalEntry.status == JournalStatus.posted),
+            func.count().filter(JournalEntry.status == JournalStatus.void),
+        ).where(JournalEntry.entry_date.between(period_range(from_period)[0], period_range(to_period)[1]))
+    )
+    posted, void = result.one()
+    return posted, void
+
+
+async def load_cube(db: AsyncSession, budget: Budget) -> BudgetCube:
+    start = add_months(budget.from_period, -settings.BUDGET_HISTORY_MONTHS)
+    # Stamp before the data: a posting in between makes the next stamp differ
+    stamp = await ledger_stamp(db, start, budget.to_period)
+    cube = cubes.get(budget.id, budget.version, stamp)
+    if cube is not None:
+        return cube
+
+    started = time.perf_counter()
+    periods = [add_months(start, n) for n in range(settings.BUDGET_HISTORY_MONTHS)]
+    periods += [add_months(budget.from_period, n) for n in range(months_between(budget.from_period, budget.to_period))]
+    column = {period: n for n, period in enumerate(periods)}
+
+    budget_rows = (await db.execute(
+        select(BudgetLine.account_id, BudgetLine.cost_center, BudgetLine.period, BudgetLine.amount)
+        .where(BudgetLine.budget_id == budget.id)
+    )).all()
+    budgeted_accounts = select(BudgetLine.account_id).where(BudgetLine.budget_id == budget.id).distinct()
+    year = func.extract("year", JournalEntry.entry_date)
+    month = func.extract("month", JournalEntry.entry_date)
+    cost_center = func.coalesce(JournalLine.cost_center, "")
+    actual_rows = (await db.execute(
+        select(JournalLine.account_id, cost_center, year, month, func.sum(JournalLine.debit - JournalLine.credit))
+        .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+        .where(
+            JournalEntry.status == JournalStatus.posted,
+            JournalEntry.entry_date.between(period_range(start)[0], period_range(budget.to_period)[1]),
+            JournalLine.account_id.in_(budgeted_accounts),
+        )
+        .group_by(JournalLine.account_id, cost_center, year, month)
+    )).all()
+    accounts = {
+        account_id: (code, name, account_type)
+        for account_id, code, name, account_type in (await db.execute(
+            select(Account.id, Account.code, Account.name, Account.type).where(Account.id.in_(budgeted_accounts))
+        )).all()
+    }
+
+    rows: dict[tuple[int, str], int] = {}
+    b_row, b_col, b_val = [], [], []
+    for account_id, center, period, amount in budget_rows:
+        b_row.append(rows.setdefault((account_id, center), len(rows)))
+        b_col.append(column[period])
+        b_val.append(float(amount))
+    a_row, a_col, a_val = [], [], []
+    for account_id, center, y, m, net in actual_rows:
+        a_row.append(rows.setdefault((account_id, center), len(rows)))
+        a_col.append(column[int(y) * 100 + int(m)])
+        # Natural sign: credit-normal accounts report credit - debit
+        a_val.append(-float(net) if accounts[account_id][2] in CREDIT_NORMAL else float(net))
+
+    shape = (len(rows), len(periods))
+    budget_matrix, actual_matrix = np.zeros(shape), np.zeros(shape)
+    np.add.at(budget_matrix, (np.array(b_row, dtype=np.intp), np.array(b_col, dtype=np.intp)), b_val)
+    np.add.at(actual_matrix, (np.array(a_row, dtype=np.intp), np.array(a_col, dtype=np.intp)), a_val)
+
+    cube = BudgetCube(
+        budget_id=budget.id,
+        version=budget.version,
+        stamp=stamp,
+        periods=periods,
+        first=settings.BUDGET_HISTORY_MONTHS,
+        account_ids=np.array([account_id for account_id, _ in rows], dtype=np.int64),
+        cost_centers=np.array([center for _, center in rows], dtype=object),
+        accounts=accounts,
+        budget=budget_matrix,
+        actual=actual_matrix,
+    )
+    cubes.put(cube)
+    cubes.loads += 1
+    cubes.load_seconds += time.perf_counter() - started
+    return cube
+
+
+# ------------------------------------------------------------------
+# 2. Budget vs. actual
+# ------------------------------------------------------------------
+async def variance_report(
+    db: AsyncSession, budget: Budget, cutoff: Optional[int], group_by: BudgetGrouping
+) -> VarianceReport:
+    cube = await load_cube(db, budget)
+    cutoff = cutoff or last_closed_period()
+    to_date = slice(cube.first, max(cube.first, cube.cutoff_index(cutoff)))
+    whole = slice(cube.first, None)
+    budget_total, budget_to_date, actual_to_date = cube.grouped(
+        group_by,
+        cube.budget[:, whole].sum(axis=1),
+        cube.budget[:, to_date].sum(axis=1),
+        cube.actual[:, to_date].sum(axis=1),
+    )
+    variance = actual_to_date - budget_to_date
+    _, keys = cube.grouping(group_by)
+    columns = zip(
+        _cents(budget_total), _cents(budget_to_date), _cents(actual_to_date),
+        _cents(variance), _pcts(variance, budget_to_date),
+    )
+    return VarianceReport(
+        budget_id=budget.id,
+        version=budget.version,
+        cutoff=cutoff,
+        group_by=group_by,
+        rows=[
+            VarianceRow(
+                **cube.key_fields(key),
+                budget=total, budget_to_date=total_to_date, actual_to_date=actual,
+                variance=difference, variance_pct=pct,
+            )
+            for key, (total, total_to_date, actual, difference, pct) in zip(keys, columns)
+        ],
+    )
+
+
+# ------------------------------------------------------------------
+# 3. Forecast scenarios
+# ------------------------------------------------------------------
+def _base_level(history: np.ndarray, params: ScenarioIn) -> np.ndarray:
+    """Per-row monthly run rate from the actuals up to the cutoff."""
+    months = history.shape[1]
+    if months == 0:
+        return np.zeros(history.shape[0])
+    if params.method == ForecastMethod.moving_average:
+        return history[:, -params.window:].mean(axis=1)
+    # Simple exponential smoothing seeded with the first month, as one
+    # weighted sum: level = Σ α(1-α)^(n-1-i)·x_i, first weight (1-α)^(n-1)
+    alpha = params.alpha
+    weights = alpha * (1 - alpha) ** np.arange(months - 1, -1, -1, dtype=float)
+    weights[0] = (1 - alpha) ** (months - 1)
+    return history @ weights
+
+
+def forecast(cube: BudgetCube, params: ScenarioIn, cutoff: int) -> np.ndarray:
+    """Rows × months: actuals up to the cutoff, the scenario's forecast after it."""
+    known = cube.cutoff_index(cutoff)
+    horizon = len(cube.periods) - known
+    level = _base_level(cube.actual[:, :known], params)
+
+    scale = np.ones(len(cube.cost_centers))
+    for adjustment in params.adjustments:
+        mask = np.ones(len(scale), dtype=bool)
+        if adjustment.account_id is not None:
+            mask &= cube.account_ids == adjustment.account_id
+        if adjustment.cost_center is not None:
+            mask &= cube.cost_centers == adjustment.cost_center
+        scale[mask] *= 1 + adjustment.percent / 100
+
+    growth = (1 + params.growth_percent / 100) ** np.arange(1, horizon + 1)
+    outlook = cube.actual.copy()
+    outlook[:, known:] = (level * scale)[:, None] * growth[None, :]
+    return outlook
+
+
+def scenario_hash(params: ScenarioIn) -> str:
+    return hashlib.sha256(params.model_dump_json().encode()).hexdigest()[:20]
+
+
+def run_scenario(cube: BudgetCube, params: ScenarioIn) -> ScenarioResult:
+    known = cube.cutoff_index(params.cutoff)
+    outlook = forecast(cube, params, params.cutoff)
+    whole = slice(cube.first, None)
+    to_date = slice(cube.first, max(cube.first, known))
+
+    budget_total, actual_to_date, outlook_total = cube.grouped(
+        params.group_by,
+        cube.budget[:, whole].sum(axis=1),
+        cube.actual[:, to_date].sum(axis=1),
+        outlook[:, whole].sum(axis=1),
+    )
+    variance = outlook_total - budget_total
+    _, keys = cube.grouping(params.group_by)
+    columns = zip(
+        _cents(budget_total), _cents(actual_to_date), _cents(outlook_total - actual_to_date),
+        _cents(outlook_total), _cents(variance), _pcts(variance, budget_total),
+    )
+    rows = [
+        ScenarioRow(
+            **cube.key_fields(key),
+            budget=total, actual_to_date=actual, forecast=ahead, outlook=outlook_sum,
+            variance=difference, variance_pct=pct,
+        )
+        for key, (total, actual, ahead, outlook_sum, difference, pct) in zip(keys, columns)
+    ]
+
+    # Monthly series per account type (summing income into expense means nothing)
+    row_types = np.array([cube.accounts[account_id][2].value for account_id in cube.account_ids.tolist()])
+    months = []
+    for account_type in sorted({key[0] for key in keys}, key=lambda t: t.value):
+        mask = row_types == account_type.value
+        budget_series = _cents(cube.budget[mask, whole].sum(axis=0))
+        outlook_series = _cents(outlook[mask, whole].sum(axis=0))
+        for n, period in enumerate(cube.periods[cube.first:]):
+            months.append(ScenarioMonth(
+                type=account_type,
+                period=period,
+                budget=budget_series[n],
+                actual=outlook_series[n] if cube.first + n < known else None,
+                outlook=outlook_series[n],
+            ))
+
+    return ScenarioResult(
+        budget_id=cube.budget_id,
+        version=cube.version,
+        scenario=scenario_hash(params),
+        cutoff=params.cutoff,
+        params=params,
+        rows=rows,
+        months=months,
+    )
+
+
+async def scenario_json(db: AsyncSession, redis: Redis, budget: Budget, params: ScenarioIn) -> str:
+    """
+    Memoized per parameter hash. The key also carries the budget version
+    and the ledger stamp, so an edit or a posting simply moves on to new
+    keys; the budget tag lets a line edit drop the old ones early.
+    """
+    params = params.model_copy(update={"cutoff": params.cutoff or last_closed_period()})
+    cube = await load_cube(db, budget)
+    posted, void = cube.stamp
+    key = f"budget:{budget.id}:v{cube.version}:{posted}-{void}:{scenario_hash(params)}"
+
+    async def render(_: AsyncSession):
+        return run_scenario(cube, params).model_dump_json()
+
+    return await report_cache.get_or_set(redis, key, [f"budget:{budget.id}"], render)
@@ -0,0 +1,211 @@
+# app/services/finance/cost_allocation.py
+"""
+Reciprocal cost allocation.
+
+With A[i, j] the share of service centre i's cost that goes to centre j
+(production centres have empty rows) and d the direct cost per centre,
+the fully loaded cost t satisfies t = d + Aᵀt, i.e. t = (I - Aᵀ)⁻¹ d.
+One linear solve replaces the iterative step-down passes and handles
+service centres that serve each other.
+"""
+import calendar
+import datetime
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+from redis.asyncio import Redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.report_cache import report_cache
+from app.crud.finance.cost_allocation import CostAllocationError, driver_version
+from app.crud.finance.ledger import CENT
+from app.models.finance.cost_allocation import AllocationDriver, CostCenter, CostCenterKind
+from app.models.finance.ledger import Account, AccountType, JournalEntry, JournalLine, JournalStatus
+from app.schemas.finance.cost_allocation import AllocationResult, AllocationRow
+from app.services.finance.statements import is_closed
+
+# Senders changed between two versions above which a fresh inversion is cheaper
+MAX_CHANGED_SENDERS = 16
+# Rank-one updates in a row before re-inverting (bounds rounding drift)
+MAX_RANK_ONE_UPDATES = 64
+
+
+class ReciprocalSolver:
+    """
+    Inverse of (I - Aᵀ) for the latest driver version seen by this process.
+
+    A driver change replaces one sender's row of A, i.e. one column of
+    I - Aᵀ, so the next version is a Sherman–Morrison rank-one update of
+    the previous inverse: O(n²) instead of a fresh O(n³) inversion. With
+    the inverse at hand every period is a single matrix-vector product.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None
+        self.centers: list = []
+        self.ids: tuple = ()
+        self.shares: Optional[np.ndarray] = None
+        self.inverse: Optional[np.ndarray] = None
+        self.updates = 0
+
+        self.full_inversions = 0
+        self.rank_one_updates = 0
+        self.reuses = 0
+
+    def _rank_one(self, shares: np.ndarray) -> Optional[np.ndarray]:
+        changed = np.flatnonzero(np.any(shares != self.shares, axis=1))
+        if len(changed) > MAX_CHANGED_SENDERS or self.updates + len(changed) > MAX_RANK_ONE_UPDATES:
+            return None
+        inverse = self.inverse.copy()
+        for i in changed:
+            u = self.shares[i] - shares[i]  # new minus old column i of I - Aᵀ
+            mu = inverse @ u
+            denominator = 1.0 + mu[i]
+            if abs(denominator) < 1e-9:
+                return None
+            inverse -= np.outer(mu / denominator, inverse[i])
+        self.updates += len(changed)
+        self.rank_one_updates += len(changed)
+        return inverse
+
+    def inverse_for(self, version: int, centers: list, shares: np.ndarray) -> np.ndarray:
+        ids = tuple(center.id for center in centers)
+        inverse = None
+        if self.inverse is not None and ids == self.ids:
+            inverse = self._rank_one(shares)
+        if inverse is None:
+            try:
+                inverse = np.linalg.inv(np.eye(len(ids)) - shares.T)
+            except np.linalg.LinAlgError:
+                inverse = None
+            if inverse is None or not np.all(np.isfinite(inverse)):
+                raise CostAllocationError(
+                    "Service cost centres allocate only among themselves; at least one needs a production receiver"
+                )
+            self.updates = 0
+            self.full_inversions += 1
+        self.version, self.centers, self.ids = version, centers, ids
+        self.shares, self.inverse = shares, inverse
+        return inverse
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "cost_centers": len(self.ids),
+            "full_inversions": self.full_inversions,
+            "rank_one_updates": self.rank_one_updates,
+            "reuses": self.reuses,
+        }
+
+
+solver = ReciprocalSolver()
+
+
+# ------------------------------------------------------------------
+# 1. Inputs
+# ------------------------------------------------------------------
+def period_range(period: int) -> tuple[datetime.date, datetime.date]:
+    year, month = divmod(period, 100)
+    return datetime.date(year, month, 1), datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+
+async def _drivers(db: AsyncSession) -> tuple[int, list, np.ndarray]:
+    """Driver version, active centres and the row-normalized share matrix, read consistently."""
+    version = await driver_version(db)
+    if version == solver.version:
+        return version, solver.centers, solver.shares
+    for _ in range(3):
+        version = await driver_version(db)
+        centers = (await db.execute(
+            select(CostCenter.id, CostCenter.code, CostCenter.name, CostCenter.kind)
+            .where(CostCenter.is_active.is_(True))
+            .order_by(CostCenter.id)
+        )).all()
+        drivers = (await db.execute(
+            select(AllocationDriver.sender_id, AllocationDriver.receiver_id, AllocationDriver.quantity)
+        )).all()
+        if await driver_version(db) == version:
+            break
+
+    index = {center.id: k for k, center in enumerate(centers)}
+    service = {center.id for center in centers if center.kind == CostCenterKind.service}
+    shares = np.zeros((len(centers), len(centers)))
+    for sender, receiver, quantity in drivers:
+        if sender in service and receiver in index and sender != receiver:
+            shares[index[sender], index[receiver]] = float(quantity)
+    totals = shares.sum(axis=1, keepdims=True)
+    np.divide(shares, totals, out=shares, where=totals > 0)
+    return version, centers, shares
+
+
+async def _direct_costs(db: AsyncSession, period: int) -> dict[str, Decimal]:
+    from_date, to_date = period_range(period)
+    result = await db.execute(
+        select(JournalLine.cost_center, func.sum(JournalLine.debit - JournalLine.credit))
+        .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+        .join(Account, Account.id == JournalLine.account_id)
+        .where(
+            Account.type == AccountType.expense,
+            JournalEntry.status == JournalStatus.posted,
+            JournalEntry.entry_date.between(from_date, to_date),
+            JournalLine.cost_center.is_not(None),
+        )
+        .group_by(JournalLine.cost_center)
+    )
+    return {code: Decimal(amount or 0) for code, amount in result.all()}
+
+
+# ------------------------------------------------------------------
+# 2. Allocation
+# ------------------------------------------------------------------
+async def allocate(db: AsyncSession, period: int) -> AllocationResult:
+    version, centers, shares = await _drivers(db)
+    direct_by_code = await _direct_costs(db, period)
+
+    direct = np.array([float(direct_by_code.get(center.code, 0)) for center in centers])
+    if version == solver.version:
+        solver.reuses += 1
+        inverse = solver.inverse
+    else:
+        inverse = solver.inverse_for(version, centers, shares) if centers else np.zeros((0, 0))
+    loaded = inverse @ direct
+    allocated_out = loaded * shares.sum(axis=1)
+    final = loaded - allocated_out
+
+    def money(value: float) -> Decimal:
+        return Decimal(repr(float(value))).quantize(CENT)
+
+    known = {center.code for center in centers}
+    rows = [
+        AllocationRow(
+            code=center.code,
+            name=center.name,
+            kind=center.kind,
+            direct=money(direct[k]),
+            received=money(loaded[k] - direct[k]),
+            allocated_out=money(allocated_out[k]),
+            final=money(final[k]),
+        )
+        for k, center in enumerate(centers)
+    ]
+    return AllocationResult(
+        period=period,
+        driver_version=version,
+        rows=rows,
+        total_direct=money(direct.sum()),
+        total_final=money(final.sum()),
+        unassigned=sum((amount for code, amount in direct_by_code.items() if code not in known), Decimal("0")).quantize(CENT),
+    )
+
+
+async def allocation_json(db: AsyncSession, redis: Redis, period: int) -> str:
+    """Cached per period and driver version; postings into the period drop it by tag."""
+    async def render(db: AsyncSession):
+        return (await allocate(db, period)).model_dump_json()
+
+    if not is_closed(period_range(period)[1]):
+        return await render(db)
+    key = f"alloc:{period}:v{await driver_version(db)}"
+    return await report_cache.get_or_set(redis, key, [f"gl:period:{period}"], render)
@@ -0,0 +1,393 @@
+# app/services/finance/period_close.py
+"""
+Month-end close as a dependency graph of steps.
+
+Worker:  python -m app.services.finance.period_close
+
+The API queues a run id on a Redis list; a worker takes it, locks the
+run and starts every step whose prerequisites are complete, each in its
+own session, so independent steps run side by side. A finished step is
+checkpointed (close_run_steps) before anything that depends on it
+starts. A failed or interrupted run is resumed from its checkpoints:
+completed steps are never repeated, the rest start over.
+
+Progress goes to a Redis stream per run, which the API relays to the
+browser as server-sent events. The checkpoint rows stay the source of
+truth once the stream has expired.
+"""
+import asyncio
+import datetime
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import run_lock
+from app.core.config import settings
+from app.crud.finance.close import get_steps
+from app.crud.finance.ledger import post_entry, trial_balance
+from app.db.session import AsyncSessionLocal
+from app.models.finance.assets import DepreciationRun
+from app.models.finance.close import CloseRun, CloseStatus, CloseStepStatus
+from app.models.finance.ledger import JournalEntry, JournalStatus
+from app.models.finance.open_items import Subledger
+from app.schemas.finance.close import CloseRunDetail, CloseRunOut, CloseStepOut
+from app.services.finance.aging import aging_summary, refresh_snapshot
+from app.services.finance.cost_allocation import allocation_json, period_range
+from app.services.finance.depreciation import run_depreciation
+from app.services.finance.statements import (
+    balance_sheet_json, cash_flow_json, invalidate_for_posting, is_closed,
+    profit_and_loss_by_cost_center_json, profit_and_loss_json,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "close:queue"
+# Stream entries kept per run (a close emits a few dozen)
+EVENT_MAXLEN = 1000
+
+
+class CloseError(ValueError):
+    """A close check failed, or the period cannot be closed."""
+
+
+def check_closable(period: int) -> None:
+    if not is_closed(period_range(period)[1]):
+        raise CloseError(f"Period {period} has not ended yet")
+
+
+# ------------------------------------------------------------------
+# 1. Steps
+# ------------------------------------------------------------------
+StepFn = Callable[[AsyncSession, Redis, int, str], Awaitable[dict]]
+
+
+@dataclass(frozen=True)
+class CloseStep:
+    name: str
+    title: str
+    requires: tuple[str, ...]
+    run: StepFn
+
+
+async def _post_journals(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    """Accruals and other adjustments are entered as drafts during the month."""
+    start, end = period_range(period)
+    entry_ids = list((await db.execute(
+        select(JournalEntry.id)
+        .where(JournalEntry.status == JournalStatus.draft, JournalEntry.entry_date.between(start, end))
+        .order_by(JournalEntry.id)
+    )).scalars())
+    # One commit per entry: an interrupted step keeps what it posted
+    for entry_id in entry_ids:
+        await post_entry(db, entry_id)
+    if entry_ids:
+        await invalidate_for_posting(redis, start)
+    return {"posted": len(entry_ids)}
+
+
+async def _depreciation(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    run = (await db.execute(select(DepreciationRun).where(DepreciationRun.period == period))).scalars().first()
+    ran_before = run is not None  # run by hand from the asset pages
+    if not ran_before:
+        run = await run_depreciation(db, period, user)
+        if run.entry_id:
+            await invalidate_for_posting(redis, period_range(period)[1])
+    return {
+        "run_id": run.id, "entry_id": run.entry_id, "assets": run.asset_count,
+        "total": str(run.total), "ran_before": ran_before,
+    }
+
+
+async def _aging(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    as_of = period_range(period)[1]
+    result = {}
+    for ledger in Subledger:
+        await refresh_snapshot(db, ledger, as_of, full=True)
+        summary = await aging_summary(db, ledger, as_of)
+        result[ledger.value] = {"parties": summary.parties, "total": str(summary.buckets.total)}
+    return result
+
+
+async def _allocation(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    allocation = json.loads(await allocation_json(db, redis, period))
+    return {key: allocation[key] for key in ("driver_version", "total_direct", "total_final", "unassigned")}
+
+
+async def _trial_balance(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    as_of = period_range(period)[1]
+    balance = await trial_balance(db, as_of)
+    if not balance.is_balanced:
+        raise CloseError(
+            f"Trial balance as of {as_of} is out by {balance.total_debit - balance.total_credit}"
+        )
+    return {"accounts": len(balance.rows), "total": str(balance.total_debit)}
+
+
+async def _statements(db: AsyncSession, redis: Redis, period: int, user: str) -> dict:
+    """Render the period's statements into the report cache."""
+    start, end = period_range(period)
+    year_start = start.replace(month=1)
+    await profit_and_loss_json(db, redis, start, end)
+    await profit_and_loss_json(db, redis, year_start, end)
+    await profit_and_loss_by_cost_center_json(db, redis, start, end)
+    await balance_sheet_json(db, redis, end)
+    await cash_flow_json(db, redis, start, end)
+    return {"rendered": ["pnl", "pnl_ytd", "pnl_by_cost_center", "balance_sheet", "cash_flow"]}
+
+
+# Listed so that every step comes after the steps it requires. Ledger
+# writers (journals, depreciation) are chained: parallel postings to the
+# same accounts would only contend on the period balance rows.
+STEPS = (
+    CloseStep("journals", "Post accrual and draft journals", (), _post_journals),
+    CloseStep("aging", "AR/AP aging snapshots", (), _aging),
+    CloseStep("depreciation", "Depreciation run", ("journals",), _depreciation),
+    CloseStep("allocation", "Cost-centre allocation", ("depreciation",), _allocation),
+    CloseStep("trial_balance", "Trial balance check", ("depreciation",), _trial_balance),
+    CloseStep("statements", "Financial statements", ("trial_balance",), _statements),
+)
+
+
+# ------------------------------------------------------------------
+# 2. Progress: events (Redis stream per run) and checkpoints
+# ------------------------------------------------------------------
+def events_key(run_id: int) -> str:
+    return f"close:{run_id}:events"
+
+
+async def publish(redis: Redis, run_id: int, event: str, **data) -> None:
+    """Best-effort: the checkpoints are authoritative, the stream is for display."""
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.xadd(
+                events_key(run_id),
+                {"event": event, "data": json.dumps({"run_id": run_id, **data}, default=str)},
+                maxlen=EVENT_MAXLEN, approximate=True,
+            )
+            pipe.expire(events_key(run_id), settings.CLOSE_EVENT_TTL_SECONDS)
+            await pipe.execute()
+    except RedisError as exc:
+        logger.warning("Close run %s progress event dropped: %s", run_id, exc)
+
+
+async def read_events(
+    redis: Redis, run_id: int, after: str, block_ms: Optional[int] = None
+) -> list[tuple[str, str, str]]:
+    """``(id, event, data)`` after stream id ``after``; waits up to ``block_ms`` for the first if given."""
+    response = await redis.xread({events_key(run_id): after}, block=block_ms, count=100)
+    return [
+        (entry_id, fields["event"], fields["data"])
+        for _, entries in response
+        for entry_id, fields in entries
+    ]
+
+
+async def run_detail(db: AsyncSession, run: CloseRun) -> CloseRunDetail:
+    """The run with its checkpoints, in graph order – for polling clients."""
+    rows = await get_steps(db, run.id)
+    steps = []
+    for step in STEPS:
+        row = rows.get(step.name)
+        steps.append(CloseStepOut(
+            step=step.name,
+            title=step.title,
+            requires=list(step.requires),
+            status=row.status if row else CloseStepStatus.pending,
+            result=json.loads(row.result) if row and row.result else None,
+            error=row.error if row else None,
+            seconds=row.seconds if row else None,
+            started_at=row.started_at if row else None,
+            completed_at=row.completed_at if row else None,
+        ))
+    return CloseRunDetail.model_validate({
+        **CloseRunOut.model_validate(run).model_dump(),
+        "done": sum(step.status == CloseStepStatus.completed for step in steps),
+        "total": len(steps),
+        "steps": steps,
+    })
+
+
+# ------------------------------------------------------------------
+# 3. Run lock
+# ------------------------------------------------------------------
+def lock_key(run_id: int) -> str:
+    return f"close:lock:{run_id}"
+
+
+async def is_running(redis: Redis, run_id: int) -> bool:
+    return bool(await redis.exists(lock_key(run_id)))
+
+
+class LockLost(Exception):
+    """Our run lock expired and was taken; stop without touching the run."""
+
+
+# ------------------------------------------------------------------
+# 4. Runner
+# ------------------------------------------------------------------
+async def _run_step(redis: Redis, step: CloseStep, period: int, user: str) -> dict:
+    async with AsyncSessionLocal() as db:
+        return await step.run(db, redis, period, user)
+
+
+async def _execute(db: AsyncSession, redis: Redis, run: CloseRun, lost: asyncio.Event) -> CloseStatus:
+    steps = await get_steps(db, run.id)
+    # Whatever an earlier attempt left running or failed starts over
+    for row in steps.values():
+        if row.status != CloseStepStatus.completed:
+            row.status, row.error = CloseStepStatus.pending, None
+    run.status, run.error = CloseStatus.running, None
+    run.attempts += 1
+    run.started_at, run.completed_at = datetime.datetime.now(), None
+    await db.commit()
+
+    done = {name for name, row in steps.items() if row.status == CloseStepStatus.completed}
+    total = len(STEPS)
+    await publish(redis, run.id, "run", status=run.status.value, attempt=run.attempts, done=len(done), total=total)
+
+    running: dict[asyncio.Task, tuple[CloseStep, float]] = {}
+    failed: list[str] = []
+    # Wakes the wait below as soon as the lock is lost, not when a step ends
+    lost_waiter = asyncio.create_task(lost.wait())
+    try:
+        while True:
+            if lost.is_set():
+                # Another worker resumed the run after our lock expired
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                raise LockLost()
+            if not failed:
+                ready = [
+                    step for step in STEPS
+                    if steps[step.name].status == CloseStepStatus.pending and done.issuperset(step.requires)
+                ]
+                for step in ready:
+                    row = steps[step.name]
+                    row.status, row.started_at = CloseStepStatus.running, datetime.datetime.now()
+                    task = asyncio.create_task(_run_step(redis, step, run.period, run.created_by))
+                    running[task] = (step, time.perf_counter())
+                if ready:
+                    await db.commit()
+                    for step in ready:
+                        await publish(redis, run.id, "step", step=step.name, status="running", done=len(done), total=total)
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait([*running, lost_waiter], return_when=asyncio.FIRST_COMPLETED)
+            finished.discard(lost_waiter)
+            rows = []
+            for task in finished:
+                step, started = running.pop(task)
+                row = steps[step.name]
+                row.seconds = round(time.perf_counter() - started, 3)
+                row.completed_at = datetime.datetime.now()
+                exc = task.exception()
+                if exc is None:
+                    row.status, row.result = CloseStepStatus.completed, json.dumps(task.result(), default=str)
+                    done.add(step.name)
+                else:
+                    # Domain errors (ValueError subclasses) need no traceback
+                    logger.error("Close run %s step %s failed: %s", run.id, step.name, exc,
+                                 exc_info=None if isinstance(exc, ValueError) else exc)
+                    row.status, row.error = CloseStepStatus.failed, str(exc) or type(exc).__name__
+                    failed.append(step.name)
+                rows.append(row)
+            # The checkpoint: dependants start only after this commit
+            await db.commit()
+            for row in rows:
+                await publish(
+                    redis, run.id, "step", step=row.step, status=row.status.value, seconds=row.seconds,
+                    result=json.loads(row.result) if row.status == CloseStepStatus.completed else None,
+                    error=row.error, done=len(done), total=total,
+                )
+    finally:
+        lost_waiter.cancel()
+        for task in running:
+            task.cancel()
+
+    run.status = CloseStatus.failed if failed else CloseStatus.completed
+    run.error = "; ".join(f"{name}: {steps[name].error}" for name in failed) or None
+    run.completed_at = datetime.datetime.now()
+    await db.commit()
+    await publish(redis, run.id, "run", status=run.status.value, error=run.error, done=len(done), total=total)
+    return run.status
+
+
+async def run_close(redis: Redis, run_id: int) -> Optional[CloseStatus]:
+    """Run (or resume) one close; ``None`` when another worker holds it or it is already done."""
+    key, ttl = lock_key(run_id), settings.CLOSE_LOCK_TTL_SECONDS
+    token = await run_lock.acquire(redis, key, ttl)
+    if token is None:
+        logger.info("Close run %s is locked by another worker", run_id)
+        return None
+    lost = asyncio.Event()
+    renewer = asyncio.create_task(run_lock.hold(redis, key, token, ttl, lost))
+    try:
+        async with AsyncSessionLocal() as db:
+            run = await db.get(CloseRun, run_id)
+            if run is None or run.status == CloseStatus.completed:
+                return None
+            try:
+                return await _execute(db, redis, run, lost)
+            except LockLost:
+                logger.error("Close run %s: lock lost, left to the worker that holds it", run_id)
+                return None
+            except Exception as exc:
+                # Bookkeeping failed (not a step): leave the run resumable
+                logger.exception("Close run %s aborted", run_id)
+                await db.rollback()
+                run.status, run.error = CloseStatus.failed, str(exc)
+                run.completed_at = datetime.datetime.now()
+                await db.commit()
+                await publish(redis, run_id, "run", status=run.status.value, error=run.error)
+                return run.status
+    finally:
+        renewer.cancel()
+        await run_lock.release(redis, key, token, ttl)
+
+
+async def enqueue(redis: Redis, run_id: int) -> None:
+    await redis.lpush(QUEUE_KEY, run_id)
+    await publish(redis, run_id, "run", status=CloseStatus.queued.value)
+
+
+async def worker(redis: Redis, poll_seconds: int = 5) -> None:
+    """Run queued closes one at a time; start more processes for more throughput."""
+    while True:
+        try:
+            item = await redis.brpop(QUEUE_KEY, timeout=poll_seconds)
+            if item is None:
+                continue
+            run_id = int(item[1])
+            logger.info("Close run %s picked up", run_id)
+            status = await run_close(redis, run_id)
+            logger.info("Close run %s finished: %s", run_id, status.value if status else "skipped")
+        except Exception:
+            # The run keeps its checkpoints and is resumed from them
+            logger.exception("Close worker iteration failed")
+            await asyncio.sleep(poll_seconds)
+
+
+async def main() -> None:
+    from app.core.redis import close_redis, get_redis, init_redis
+    from app.db.session import dispose_engines
+
+    await init_redis()
+    try:
+        await worker(await get_redis())
+    finally:
+        await close_redis()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
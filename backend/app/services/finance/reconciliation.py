@@ -0,0 +1,374 @@
+# app/services/finance/reconciliation.py
+"""
+Bank reconciliation: statement lines against posted GL lines of the same
+bank/cash account.
+
+Candidates are bucketed in hash indexes (amount + reference, then amount
+alone) whose entries are sorted by date, so each bank line finds its
+partner with one dict lookup and a bisect into the date window instead of
+a scan over every GL line. Matched candidates are unlinked from their
+bucket, so later lookups never walk over them. Passes run strictest
+first; anything left over is the residue for manual review.
+"""
+import asyncio
+import datetime
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from decimal import Decimal
+from typing import Callable, Hashable, Iterable, NamedTuple, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.finance.bank import get_bank_account, save_matches, unmatched_gl_lines
+from app.models.finance.bank import BankStatementLine
+from app.models.finance.ledger import JournalEntry, JournalLine
+from app.schemas.finance.bank import (
+    BankLineOut, GLLineOut, ReconciliationResult, ReconciliationRules, UnmatchedResidue,
+)
+
+# Lines of each side listed with a residue; counts and totals cover all
+RESIDUE_LIMIT = 100
+
+
+class Candidate(NamedTuple):
+    id: int
+    day: int  # date ordinal
+    cents: int  # signed: + money in, - money out
+    reference: str  # normalized, "" when missing
+
+
+# (rule, bank line ids, journal line ids)
+Match = tuple[str, list[int], list[int]]
+
+
+def normalize_reference(value: Optional[str]) -> str:
+    return re.sub(r"[^0-9A-Z]", "", (value or "").upper())
+
+
+def _candidate(id: int, day: datetime.date, amount, reference: Optional[str]) -> Candidate:
+    return Candidate(id, day.toordinal(), int((Decimal(amount) * 100).to_integral_value()), normalize_reference(reference))
+
+
+# ------------------------------------------------------------------
+# 1. Indexes
+# ------------------------------------------------------------------
+class _DateIndex:
+    """
+    Candidates under one hash key, sorted by date.
+
+    Taken candidates are skipped with next-free links in both directions
+    (union-find with path compression), so a lookup costs a bisect plus
+    near-constant work however many neighbours are already matched.
+    Positions are 1-based; 0 and n + 1 are sentinels that are never taken.
+    """
+
+    __slots__ = ("days", "items", "_right", "_left")
+
+    def __init__(self, items: list[Candidate]):
+        items.sort(key=lambda c: (c.day, c.id))
+        self.items = items
+        self.days = [c.day for c in items]
+        self._right = list(range(len(items) + 2))
+        self._left = list(range(len(items) + 2))
+
+    @staticmethod
+    def _free(links: list[int], pos: int) -> int:
+        root = pos
+        while links[root] != root:
+            root = links[root]
+        while links[pos] != root:
+            links[pos], pos = root, links[pos]
+        return root
+
+    def nearest(self, day: int, window: int) -> Optional[int]:
+        """Position of the closest free candidate within ``window`` days, later date on a tie."""
+        at = bisect_left(self.days, day)
+        hi = self._free(self._right, at + 1)
+        lo = self._free(self._left, at)
+        use_hi = hi <= len(self.days) and self.days[hi - 1] - day <= window
+        use_lo = lo >= 1 and day - self.days[lo - 1] <= window
+        if use_hi and (not use_lo or self.days[hi - 1] - day <= day - self.days[lo - 1]):
+            return hi
+        return lo if use_lo else None
+
+    def take(self, pos: int) -> Candidate:
+        self._right[pos] = pos + 1
+        self._left[pos] = pos - 1
+        return self.items[pos - 1]
+
+
+def _index(items: Iterable[Candidate], key: Callable[[Candidate], Optional[Hashable]]) -> dict:
+    groups: dict = defaultdict(list)
+    for item in items:
+        k = key(item)
+        if k is not None:
+            groups[k].append(item)
+    return {k: _DateIndex(group) for k, group in groups.items()}
+
+
+# ------------------------------------------------------------------
+# 2. Matching passes
+# ------------------------------------------------------------------
+def match_lines(bank: list[Candidate], gl: list[Candidate], rules: ReconciliationRules) -> list[Match]:
+    """
+    Pure in-memory matcher, O((n + m) log m) for the one-to-one passes:
+
+    1. reference   – same amount and normalized reference, nearest date
+    2. amount_date – same amount, nearest date in the window
+    3. tolerance   – amount within ``amount_tolerance``: the distinct
+                     amounts are walked outward from the line's own, each
+                     one a date index like the exact passes
+    4. many_to_one – one line against all free lines of the other side that
+                     share its reference, or fall on one day, when their sum
+                     is within tolerance (deposit slips, batch payments)
+    """
+    window = rules.date_window_days
+    tolerance = int(rules.amount_tolerance * 100)
+    taken_bank: set[int] = set()
+    taken_gl: set[int] = set()
+    matches: list[Match] = []
+    bank = sorted(bank, key=lambda c: (c.day, c.id))
+
+    def one_to_one(rule: str, key: Callable[[Candidate], Optional[Hashable]]) -> None:
+        index = _index((g for g in gl if g.id not in taken_gl), key)
+        for line in bank:
+            if line.id in taken_bank:
+                continue
+            k = key(line)
+            bucket = index.get(k) if k is not None else None
+            pos = bucket.nearest(line.day, window) if bucket else None
+            if pos is not None:
+                partner = bucket.take(pos)
+                taken_bank.add(line.id)
+                taken_gl.add(partner.id)
+                matches.append((rule, [line.id], [partner.id]))
+
+    if rules.use_reference:
+        one_to_one("reference", lambda c: (c.cents, c.reference) if c.reference else None)
+    one_to_one("amount_date", lambda c: c.cents)
+
+    if tolerance:
+        index = _index((g for g in gl if g.id not in taken_gl), lambda c: c.cents)
+        amounts = sorted(index)
+        for line in bank:
+            if line.id in taken_bank:
+                continue
+            best = _closest_amount(index, amounts, line, window, tolerance)
+            if best:
+                bucket, pos = best
+                partner = bucket.take(pos)
+                taken_bank.add(line.id)
+                taken_gl.add(partner.id)
+                matches.append(("tolerance", [line.id], [partner.id]))
+
+    if rules.many_to_one:
+        for single_side_is_bank in (True, False):
+            singles, pool = (bank, gl) if single_side_is_bank else (gl, bank)
+            taken_single, taken_pool = (taken_bank, taken_gl) if single_side_is_bank else (taken_gl, taken_bank)
+            for single, group in _groups(singles, pool, taken_single, taken_pool, window, tolerance, rules.max_group_size):
+                ids = [c.id for c in group]
+                matches.append(("many_to_one", [single.id], ids) if single_side_is_bank else ("many_to_one", ids, [single.id]))
+    return matches
+
+
+def _closeness(item: Candidate, day: int) -> tuple:
+    """The order ``_DateIndex.nearest`` walks in: nearer date, later date, then outward by id."""
+    earlier = item.day < day
+    return abs(item.day - day), earlier, -item.id if earlier else item.id
+
+
+def _closest_amount(
+    index: dict[int, _DateIndex], amounts: list[int], line: Candidate, window: int, tolerance: int
+) -> Optional[tuple[_DateIndex, int]]:
+    """
+    Free candidate of the same sign with the closest amount, then the
+    closest date: amounts are tried in order of distance from the line's,
+    both neighbours of an equal distance before moving further out.
+    """
+    inflow = line.cents > 0
+    hi = bisect_left(amounts, line.cents)
+    lo = hi - 1
+    while True:
+        distances = []
+        if lo >= 0 and line.cents - amounts[lo] <= tolerance:
+            distances.append(line.cents - amounts[lo])
+        if hi < len(amounts) and amounts[hi] - line.cents <= tolerance:
+            distances.append(amounts[hi] - line.cents)
+        if not distances:
+            return None
+        distance = min(distances)
+        found = []
+        for cents in {line.cents - distance, line.cents + distance}:
+            bucket = index.get(cents)
+            if bucket is None or (cents > 0) != inflow:
+                continue
+            pos = bucket.nearest(line.day, window)
+            if pos is not None:
+                found.append((_closeness(bucket.items[pos - 1], line.day), bucket, pos))
+        if lo >= 0 and line.cents - amounts[lo] == distance:
+            lo -= 1
+        if hi < len(amounts) and amounts[hi] - line.cents == distance:
+            hi += 1
+        if found:
+            _, bucket, pos = min(found, key=lambda f: f[0])
+            return bucket, pos
+
+
+class _Group:
+    """Free candidates sharing a key, with their running sum; taking one removes it in O(1)."""
+    __slots__ = ("items", "cents")
+
+    def __init__(self):
+        self.items: dict[int, Candidate] = {}
+        self.cents = 0
+
+    def add(self, item: Candidate) -> None:
+        self.items[item.id] = item
+        self.cents += item.cents
+
+    def discard(self, item: Candidate) -> None:
+        if self.items.pop(item.id, None) is not None:
+            self.cents -= item.cents
+
+
+def _groups(
+    singles: list[Candidate],
+    pool: list[Candidate],
+    taken_single: set[int],
+    taken_pool: set[int],
+    window: int,
+    tolerance: int,
+    max_size: int,
+) -> Iterable[tuple[Candidate, list[Candidate]]]:
+    """
+    Same-day groups are checked from their count and running sum alone, so
+    a busy day costs one lookup per single line instead of a rescan; a
+    group is only listed once it matches.
+    """
+    by_reference: dict[tuple[str, bool], _Group] = defaultdict(_Group)
+    by_day: dict[tuple[int, bool], _Group] = defaultdict(_Group)
+    for item in pool:
+        if item.id in taken_pool:
+            continue
+        if item.reference:
+            by_reference[(item.reference, item.cents > 0)].add(item)
+        by_day[(item.day, item.cents > 0)].add(item)
+    # Nearest day first
+    offsets = sorted(range(-window, window + 1), key=abs)
+
+    def fits(single: Candidate, size: int, cents: int) -> bool:
+        return 2 <= size <= max_size and abs(cents - single.cents) <= tolerance
+
+    for single in singles:
+        if single.id in taken_single:
+            continue
+        inflow = single.cents > 0
+        group = None
+        shared = by_reference.get((single.reference, inflow)) if single.reference else None
+        if shared is not None and len(shared.items) >= 2:
+            option = [c for c in shared.items.values() if abs(c.day - single.day) <= window]
+            if fits(single, len(option), sum(c.cents for c in option)):
+                group = option
+        if group is None:
+            for offset in offsets:
+                day = by_day.get((single.day + offset, inflow))
+                if day is not None and fits(single, len(day.items), day.cents):
+                    group = list(day.items.values())
+                    break
+        if group is None:
+            continue
+        taken_single.add(single.id)
+        for c in group:
+            taken_pool.add(c.id)
+            by_day[(c.day, c.cents > 0)].discard(c)
+            if c.reference:
+                by_reference[(c.reference, c.cents > 0)].discard(c)
+        yield single, group
+
+
+# ------------------------------------------------------------------
+# 3. Database side
+# ------------------------------------------------------------------
+def _bank_scope(account_id: int, rules: ReconciliationRules):
+    L = BankStatementLine
+    stmt = select(L).where(L.account_id == account_id, L.match_id.is_(None))
+    if rules.from_date:
+        stmt = stmt.where(L.booking_date >= rules.from_date)
+    if rules.to_date:
+        stmt = stmt.where(L.booking_date <= rules.to_date)
+    return stmt.order_by(L.booking_date, L.id)
+
+
+def _gl_scope(account_id: int, start: Optional[datetime.date], end: Optional[datetime.date]):
+    stmt = unmatched_gl_lines(account_id)
+    if start:
+        stmt = stmt.where(JournalEntry.entry_date >= start)
+    if end:
+        stmt = stmt.where(JournalEntry.entry_date <= end)
+    return stmt.order_by(JournalEntry.entry_date, JournalLine.id)
+
+
+async def unmatched_residue(
+    db: AsyncSession, account_id: int, rules: Optional[ReconciliationRules] = None, limit: int = RESIDUE_LIMIT
+) -> UnmatchedResidue:
+    """The oldest ``limit`` open lines of each side, with counts and totals of all of them."""
+    rules = rules or ReconciliationRules()
+    L = BankStatementLine
+    bank_scope = _bank_scope(account_id, rules)
+    bank_lines = list((await db.execute(bank_scope.limit(limit))).scalars().all())
+    bank_count, bank_total = (await db.execute(
+        bank_scope.order_by(None).with_only_columns(func.count(L.id), func.coalesce(func.sum(L.amount), 0))
+    )).one()
+    gl_scope = _gl_scope(account_id, rules.from_date, rules.to_date)
+    gl_lines = [GLLineOut(**row._mapping) for row in (await db.execute(gl_scope.limit(limit))).all()]
+    gl = gl_scope.order_by(None).subquery()
+    gl_count, gl_total = (await db.execute(
+        select(func.count(), func.coalesce(func.sum(gl.c.amount), 0))
+    )).one()
+    return UnmatchedResidue(
+        account_id=account_id,
+        bank_lines=bank_lines,
+        gl_lines=gl_lines,
+        bank_count=bank_count,
+        gl_count=gl_count,
+        bank_total=Decimal(bank_total),
+        gl_total=Decimal(gl_total),
+    )
+
+
+async def reconcile(
+    db: AsyncSession, account_id: int, rules: ReconciliationRules, user: str
+) -> Optional[ReconciliationResult]:
+    """Match the account's open bank lines, persist the matches and return the residue."""
+    if not await get_bank_account(db, account_id, for_update=True):
+        return None
+
+    L = BankStatementLine
+    bank_rows = (await db.execute(
+        _bank_scope(account_id, rules).with_only_columns(L.id, L.booking_date, L.amount, L.reference)
+    )).all()
+    bank = [_candidate(*row) for row in bank_rows]
+
+    matches: list[Match] = []
+    if bank:
+        # GL lines can only pair with bank lines inside the date window
+        window = datetime.timedelta(days=rules.date_window_days)
+        start = min(row.booking_date for row in bank_rows) - window
+        end = max(row.booking_date for row in bank_rows) + window
+        gl_rows = (await db.execute(_gl_scope(account_id, start, end))).all()
+        gl = [_candidate(row.id, row.entry_date, row.amount, row.reference) for row in gl_rows]
+        # CPU-bound: keep the event loop serving other requests meanwhile
+        matches = await asyncio.to_thread(match_lines, bank, gl, rules)
+        await save_matches(db, account_id, matches, user)
+        await db.commit()
+
+    residue = await unmatched_residue(db, account_id, rules)
+    return ReconciliationResult(
+        **residue.model_dump(),
+        matches=len(matches),
+        matched_by_rule=dict(Counter(rule for rule, _, _ in matches)),
+        bank_lines_matched=sum(len(bank_ids) for _, bank_ids, _ in matches),
+        gl_lines_matched=sum(len(gl_ids) for _, _, gl_ids in matches),
+    )
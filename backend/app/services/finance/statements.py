@@ -0,0 +1,288 @@
+# app/services/finance/statements.py
+import calendar
+import datetime
+from collections import defaultdict
+from decimal import Decimal
+from typing import Awaitable, Callable, Iterable, List, Optional
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.report_cache import report_cache
+from app.crud.finance.ledger import CENT, ZERO, account_balances, period_of
+from app.models.finance.ledger import (
+    Account, AccountDailyBalance, AccountPeriodBalance, AccountType, JournalEntry, JournalLine, JournalStatus,
+)
+from app.schemas.finance.statements import (
+    BalanceSheet, CashFlow, CashFlowLine, ProfitAndLoss, StatementLine,
+)
+
+ASSET_TYPES = (AccountType.asset, AccountType.bank, AccountType.cash)
+CASH_TYPES = (AccountType.bank, AccountType.cash)
+PNL_TYPES = (AccountType.income, AccountType.expense)
+ACCOUNTS_TAG = "gl:accounts"
+
+
+# ------------------------------------------------------------------
+# 1. Periods, cacheability and tags
+# ------------------------------------------------------------------
+def is_month_end(day: datetime.date) -> bool:
+    return calendar.monthrange(day.year, day.month)[1] == day.day
+
+
+def periods_between(start: datetime.date, end: datetime.date) -> list[int]:
+    periods, year, month = [], start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        periods.append(year * 100 + month)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return periods
+
+
+def is_closed(day: datetime.date) -> bool:
+    """Only months before the current one are cached – the open month changes all day."""
+    return day < datetime.date.today().replace(day=1)
+
+
+# A range statement depends on every month in it; a cumulative one
+# (balance sheet) on every month up to its date, so it is tagged with its
+# own month and a posting invalidates that tag for all later months.
+def _range_tags(from_date: datetime.date, to_date: datetime.date) -> list[str]:
+    return [f"gl:period:{period}" for period in periods_between(from_date, to_date)]
+
+
+def _upto_tag(as_of: datetime.date) -> str:
+    return f"gl:upto:{period_of(as_of)}"
+
+
+async def invalidate_for_posting(redis: Redis, entry_date: datetime.date) -> int:
+    """Drop cached statements changed by a posting/void dated ``entry_date``."""
+    if not is_closed(entry_date):
+        return 0
+    last_closed = datetime.date.today().replace(day=1) - datetime.timedelta(days=1)
+    tags = [f"gl:period:{period_of(entry_date)}"]
+    tags += [f"gl:upto:{period}" for period in periods_between(entry_date, last_closed)]
+    return await report_cache.invalidate(redis, tags)
+
+
+async def invalidate_for_accounts(redis: Redis) -> int:
+    """Drop cached balance sheets after the chart of accounts (or an opening balance) changed."""
+    return await report_cache.invalidate(redis, [ACCOUNTS_TAG])
+
+
+async def _cached(
+    db: AsyncSession,
+    redis: Redis,
+    key: str,
+    tags: Iterable[str],
+    cacheable: bool,
+    render: Callable[[AsyncSession], Awaitable[str]],
+) -> str:
+    if not cacheable:
+        return await render(db)
+    return await report_cache.get_or_set(redis, key, tags, render)
+
+
+# ------------------------------------------------------------------
+# 2. Grouped aggregate
+# ------------------------------------------------------------------
+def _movements(
+    from_date: datetime.date,
+    to_date: datetime.date,
+    types: Iterable[AccountType],
+    *,
+    by_cost_center: bool = False,
+    cost_center: Optional[str] = None,
+):
+    """
+    Debit/credit totals per account (and cost centre) over the range, as a
+    single GROUP BY. Whole months read the period-balance table, other
+    ranges the daily balances; only cost-centre splits read the posted
+    journal lines.
+    """
+    group = [Account.id, Account.code, Account.name, Account.type]
+    if not by_cost_center and cost_center is None:
+        if from_date.day == 1 and is_month_end(to_date):
+            B = AccountPeriodBalance
+            return (
+                select(*group, func.sum(B.debit), func.sum(B.credit))
+                .join(B, B.account_id == Account.id)
+                .where(
+                    Account.type.in_(list(types)),
+                    B.period.between(period_of(from_date), period_of(to_date)),
+                )
+                .group_by(*group)
+                .order_by(Account.code)
+            )
+        D = AccountDailyBalance
+        return (
+            select(*group, func.sum(D.debit), func.sum(D.credit))
+            .join(D, D.account_id == Account.id)
+            .where(Account.type.in_(list(types)), D.day.between(from_date, to_date))
+            .group_by(*group)
+            .order_by(Account.code)
+        )
+
+    if by_cost_center:
+        group.append(JournalLine.cost_center)
+    stmt = (
+        select(*group, func.sum(JournalLine.debit), func.sum(JournalLine.credit))
+        .join(JournalLine, JournalLine.account_id == Account.id)
+        .join(JournalEntry, JournalEntry.id == JournalLine.entry_id)
+        .where(
+            Account.type.in_(list(types)),
+            JournalEntry.status == JournalStatus.posted,
+            JournalEntry.entry_date.between(from_date, to_date),
+        )
+        .group_by(*group)
+        .order_by(Account.code)
+    )
+    if cost_center is not None:
+        stmt = stmt.where(JournalLine.cost_center == cost_center)
+    return stmt
+
+
+def _line(row, amount: Decimal) -> StatementLine:
+    return StatementLine(account_id=row[0], code=row[1], name=row[2], type=row[3], amount=amount)
+
+
+# ------------------------------------------------------------------
+# 3. Statements
+# ------------------------------------------------------------------
+def _build_profit_and_loss(from_date, to_date, cost_center, rows) -> ProfitAndLoss:
+    revenue, expenses = [], []
+    for row in rows:
+        debit, credit = Decimal(row[-2] or 0), Decimal(row[-1] or 0)
+        if row[3] == AccountType.income:
+            revenue.append(_line(row, (credit - debit).quantize(CENT)))
+        else:
+            expenses.append(_line(row, (debit - credit).quantize(CENT)))
+    total_revenue = sum((line.amount for line in revenue), ZERO)
+    total_expenses = sum((line.amount for line in expenses), ZERO)
+    net_profit = total_revenue - total_expenses
+    return ProfitAndLoss(
+        from_date=from_date,
+        to_date=to_date,
+        cost_center=cost_center,
+        revenue=revenue,
+        expenses=expenses,
+        total_revenue=total_revenue,
+        total_expenses=total_expenses,
+        net_profit=net_profit,
+        margin=(net_profit / total_revenue * 100).quantize(CENT) if total_revenue else ZERO,
+    )
+
+
+async def profit_and_loss(
+    db: AsyncSession, from_date: datetime.date, to_date: datetime.date, cost_center: Optional[str] = None
+) -> ProfitAndLoss:
+    result = await db.execute(_movements(from_date, to_date, PNL_TYPES, cost_center=cost_center))
+    return _build_profit_and_loss(from_date, to_date, cost_center, result.all())
+
+
+async def profit_and_loss_by_cost_center(
+    db: AsyncSession, from_date: datetime.date, to_date: datetime.date
+) -> list[ProfitAndLoss]:
+    """One P&L per cost centre (None = lines without one) from one query."""
+    result = await db.execute(_movements(from_date, to_date, PNL_TYPES, by_cost_center=True))
+    by_center: dict[Optional[str], list] = defaultdict(list)
+    for row in result.all():
+        by_center[row[4]].append(row[:4] + row[5:])
+    return [
+        _build_profit_and_loss(from_date, to_date, center, rows)
+        for center, rows in sorted(by_center.items(), key=lambda item: (item[0] is None, item[0] or ""))
+    ]
+
+
+async def balance_sheet(db: AsyncSession, as_of: datetime.date) -> BalanceSheet:
+    assets, liabilities, equity = [], [], []
+    retained = ZERO
+    for account, balance in await account_balances(db, as_of):
+        row = (account.id, account.code, account.name, account.type)
+        if account.type in ASSET_TYPES:
+            assets.append(_line(row, balance))
+        elif account.type == AccountType.liability:
+            liabilities.append(_line(row, -balance))
+        elif account.type == AccountType.equity:
+            equity.append(_line(row, -balance))
+        else:
+            retained -= balance
+    total_assets = sum((line.amount for line in assets), ZERO)
+    total_liabilities = sum((line.amount for line in liabilities), ZERO)
+    total_equity = sum((line.amount for line in equity), ZERO) + retained
+    return BalanceSheet(
+        as_of=as_of,
+        assets=assets,
+        liabilities=liabilities,
+        equity=equity,
+        retained_earnings=retained,
+        total_assets=total_assets,
+        total_liabilities=total_liabilities,
+        total_equity=total_equity,
+        is_balanced=total_assets == total_liabilities + total_equity,
+    )
+
+
+async def cash_flow(db: AsyncSession, from_date: datetime.date, to_date: datetime.date) -> CashFlow:
+    result = await db.execute(_movements(from_date, to_date, CASH_TYPES))
+    accounts = []
+    for account_id, code, name, _, debit, credit in result.all():
+        inflow, outflow = Decimal(debit or 0).quantize(CENT), Decimal(credit or 0).quantize(CENT)
+        accounts.append(CashFlowLine(
+            account_id=account_id, code=code, name=name, inflow=inflow, outflow=outflow, net=inflow - outflow,
+        ))
+    total_inflow = sum((line.inflow for line in accounts), ZERO)
+    total_outflow = sum((line.outflow for line in accounts), ZERO)
+    return CashFlow(
+        from_date=from_date,
+        to_date=to_date,
+        accounts=accounts,
+        total_inflow=total_inflow,
+        total_outflow=total_outflow,
+        net_cash_flow=total_inflow - total_outflow,
+    )
+
+
+# ------------------------------------------------------------------
+# 4. Cached JSON (closed periods only)
+# ------------------------------------------------------------------
+_profit_and_loss_list = TypeAdapter(List[ProfitAndLoss])
+
+
+async def profit_and_loss_json(
+    db: AsyncSession, redis: Redis, from_date: datetime.date, to_date: datetime.date, cost_center: Optional[str] = None
+) -> str:
+    async def render(db: AsyncSession):
+        return (await profit_and_loss(db, from_date, to_date, cost_center)).model_dump_json()
+
+    key = f"pnl:{from_date}:{to_date}:{cost_center or ''}"
+    return await _cached(db, redis, key, _range_tags(from_date, to_date), is_closed(to_date), render)
+
+
+async def profit_and_loss_by_cost_center_json(
+    db: AsyncSession, redis: Redis, from_date: datetime.date, to_date: datetime.date
+) -> str:
+    async def render(db: AsyncSession):
+        reports = await profit_and_loss_by_cost_center(db, from_date, to_date)
+        return _profit_and_loss_list.dump_json(reports).decode()
+
+    key = f"pnl-cc:{from_date}:{to_date}"
+    return await _cached(db, redis, key, _range_tags(from_date, to_date), is_closed(to_date), render)
+
+
+async def balance_sheet_json(db: AsyncSession, redis: Redis, as_of: datetime.date) -> str:
+    async def render(db: AsyncSession):
+        return (await balance_sheet(db, as_of)).model_dump_json()
+
+    # Opening balances count too, so a new account drops every balance sheet
+    tags = [_upto_tag(as_of), ACCOUNTS_TAG]
+    return await _cached(db, redis, f"bs:{as_of}", tags, is_closed(as_of), render)
+
+
+async def cash_flow_json(db: AsyncSession, redis: Redis, from_date: datetime.date, to_date: datetime.date) -> str:
+    async def render(db: AsyncSession):
+        return (await cash_flow(db, from_date, to_date)).model_dump_json()
+
+    key = f"cf:{from_date}:{to_date}"
+    return await _cached(db, redis, key, _range_tags(from_date, to_date), is_closed(to_date), render)
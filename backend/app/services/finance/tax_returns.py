@@ -0,0 +1,361 @@
+# app/services/finance/tax_returns.py
+"""
+GST/VAT return files.
+
+The invoice tax lines of the period are read once through a server-side
+cursor. Consecutive lines of one invoice are folded into its document
+rows and written straight to the file; the summary only keeps a running
+total per (supply, tax code, rate, place of supply). Memory therefore
+grows with the number of distinct tax keys, never with the number of
+lines, and a quarter of 10M lines is written in constant memory.
+
+Returns are written by the tax return worker (python -m
+app.services.finance.tax_returns) from a Redis queue, under a run lock
+like the period close; a return whose worker died is failed by the
+sweep and can be retried.
+"""
+import asyncio
+import csv
+import datetime
+import json
+import logging
+import os
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Optional, TextIO
+
+from redis.asyncio import Redis
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import run_lock
+from app.core.config import settings
+from app.crud.finance.tax import return_repo
+from app.db.session import AsyncSessionLocal
+from app.models.finance.open_items import OpenItem, Subledger
+from app.models.finance.tax import InvoiceTaxLine, ReturnFormat, TaxReturn, TaxReturnStatus
+
+logger = logging.getLogger(__name__)
+
+SUPPLY = {Subledger.ar: "outward", Subledger.ap: "inward"}
+
+CSV_COLUMNS = (
+    "section", "supply", "document_number", "party_code", "issue_date",
+    "tax_code", "rate", "place_of_supply", "lines", "taxable_amount", "tax_amount",
+)
+
+MEDIA_TYPES = {ReturnFormat.json: "application/json", ReturnFormat.csv: "text/csv"}
+
+
+def _rate(value: Decimal) -> str:
+    return format(value.normalize(), "f")
+
+
+# ------------------------------------------------------------------
+# 1. Writers (append-only, one row at a time)
+# ------------------------------------------------------------------
+class _JsonWriter:
+    """``{"return": …, "documents": [ … ], "summary": [ … ], "totals": {…}}``"""
+
+    def __init__(self, out: TextIO, header: dict):
+        self.out = out
+        self.first = True
+        out.write('{"return": ' + json.dumps(header) + ', "documents": [')
+
+    def document(self, row: dict) -> None:
+        self.out.write(("\n" if self.first else ",\n") + json.dumps(row))
+        self.first = False
+
+    def finish(self, summary: list[dict], totals: list[dict]) -> None:
+        self.out.write(
+            '\n], "summary": ' + json.dumps(summary, indent=1)
+            + ', "totals": ' + json.dumps(totals, indent=1) + "}\n"
+        )
+
+
+class _CsvWriter:
+    """One table; the ``section`` column tells document, summary and total rows apart."""
+
+    def __init__(self, out: TextIO, header: dict):
+        self.writer = csv.DictWriter(out, fieldnames=CSV_COLUMNS)
+        self.writer.writeheader()
+
+    def document(self, row: dict) -> None:
+        self.writer.writerow({"section": "document", **row})
+
+    def finish(self, summary: list[dict], totals: list[dict]) -> None:
+        self.writer.writerows({"section": "summary", **row} for row in summary)
+        self.writer.writerows({"section": "total", **row} for row in totals)
+
+
+WRITERS = {ReturnFormat.json: _JsonWriter, ReturnFormat.csv: _CsvWriter}
+
+
+# ------------------------------------------------------------------
+# 2. Single pass over the lines
+# ------------------------------------------------------------------
+def _line_query(from_date: datetime.date, to_date: datetime.date):
+    return (
+        select(
+            OpenItem.id, OpenItem.ledger, OpenItem.document_number, OpenItem.party_code, OpenItem.issue_date,
+            InvoiceTaxLine.tax_code, InvoiceTaxLine.rate, InvoiceTaxLine.place_of_supply,
+            InvoiceTaxLine.taxable_amount, InvoiceTaxLine.tax_amount,
+        )
+        .join(InvoiceTaxLine, InvoiceTaxLine.open_item_id == OpenItem.id)
+        .where(OpenItem.issue_date.between(from_date, to_date))
+        .order_by(OpenItem.id, InvoiceTaxLine.id)
+        .execution_options(yield_per=settings.TAX_RETURN_BATCH_SIZE)
+    )
+
+
+async def write_return(
+    db: AsyncSession, from_date: datetime.date, to_date: datetime.date, fmt: ReturnFormat, out: TextIO
+) -> dict:
+    """Stream the period's lines into ``out``; returns the counters for the TaxReturn row."""
+    writer = WRITERS[fmt](out, {
+        "from_date": from_date.isoformat(),
+        "to_date": to_date.isoformat(),
+        "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+    })
+    # (supply, tax_code, rate, place_of_supply) → [lines, taxable, tax]
+    summary: dict[tuple, list] = {}
+    # Lines of the invoice being read, by (tax_code, rate, place_of_supply)
+    document: dict[tuple, list] = {}
+    current: Optional[tuple] = None
+    lines = documents = 0
+
+    def flush() -> None:
+        _, ledger, number, party, issued = current
+        for (tax_code, rate, place), (count, taxable, tax) in document.items():
+            writer.document({
+                "supply": SUPPLY[ledger],
+                "document_number": number,
+                "party_code": party,
+                "issue_date": issued.isoformat(),
+                "tax_code": tax_code,
+                "rate": _rate(rate),
+                "place_of_supply": place,
+                "lines": count,
+                "taxable_amount": str(taxable),
+                "tax_amount": str(tax),
+            })
+            totals = summary.setdefault((SUPPLY[ledger], tax_code, rate, place), [0, Decimal("0"), Decimal("0")])
+            totals[0] += count
+            totals[1] += taxable
+            totals[2] += tax
+        document.clear()
+
+    result = await db.stream(_line_query(from_date, to_date))
+    async for batch in result.partitions():
+        for item_id, ledger, number, party, issued, tax_code, rate, place, taxable, tax in batch:
+            if current is None or current[0] != item_id:
+                if current is not None:
+                    flush()
+                current = (item_id, ledger, number, party, issued)
+                documents += 1
+            totals = document.setdefault((tax_code, rate, place), [0, Decimal("0"), Decimal("0")])
+            totals[0] += 1
+            totals[1] += taxable
+            totals[2] += tax
+        lines += len(batch)
+    if current is not None:
+        flush()
+
+    by_supply = {supply: [Decimal("0"), Decimal("0")] for supply in SUPPLY.values()}
+    summary_rows = []
+    for (supply, tax_code, rate, place), (count, taxable, tax) in sorted(summary.items()):
+        summary_rows.append({
+            "supply": supply, "tax_code": tax_code, "rate": _rate(rate), "place_of_supply": place,
+            "lines": count, "taxable_amount": str(taxable), "tax_amount": str(tax),
+        })
+        by_supply[supply][0] += taxable
+        by_supply[supply][1] += tax
+    writer.finish(summary_rows, [
+        {"supply": supply, "taxable_amount": str(taxable), "tax_amount": str(tax)}
+        for supply, (taxable, tax) in by_supply.items()
+    ])
+    return {
+        "lines": lines,
+        "documents": documents,
+        "output_taxable": by_supply["outward"][0],
+        "output_tax": by_supply["outward"][1],
+        "input_taxable": by_supply["inward"][0],
+        "input_tax": by_supply["inward"][1],
+    }
+
+
+# ------------------------------------------------------------------
+# 3. Return file
+# ------------------------------------------------------------------
+def return_path(tax_return: TaxReturn) -> Path:
+    name = f"tax-return-{tax_return.id}-{tax_return.from_date:%Y%m%d}-{tax_return.to_date:%Y%m%d}"
+    return Path(settings.TAX_RETURN_DIR) / f"{name}.{tax_return.format.value}"
+
+
+QUEUE_KEY = "tax_returns:queue"
+
+
+def lock_key(return_id: int) -> str:
+    return f"tax_returns:lock:{return_id}"
+
+
+async def enqueue(redis: Redis, return_id: int) -> None:
+    await redis.lpush(QUEUE_KEY, return_id)
+
+
+async def generate_return(db: AsyncSession, tax_return: TaxReturn) -> TaxReturnStatus:
+    """
+    Write the file, then mark the return completed or failed. The file
+    appears under its final name only once complete.
+
+    Lines are read from the primary: invoices posted just before the
+    return was requested may not have reached a replica yet.
+    """
+    return_id = tax_return.id
+    await return_repo.update(db, tax_return, {"status": TaxReturnStatus.running})
+    await db.commit()
+    path = return_path(tax_return)
+    partial = path.with_name(path.name + ".part")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Large buffer: the writers emit one short row at a time
+            with open(partial, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+                counters = await write_return(db, tax_return.from_date, tax_return.to_date, tax_return.format, out)
+        except BaseException:
+            # Cancelled (lock lost) included
+            partial.unlink(missing_ok=True)
+            raise
+        os.replace(partial, path)
+    except Exception as exc:
+        logger.exception("Tax return %s failed", return_id)
+        await db.rollback()
+        tax_return = await return_repo.get(db, return_id)
+        await return_repo.update(db, tax_return, {
+            "status": TaxReturnStatus.failed,
+            "error": str(exc),
+            "completed_at": datetime.datetime.now(),
+        })
+    else:
+        await return_repo.update(db, tax_return, {
+            **counters,
+            "status": TaxReturnStatus.completed,
+            "file_path": str(path),
+            "completed_at": datetime.datetime.now(),
+        })
+    await db.commit()
+    return tax_return.status
+
+
+# ------------------------------------------------------------------
+# 4. Worker
+# ------------------------------------------------------------------
+async def run_return(redis: Redis, return_id: int) -> Optional[TaxReturnStatus]:
+    """Write one queued return; ``None`` when another worker holds it or it is not queued."""
+    key, ttl = lock_key(return_id), settings.TAX_RETURN_LOCK_TTL_SECONDS
+    token = await run_lock.acquire(redis, key, ttl)
+    if token is None:
+        logger.info("Tax return %s is locked by another worker", return_id)
+        return None
+    lost = asyncio.Event()
+    renewer = asyncio.create_task(run_lock.hold(redis, key, token, ttl, lost))
+    try:
+        async with AsyncSessionLocal() as db:
+            tax_return = await return_repo.get(db, return_id)
+            if tax_return is None or tax_return.status != TaxReturnStatus.queued:
+                return None
+            work = asyncio.create_task(generate_return(db, tax_return))
+            lost_waiter = asyncio.create_task(lost.wait())
+            try:
+                await asyncio.wait([work, lost_waiter], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                lost_waiter.cancel()
+            if not work.done():
+                # The sweep may fail the return now
+                work.cancel()
+                await asyncio.gather(work, return_exceptions=True)
+                logger.error("Tax return %s: lock lost, stopped", return_id)
+                return None
+            return work.result()
+    finally:
+        renewer.cancel()
+        await run_lock.release(redis, key, token, ttl)
+
+
+async def sweep(redis: Redis) -> int:
+    """
+    Fail returns left ``running`` by a worker that stopped (its lock
+    expired) so they can be retried, and queue again returns ``queued``
+    for longer than the sweep interval that are neither on the queue nor
+    locked (the enqueue failed, or a worker stopped between taking and
+    starting them); returns how many.
+    """
+    stale = datetime.datetime.now() - datetime.timedelta(seconds=settings.TAX_RETURN_SWEEP_SECONDS)
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(TaxReturn.id, TaxReturn.status).where(or_(
+                TaxReturn.status == TaxReturnStatus.running,
+                (TaxReturn.status == TaxReturnStatus.queued) & (TaxReturn.created_at < stale),
+            ))
+        )).all()
+        unlocked = [(return_id, status) for return_id, status in rows if not await redis.exists(lock_key(return_id))]
+        abandoned = [return_id for return_id, status in unlocked if status == TaxReturnStatus.running]
+        if abandoned:
+            # Still running: a return that finished meanwhile is left alone
+            await db.execute(
+                update(TaxReturn)
+                .where(TaxReturn.id.in_(abandoned), TaxReturn.status == TaxReturnStatus.running)
+                .values(status=TaxReturnStatus.failed, error="Interrupted: the tax return worker stopped",
+                        completed_at=datetime.datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            logger.warning("Tax return sweep failed %s abandoned returns: %s", len(abandoned), abandoned)
+    # One entry per waiting return: the list stays short
+    on_queue = set(await redis.lrange(QUEUE_KEY, 0, -1))
+    lost = [return_id for return_id, status in unlocked
+            if status == TaxReturnStatus.queued and str(return_id) not in on_queue]
+    for return_id in lost:
+        await enqueue(redis, return_id)
+    if lost:
+        logger.warning("Tax return sweep queued %s returns again: %s", len(lost), lost)
+    return len(abandoned) + len(lost)
+
+
+async def worker(redis: Redis, poll_seconds: int = 5) -> None:
+    """Write queued returns one at a time; start more processes for more throughput."""
+    next_sweep = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_sweep:
+                await sweep(redis)
+                next_sweep = time.monotonic() + settings.TAX_RETURN_SWEEP_SECONDS
+            item = await redis.brpop(QUEUE_KEY, timeout=poll_seconds)
+            if item is None:
+                continue
+            return_id = int(item[1])
+            logger.info("Tax return %s picked up", return_id)
+            status = await run_return(redis, return_id)
+            logger.info("Tax return %s finished: %s", return_id, status.value if status else "skipped")
+        except Exception:
+            # A return taken here stays queued or running; the sweep brings it back
+            logger.exception("Tax return worker iteration failed")
+            await asyncio.sleep(poll_seconds)
+
+
+async def main() -> None:
+    from app.core.redis import close_redis, get_redis, init_redis
+    from app.db.session import dispose_engines
+
+    await init_redis()
+    try:
+        await worker(await get_redis())
+    finally:
+        await close_redis()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
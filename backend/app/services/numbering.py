@@ -0,0 +1,93 @@
+# app/services/numbering.py
+import asyncio
+import datetime
+from typing import Optional
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.numbering import DocumentSequence
+
+# {branch} renders as "-<branch>" or "" for company-wide numbering
+DOCUMENT_FORMATS = {
+    "PR": "PR{branch}-{year}-{seq:04d}",     # purchase requisition
+    "PO": "PO{branch}-{year}-{seq:04d}",     # purchase order
+    "GRN": "GRN{branch}-{year}-{seq:04d}",   # goods receipt note
+    "SO": "SO{branch}-{year}-{seq:05d}",     # sales order
+    "INV": "INV{branch}-{year}-{seq:05d}",   # sales invoice
+    "JE": "JE{branch}-{year}-{seq:06d}",     # journal entry
+}
+
+
+class DocumentNumberAllocator:
+    """
+    Hands out document numbers from blocks reserved in ``document_sequences``.
+
+    Each worker reserves ``block_size`` numbers with one upsert and serves
+    them from memory, so allocation is O(1) and never collides across
+    workers. Numbers left in a block when a worker stops are skipped: the
+    sequence is unique and increasing per worker, not gap-free.
+    """
+
+    def __init__(self, block_size: int, session_factory=AsyncSessionLocal):
+        self.block_size = block_size
+        self._session_factory = session_factory
+        # key → [next value, end of block (exclusive)]
+        self._blocks: dict[tuple[str, str, int], list[int]] = {}
+        self._locks: dict[tuple[str, str, int], asyncio.Lock] = {}
+
+    async def _reserve(self, key: tuple[str, str, int], size: int) -> tuple[int, int]:
+        doc_type, branch, year = key
+        # Own session: the reservation commits even if the caller rolls back
+        async with self._session_factory() as db:
+            insert = sqlite.insert if db.bind.dialect.name == "sqlite" else postgresql.insert
+            stmt = (
+                insert(DocumentSequence)
+                .values(doc_type=doc_type, branch=branch, year=year, next_value=1 + size)
+                .on_conflict_do_update(
+                    index_elements=["doc_type", "branch", "year"],
+                    set_={"next_value": DocumentSequence.next_value + size},
+                )
+                .returning(DocumentSequence.next_value)
+            )
+            end = (await db.execute(stmt)).scalar_one()
+            await db.commit()
+        return end - size, end
+
+    async def allocate(
+        self, doc_type: str, count: int = 1, *, branch: str = "", year: Optional[int] = None
+    ) -> list[int]:
+        """Raw sequence values (use ``next_number(s)`` for formatted numbers)."""
+        if doc_type not in DOCUMENT_FORMATS:
+            raise ValueError(f"Unknown document type: {doc_type}")
+        key = (doc_type, branch, year or datetime.date.today().year)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        values: list[int] = []
+        async with lock:
+            block = self._blocks.get(key)
+            while len(values) < count:
+                if block is None or block[0] >= block[1]:
+                    start, end = await self._reserve(key, max(self.block_size, count - len(values)))
+                    block = self._blocks[key] = [start, end]
+                take = min(count - len(values), block[1] - block[0])
+                values.extend(range(block[0], block[0] + take))
+                block[0] += take
+        return values
+
+    async def next_numbers(
+        self, doc_type: str, count: int, *, branch: str = "", year: Optional[int] = None
+    ) -> list[str]:
+        year = year or datetime.date.today().year
+        template = DOCUMENT_FORMATS[doc_type]
+        branch_part = f"-{branch}" if branch else ""
+        return [
+            template.format(branch=branch_part, year=year, seq=seq)
+            for seq in await self.allocate(doc_type, count, branch=branch, year=year)
+        ]
+
+    async def next_number(self, doc_type: str, *, branch: str = "", year: Optional[int] = None) -> str:
+        return (await self.next_numbers(doc_type, 1, branch=branch, year=year))[0]
+
+
+document_numbers = DocumentNumberAllocator(block_size=settings.DOCUMENT_NUMBER_BLOCK_SIZE)
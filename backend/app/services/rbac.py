@@ -1,10 +1,140 @@
+from typing import Iterable, Optional
 from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from jose import JWTError, jwt
 from app.config.module_access import MODULE_ACCESS
 from app.constants.roles import ROLES
+from app.core.config import settings
+
+# ------------------------------------------------------------------
+# 1. Role sets as bitmasks
+# ------------------------------------------------------------------
+ROLE_BITS = {role: 1 << index for index, role in enumerate(ROLES)}
+
+
+def role_mask(roles: Iterable[int]) -> int:
+    mask = 0
+    for role in roles:
+        mask |= ROLE_BITS[ROLES(role)]
+    return mask
+
+
+# ------------------------------------------------------------------
+# 2. Route-prefix trie (one node per path segment)
+# ------------------------------------------------------------------
+class _Node:
+    __slots__ = ("children", "mask")
+
+    def __init__(self):
+        self.children: dict[str, "_Node"] = {}
+        self.mask: Optional[int] = None
+
+
+class AccessTrie:
+    """
+    MODULE_ACCESS compiled into a segment trie. A path is governed by its
+    longest registered prefix, so "/finance/ledger/123" uses the
+    "/finance/ledger" entry, while "/inventory/st" does not cover
+    "/inventory/stock". The "/" entry (dashboard) only matches "/" itself.
+    """
+
+    def __init__(self, access: dict):
+        self.root = _Node()
+        self.depth = 0
+        for path, roles in access.items():
+            node = self.root
+            segments = _segments(path)
+            for segment in segments:
+                node = node.children.setdefault(segment, _Node())
+            node.mask = role_mask(roles)
+            self.depth = max(self.depth, len(segments))
+
+    def lookup(self, path: str) -> Optional[int]:
+        """Role mask of the longest matching prefix, or None if no module owns the path."""
+        # Only the first `depth` segments can match – don't split the rest
+        node, mask, matched = self.root, None, False
+        for segment in path.split("/", self.depth + 1)[: self.depth + 1]:
+            if not segment:
+                continue
+            matched = True
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if node.mask is not None:
+                mask = node.mask
+        return mask if matched else self.root.mask
+
+    def allows(self, user_role: int, path: str) -> bool:
+        if user_role == ROLES.SUPER_ADMIN:
+            return True
+        mask = self.lookup(path)
+        return mask is not None and bool(mask & ROLE_BITS.get(user_role, 0))
+
+
+def _segments(path: str) -> list[str]:
+    return [segment for segment in path.split("/") if segment]
+
+
+access_trie = AccessTrie(MODULE_ACCESS)
+
 
 def enforce_access(user_role: int, path: str):
-    if user_role == ROLES.SUPER_ADMIN:
-        return
-    allowed = MODULE_ACCESS.get(path, [])
-    if user_role not in allowed:
-        raise HTTPException(status_code=403, detail="Access denied")
\ No newline at end of file
+    if not access_trie.allows(user_role, path):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+
+# ------------------------------------------------------------------
+# 3. Middleware: authorize module routes from the JWT role claim
+# ------------------------------------------------------------------
+class RBACMiddleware:
+    """
+    ASGI middleware for routes under ``prefix`` whose remainder belongs to a
+    module in MODULE_ACCESS (e.g. /api/v1/finance/ledger/...). Decides from
+    the signed token's ``role`` claim alone – no DB or Redis access. A token
+    whose claim no longer matches the user's role (demotion) is rejected by
+    ``get_current_user``, which loads the principal anyway. Routes outside
+    every module (auth, users, metrics) pass through to their own deps.
+    """
+
+    def __init__(self, app, prefix: str = settings.API_V1_STR, trie: AccessTrie = access_trie):
+        self.app = app
+        self.prefix = prefix
+        self.trie = trie
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            return await self.app(scope, receive, send)
+        path: str = scope["path"]
+        if not path.startswith(self.prefix):
+            return await self.app(scope, receive, send)
+        mask = self.trie.lookup(path[len(self.prefix):])
+        if mask is None:
+            return await self.app(scope, receive, send)
+
+        role = _role_claim(scope)
+        if role is None:
+            response = JSONResponse(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                content={"detail": "Could not validate credentials"},
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        elif role != ROLES.SUPER_ADMIN and not mask & ROLE_BITS.get(role, 0):
+            response = JSONResponse(status_code=status.HTTP_403_FORBIDDEN, content={"detail": "Access denied"})
+        else:
+            return await self.app(scope, receive, send)
+        await response(scope, receive, send)
+
+
+def _role_claim(scope) -> Optional[int]:
+    """The token's role; ``None`` for a missing or invalid token or an unknown role."""
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+                return ROLES(int(payload["role"]))
+            except (JWTError, KeyError, TypeError, ValueError):
+                return None
+    return None
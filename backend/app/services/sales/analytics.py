@@ -0,0 +1,356 @@
+# app/services/sales/analytics.py
+"""
+Sales dashboard over the rollups (``app.models.sales.analytics``).
+
+A date range is read from the coarsest rows that fit – whole years,
+then whole months, then the days at either end – each span as its own
+index range, so three years of orders come down to a few dozen rows per
+rollup key. The filters pick the rollup level: the order rollups unless
+a product is given, the customer-level rows only for customer counts
+and rankings. Rendered dashboards are cached in
+Redis, tagged by month; order postings drop the months they touch.
+"""
+import datetime
+import heapq
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from redis.asyncio import Redis
+from sqlalchemy import case, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.report_cache import TaggedCache
+from app.crud.finance.ledger import CENT, ZERO
+from app.models.sales.analytics import ALL, ALL_HOURS, RollupGrain, SalesOrderRollup, SalesRollup
+from app.models.sales.master import Customer, Product
+from app.models.sales.orders import SalesOrderStatus
+from app.schemas.sales.analytics import (
+    CustomerSales, HourlySales, MonthlySales, ProductSales, SalesDashboard, SalesMetrics, StatusSales,
+)
+
+ONE_DAY = datetime.timedelta(days=1)
+TREND_DAYS = 30
+MONTHLY_POINTS = 12
+
+analytics_cache = TaggedCache("sales-analytics", ttl_seconds=settings.SALES_ANALYTICS_CACHE_TTL_SECONDS)
+
+
+@dataclass(frozen=True)
+class Scope:
+    """Dashboard filters besides the date range."""
+    region: Optional[str] = None
+    customer_id: Optional[int] = None
+    product_id: Optional[int] = None
+
+
+# ------------------------------------------------------------------
+# 1. Ranges and rollup levels
+# ------------------------------------------------------------------
+def _next_month(day: datetime.date) -> datetime.date:
+    return (day.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+
+
+def _months_back(day: datetime.date, months: int) -> datetime.date:
+    index = day.year * 12 + day.month - 1 - months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _year_start(day: datetime.date) -> datetime.date:
+    return day.replace(month=1, day=1)
+
+
+def spans(
+    from_date: datetime.date, to_date: datetime.date, coarsest: RollupGrain = RollupGrain.year
+) -> list[tuple[RollupGrain, datetime.date, datetime.date]]:
+    """
+    Cover [from_date, to_date] with the coarsest rows that fit: whole
+    years, then whole months, then days at either end.
+    """
+    first_month = from_date if from_date.day == 1 else _next_month(from_date)
+    end_month = (to_date + ONE_DAY).replace(day=1)  # first day after the last whole month
+    if first_month >= end_month:
+        return [(RollupGrain.day, from_date, to_date)]
+    covered = []
+
+    def cover(grain, start, end):
+        if start <= end:
+            covered.append((grain, start, end))
+
+    first_year = first_month if first_month.month == 1 else first_month.replace(year=first_month.year + 1, month=1)
+    end_year = _year_start(end_month)  # first day after the last whole year
+    cover(RollupGrain.day, from_date, first_month - ONE_DAY)
+    if coarsest == RollupGrain.year and first_year < end_year:
+        cover(RollupGrain.month, first_month, (first_year - ONE_DAY).replace(day=1))
+        cover(RollupGrain.year, first_year, _year_start(end_year - ONE_DAY))
+        cover(RollupGrain.month, end_year, (end_month - ONE_DAY).replace(day=1))
+    else:
+        cover(RollupGrain.month, first_month, (end_month - ONE_DAY).replace(day=1))
+    cover(RollupGrain.day, end_month, to_date)
+    return covered
+
+
+def _ranged(R, columns: list, where: list, from_date, to_date, coarsest: RollupGrain = RollupGrain.year):
+    """The rollup rows covering the range: one index range per span, as a UNION ALL subquery."""
+    return union_all(*[
+        select(*columns).where(*where, R.grain == grain, R.period.between(start, end))
+        for grain, start, end in spans(from_date, to_date, coarsest)
+    ]).subquery()
+
+
+def _booked(scope: Scope, per_customer: bool = False):
+    """Rollup and level holding booked revenue for the scope."""
+    if scope.product_id is not None:
+        R = SalesRollup
+        where = [R.product_id == scope.product_id]
+    else:
+        R = SalesOrderRollup
+        where = [R.hour == ALL_HOURS, R.status != SalesOrderStatus.cancelled]
+    if scope.customer_id is not None:
+        where.append(R.customer_id == scope.customer_id)
+    else:
+        where.append(R.customer_id != ALL if per_customer else R.customer_id == ALL)
+    if scope.region is not None:
+        where.append(R.region == scope.region)
+    return R, where
+
+
+def _orders_level(scope: Scope, hourly: bool):
+    # Order rollups at the scope's customer level, ignoring the product
+    R = SalesOrderRollup
+    # IN rather than != so the hour stays an index seek
+    where = [R.hour.in_(range(24)) if hourly else R.hour == ALL_HOURS]
+    where.append(R.customer_id == (ALL if scope.customer_id is None else scope.customer_id))
+    if scope.region is not None:
+        where.append(R.region == scope.region)
+    return where
+
+
+def _percent(recent, previous) -> float:
+    if not previous:
+        return 100.0 if recent else 0.0
+    return round(float((recent - previous) / previous * 100), 1)
+
+
+def _aov(revenue: Decimal, orders: int) -> Decimal:
+    return (revenue / orders).quantize(CENT) if orders else ZERO
+
+
+# ------------------------------------------------------------------
+# 2. Dashboard sections
+# ------------------------------------------------------------------
+async def _totals(db: AsyncSession, scope: Scope, from_date, to_date) -> tuple[Decimal, int]:
+    R, where = _booked(scope)
+    rows = _ranged(R, [R.revenue, R.orders], where, from_date, to_date)
+    revenue, orders = (await db.execute(
+        select(func.coalesce(func.sum(rows.c.revenue), 0), func.coalesce(func.sum(rows.c.orders), 0))
+    )).one()
+    return Decimal(revenue), orders
+
+
+async def _trend(db: AsyncSession, scope: Scope, to_date) -> tuple[Decimal, float, float]:
+    R, where = _booked(scope)
+    recent_start = to_date - datetime.timedelta(days=TREND_DAYS - 1)
+    recent = R.period >= recent_start
+    row = (await db.execute(
+        select(
+            func.coalesce(func.sum(case((recent, R.revenue), else_=0)), 0),
+            func.coalesce(func.sum(case((recent, R.orders), else_=0)), 0),
+            func.coalesce(func.sum(case((recent, 0), else_=R.revenue)), 0),
+            func.coalesce(func.sum(case((recent, 0), else_=R.orders)), 0),
+        )
+        .where(
+            *where, R.grain == RollupGrain.day,
+            R.period.between(recent_start - datetime.timedelta(days=TREND_DAYS), to_date),
+        )
+    )).one()
+    recent_revenue, recent_orders, previous_revenue, previous_orders = row
+    return (
+        Decimal(recent_revenue),
+        _percent(Decimal(recent_revenue), Decimal(previous_revenue)),
+        _percent(recent_orders, previous_orders),
+    )
+
+
+async def _customers(db: AsyncSession, scope: Scope, from_date, to_date, top: int):
+    """Distinct and repeat customers plus the top ``top``, from one pass over the customer-level rows."""
+    R, where = _booked(scope, per_customer=True)
+    rows = _ranged(R, [R.customer_id, R.revenue, R.orders], where, from_date, to_date)
+    totals = (await db.execute(
+        select(rows.c.customer_id, func.sum(rows.c.revenue), func.sum(rows.c.orders))
+        .group_by(rows.c.customer_id)
+        .having(func.sum(rows.c.orders) > 0)
+    )).all()
+    repeat = sum(1 for _, _, orders in totals if orders > 1)
+    best = heapq.nlargest(top, totals, key=lambda row: row[1])
+    customers = {
+        customer.id: customer for customer in (await db.execute(
+            select(Customer).where(Customer.id.in_([customer_id for customer_id, _, _ in best]))
+        )).scalars()
+    }
+    ranked = [
+        CustomerSales(
+            customer_id=customer_id,
+            code=customers[customer_id].code,
+            name=customers[customer_id].name,
+            revenue=revenue,
+            orders=orders,
+            aov=_aov(Decimal(revenue), orders),
+        )
+        for customer_id, revenue, orders in best
+    ]
+    return len(totals), repeat, ranked
+
+
+async def _top_products(db: AsyncSession, scope: Scope, from_date, to_date, top: int) -> list[ProductSales]:
+    R = SalesRollup
+    where = [R.customer_id == (ALL if scope.customer_id is None else scope.customer_id)]
+    if scope.product_id is not None:
+        where.append(R.product_id == scope.product_id)
+    if scope.region is not None:
+        where.append(R.region == scope.region)
+    rows = _ranged(R, [R.product_id, R.revenue, R.quantity, R.orders], where, from_date, to_date)
+    # Partial sums per span, merged per product; only the top ones are joined to the master
+    revenue = func.sum(rows.c.revenue).label("revenue")
+    ranked = (
+        select(rows.c.product_id, revenue, func.sum(rows.c.quantity).label("quantity"),
+               func.sum(rows.c.orders).label("orders"))
+        .group_by(rows.c.product_id)
+        .having(func.sum(rows.c.orders) > 0)
+        .order_by(revenue.desc(), rows.c.product_id)
+        .limit(top)
+        .subquery()
+    )
+    found = (await db.execute(
+        select(ranked, Product.sku, Product.name)
+        .join(Product, Product.id == ranked.c.product_id)
+        .order_by(ranked.c.revenue.desc(), ranked.c.product_id)
+    )).all()
+    return [
+        ProductSales(
+            product_id=product_id,
+            sku=sku,
+            name=name,
+            revenue=revenue,
+            quantity=quantity,
+            orders=orders,
+            avg_price=(Decimal(revenue) / quantity).quantize(CENT) if quantity else ZERO,
+        )
+        for product_id, revenue, quantity, orders, sku, name in found
+    ]
+
+
+async def _monthly(db: AsyncSession, scope: Scope, from_date, to_date) -> list[MonthlySales]:
+    window_start = max(from_date, _months_back(to_date, MONTHLY_POINTS - 1))
+    R, where = _booked(scope)
+    rows = _ranged(R, [R.period, R.revenue, R.orders], where, window_start, to_date, coarsest=RollupGrain.month)
+    months: dict[datetime.date, list] = {}
+    for period, revenue, orders in (await db.execute(
+        select(rows.c.period, func.sum(rows.c.revenue), func.sum(rows.c.orders)).group_by(rows.c.period)
+    )).all():
+        totals = months.setdefault(period.replace(day=1), [ZERO, 0, 0])
+        totals[0] += Decimal(revenue)
+        totals[1] += orders
+
+    # Distinct customers: exact per month row; the partial months at the ends once over their days
+    C, customer_where = _booked(scope, per_customer=True)
+    for grain, start, end in spans(window_start, to_date, coarsest=RollupGrain.month):
+        customers = func.count(C.customer_id.distinct())
+        stmt = (
+            select(C.period, customers).group_by(C.period) if grain == RollupGrain.month
+            else select(func.min(C.period), customers)
+        ).where(*customer_where, C.orders > 0, C.grain == grain, C.period.between(start, end))
+        for period, customers in (await db.execute(stmt)).all():
+            if period is not None and period.replace(day=1) in months:
+                months[period.replace(day=1)][2] = customers
+
+    return [
+        MonthlySales(month=month, revenue=revenue, orders=orders, customers=customers, aov=_aov(revenue, orders))
+        for month, (revenue, orders, customers) in sorted(months.items())
+    ]
+
+
+async def _status(db: AsyncSession, scope: Scope, from_date, to_date) -> list[StatusSales]:
+    R = SalesOrderRollup
+    rows = _ranged(R, [R.status, R.orders, R.revenue], _orders_level(scope, hourly=False), from_date, to_date)
+    found = (await db.execute(
+        select(rows.c.status, func.sum(rows.c.orders), func.sum(rows.c.revenue)).group_by(rows.c.status)
+    )).all()
+    return [
+        StatusSales(status=status, orders=orders, revenue=revenue)
+        for status, orders, revenue in sorted(found, key=lambda row: list(SalesOrderStatus).index(row[0]))
+        if orders > 0
+    ]
+
+
+async def _hourly(db: AsyncSession, scope: Scope, from_date, to_date) -> list[HourlySales]:
+    R = SalesOrderRollup
+    where = [*_orders_level(scope, hourly=True), R.status != SalesOrderStatus.cancelled]
+    rows = _ranged(R, [R.hour, R.orders, R.revenue], where, from_date, to_date)
+    found = {hour: (orders, revenue) for hour, orders, revenue in (await db.execute(
+        select(rows.c.hour, func.sum(rows.c.orders), func.sum(rows.c.revenue)).group_by(rows.c.hour)
+    )).all()}
+    return [
+        HourlySales(hour=hour, orders=found.get(hour, (0, ZERO))[0], revenue=found.get(hour, (0, ZERO))[1])
+        for hour in range(24)
+    ]
+
+
+async def dashboard(
+    db: AsyncSession, from_date: datetime.date, to_date: datetime.date, scope: Scope, top: int = 8
+) -> SalesDashboard:
+    revenue, booked_orders = await _totals(db, scope, from_date, to_date)
+    recent_revenue, revenue_trend, order_trend = await _trend(db, scope, to_date)
+    unique, repeat, top_customers = await _customers(db, scope, from_date, to_date, top)
+    status = await _status(db, scope, from_date, to_date)
+    return SalesDashboard(
+        from_date=from_date,
+        to_date=to_date,
+        region=scope.region,
+        customer_id=scope.customer_id,
+        product_id=scope.product_id,
+        metrics=SalesMetrics(
+            total_revenue=revenue,
+            total_orders=booked_orders if scope.product_id is not None else sum(row.orders for row in status),
+            average_order_value=_aov(revenue, booked_orders),
+            unique_customers=unique,
+            repeat_customers=repeat,
+            recent_revenue=recent_revenue,
+            revenue_trend=revenue_trend,
+            order_trend=order_trend,
+        ),
+        monthly=await _monthly(db, scope, from_date, to_date),
+        top_products=await _top_products(db, scope, from_date, to_date, top),
+        top_customers=top_customers,
+        status=status,
+        hourly=await _hourly(db, scope, from_date, to_date),
+    )
+
+
+# ------------------------------------------------------------------
+# 3. Cached JSON
+# ------------------------------------------------------------------
+def _month_tags(days: Iterable[datetime.date]) -> set[str]:
+    return {f"month:{day:%Y-%m}" for day in days}
+
+
+async def dashboard_json(
+    db: AsyncSession, redis: Redis, from_date: datetime.date, to_date: datetime.date, scope: Scope, top: int = 8
+) -> str:
+    async def render(db: AsyncSession):
+        return (await dashboard(db, from_date, to_date, scope, top)).model_dump_json()
+
+    # Every month the dashboard reads, the trend window included
+    first = min(from_date, to_date - datetime.timedelta(days=2 * TREND_DAYS)).replace(day=1)
+    months = []
+    while first <= to_date:
+        months.append(first)
+        first = _next_month(first)
+    key = f"dashboard:{from_date}:{to_date}:{scope.region or ''}:{scope.customer_id or ''}:{scope.product_id or ''}:{top}"
+    return await analytics_cache.get_or_set(redis, key, ["all", *_month_tags(months)], render)
+
+
+async def invalidate(redis: Redis, days: Optional[Iterable[datetime.date]] = None) -> int:
+    """Drop cached dashboards reading the months of ``days``; every one when None."""
+    return await analytics_cache.invalidate(redis, ["all"] if days is None else _month_tags(days))
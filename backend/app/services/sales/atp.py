@@ -0,0 +1,289 @@
+# app/services/sales/atp.py
+"""
+Time-phased available-to-promise.
+
+Each product's stock ledger is kept in memory as a timeline: the dates
+on which planned receipts or reservations fall, with cumulative supply
+and demand up to each date and the suffix minimum of their difference
+(the "floor"). What can be promised on a date without breaking a later
+reservation is on hand + floor, and the floor never decreases with the
+date – so the earliest date a quantity becomes available is one bisect.
+
+Timelines are loaded once per worker and then follow the ledger: every
+check first reads the movements posted since the last one (by id) and
+applies them in place. Ids committed out of order leave gaps that are
+re-read until they show up or ``ATP_GAP_RETRY_SECONDS`` pass (rolled
+back inserts never do).
+"""
+import asyncio
+import bisect
+import datetime
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.finance.ledger import ZERO
+from app.models.sales.master import Product
+from app.models.sales.stock import MovementType, StockMovement
+from app.schemas.sales.stock import ATPCheckIn, ATPOrderIn, ATPOrderOut, ATPResult
+
+RECEIPT = MovementType.receipt.value
+ISSUE = MovementType.issue.value
+PLANNED_RECEIPT = MovementType.planned_receipt.value
+
+
+class ATPError(ValueError):
+    """Unknown or inactive product."""
+
+
+# ------------------------------------------------------------------
+# 1. Timeline
+# ------------------------------------------------------------------
+class Timeline:
+    """Cumulative supply/demand of one product by date, as sorted parallel lists."""
+
+    __slots__ = ("on_hand", "dates", "supply", "demand", "floor")
+
+    def __init__(self):
+        self.on_hand = ZERO
+        # Index 0 is "before any date": no receipts or reservations yet
+        self.dates: list[datetime.date] = [datetime.date.min]
+        self.supply: list[Decimal] = [ZERO]
+        self.demand: list[Decimal] = [ZERO]
+        self.floor: list[Decimal] = [ZERO]  # min over later dates of supply - demand
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple[str, datetime.date, Decimal]]) -> "Timeline":
+        """From (movement type, due date, quantity) totals: cumulated forward, floored backward."""
+        timeline = cls()
+        phased: dict[datetime.date, list[Decimal]] = {}
+        for kind, due_date, quantity in rows:
+            if kind == RECEIPT:
+                timeline.on_hand += quantity
+            elif kind == ISSUE:
+                timeline.on_hand -= quantity
+            else:
+                totals = phased.setdefault(due_date, [ZERO, ZERO])
+                totals[0 if kind == PLANNED_RECEIPT else 1] += quantity
+        supply = demand = ZERO
+        for due_date in sorted(phased):
+            supply += phased[due_date][0]
+            demand += phased[due_date][1]
+            timeline.dates.append(due_date)
+            timeline.supply.append(supply)
+            timeline.demand.append(demand)
+        floor = timeline.floor = [ZERO] * len(timeline.dates)
+        lowest = None
+        for i in range(len(timeline.dates) - 1, -1, -1):
+            net = timeline.supply[i] - timeline.demand[i]
+            lowest = net if lowest is None or net < lowest else lowest
+            floor[i] = lowest
+        return timeline
+
+    def post(self, kind: str, due_date: datetime.date, quantity: Decimal) -> None:
+        """Apply one movement in place: a shift of the later totals and a partial floor repair."""
+        if kind == RECEIPT:
+            self.on_hand += quantity
+            return
+        if kind == ISSUE:
+            self.on_hand -= quantity
+            return
+        dates, supply, demand, floor = self.dates, self.supply, self.demand, self.floor
+        j = bisect.bisect_left(dates, due_date)
+        if j == len(dates) or dates[j] != due_date:
+            # New date: same totals as the date before it until the movement lands
+            dates.insert(j, due_date)
+            supply.insert(j, supply[j - 1])
+            demand.insert(j, demand[j - 1])
+            net = supply[j] - demand[j]
+            floor.insert(j, net if j + 1 == len(dates) else min(net, floor[j]))
+        totals, delta = (supply, quantity) if kind == PLANNED_RECEIPT else (demand, -quantity)
+        for i in range(j, len(dates)):
+            totals[i] += quantity
+            floor[i] += delta
+        # Earlier floors only change where the new minimum reaches them
+        for i in range(j - 1, -1, -1):
+            lowest = min(supply[i] - demand[i], floor[i + 1])
+            if lowest == floor[i]:
+                break
+            floor[i] = lowest
+
+    def _index(self, on: datetime.date) -> int:
+        return bisect.bisect_right(self.dates, on) - 1
+
+    def available(self, on: datetime.date) -> Decimal:
+        """Promisable on ``on`` without taking stock a later reservation needs."""
+        return self.on_hand + self.floor[self._index(on)]
+
+    def earliest(self, quantity: Decimal, on: datetime.date) -> Optional[datetime.date]:
+        """First date from ``on`` with ``quantity`` promisable; None beyond the planned supply."""
+        i = bisect.bisect_left(self.floor, quantity - self.on_hand)
+        if i == len(self.floor):
+            return None
+        return on if i <= self._index(on) else self.dates[i]
+
+    def check(self, product_id: int, quantity: Decimal, required_date: datetime.date) -> ATPResult:
+        k = self._index(required_date)
+        atp = self.on_hand + self.floor[k]
+        can_fulfill = atp >= quantity
+        return ATPResult(
+            product_id=product_id,
+            requested_quantity=quantity,
+            required_date=required_date,
+            on_hand=self.on_hand,
+            committed=self.demand[-1],
+            planned_receipts=self.supply[k],
+            atp_quantity=atp,
+            can_fulfill=can_fulfill,
+            shortfall=ZERO if can_fulfill else quantity - max(atp, ZERO),
+            promised_date=required_date if can_fulfill else self.earliest(quantity, required_date),
+            status="Available" if can_fulfill else "Backorder",
+        )
+
+
+# ------------------------------------------------------------------
+# 2. Per-worker timeline cache
+# ------------------------------------------------------------------
+class TimelineCache:
+    """Loaded timelines (LRU) and the stock ledger position they reflect."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._timelines: OrderedDict[int, Timeline] = OrderedDict()
+        self.watermark: Optional[int] = None  # highest movement id applied
+        self._gaps: dict[int, float] = {}     # unseen ids below it → retry deadline
+        self._lock = asyncio.Lock()
+        self.syncs = 0
+        self.applied = 0
+        self.loads = 0
+        self.hits = 0
+
+    async def _sync(self, db: AsyncSession) -> None:
+        if self.watermark is None:
+            # Nothing loaded yet: start from the ledger's current end
+            self.watermark = (await db.execute(select(func.max(StockMovement.id)))).scalar() or 0
+            return
+        now = time.monotonic()
+        for movement_id in [movement_id for movement_id, deadline in self._gaps.items() if deadline < now]:
+            del self._gaps[movement_id]
+        newer = StockMovement.id > self.watermark
+        result = await db.execute(
+            select(
+                StockMovement.id, StockMovement.product_id, StockMovement.movement_type,
+                StockMovement.due_date, StockMovement.quantity,
+            )
+            .where(or_(newer, StockMovement.id.in_(list(self._gaps))) if self._gaps else newer)
+            .order_by(StockMovement.id)
+        )
+        self.syncs += 1
+        deadline = now + settings.ATP_GAP_RETRY_SECONDS
+        for movement_id, product_id, kind, due_date, quantity in result.all():
+            if movement_id > self.watermark:
+                for missing in range(self.watermark + 1, movement_id):
+                    self._gaps[missing] = deadline
+                self.watermark = movement_id
+            else:
+                del self._gaps[movement_id]
+            timeline = self._timelines.get(product_id)
+            if timeline is not None:
+                timeline.post(kind.value, due_date, quantity)
+                self.applied += 1
+
+    async def _load(self, db: AsyncSession, product_ids: list[int]) -> None:
+        # Exactly the movements the watermark covers: later ones and gaps arrive by sync
+        stmt = (
+            select(StockMovement.product_id, StockMovement.movement_type, StockMovement.due_date,
+                   func.sum(StockMovement.quantity))
+            .where(StockMovement.product_id.in_(product_ids), StockMovement.id <= self.watermark)
+            .group_by(StockMovement.product_id, StockMovement.movement_type, StockMovement.due_date)
+        )
+        if self._gaps:
+            stmt = stmt.where(StockMovement.id.not_in(list(self._gaps)))
+        rows: dict[int, list] = {product_id: [] for product_id in product_ids}
+        for product_id, kind, due_date, quantity in (await db.execute(stmt)).all():
+            rows[product_id].append((kind.value, due_date, quantity))
+        for product_id, product_rows in rows.items():
+            self._timelines[product_id] = Timeline.build(product_rows)
+        self.loads += len(product_ids)
+
+    async def timelines(self, db: AsyncSession, product_ids: Iterable[int]) -> dict[int, Timeline]:
+        """Current timelines of ``product_ids``, loading the missing ones."""
+        product_ids = list(dict.fromkeys(product_ids))
+        async with self._lock:
+            await self._sync(db)
+            missing = [product_id for product_id in product_ids if product_id not in self._timelines]
+            if missing:
+                await self._load(db, missing)
+            self.hits += len(product_ids) - len(missing)
+            found = {}
+            for product_id in product_ids:
+                self._timelines.move_to_end(product_id)
+                found[product_id] = self._timelines[product_id]
+            while len(self._timelines) > self.size:
+                self._timelines.popitem(last=False)
+            return found
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "timelines": len(self._timelines),
+            "watermark": self.watermark,
+            "gaps": len(self._gaps),
+            "syncs": self.syncs,
+            "applied": self.applied,
+            "loads": self.loads,
+            "hits": self.hits,
+        }
+
+
+timelines = TimelineCache(settings.ATP_TIMELINE_CACHE_SIZE)
+
+
+# ------------------------------------------------------------------
+# 3. Checks
+# ------------------------------------------------------------------
+async def _checked_timelines(db: AsyncSession, product_ids: set[int]) -> dict[int, Timeline]:
+    result = await db.execute(select(Product.id).where(Product.id.in_(product_ids), Product.is_active.is_(True)))
+    missing = sorted(product_ids - set(result.scalars()))
+    if missing:
+        raise ATPError(f"Unknown or inactive products: {missing}")
+    return await timelines.timelines(db, product_ids)
+
+
+async def check(db: AsyncSession, check_in: ATPCheckIn) -> ATPResult:
+    found = await _checked_timelines(db, {check_in.product_id})
+    return found[check_in.product_id].check(check_in.product_id, check_in.quantity, check_in.required_date)
+
+
+async def check_order(db: AsyncSession, order_in: ATPOrderIn) -> ATPOrderOut:
+    """Every line of an order; repeated products ask for their running total."""
+    found = await _checked_timelines(db, {line.product_id for line in order_in.lines})
+    asked: dict[int, Decimal] = {}
+    results = []
+    for line in order_in.lines:
+        before = asked.get(line.product_id, ZERO)
+        asked[line.product_id] = before + line.quantity
+        result = found[line.product_id].check(line.product_id, before + line.quantity, order_in.required_date)
+        # Report the line itself; earlier lines of the product already hold their share
+        shortfall = min(result.shortfall, line.quantity)
+        results.append(result.model_copy(update={
+            "requested_quantity": line.quantity,
+            "atp_quantity": max(result.atp_quantity - before, ZERO),
+            "shortfall": shortfall,
+        }))
+
+    promised = [result.promised_date for result in results]
+    fulfilled = sum(result.can_fulfill for result in results)
+    return ATPOrderOut(
+        results=results,
+        overall_status="Available" if fulfilled == len(results) else "Partial" if fulfilled else "Backorder",
+        total_requested=sum((line.quantity for line in order_in.lines), ZERO),
+        total_available=sum((result.requested_quantity for result in results if result.can_fulfill), ZERO),
+        total_backorder=sum((result.shortfall for result in results), ZERO),
+        complete_date=None if None in promised else max(promised),
+    )
@@ -0,0 +1,472 @@
+# app/services/sales/billing.py
+"""
+Billing runs: every billable order up to a date invoiced in one go.
+
+Billing is one transaction. The open and delivered orders up to the
+billing date are selected once and their invoice numbers drawn from the
+INV sequence in a single reservation. Invoices, AR open items, the order
+status change (with its analytics postings) and the exposure move from
+open orders to receivables are then written as batched statements – a
+few dozen round trips for 50k orders instead of one save per invoice.
+
+Documents are rendered afterwards: the run's invoices are read back in
+chunks and turned into PDFs across a process pool whose workers compile
+the invoice template once (``app.services.sales.invoice_pdf``). Chunks
+are written to the run's ZIP archive or directory as they come back, so
+memory stays at a few chunks in flight. A run whose rendering failed
+renders again on retry without billing twice.
+
+Runs are executed by the billing worker (python -m
+app.services.sales.billing) from a Redis queue, under a run lock like
+the period close; a run whose worker died is failed by the sweep and
+can be retried.
+
+Sales orders carry no tax data, so billed AR items have no invoice tax
+lines and do not appear in the GST/VAT return
+(``app.services.finance.tax_returns``); taxable sales invoices still have
+to be entered through POST /finance/ar/items with their tax lines.
+"""
+import asyncio
+import datetime
+import logging
+import os
+import shutil
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Sequence
+
+from redis.asyncio import Redis
+from sqlalchemy import bindparam, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import run_lock
+from app.core.config import settings
+from app.crud.finance.ledger import ZERO
+from app.crud.sales import analytics, output
+from app.crud.sales.billing import run_repo
+from app.crud.sales.output import OutputSubject
+from app.crud.sales.orders import EXPOSED
+from app.db.session import AsyncSessionLocal
+from app.models.finance.open_items import OpenItem, OpenItemStatus, Subledger
+from app.models.sales.billing import BillingOutput, BillingRun, BillingRunStatus, SalesInvoice
+from app.models.sales.credit import CreditExposure
+from app.models.sales.master import Customer, Product
+from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+from app.models.sales.output import OutputType
+from app.services.numbering import document_numbers
+from app.services.sales import invoice_pdf
+from app.services.sales.analytics import invalidate as invalidate_dashboards
+from app.services.sales.invoice_pdf import InvoiceDocument, InvoiceLine, InvoiceTemplate
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------------
+# 1. Billing
+# ------------------------------------------------------------------
+def _billable(run: BillingRun) -> list:
+    where = [SalesOrder.status.in_(EXPOSED), SalesOrder.order_date <= run.billing_date]
+    if run.customer_id is not None:
+        where.append(SalesOrder.customer_id == run.customer_id)
+    return where
+
+
+async def bill_orders(db: AsyncSession, run: BillingRun) -> list[datetime.date]:
+    """Invoice the run's orders and commit; returns the billed order dates."""
+    orders = (await db.execute(
+        select(
+            SalesOrder.id, SalesOrder.customer_id, SalesOrder.order_date, SalesOrder.total,
+            Customer.code, Customer.name, Customer.customer_group, SalesOrder.region,
+        )
+        .join(Customer, Customer.id == SalesOrder.customer_id)
+        .where(*_billable(run))
+        .order_by(SalesOrder.id)
+        # Orders another run is billing right now are left to that run
+        .with_for_update(of=SalesOrder, skip_locked=True)
+    )).all()
+    # Numbers come from their own transaction: one reservation for the whole run
+    numbers = await document_numbers.next_numbers("INV", len(orders), year=run.billing_date.year) if orders else []
+    due_date = run.billing_date + datetime.timedelta(days=settings.BILLING_PAYMENT_TERMS_DAYS)
+
+    batch = settings.BILLING_BATCH_SIZE
+    for offset in range(0, len(orders), batch):
+        chunk = list(zip(numbers[offset:offset + batch], orders[offset:offset + batch]))
+        await db.execute(insert(SalesInvoice), [
+            {"invoice_number": number, "run_id": run.id, "order_id": order_id, "customer_id": customer_id,
+             "issue_date": run.billing_date, "due_date": due_date, "total": total}
+            for number, (order_id, customer_id, _, total, *_) in chunk
+        ])
+        await db.execute(insert(OpenItem), [
+            {"ledger": Subledger.ar, "party_code": code, "party_name": name, "document_number": number,
+             "issue_date": run.billing_date, "due_date": due_date, "amount": total, "balance": total,
+             "status": OpenItemStatus.open}
+            for number, (_, _, _, total, code, name, _, _) in chunk
+        ])
+        order_ids = [order_id for _, (order_id, *_) in chunk]
+        await analytics.post_orders(db, order_ids, -1)
+        await db.execute(
+            update(SalesOrder)
+            .where(SalesOrder.id.in_(order_ids))
+            .values(status=SalesOrderStatus.invoiced)
+            .execution_options(synchronize_session=False)
+        )
+        await analytics.post_orders(db, order_ids)
+
+    by_customer: dict[int, Decimal] = {}
+    for _, customer_id, _, total, *_ in orders:
+        by_customer[customer_id] = by_customer.get(customer_id, ZERO) + total
+    if by_customer:
+        # Open orders become receivables: one executemany for every customer
+        exposures = CreditExposure.__table__
+        await db.execute(
+            update(exposures)
+            .where(exposures.c.customer_id == bindparam("b_customer"))
+            .values(
+                open_orders=exposures.c.open_orders - bindparam("b_amount"),
+                open_receivables=exposures.c.open_receivables + bindparam("b_amount"),
+            ),
+            [{"b_customer": customer_id, "b_amount": amount} for customer_id, amount in by_customer.items()],
+        )
+    if orders:
+        # Invoice output (email / print) is determined here, sent by the output worker
+        invoice_ids = dict((await db.execute(
+            select(SalesInvoice.order_id, SalesInvoice.id).where(SalesInvoice.run_id == run.id)
+        )).all())
+        await output.schedule(db, OutputType.invoice, [
+            OutputSubject(invoice_ids[order_id], customer_id, group, region, total)
+            for order_id, customer_id, _, total, _, _, group, region in orders
+        ])
+    await run_repo.update(db, run, {
+        "status": BillingRunStatus.rendering,
+        "invoices": len(orders),
+        "total": sum(by_customer.values(), ZERO),
+        "invoiced_at": datetime.datetime.now(),
+    })
+    await db.commit()
+    return sorted({order_date for _, _, order_date, *_ in orders})
+
+
+# ------------------------------------------------------------------
+# 2. Documents
+# ------------------------------------------------------------------
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.BILLING_WORKERS,
+            initializer=invoice_pdf.init_worker,
+            initargs=(settings.BILLING_COMPANY_NAME, settings.BILLING_COMPANY_ADDRESS),
+        )
+    return _executor
+
+
+def shutdown_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+@lru_cache(maxsize=1)
+def template() -> InvoiceTemplate:
+    """The template of this process (single invoices, small runs)."""
+    return InvoiceTemplate(settings.BILLING_COMPANY_NAME, settings.BILLING_COMPANY_ADDRESS)
+
+
+async def load_documents(
+    db: AsyncSession, where: Sequence, after_id: int = 0, limit: int = 1
+) -> tuple[list[InvoiceDocument], int]:
+    """Invoices matching ``where`` after ``after_id`` in id order with their lines, and the last id read."""
+    heads = (await db.execute(
+        select(
+            SalesInvoice.id, SalesInvoice.invoice_number, SalesInvoice.issue_date, SalesInvoice.due_date,
+            SalesInvoice.order_id, SalesOrder.order_number, Customer.code, Customer.name, SalesOrder.region,
+            SalesInvoice.total,
+        )
+        .join(SalesOrder, SalesOrder.id == SalesInvoice.order_id)
+        .join(Customer, Customer.id == SalesInvoice.customer_id)
+        .where(*where, SalesInvoice.id > after_id)
+        .order_by(SalesInvoice.id)
+        .limit(limit)
+    )).all()
+    lines: dict[int, list[InvoiceLine]] = {}
+    for order_id, *line in (await db.execute(
+        select(
+            SalesOrderLine.order_id, Product.sku, Product.name,
+            SalesOrderLine.quantity, SalesOrderLine.unit_price, SalesOrderLine.amount,
+        )
+        .join(Product, Product.id == SalesOrderLine.product_id)
+        .where(SalesOrderLine.order_id.in_([head.order_id for head in heads]))
+        .order_by(SalesOrderLine.order_id, SalesOrderLine.line_no)
+    )).all():
+        lines.setdefault(order_id, []).append(InvoiceLine(*line))
+    return [
+        InvoiceDocument(
+            number, issue_date, due_date, order_number, code, name, region, total, lines.get(order_id, []),
+        )
+        for _, number, issue_date, due_date, order_id, order_number, code, name, region, total in heads
+    ], (heads[-1].id if heads else after_id)
+
+
+class _ZipSink:
+    def __init__(self, path: Path):
+        # Page streams are deflated already: stored entries, no second compression
+        self.archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED)
+
+    def write(self, rendered: list[tuple[str, bytes]]) -> None:
+        for number, pdf in rendered:
+            self.archive.writestr(f"{number}.pdf", pdf)
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class _DirectorySink:
+    def __init__(self, path: Path):
+        path.mkdir()
+        self.path = path
+
+    def write(self, rendered: list[tuple[str, bytes]]) -> None:
+        for number, pdf in rendered:
+            (self.path / f"{number}.pdf").write_bytes(pdf)
+
+    def close(self) -> None:
+        pass
+
+
+def run_path(run: BillingRun) -> Path:
+    name = f"billing-run-{run.id}-{run.billing_date:%Y%m%d}"
+    return Path(settings.BILLING_OUTPUT_DIR) / (f"{name}.zip" if run.output == BillingOutput.zip else name)
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir():
+        shutil.rmtree(path)
+    else:
+        path.unlink(missing_ok=True)
+
+
+async def write_documents(db: AsyncSession, run: BillingRun) -> int:
+    """
+    Render every invoice of the run into its archive / directory; returns
+    the number written. The output appears under its final name only
+    once complete.
+    """
+    path = run_path(run)
+    partial = path.with_name(path.name + ".part")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _remove(partial)
+    chunk = settings.BILLING_RENDER_CHUNK
+    parallel = settings.BILLING_WORKERS > 1 and run.invoices > chunk
+    loop = asyncio.get_running_loop()
+    in_flight: deque = deque()
+    written = 0
+    sink = (_ZipSink if run.output == BillingOutput.zip else _DirectorySink)(partial)
+    try:
+        after_id = 0
+        while True:
+            # Next chunk is read while the pool renders the previous ones
+            documents, after_id = await load_documents(db, [SalesInvoice.run_id == run.id], after_id, chunk)
+            if not documents:
+                break
+            if not parallel:
+                sink.write([(doc.invoice_number, template().render(doc)) for doc in documents])
+                written += len(documents)
+                continue
+            in_flight.append(loop.run_in_executor(_pool(), invoice_pdf.render_batch, documents))
+            if len(in_flight) >= 2 * settings.BILLING_WORKERS:
+                rendered = await in_flight.popleft()
+                sink.write(rendered)
+                written += len(rendered)
+        while in_flight:
+            rendered = await in_flight.popleft()
+            sink.write(rendered)
+            written += len(rendered)
+    except BaseException:
+        for future in in_flight:
+            future.cancel()
+        sink.close()
+        _remove(partial)
+        raise
+    sink.close()
+    _remove(path)
+    os.replace(partial, path)
+    return written
+
+
+async def render_invoice(db: AsyncSession, invoice_id: int) -> Optional[tuple[str, bytes]]:
+    """(invoice number, PDF) of one invoice, rendered in-process."""
+    documents, _ = await load_documents(db, [SalesInvoice.id == invoice_id])
+    if not documents:
+        return None
+    return documents[0].invoice_number, template().render(documents[0])
+
+
+# ------------------------------------------------------------------
+# 3. Worker
+# ------------------------------------------------------------------
+QUEUE_KEY = "billing:queue"
+
+
+def lock_key(run_id: int) -> str:
+    return f"billing:lock:{run_id}"
+
+
+async def enqueue(redis: Redis, run_id: int) -> None:
+    await redis.lpush(QUEUE_KEY, run_id)
+
+
+async def execute_run(db: AsyncSession, redis: Redis, run: BillingRun) -> BillingRunStatus:
+    """
+    Bill (status ``running``) unless an earlier attempt did, then write
+    the documents (``rendering``); the run ends ``completed`` or ``failed``.
+    """
+    run_id, billed = run.id, run.invoiced_at is not None
+    await run_repo.update(db, run, {"status": BillingRunStatus.rendering if billed else BillingRunStatus.running})
+    await db.commit()
+    try:
+        if not billed:
+            order_dates = await bill_orders(db, run)
+            if order_dates:
+                await invalidate_dashboards(redis, order_dates)
+                # Local import: the output worker renders with this module's template
+                from app.services.sales.output import enqueue_scheduled
+                await enqueue_scheduled(redis, db)
+        documents = await write_documents(db, run)
+    except Exception as exc:
+        logger.exception("Billing run %s failed", run_id)
+        await db.rollback()
+        run = await run_repo.get(db, run_id)
+        await run_repo.update(db, run, {
+            "status": BillingRunStatus.failed,
+            "error": str(exc),
+            "completed_at": datetime.datetime.now(),
+        })
+    else:
+        await run_repo.update(db, run, {
+            "status": BillingRunStatus.completed,
+            "documents": documents,
+            "output_path": str(run_path(run)),
+            "completed_at": datetime.datetime.now(),
+        })
+    await db.commit()
+    return run.status
+
+
+async def run_billing(redis: Redis, run_id: int) -> Optional[BillingRunStatus]:
+    """Run one queued run; ``None`` when another worker holds it or it is not queued."""
+    key, ttl = lock_key(run_id), settings.BILLING_LOCK_TTL_SECONDS
+    token = await run_lock.acquire(redis, key, ttl)
+    if token is None:
+        logger.info("Billing run %s is locked by another worker", run_id)
+        return None
+    lost = asyncio.Event()
+    renewer = asyncio.create_task(run_lock.hold(redis, key, token, ttl, lost))
+    try:
+        async with AsyncSessionLocal() as db:
+            run = await run_repo.get(db, run_id)
+            if run is None or run.status != BillingRunStatus.queued:
+                return None
+            work = asyncio.create_task(execute_run(db, redis, run))
+            lost_waiter = asyncio.create_task(lost.wait())
+            try:
+                await asyncio.wait([work, lost_waiter], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                lost_waiter.cancel()
+            if not work.done():
+                # The sweep may fail the run now; billing rolls back with us
+                work.cancel()
+                await asyncio.gather(work, return_exceptions=True)
+                logger.error("Billing run %s: lock lost, stopped", run_id)
+                return None
+            return work.result()
+    finally:
+        renewer.cancel()
+        await run_lock.release(redis, key, token, ttl)
+
+
+async def sweep(redis: Redis) -> int:
+    """
+    Fail runs left ``running`` / ``rendering`` by a worker that stopped
+    (its lock expired) so they can be retried, and queue again runs
+    ``queued`` for longer than the sweep interval that are neither on the
+    queue nor locked (the enqueue failed, or a worker stopped between
+    taking and starting them); returns how many.
+    """
+    active = (BillingRunStatus.running, BillingRunStatus.rendering)
+    stale = datetime.datetime.now() - datetime.timedelta(seconds=settings.BILLING_SWEEP_SECONDS)
+    async with AsyncSessionLocal() as db:
+        rows = (await db.execute(
+            select(BillingRun.id, BillingRun.status).where(or_(
+                BillingRun.status.in_(active),
+                (BillingRun.status == BillingRunStatus.queued) & (BillingRun.created_at < stale),
+            ))
+        )).all()
+        unlocked = [(run_id, status) for run_id, status in rows if not await redis.exists(lock_key(run_id))]
+        abandoned = [run_id for run_id, status in unlocked if status in active]
+        if abandoned:
+            # Still active: a run that finished meanwhile is left alone
+            await db.execute(
+                update(BillingRun)
+                .where(BillingRun.id.in_(abandoned), BillingRun.status.in_(active))
+                .values(status=BillingRunStatus.failed, error="Interrupted: the billing worker stopped",
+                        completed_at=datetime.datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+            logger.warning("Billing sweep failed %s abandoned runs: %s", len(abandoned), abandoned)
+    # One entry per waiting run: the list stays short
+    on_queue = set(await redis.lrange(QUEUE_KEY, 0, -1))
+    lost = [run_id for run_id, status in unlocked if status == BillingRunStatus.queued and str(run_id) not in on_queue]
+    for run_id in lost:
+        await enqueue(redis, run_id)
+    if lost:
+        logger.warning("Billing sweep queued %s runs again: %s", len(lost), lost)
+    return len(abandoned) + len(lost)
+
+
+async def worker(redis: Redis, poll_seconds: int = 5) -> None:
+    """Run queued billing runs one at a time; start more processes for more throughput."""
+    next_sweep = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_sweep:
+                await sweep(redis)
+                next_sweep = time.monotonic() + settings.BILLING_SWEEP_SECONDS
+            item = await redis.brpop(QUEUE_KEY, timeout=poll_seconds)
+            if item is None:
+                continue
+            run_id = int(item[1])
+            logger.info("Billing run %s picked up", run_id)
+            status = await run_billing(redis, run_id)
+            logger.info("Billing run %s finished: %s", run_id, status.value if status else "skipped")
+        except Exception:
+            # A run taken here stays queued or running; the sweep brings it back
+            logger.exception("Billing worker iteration failed")
+            await asyncio.sleep(poll_seconds)
+
+
+async def main() -> None:
+    from app.core.redis import close_redis, get_redis, init_redis
+    from app.db.session import dispose_engines
+
+    await init_redis()
+    try:
+        await worker(await get_redis())
+    finally:
+        shutdown_pool()
+        await close_redis()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,260 @@
+# app/services/sales/credit.py
+"""
+Credit checks and credit-hold release over the exposure table.
+
+``credit_exposures`` is maintained by the order, AR invoice and payment
+postings (``app.crud.sales.credit``), so every read here is a primary-key
+lookup or one aggregate over one row per customer – never a walk over
+invoices or payment history.
+"""
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, case, func, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.finance.ledger import CENT, ZERO
+from app.crud.sales import analytics, output
+from app.crud.sales.output import OutputSubject
+from app.crud.sales.orders import EXPOSED
+from app.models.finance.open_items import OpenItem, OpenItemStatus, Subledger
+from app.models.sales.credit import CreditExposure
+from app.models.sales.master import Customer
+from app.models.sales.orders import SalesOrder, SalesOrderStatus
+from app.models.sales.output import OutputType
+from app.schemas.sales.credit import CreditCheck, CreditPosition, CreditSummary, RebuildResult, ReleaseResult
+
+HUNDRED = Decimal(100)
+# Held orders released per UPDATE statement
+RELEASE_BATCH_SIZE = 5000
+# Exposure share of the limit counted as high risk (CreditManagement overview)
+HIGH_RISK_UTILIZATION = Decimal("0.8")
+
+
+class CreditError(ValueError):
+    """Unknown customer."""
+
+
+# ------------------------------------------------------------------
+# 1. Checks and positions
+# ------------------------------------------------------------------
+async def _exposure(db: AsyncSession, customer_id: int) -> tuple[Customer, CreditExposure]:
+    row = (await db.execute(
+        select(Customer, CreditExposure)
+        .join(CreditExposure, CreditExposure.customer_id == Customer.id)
+        .where(Customer.id == customer_id)
+    )).first()
+    if row is None:
+        raise CreditError(f"Unknown customer {customer_id}")
+    return row
+
+
+async def check_credit(db: AsyncSession, customer_id: int, amount: Decimal) -> CreditCheck:
+    """Would an order of ``amount`` be accepted now (the check ``create_order`` applies)."""
+    customer, exposure = await _exposure(db, customer_id)
+    total = exposure.open_orders + exposure.open_receivables
+    limit = customer.credit_limit
+    available = None if limit is None else limit - total
+    allowed = limit is None or total + amount <= limit
+    return CreditCheck(
+        customer_id=customer_id,
+        amount=amount,
+        allowed=allowed,
+        credit_limit=limit,
+        exposure=total,
+        available_credit=available,
+        reason=None if allowed else f"Credit limit exceeded. Available: {available}, required: {amount}",
+    )
+
+
+def _position(customer: Customer, exposure: CreditExposure) -> CreditPosition:
+    total = exposure.open_orders + exposure.open_receivables
+    limit = customer.credit_limit
+    utilization = (total / limit * HUNDRED).quantize(CENT) if limit else ZERO
+    days = exposure.avg_payment_days
+    # Scoring of the former client-side assessCreditRisk
+    score = 30 if utilization > 90 else 20 if utilization > 70 else 10 if utilization > 50 else 0
+    score += 30 if days > 60 else 20 if days > 45 else 10 if days > 30 else 0
+    if limit is not None and total > limit * HIGH_RISK_UTILIZATION:
+        score += 40
+    return CreditPosition(
+        customer_id=customer.id,
+        code=customer.code,
+        name=customer.name,
+        credit_limit=limit,
+        open_orders=exposure.open_orders,
+        open_receivables=exposure.open_receivables,
+        exposure=total,
+        available_credit=None if limit is None else limit - total,
+        utilization=utilization,
+        payments=exposure.payments,
+        avg_payment_days=round(days, 1),
+        risk_score=score,
+        risk_level="High" if score >= 60 else "Medium" if score >= 30 else "Low",
+    )
+
+
+async def position(db: AsyncSession, customer_id: int) -> CreditPosition:
+    return _position(*await _exposure(db, customer_id))
+
+
+async def positions(db: AsyncSession, exposures: Iterable[CreditExposure]) -> list[CreditPosition]:
+    """Positions for a page of exposure rows."""
+    exposures = list(exposures)
+    customers = {
+        customer.id: customer for customer in (await db.execute(
+            select(Customer).where(Customer.id.in_([exposure.customer_id for exposure in exposures]))
+        )).scalars()
+    }
+    return [_position(customers[exposure.customer_id], exposure) for exposure in exposures]
+
+
+def exposure_list_query(over_limit: Optional[bool] = None):
+    stmt = select(CreditExposure)
+    if over_limit is not None:
+        limit = select(Customer.credit_limit).where(Customer.id == CreditExposure.customer_id).scalar_subquery()
+        exceeded = CreditExposure.open_orders + CreditExposure.open_receivables > limit
+        stmt = stmt.where(exceeded if over_limit else or_(limit.is_(None), ~exceeded))
+    return stmt
+
+
+async def summary(db: AsyncSession) -> CreditSummary:
+    total = CreditExposure.open_orders + CreditExposure.open_receivables
+    limit = Customer.credit_limit
+    row = (await db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(limit), 0),
+            func.coalesce(func.sum(total), 0),
+            # Utilization only over customers that have a limit
+            func.coalesce(func.sum(case((limit.is_not(None), total), else_=0)), 0),
+            func.coalesce(func.sum(CreditExposure.open_receivables), 0),
+            func.coalesce(func.sum(case((total > limit * HIGH_RISK_UTILIZATION, 1), else_=0)), 0),
+            func.coalesce(func.sum(case((total > limit, 1), else_=0)), 0),
+        ).select_from(CreditExposure).join(Customer, Customer.id == CreditExposure.customer_id)
+    )).one()
+    held = (await db.execute(
+        select(func.count(), func.coalesce(func.sum(SalesOrder.total), 0))
+        .where(SalesOrder.status == SalesOrderStatus.credit_hold)
+    )).one()
+    customers, credit_limit, exposure, limited, receivables, high_risk, over_limit = row
+    return CreditSummary(
+        customers=customers,
+        total_credit_limit=credit_limit,
+        total_exposure=exposure,
+        total_receivables=receivables,
+        utilization_rate=(Decimal(limited) / Decimal(credit_limit) * HUNDRED).quantize(CENT) if credit_limit else ZERO,
+        high_risk_customers=high_risk,
+        over_limit_customers=over_limit,
+        held_orders=held[0],
+        held_amount=held[1],
+    )
+
+
+# ------------------------------------------------------------------
+# 2. Bulk jobs
+# ------------------------------------------------------------------
+async def release_blocked(db: AsyncSession, customer_ids: Optional[list[int]] = None) -> ReleaseResult:
+    """
+    Release held orders that now fit their customer's headroom, oldest
+    first per customer: a running total over the held orders against
+    limit - exposure, in one query. An order that does not fit keeps the
+    ones after it on hold too. Released orders get their confirmation
+    output scheduled, as if saved open.
+    """
+    held = SalesOrder.status == SalesOrderStatus.credit_hold
+    scope = [held] if customer_ids is None else [held, SalesOrder.customer_id.in_(customer_ids)]
+    # Lock the exposure rows so orders saved meanwhile wait for the release
+    await db.execute(
+        select(CreditExposure.customer_id)
+        .where(CreditExposure.customer_id.in_(select(SalesOrder.customer_id).where(*scope)))
+        .order_by(CreditExposure.customer_id)
+        .with_for_update()
+    )
+    running = (
+        select(
+            SalesOrder.id, SalesOrder.customer_id, SalesOrder.order_number, SalesOrder.total, SalesOrder.region,
+            func.sum(SalesOrder.total).over(partition_by=SalesOrder.customer_id, order_by=SalesOrder.id).label("running"),
+        )
+        .where(*scope)
+        .subquery()
+    )
+    fits = (await db.execute(
+        select(
+            running.c.id, running.c.customer_id, running.c.order_number, running.c.total,
+            Customer.customer_group, running.c.region,
+        )
+        .join(CreditExposure, CreditExposure.customer_id == running.c.customer_id)
+        .join(Customer, Customer.id == running.c.customer_id)
+        .where(
+            Customer.credit_limit.is_(None)
+            | (CreditExposure.open_orders + CreditExposure.open_receivables + running.c.running <= Customer.credit_limit)
+        )
+        .order_by(running.c.id)
+    )).all()
+
+    by_customer: dict[int, Decimal] = {}
+    for _, customer_id, _, total, _, _ in fits:
+        by_customer[customer_id] = by_customer.get(customer_id, ZERO) + total
+    order_ids = [order_id for order_id, *_ in fits]
+    for offset in range(0, len(order_ids), RELEASE_BATCH_SIZE):
+        batch = order_ids[offset:offset + RELEASE_BATCH_SIZE]
+        await analytics.post_orders(db, batch, -1)
+        await db.execute(
+            update(SalesOrder)
+            .where(SalesOrder.id.in_(batch), held)
+            .values(status=SalesOrderStatus.open)
+            .execution_options(synchronize_session=False)
+        )
+        await analytics.post_orders(db, batch)
+    await output.schedule(db, OutputType.order_confirmation, [
+        OutputSubject(order_id, customer_id, group, region, total)
+        for order_id, customer_id, _, total, group, region in fits
+    ])
+    if by_customer:
+        # One executemany for every customer's exposure
+        exposures = CreditExposure.__table__
+        await db.execute(
+            update(exposures)
+            .where(exposures.c.customer_id == bindparam("b_customer"))
+            .values(open_orders=exposures.c.open_orders + bindparam("b_amount")),
+            [{"b_customer": customer_id, "b_amount": amount} for customer_id, amount in by_customer.items()],
+        )
+    await db.commit()
+    still_held = (await db.execute(select(func.count()).select_from(SalesOrder).where(*scope))).scalar_one()
+    return ReleaseResult(
+        released=len(fits),
+        released_amount=sum(by_customer.values(), ZERO),
+        order_numbers=[order_number for _, _, order_number, *_ in fits],
+        still_held=still_held,
+    )
+
+
+async def rebuild_exposures(db: AsyncSession) -> RebuildResult:
+    """Recompute open orders and receivables from the documents (payment days are kept)."""
+    await db.execute(insert(CreditExposure).from_select(
+        ["customer_id"],
+        select(Customer.id).where(Customer.id.not_in(select(CreditExposure.customer_id))),
+    ))
+    orders = (
+        select(func.coalesce(func.sum(SalesOrder.total), 0))
+        .where(SalesOrder.customer_id == CreditExposure.customer_id, SalesOrder.status.in_(EXPOSED))
+        .scalar_subquery()
+    )
+    receivables = (
+        select(func.coalesce(func.sum(OpenItem.balance), 0))
+        .join(Customer, Customer.code == OpenItem.party_code)
+        .where(
+            Customer.id == CreditExposure.customer_id,
+            OpenItem.ledger == Subledger.ar,
+            OpenItem.status != OpenItemStatus.paid,
+        )
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        update(CreditExposure)
+        .values(open_orders=orders, open_receivables=receivables)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return RebuildResult(customers=result.rowcount)
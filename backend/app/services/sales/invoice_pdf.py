@@ -0,0 +1,233 @@
+# app/services/sales/invoice_pdf.py
+"""
+Invoice PDFs without a PDF library.
+
+``InvoiceTemplate`` compiles everything that is the same on every
+invoice once – file header, font objects, letterhead, labels, table
+header and rules – into ready byte strings and column geometry. Rendering
+an invoice then only formats its own values into text operators,
+deflates the page streams and writes the cross-reference table. Pool
+workers build the template once in their initializer (``init_worker``)
+and render whole batches (``render_batch``).
+
+Text uses the standard Helvetica fonts (WinAnsiEncoding), so nothing is
+embedded and a one-page invoice is about 2 KB.
+"""
+import datetime
+import zlib
+from decimal import Decimal
+from typing import NamedTuple, Optional, Sequence
+
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842  # A4 in points
+LEFT, RIGHT = 50, 545
+ROW_HEIGHT = 16
+FIRST_PAGE_ROWS_TOP = 632    # below letterhead, addresses and table header
+NEXT_PAGE_ROWS_TOP = 762     # continuation pages: table header only
+ROWS_BOTTOM = 80             # footer below
+DESCRIPTION_CHARS = 38
+
+# Advance widths (1/1000 em) of ASCII 32–126 in the standard Helvetica fonts
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+FONTS = {b"F1": _HELVETICA, b"F2": _HELVETICA_BOLD}
+
+# Table columns: (title, x, right-aligned)
+COLUMNS = (
+    ("#", LEFT, False),
+    ("SKU", 72, False),
+    ("Description", 160, False),
+    ("Qty", 380, True),
+    ("Unit price", 460, True),
+    ("Amount", RIGHT, True),
+)
+
+
+class InvoiceLine(NamedTuple):
+    sku: str
+    description: str
+    quantity: Decimal
+    unit_price: Decimal
+    amount: Decimal
+
+
+class InvoiceDocument(NamedTuple):
+    """Everything printed on one invoice (plain tuple: cheap to ship to pool workers)."""
+    invoice_number: str
+    issue_date: datetime.date
+    due_date: datetime.date
+    order_number: str
+    customer_code: str
+    customer_name: str
+    region: Optional[str]
+    total: Decimal
+    lines: Sequence[InvoiceLine]
+
+
+def _encode(text: str) -> bytes:
+    raw = " ".join(str(text).split()).encode("cp1252", "replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _width(text: str, font: bytes, size: float) -> float:
+    widths = FONTS[font]
+    return sum(widths[ord(c) - 32] if 32 <= ord(c) < 127 else 556 for c in text) * size / 1000
+
+
+def _text(x: float, y: float, text: str, font: bytes = b"F1", size: float = 9, right: bool = False) -> bytes:
+    if right:
+        x -= _width(text, font, size)
+    return b"BT /%s %g Tf %.2f %.2f Td (%s) Tj ET\n" % (font, size, x, y, _encode(text))
+
+
+def _rule(y: float, weight: float = 0.5) -> bytes:
+    return b"%g w %d %.2f m %d %.2f l S\n" % (weight, LEFT, y, RIGHT, y)
+
+
+def _money(value: Decimal) -> str:
+    return f"{value:,.2f}"
+
+
+def _quantity(value: Decimal) -> str:
+    return f"{value.normalize():f}" if value == value.to_integral_value() else f"{value:,.4f}".rstrip("0")
+
+
+class InvoiceTemplate:
+    def __init__(self, company: str, address: str = ""):
+        self.header = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+        self.fonts = [
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        ]
+        self.page = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+            b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %%d 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT)
+        )
+        table_header = lambda top: b"".join([  # noqa: E731
+            _rule(top + 12),
+            *[_text(x, top, title, b"F2", 9, right) for title, x, right in COLUMNS],
+            _rule(top - 6),
+        ])
+        self.first_page = b"".join([
+            _text(LEFT, 790, company, b"F2", 16),
+            _text(LEFT, 776, address, b"F1", 9) if address else b"",
+            _text(RIGHT, 790, "INVOICE", b"F2", 20, right=True),
+            _text(LEFT, 740, "Bill to", b"F2", 10),
+            *[_text(360, 740 - 14 * n, label) for n, label in enumerate(
+                ("Invoice no.", "Invoice date", "Due date", "Order no.")
+            )],
+            table_header(FIRST_PAGE_ROWS_TOP + 20),
+        ])
+        self.next_page = table_header(NEXT_PAGE_ROWS_TOP + 20)
+        self.first_rows = (FIRST_PAGE_ROWS_TOP - ROWS_BOTTOM) // ROW_HEIGHT
+        self.next_rows = (NEXT_PAGE_ROWS_TOP - ROWS_BOTTOM) // ROW_HEIGHT
+
+    def _pages(self, lines: Sequence[InvoiceLine]) -> list[list[tuple[int, InvoiceLine]]]:
+        """Lines per page; the last page keeps two rows free for the total."""
+        numbered = list(enumerate(lines, start=1))
+        pages, capacity = [], self.first_rows
+        while True:
+            if len(numbered) <= capacity - 2:
+                pages.append(numbered)
+                return pages
+            take = min(capacity, len(numbered))
+            pages.append(numbered[:take])
+            numbered = numbered[take:]
+            capacity = self.next_rows
+
+    def _row(self, y: float, number: int, line: InvoiceLine) -> bytes:
+        description = line.description
+        if len(description) > DESCRIPTION_CHARS:
+            description = description[:DESCRIPTION_CHARS - 1] + "…"
+        return b"".join([
+            _text(COLUMNS[0][1], y, str(number)),
+            _text(COLUMNS[1][1], y, line.sku[:16]),
+            _text(COLUMNS[2][1], y, description),
+            _text(COLUMNS[3][1], y, _quantity(line.quantity), right=True),
+            _text(COLUMNS[4][1], y, _money(line.unit_price), right=True),
+            _text(COLUMNS[5][1], y, _money(line.amount), right=True),
+        ])
+
+    def _page_stream(self, doc: InvoiceDocument, page: int, count: int, rows) -> bytes:
+        if page == 0:
+            parts = [self.first_page]
+            values = (doc.invoice_number, f"{doc.issue_date:%d %b %Y}", f"{doc.due_date:%d %b %Y}", doc.order_number)
+            parts += [_text(RIGHT, 740 - 14 * n, value, b"F2", 9, right=True) for n, value in enumerate(values)]
+            parts += [
+                _text(LEFT, 725, doc.customer_name, b"F1", 10),
+                _text(LEFT, 711, f"Customer {doc.customer_code}"),
+            ]
+            if doc.region:
+                parts.append(_text(LEFT, 697, f"Region: {doc.region}"))
+            y = FIRST_PAGE_ROWS_TOP
+        else:
+            parts = [self.next_page]
+            y = NEXT_PAGE_ROWS_TOP
+        for number, line in rows:
+            parts.append(self._row(y, number, line))
+            y -= ROW_HEIGHT
+        if page == count - 1:
+            parts += [
+                _rule(y + ROW_HEIGHT - 6),
+                _text(COLUMNS[4][1], y - 8, "Total", b"F2", 10, right=True),
+                _text(RIGHT, y - 8, _money(doc.total), b"F2", 10, right=True),
+            ]
+        parts += [
+            _text(LEFT, 40, f"Invoice {doc.invoice_number} for order {doc.order_number}", b"F1", 8),
+            _text(RIGHT, 40, f"Page {page + 1} of {count}", b"F1", 8, right=True),
+        ]
+        return b"".join(parts)
+
+    def render(self, doc: InvoiceDocument) -> bytes:
+        pages = self._pages(doc.lines)
+        count = len(pages)
+        kids = b" ".join(b"%d 0 R" % (5 + 2 * n) for n in range(count))
+        objects = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, count),
+            *self.fonts,
+        ]
+        for n, rows in enumerate(pages):
+            stream = zlib.compress(self._page_stream(doc, n, count, rows), 6)
+            objects.append(self.page % (6 + 2 * n))
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+        out = bytearray(self.header)
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+        return bytes(out)
+
+
+# ------------------------------------------------------------------
+# Pool workers: one template per process
+# ------------------------------------------------------------------
+_template: Optional[InvoiceTemplate] = None
+
+
+def init_worker(company: str, address: str) -> None:
+    global _template
+    _template = InvoiceTemplate(company, address)
+
+
+def render_batch(documents: Sequence[InvoiceDocument]) -> list[tuple[str, bytes]]:
+    """(invoice number, PDF) per document, in order."""
+    return [(doc.invoice_number, _template.render(doc)) for doc in documents]
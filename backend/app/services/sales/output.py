@@ -0,0 +1,551 @@
+# app/services/sales/output.py
+"""
+Document output: rendering and dispatch of the jobs output determination
+scheduled (``app.crud.sales.output.schedule``).
+
+Worker:  python -m app.services.sales.output
+
+Saving a document only inserts its jobs in the same transaction; after
+the commit their ids go onto a Redis list. Nothing is rendered or sent
+while the user waits. The worker takes up to OUTPUT_BATCH_SIZE ids at a
+time, claims them in one UPDATE, renders each document once and sends
+the batch over one SMTP connection (or writes it to the file sinks).
+
+Dedup is layered: one job per document, type and channel (unique key),
+an id sits on the queue at most once (a Redis set next to the list,
+popped together with it), and the claim only takes jobs still queued or
+due for retry, so an id popped twice is sent once. Failed sends and
+documents that fail to render wait on a sorted set of due times with
+exponential backoff until OUTPUT_MAX_ATTEMPTS. A sweep every
+OUTPUT_SWEEP_SECONDS pushes again what Redis lost (waiting jobs not in
+the set) or a crashed worker left claimed – the job rows are the source
+of truth.
+"""
+import asyncio
+import datetime
+import logging
+import os
+import smtplib
+import time
+from dataclasses import dataclass
+from email.message import EmailMessage
+from email.utils import make_msgid
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.sales.output import SCHEDULED
+from app.db.session import AsyncSessionLocal
+from app.models.sales.billing import SalesInvoice
+from app.models.sales.master import Customer, Product
+from app.models.sales.orders import SalesOrder, SalesOrderLine
+from app.models.sales.output import OutputChannel, OutputJob, OutputJobStatus, OutputType
+from app.schemas.sales.output import OutputQueueStats
+from app.services.sales.billing import load_documents, template
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "output:queue"
+QUEUED_KEY = "output:queued"  # ids on the queue (dedup)
+RETRY_KEY = "output:retry"    # id -> due timestamp
+# Ids per enqueue script call
+ENQUEUE_CHUNK = 1000
+
+
+# ------------------------------------------------------------------
+# 1. Queue
+# ------------------------------------------------------------------
+# KEYS: queue, queued set, ARGV: ids – pushes the ids not queued already
+ENQUEUE_LUA = """
+local pushed = 0
+for _, id in ipairs(ARGV) do
+    if redis.call('SADD', KEYS[2], id) == 1 then
+        redis.call('LPUSH', KEYS[1], id)
+        pushed = pushed + 1
+    end
+end
+return pushed
+"""
+
+# KEYS: queue, queued set, ARGV: count – pops from the list and the set together
+TAKE_LUA = """
+local ids = redis.call('RPOP', KEYS[1], ARGV[1])
+if not ids then
+    return {}
+end
+redis.call('SREM', KEYS[2], unpack(ids))
+return ids
+"""
+
+# KEYS: retry zset, queue, queued set, ARGV: now, limit – moves due retries onto the queue
+PROMOTE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, id in ipairs(due) do
+    redis.call('ZREM', KEYS[1], id)
+    if redis.call('SADD', KEYS[3], id) == 1 then
+        redis.call('LPUSH', KEYS[2], id)
+    end
+end
+return #due
+"""
+
+
+async def enqueue(redis: Redis, job_ids: Sequence[int]) -> int:
+    pushed = 0
+    for offset in range(0, len(job_ids), ENQUEUE_CHUNK):
+        pushed += await redis.eval(ENQUEUE_LUA, 2, QUEUE_KEY, QUEUED_KEY, *job_ids[offset:offset + ENQUEUE_CHUNK])
+    return pushed
+
+
+async def enqueue_scheduled(redis: Redis, db: AsyncSession) -> int:
+    """
+    Push the jobs the session scheduled; call after its commit. Without
+    Redis the jobs stay queued in the table and the next sweep finds them.
+    """
+    job_ids = db.info.pop(SCHEDULED, [])
+    if not job_ids:
+        return 0
+    try:
+        return await enqueue(redis, job_ids)
+    except RedisError as exc:
+        logger.warning("%s output jobs left to the sweep: %s", len(job_ids), exc)
+        return 0
+
+
+async def take(redis: Redis, batch: int, timeout: int) -> list[int]:
+    """
+    Up to ``batch`` ids; waits up to ``timeout`` seconds for the first.
+    Empty when another worker took them first.
+    """
+    # Waits without taking anything (the id moves back to where it was)
+    if await redis.blmove(QUEUE_KEY, QUEUE_KEY, timeout, "RIGHT", "RIGHT") is None:
+        return []
+    return [int(job_id) for job_id in await redis.eval(TAKE_LUA, 2, QUEUE_KEY, QUEUED_KEY, batch)]
+
+
+async def promote_retries(redis: Redis, limit: int = 1000) -> int:
+    return await redis.eval(PROMOTE_LUA, 3, RETRY_KEY, QUEUE_KEY, QUEUED_KEY, time.time(), limit)
+
+
+async def _lost(redis: Redis, job_ids: list[int]) -> list[int]:
+    """The ids not on the queue."""
+    lost = []
+    for offset in range(0, len(job_ids), ENQUEUE_CHUNK):
+        chunk = job_ids[offset:offset + ENQUEUE_CHUNK]
+        lost += [job_id for job_id, queued in zip(chunk, await redis.smismember(QUEUED_KEY, chunk)) if not queued]
+    return lost
+
+
+async def sweep(redis: Redis) -> int:
+    """
+    Queue again every claimed job whose lease expired, and every job left
+    queued or due past the sweep interval that is not on the queue (Redis
+    lost it); returns how many. A lease that expired on the last attempt
+    fails its job.
+    """
+    now = datetime.datetime.now()
+    stale = now - datetime.timedelta(seconds=settings.OUTPUT_SWEEP_SECONDS)
+    expired = (OutputJob.status == OutputJobStatus.sending) & (OutputJob.claimed_until < now)
+    async with AsyncSessionLocal() as db:
+        failed = (await db.execute(
+            update(OutputJob)
+            .where(expired, OutputJob.attempts >= settings.OUTPUT_MAX_ATTEMPTS)
+            .values(status=OutputJobStatus.failed, claimed_until=None, updated_at=now,
+                    error="Claim expired on the last attempt")
+            .execution_options(synchronize_session=False)
+        )).rowcount
+        reclaimed = list((await db.execute(
+            update(OutputJob)
+            .where(expired)
+            .values(status=OutputJobStatus.queued, claimed_until=None, updated_at=now)
+            .returning(OutputJob.id)
+            .execution_options(synchronize_session=False)
+        )).scalars())
+        # Waiting in a long queue is not lost: only ids missing from the set are pushed
+        waiting = list((await db.execute(
+            select(OutputJob.id).where(or_(
+                (OutputJob.status == OutputJobStatus.queued) & (OutputJob.updated_at < stale),
+                (OutputJob.status == OutputJobStatus.retry) & (OutputJob.next_attempt_at < stale),
+            ))
+        )).scalars())
+        await db.commit()
+    if failed:
+        logger.warning("Output sweep failed %s jobs claimed on their last attempt", failed)
+    job_ids = reclaimed + await _lost(redis, waiting)
+    if job_ids:
+        await enqueue(redis, job_ids)
+        logger.info("Output sweep queued %s jobs again", len(job_ids))
+    return len(job_ids)
+
+
+async def queue_stats(db: AsyncSession, redis: Redis) -> OutputQueueStats:
+    counts = dict((await db.execute(
+        select(OutputJob.status, func.count()).group_by(OutputJob.status)
+    )).all())
+    return OutputQueueStats(
+        queued=await redis.llen(QUEUE_KEY),
+        retrying=await redis.zcard(RETRY_KEY),
+        jobs={job_status: counts.get(job_status, 0) for job_status in OutputJobStatus},
+    )
+
+
+# ------------------------------------------------------------------
+# 2. Rendering
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class Rendered:
+    subject: str
+    body: str
+    filename: str
+    attachment: Optional[bytes] = None  # PDF; text-only documents go out as their body
+
+
+async def _render_invoices(db: AsyncSession, invoice_ids: Sequence[int]) -> dict[int, Rendered]:
+    documents, _ = await load_documents(db, [SalesInvoice.id.in_(invoice_ids)], limit=len(invoice_ids))
+    ids = dict((await db.execute(
+        select(SalesInvoice.invoice_number, SalesInvoice.id).where(SalesInvoice.id.in_(invoice_ids))
+    )).all())
+    rendered = {}
+    for doc in documents:
+        rendered[ids[doc.invoice_number]] = Rendered(
+            subject=f"Invoice {doc.invoice_number}",
+            body=(
+                f"Dear {doc.customer_name},\n\n"
+                f"please find attached invoice {doc.invoice_number} for order {doc.order_number} "
+                f"over {doc.total:,.2f}, due on {doc.due_date:%d %b %Y}.\n\n{settings.BILLING_COMPANY_NAME}\n"
+            ),
+            filename=f"{doc.invoice_number}.pdf",
+            attachment=template().render(doc),
+        )
+    return rendered
+
+
+async def _render_confirmations(db: AsyncSession, order_ids: Sequence[int]) -> dict[int, Rendered]:
+    orders = (await db.execute(
+        select(SalesOrder.id, SalesOrder.order_number, SalesOrder.order_date, SalesOrder.total, Customer.name)
+        .join(Customer, Customer.id == SalesOrder.customer_id)
+        .where(SalesOrder.id.in_(order_ids))
+    )).all()
+    lines: dict[int, list[str]] = {}
+    for order_id, line_no, sku, name, quantity, unit_price, amount in (await db.execute(
+        select(
+            SalesOrderLine.order_id, SalesOrderLine.line_no, Product.sku, Product.name,
+            SalesOrderLine.quantity, SalesOrderLine.unit_price, SalesOrderLine.amount,
+        )
+        .join(Product, Product.id == SalesOrderLine.product_id)
+        .where(SalesOrderLine.order_id.in_(order_ids))
+        .order_by(SalesOrderLine.order_id, SalesOrderLine.line_no)
+    )).all():
+        lines.setdefault(order_id, []).append(
+            f"{line_no:>4}  {sku[:12]:<12} {name[:22]:<22} {quantity.normalize():>8f} x {unit_price:>10,.2f} = {amount:>12,.2f}"
+        )
+    rendered = {}
+    for order_id, number, order_date, total, customer in orders:
+        rendered[order_id] = Rendered(
+            subject=f"Order confirmation {number}",
+            body="\n".join([
+                f"Dear {customer},",
+                "",
+                f"thank you for your order {number} of {order_date:%d %b %Y}.",
+                "We confirm the following items:",
+                "",
+                *lines.get(order_id, []),
+                "",
+                f"Order total: {total:,.2f}",
+                "",
+                settings.BILLING_COMPANY_NAME,
+                "",
+            ]),
+            filename=f"{number}.txt",
+        )
+    return rendered
+
+
+RENDERERS = {
+    OutputType.order_confirmation: _render_confirmations,
+    OutputType.invoice: _render_invoices,
+}
+
+
+async def _render(
+    db: AsyncSession, output_type: OutputType, document_ids: list[int]
+) -> tuple[dict[int, Rendered], dict[int, str]]:
+    """Documents and rendering errors by document id; one bad document does not fail the rest."""
+    render = RENDERERS[output_type]
+    try:
+        return await render(db, document_ids), {}
+    except Exception as exc:
+        if len(document_ids) == 1:
+            await db.rollback()
+            return {}, {document_ids[0]: f"Rendering failed: {exc}"}
+        logger.warning("Rendering %s %ss failed, rendering one at a time: %s",
+                       len(document_ids), output_type.value, exc)
+    documents, errors = {}, {}
+    await db.rollback()
+    for document_id in document_ids:
+        try:
+            documents.update(await render(db, [document_id]))
+        except Exception as exc:
+            await db.rollback()
+            errors[document_id] = f"Rendering failed: {exc}"
+    return documents, errors
+
+
+# ------------------------------------------------------------------
+# 3. Sinks
+# ------------------------------------------------------------------
+def _message(job, document: Rendered) -> EmailMessage:
+    message = EmailMessage()
+    message["From"] = settings.OUTPUT_SENDER
+    message["To"] = job.recipient
+    message["Subject"] = document.subject
+    message["Message-ID"] = make_msgid(f"output-{job.id}")
+    message.set_content(document.body)
+    if document.attachment is not None:
+        message.add_attachment(document.attachment, maintype="application", subtype="pdf", filename=document.filename)
+    return message
+
+
+def _write(path: Path, content: bytes) -> None:
+    """Appears under its name only once complete (folders are picked up by other programs)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".part")
+    partial.write_bytes(content)
+    os.replace(partial, path)
+
+
+def _send_mail(messages: list[tuple[int, EmailMessage]]) -> dict[int, str]:
+    """Errors by job id; the whole batch over one connection (runs in a thread)."""
+    if settings.OUTPUT_EMAIL_SINK == "file":
+        return _write_files([
+            (job_id, Path(settings.OUTPUT_DIR) / "mail" / f"{job_id}.eml", bytes(message))
+            for job_id, message in messages
+        ])
+    errors = {}
+    done = 0
+    try:
+        with smtplib.SMTP(settings.OUTPUT_SMTP_HOST, settings.OUTPUT_SMTP_PORT, timeout=30) as smtp:
+            if settings.OUTPUT_SMTP_STARTTLS:
+                smtp.starttls()
+            if settings.OUTPUT_SMTP_USER:
+                smtp.login(settings.OUTPUT_SMTP_USER, settings.OUTPUT_SMTP_PASSWORD or "")
+            for job_id, message in messages:
+                try:
+                    smtp.send_message(message)
+                except smtplib.SMTPRecipientsRefused as exc:
+                    errors[job_id] = f"Recipient refused: {exc.recipients}"
+                except smtplib.SMTPResponseException as exc:
+                    errors[job_id] = f"SMTP {exc.smtp_code}: {exc.smtp_error!r}"
+                done += 1
+    except (OSError, smtplib.SMTPException) as exc:
+        # Connection lost or refused: whatever was not sent yet fails with it
+        errors.update({job_id: f"SMTP: {exc}" for job_id, _ in messages[done:]})
+    return errors
+
+
+def _write_files(files: list[tuple[int, Path, bytes]]) -> dict[int, str]:
+    errors = {}
+    for job_id, path, content in files:
+        try:
+            _write(path, content)
+        except OSError as exc:
+            errors[job_id] = str(exc)
+    return errors
+
+
+# ------------------------------------------------------------------
+# 4. Worker
+# ------------------------------------------------------------------
+@dataclass
+class BatchResult:
+    sent: int = 0
+    retrying: int = 0
+    failed: int = 0
+
+
+def _backoff(attempts: int) -> datetime.timedelta:
+    return datetime.timedelta(seconds=settings.OUTPUT_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+def _lease_end() -> datetime.datetime:
+    return datetime.datetime.now() + datetime.timedelta(seconds=settings.OUTPUT_LEASE_SECONDS)
+
+
+async def _hold_lease(job_ids: list[int]) -> None:
+    """Extend the claim on a batch until cancelled, so the sweep leaves a slow send alone."""
+    while True:
+        await asyncio.sleep(settings.OUTPUT_LEASE_SECONDS / 3)
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(
+                    update(OutputJob)
+                    .where(OutputJob.id.in_(job_ids), OutputJob.status == OutputJobStatus.sending)
+                    .values(claimed_until=_lease_end())
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+        except SQLAlchemyError as exc:
+            logger.warning("Output lease renewal for %s jobs failed: %s", len(job_ids), exc)
+
+
+async def process_batch(redis: Redis, job_ids: Iterable[int]) -> BatchResult:
+    """Claim, render and send one batch of jobs."""
+    now = datetime.datetime.now()
+    async with AsyncSessionLocal() as db:
+        jobs = (await db.execute(
+            update(OutputJob)
+            .where(
+                OutputJob.id.in_(list(job_ids)),
+                # A job whose lease expired on its last attempt is failed by the sweep
+                OutputJob.attempts < settings.OUTPUT_MAX_ATTEMPTS,
+                or_(
+                    OutputJob.status == OutputJobStatus.queued,
+                    (OutputJob.status == OutputJobStatus.retry) & (OutputJob.next_attempt_at <= now),
+                ),
+            )
+            .values(
+                status=OutputJobStatus.sending, attempts=OutputJob.attempts + 1,
+                claimed_until=_lease_end(), updated_at=now,
+            )
+            .returning(
+                OutputJob.id, OutputJob.output_type, OutputJob.channel, OutputJob.document_id,
+                OutputJob.recipient, OutputJob.attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )).all()
+        await db.commit()
+        if not jobs:
+            return BatchResult()
+        lease = asyncio.create_task(_hold_lease([job.id for job in jobs]))
+        try:
+            return await _send_batch(db, redis, jobs)
+        finally:
+            lease.cancel()
+
+
+async def _send_batch(db: AsyncSession, redis: Redis, jobs: Sequence) -> BatchResult:
+    """Render and send claimed jobs, then record each outcome and release the claims."""
+    # Each document once, however many channels it goes out on
+    documents: dict[tuple[OutputType, int], Rendered] = {}
+    render_errors: dict[tuple[OutputType, int], str] = {}
+    for output_type in RENDERERS:
+        document_ids = sorted({job.document_id for job in jobs if job.output_type == output_type})
+        if document_ids:
+            rendered, failed = await _render(db, output_type, document_ids)
+            documents.update(((output_type, document_id), document) for document_id, document in rendered.items())
+            render_errors.update(((output_type, document_id), error) for document_id, error in failed.items())
+
+    errors: dict[int, str] = {}
+    permanent: set[int] = set()
+    messages, files = [], []
+    for job in jobs:
+        key = (job.output_type, job.document_id)
+        document = documents.get(key)
+        if key in render_errors:
+            # Retried with backoff like a failed send, up to OUTPUT_MAX_ATTEMPTS
+            errors[job.id] = render_errors[key]
+        elif document is None:
+            permanent.add(job.id)
+            errors[job.id] = f"{job.output_type.value} {job.document_id} not found"
+        elif job.channel == OutputChannel.email:
+            try:
+                messages.append((job.id, _message(job, document)))
+            except ValueError as exc:
+                # Malformed recipient or header: it will not get better
+                permanent.add(job.id)
+                errors[job.id] = f"Invalid message: {exc}"
+        else:
+            path = Path(settings.OUTPUT_DIR) / "files" / (job.recipient or "print") / document.filename
+            files.append((job.id, path, document.attachment or document.body.encode()))
+    if messages:
+        errors.update(await asyncio.to_thread(_send_mail, messages))
+    if files:
+        errors.update(await asyncio.to_thread(_write_files, files))
+
+    result = BatchResult()
+    sent = [job.id for job in jobs if job.id not in errors]
+    if sent:
+        await db.execute(
+            update(OutputJob)
+            .where(OutputJob.id.in_(sent))
+            .values(
+                status=OutputJobStatus.sent, error=None, next_attempt_at=None, claimed_until=None,
+                sent_at=datetime.datetime.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result.sent = len(sent)
+    retries, outcomes = {}, []
+    for job in jobs:
+        if job.id not in errors:
+            continue
+        if job.id in permanent or job.attempts >= settings.OUTPUT_MAX_ATTEMPTS:
+            outcomes.append({"b_id": job.id, "b_status": OutputJobStatus.failed, "b_next": None,
+                             "b_error": errors[job.id]})
+            result.failed += 1
+        else:
+            due = datetime.datetime.now() + _backoff(job.attempts)
+            outcomes.append({"b_id": job.id, "b_status": OutputJobStatus.retry, "b_next": due,
+                             "b_error": errors[job.id]})
+            retries[job.id] = due.timestamp()
+            result.retrying += 1
+    if outcomes:
+        jobs_table = OutputJob.__table__
+        await db.execute(
+            update(jobs_table)
+            .where(jobs_table.c.id == bindparam("b_id"))
+            .values(status=bindparam("b_status"), next_attempt_at=bindparam("b_next"),
+                    error=bindparam("b_error"), claimed_until=None, updated_at=datetime.datetime.now()),
+            outcomes,
+        )
+    await db.commit()
+    if retries:
+        try:
+            await redis.zadd(RETRY_KEY, retries)
+        except RedisError as exc:
+            logger.warning("%s output retries left to the sweep: %s", len(retries), exc)
+    if errors:
+        logger.warning("Output batch: %s sent, %s to retry, %s failed (first error: %s)",
+                       result.sent, result.retrying, result.failed, next(iter(errors.values())))
+    return result
+
+
+async def worker(redis: Redis, poll_seconds: int = 5) -> None:
+    """Send queued output in batches; start more processes for more throughput."""
+    next_sweep = 0.0
+    while True:
+        try:
+            if time.monotonic() >= next_sweep:
+                await sweep(redis)
+                next_sweep = time.monotonic() + settings.OUTPUT_SWEEP_SECONDS
+            await promote_retries(redis)
+            job_ids = await take(redis, settings.OUTPUT_BATCH_SIZE, poll_seconds)
+            if job_ids:
+                await process_batch(redis, job_ids)
+        except Exception:
+            # Claimed jobs of a broken batch come back with the sweep
+            logger.exception("Output batch failed")
+            await asyncio.sleep(poll_seconds)
+
+
+async def main() -> None:
+    from app.core.redis import close_redis, get_redis, init_redis
+    from app.db.session import dispose_engines
+
+    await init_redis()
+    try:
+        await worker(await get_redis())
+    finally:
+        await close_redis()
+        await dispose_engines()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,474 @@
+# app/services/sales/pricing.py
+"""
+Batch pricing over compiled condition records.
+
+The active pricing rules and discount schemes valid on a date are
+compiled into a price book. Each condition is filed under every
+(product, customer group) pair it names, None standing for "any", so the
+candidates for a line are four dict lookups instead of a scan of every
+condition. The candidates' quantity bounds (min/max quantity, tier
+bands) become sorted break points; a quantity falls into a break with
+two bisects.
+
+Within one break the winning rule, its price and the applicable
+discounts cannot change, so they are resolved once per (customer group,
+product, list price, break) and memoized in the book. Only what depends
+on the exact quantity or the order value (buy-x-get-y counts, minimum
+order value) is evaluated per line.
+
+A book is keyed by the pricing version, bumped by every rule or scheme
+change, and the pricing date: a change retires the book and its memo on
+every worker at their next request.
+"""
+import bisect
+import datetime
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.crud.finance.ledger import CENT, ZERO
+from app.crud.sales.pricing import pricing_version
+from app.models.sales.master import Customer, Product
+from app.models.sales.pricing import DiscountScheme, DiscountType, PricingRule, PricingRuleType
+from app.schemas.sales.pricing import (
+    AppliedDiscount, Quote, QuoteIn, QuoteLine, SimulationIn, SimulationOut, SimulationResult,
+)
+
+HUNDRED = Decimal(100)
+UNIT = Decimal("0.0001")
+
+# Condition kinds as plain strings: enum ``.value`` lookups dominate the hot loop
+FIXED_PRICE = PricingRuleType.fixed_price.value
+FIXED_DISCOUNT = PricingRuleType.fixed_discount.value
+PERCENT_OFF_LIST = {PricingRuleType.percentage_discount.value, PricingRuleType.bundle_pricing.value}
+PERCENTAGE = DiscountType.percentage.value
+FIXED_AMOUNT = DiscountType.fixed_amount.value
+BUY_X_GET_Y = DiscountType.buy_x_get_y.value
+VOLUME_DISCOUNT = DiscountType.volume_discount.value
+
+
+class PricingError(ValueError):
+    """Unknown or inactive customer or product."""
+
+
+# ------------------------------------------------------------------
+# 1. Compiled conditions
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class Band:
+    lo: Decimal
+    hi: Optional[Decimal]  # None = open-ended
+    percent: Decimal
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A pricing rule or discount scheme reduced to what the engine evaluates."""
+    id: int
+    code: str
+    kind: str  # PricingRuleType or DiscountType value
+    value: Decimal
+    lo: Decimal
+    hi: Optional[Decimal]
+    bands: tuple[Band, ...] = ()
+    priority: int = 0
+    buy: int = 0
+    get: int = 0
+    min_order_value: Optional[Decimal] = None
+
+
+def _bands(tiers: list[dict]) -> tuple[Band, ...]:
+    return tuple(
+        Band(
+            Decimal(str(tier.get("min_qty") or 0)),
+            None if tier.get("max_qty") is None else Decimal(str(tier["max_qty"])),
+            Decimal(str(tier["discount"])),
+        )
+        for tier in tiers
+    )
+
+
+def _band(bands: tuple[Band, ...], quantity: Decimal) -> Optional[Band]:
+    """The band with the highest lower bound that contains ``quantity``."""
+    best = None
+    for band in bands:
+        if band.lo <= quantity and (band.hi is None or quantity <= band.hi) and (best is None or band.lo > best.lo):
+            best = band
+    return best
+
+
+def _in_range(condition: Condition, quantity: Decimal) -> bool:
+    return condition.lo <= quantity and (condition.hi is None or quantity <= condition.hi)
+
+
+def _rule_condition(rule: PricingRule) -> Condition:
+    return Condition(
+        id=rule.id, code=rule.code, kind=rule.rule_type.value, value=Decimal(rule.value),
+        lo=Decimal(rule.min_quantity or 0), hi=None if rule.max_quantity is None else Decimal(rule.max_quantity),
+        bands=_bands(rule.tiers or []), priority=rule.priority,
+    )
+
+
+def _scheme_condition(scheme: DiscountScheme) -> Condition:
+    return Condition(
+        id=scheme.id, code=scheme.code, kind=scheme.discount_type.value, value=Decimal(scheme.value),
+        lo=Decimal(scheme.min_quantity or 0), hi=None, bands=_bands(scheme.tiers or []),
+        buy=scheme.buy_quantity or 0, get=scheme.get_quantity or 0,
+        min_order_value=None if scheme.min_order_value is None else Decimal(scheme.min_order_value),
+    )
+
+
+def _file(conditions: list[Condition], scopes: list[tuple[list, list]]) -> dict[tuple, list[Condition]]:
+    """(product_id | None, customer_group | None) → conditions, in id order."""
+    index: dict[tuple, list[Condition]] = {}
+    for condition, (product_ids, groups) in zip(conditions, scopes):
+        for product_id in product_ids or [None]:
+            for group in groups or [None]:
+                index.setdefault((product_id, group), []).append(condition)
+    return index
+
+
+def _rule_price(rule: Condition, list_price: Decimal, quantity: Decimal) -> Optional[Decimal]:
+    kind = rule.kind
+    if kind == FIXED_PRICE:
+        return rule.value
+    if kind in PERCENT_OFF_LIST:
+        return list_price * (1 - rule.value / HUNDRED)
+    if kind == FIXED_DISCOUNT:
+        return max(ZERO, list_price - rule.value)
+    band = _band(rule.bands, quantity)  # tiered_pricing
+    return list_price * (1 - band.percent / HUNDRED) if band else None
+
+
+# ------------------------------------------------------------------
+# 2. Resolution per quantity break
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class Resolution:
+    rule: Optional[Condition]
+    rule_price: Decimal
+    # (scheme, percent or amount) in id order; buy-x-get-y carries 0
+    discounts: tuple[tuple[Condition, Decimal], ...]
+
+
+@dataclass
+class _Slot:
+    """Candidates of one (customer group, product, list price) and its resolved breaks."""
+    rules: list[Condition]
+    schemes: list[Condition]
+    starts: list[Decimal]
+    ends: list[Decimal]
+    resolved: dict[tuple[int, int], Resolution] = field(default_factory=dict)
+
+    def break_of(self, quantity: Decimal) -> tuple[int, int]:
+        # Bounds passed below and above quantity identify the break
+        return bisect.bisect_right(self.starts, quantity), bisect.bisect_left(self.ends, quantity)
+
+
+def _slot(rules: list[Condition], schemes: list[Condition]) -> _Slot:
+    starts, ends = [], []
+    for condition in (*rules, *schemes):
+        starts.append(condition.lo)
+        if condition.hi is not None:
+            ends.append(condition.hi)
+        for band in condition.bands:
+            starts.append(band.lo)
+            if band.hi is not None:
+                ends.append(band.hi)
+    return _Slot(rules, schemes, sorted(set(starts)), sorted(set(ends)))
+
+
+def _resolve(slot: _Slot, list_price: Decimal, quantity: Decimal) -> Resolution:
+    best, best_price = None, list_price
+    for rule in slot.rules:
+        if not _in_range(rule, quantity):
+            continue
+        price = _rule_price(rule, list_price, quantity)
+        if price is None:
+            continue
+        # Lowest price wins; ties go to the lower priority number
+        if price < best_price or (best is not None and price == best_price and rule.priority < best.priority):
+            best, best_price = rule, price
+
+    discounts = []
+    for scheme in slot.schemes:
+        if not _in_range(scheme, quantity):
+            continue
+        if scheme.kind == VOLUME_DISCOUNT:
+            band = _band(scheme.bands, quantity)
+            if band:
+                discounts.append((scheme, band.percent))
+        elif scheme.kind == BUY_X_GET_Y:
+            discounts.append((scheme, ZERO))
+        else:
+            discounts.append((scheme, scheme.value))
+    return Resolution(best, best_price.quantize(CENT), tuple(discounts))
+
+
+def apply_discounts(
+    resolution: Resolution, quantity: Decimal, order_value: Decimal
+) -> tuple[Decimal, list[tuple[Condition, Decimal]]]:
+    """Line amount after the stacked discounts, and what each took off."""
+    total = (resolution.rule_price * quantity).quantize(CENT)
+    applied = []
+    for scheme, parameter in resolution.discounts:
+        if scheme.min_order_value is not None and order_value < scheme.min_order_value:
+            continue
+        kind = scheme.kind
+        if kind in (PERCENTAGE, VOLUME_DISCOUNT):
+            amount = total * parameter / HUNDRED
+        elif kind == FIXED_AMOUNT:
+            amount = parameter * quantity
+        else:  # buy_x_get_y: free units at the current unit price
+            free = (quantity // (scheme.buy + scheme.get)) * scheme.get
+            amount = free * total / quantity
+        amount = min(amount, total).quantize(CENT)
+        if amount > 0:
+            total -= amount
+            applied.append((scheme, amount))
+    return total, applied
+
+
+# ------------------------------------------------------------------
+# 3. Price book
+# ------------------------------------------------------------------
+class PriceBook:
+    """Conditions valid on one date under one pricing version, with the resolution memo."""
+
+    def __init__(self, version: int, pricing_date: datetime.date, rules: list[PricingRule], schemes: list[DiscountScheme]):
+        self.version = version
+        self.pricing_date = pricing_date
+        self.rule_count = len(rules)
+        self.scheme_count = len(schemes)
+        self._rules = _file(
+            [_rule_condition(rule) for rule in rules], [(rule.product_ids, rule.customer_groups) for rule in rules]
+        )
+        self._schemes = _file(
+            [_scheme_condition(scheme) for scheme in schemes],
+            [(scheme.product_ids, scheme.customer_groups) for scheme in schemes],
+        )
+        self._slots: OrderedDict = OrderedDict()
+        self.resolutions = 0
+        self.reuses = 0
+
+    @staticmethod
+    def _candidates(index: dict, product_id: int, group: Optional[str]) -> list[Condition]:
+        # A set: without a group the four keys collapse to two
+        found = []
+        for key in {(product_id, group), (product_id, None), (None, group), (None, None)}:
+            found.extend(index.get(key, ()))
+        found.sort(key=lambda condition: condition.id)
+        return found
+
+    def resolve(self, group: Optional[str], product_id: int, list_price: Decimal, quantity: Decimal) -> Resolution:
+        key = (group, product_id, list_price)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = _slot(
+                self._candidates(self._rules, product_id, group),
+                self._candidates(self._schemes, product_id, group),
+            )
+            if len(self._slots) > settings.PRICE_RESOLUTION_CACHE_SIZE:
+                self._slots.popitem(last=False)
+        else:
+            self._slots.move_to_end(key)
+        point = slot.break_of(quantity)
+        resolution = slot.resolved.get(point)
+        if resolution is None:
+            resolution = slot.resolved[point] = _resolve(slot, list_price, quantity)
+            self.resolutions += 1
+        else:
+            self.reuses += 1
+        return resolution
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "pricing_date": self.pricing_date.isoformat(),
+            "rules": self.rule_count,
+            "schemes": self.scheme_count,
+            "slots": len(self._slots),
+            "resolutions": self.resolutions,
+            "reuses": self.reuses,
+        }
+
+
+class BookCache:
+    """Most recently used price books, one per (pricing version, date)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._books: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.compiles = 0
+        self.compile_seconds = 0.0
+
+    def get(self, version: int, pricing_date: datetime.date) -> Optional[PriceBook]:
+        book = self._books.get((version, pricing_date))
+        if book is not None:
+            self._books.move_to_end((version, pricing_date))
+            self.hits += 1
+        return book
+
+    def put(self, book: PriceBook) -> None:
+        # Books of older versions are never asked for again
+        for key in [key for key in self._books if key[0] < book.version]:
+            del self._books[key]
+        self._books[(book.version, book.pricing_date)] = book
+        while len(self._books) > self.size:
+            self._books.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "compiles": self.compiles,
+            "compile_seconds_avg": round(self.compile_seconds / self.compiles, 4) if self.compiles else 0.0,
+            "books": [book.stats() for book in self._books.values()],
+        }
+
+
+books = BookCache(settings.PRICE_BOOK_CACHE_SIZE)
+
+
+async def price_book(db: AsyncSession, pricing_date: datetime.date) -> PriceBook:
+    # Version before the conditions: a change in between makes the next version differ
+    version = await pricing_version(db)
+    book = books.get(version, pricing_date)
+    if book is not None:
+        return book
+    started = time.perf_counter()
+    rules = (await db.execute(select(PricingRule).where(
+        PricingRule.is_active.is_(True), PricingRule.valid_from <= pricing_date, PricingRule.valid_to >= pricing_date,
+    ))).scalars().all()
+    schemes = (await db.execute(select(DiscountScheme).where(
+        DiscountScheme.is_active.is_(True), DiscountScheme.valid_from <= pricing_date, DiscountScheme.valid_to >= pricing_date,
+    ))).scalars().all()
+    book = PriceBook(version, pricing_date, list(rules), list(schemes))
+    books.compiles += 1
+    books.compile_seconds += time.perf_counter() - started
+    books.put(book)
+    return book
+
+
+# ------------------------------------------------------------------
+# 4. Orders and simulations
+# ------------------------------------------------------------------
+async def _products(db: AsyncSession, product_ids: set[int]) -> dict[int, tuple[str, Decimal]]:
+    result = await db.execute(
+        select(Product.id, Product.sku, Product.list_price)
+        .where(Product.id.in_(product_ids), Product.is_active.is_(True))
+    )
+    return {product_id: (sku, list_price) for product_id, sku, list_price in result.all()}
+
+
+async def quote(db: AsyncSession, quote_in: QuoteIn) -> Quote:
+    """Price every line of an order in one pass over the book."""
+    customer = await db.get(Customer, quote_in.customer_id)
+    if customer is None or not customer.is_active:
+        raise PricingError(f"Unknown customer {quote_in.customer_id}")
+    products = await _products(db, {line.product_id for line in quote_in.lines})
+    missing = sorted({line.product_id for line in quote_in.lines} - set(products))
+    if missing:
+        raise PricingError(f"Unknown or inactive products: {missing}")
+
+    pricing_date = quote_in.pricing_date or datetime.date.today()
+    book = await price_book(db, pricing_date)
+    group = customer.customer_group
+    resolutions = [
+        book.resolve(group, line.product_id, products[line.product_id][1], line.quantity) for line in quote_in.lines
+    ]
+    # Minimum order values compare against the order after rules, before discounts
+    order_value = sum(((r.rule_price * line.quantity).quantize(CENT) for r, line in zip(resolutions, quote_in.lines)), ZERO)
+
+    lines = []
+    list_total = discount_total = total = ZERO
+    for resolution, line in zip(resolutions, quote_in.lines):
+        sku, list_price = products[line.product_id]
+        amount, applied = apply_discounts(resolution, line.quantity, order_value)
+        list_amount = (list_price * line.quantity).quantize(CENT)
+        lines.append(QuoteLine(
+            product_id=line.product_id,
+            sku=sku,
+            quantity=line.quantity,
+            list_price=list_price,
+            rule_code=resolution.rule.code if resolution.rule else None,
+            rule_price=resolution.rule_price,
+            discounts=[
+                AppliedDiscount(code=scheme.code, discount_type=scheme.kind, amount=discount)
+                for scheme, discount in applied
+            ],
+            unit_price=(amount / line.quantity).quantize(UNIT),
+            amount=amount,
+            savings=list_amount - amount,
+        ))
+        list_total += list_amount
+        discount_total += sum((discount for _, discount in applied), ZERO)
+        total += amount
+    return Quote(
+        customer_id=customer.id,
+        customer_group=group,
+        pricing_date=pricing_date,
+        pricing_version=book.version,
+        lines=lines,
+        list_total=list_total,
+        order_value=order_value,
+        discount_total=discount_total,
+        total=total,
+    )
+
+
+async def simulate(db: AsyncSession, simulation_in: SimulationIn) -> SimulationOut:
+    """Price independent (customer, product, quantity) cases – the Pricing page grid."""
+    cases = simulation_in.cases
+    products = await _products(db, {case.product_id for case in cases})
+    customer_ids = {case.customer_id for case in cases if case.customer_id is not None}
+    groups = {}
+    if customer_ids:
+        result = await db.execute(
+            select(Customer.id, Customer.customer_group).where(Customer.id.in_(customer_ids), Customer.is_active.is_(True))
+        )
+        groups = dict(result.all())
+
+    pricing_date = simulation_in.pricing_date or datetime.date.today()
+    book = await price_book(db, pricing_date)
+    results = []
+    for case in cases:
+        group = groups.get(case.customer_id) if case.customer_id is not None else case.customer_group
+        product = products.get(case.product_id)
+        error = (
+            f"Unknown or inactive product {case.product_id}" if product is None
+            else f"Unknown customer {case.customer_id}" if case.customer_id is not None and group is None
+            else None
+        )
+        if error:
+            results.append(SimulationResult(
+                product_id=case.product_id, customer_group=group, quantity=case.quantity, list_price=ZERO,
+                final_price=ZERO, discount_codes=[], savings=ZERO, discount_percent=ZERO, error=error,
+            ))
+            continue
+        list_price = product[1]
+        resolution = book.resolve(group, case.product_id, list_price, case.quantity)
+        order_value = case.order_value
+        if order_value is None:
+            order_value = (resolution.rule_price * case.quantity).quantize(CENT)
+        amount, applied = apply_discounts(resolution, case.quantity, order_value)
+        final_price = (amount / case.quantity).quantize(UNIT)
+        results.append(SimulationResult(
+            product_id=case.product_id,
+            customer_group=group,
+            quantity=case.quantity,
+            list_price=list_price,
+            final_price=final_price,
+            rule_code=resolution.rule.code if resolution.rule else None,
+            discount_codes=[scheme.code for scheme, _ in applied],
+            savings=list_price - final_price,
+            discount_percent=((list_price - final_price) / list_price * HUNDRED).quantize(CENT) if list_price else ZERO,
+        ))
+    return SimulationOut(pricing_date=pricing_date, pricing_version=book.version, results=results)
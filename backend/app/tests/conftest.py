@@ -0,0 +1,48 @@
+# app/tests/conftest.py
+"""
+Behaviour tests run against SQLite (aiosqlite) and fakeredis, the same
+stand-ins the benchmark suite uses, so they need no PostgreSQL or Redis.
+Every test gets freshly created tables.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import pytest_asyncio
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+os.environ.setdefault("DATABASE_URL_OVERRIDE", f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='erp-test-')}/test.db")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.chdir(BACKEND_DIR)  # settings read .env from the working directory
+
+from fakeredis import FakeServer  # noqa: E402
+from fakeredis.aioredis import FakeRedis  # noqa: E402
+
+import app.models  # noqa: E402,F401  – register every table
+from app.db.session import AsyncSessionLocal, create_db_and_tables, dispose_engines, drop_db_and_tables  # noqa: E402
+from app.services.numbering import document_numbers  # noqa: E402
+
+# Manual connectivity script: runs a query at import against the live
+# PostgreSQL from .env, so it is not collected with the behaviour tests.
+collect_ignore = ["test_db.py"]
+
+
+@pytest_asyncio.fixture
+async def db():
+    await drop_db_and_tables()
+    await create_db_and_tables()
+    # Blocks reserved against the previous test's tables are gone
+    document_numbers._blocks.clear()
+    document_numbers._locks.clear()
+    async with AsyncSessionLocal() as session:
+        yield session
+    await dispose_engines()
+
+
+@pytest_asyncio.fixture
+async def redis():
+    client = FakeRedis(server=FakeServer(), decode_responses=True)
+    yield client
+    await client.aclose()
@@ -0,0 +1,77 @@
+# app/tests/test_aging.py
+import asyncio
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.crud.finance import open_items
+from app.db.session import AsyncSessionLocal
+from app.models.finance.open_items import Subledger
+from app.schemas.finance.open_items import OpenItemCreate
+from app.services.finance import aging
+from app.services.finance.aging import AgingError
+
+pytestmark = pytest.mark.asyncio
+
+TODAY = datetime.date.today()
+
+
+async def _item(db, number, party, due_days_ago, amount):
+    due = TODAY - datetime.timedelta(days=due_days_ago)
+    return await open_items.create_item(db, Subledger.ap, OpenItemCreate(
+        party_code=party, document_number=number, issue_date=due - datetime.timedelta(days=30),
+        due_date=due, amount=Decimal(amount),
+    ))
+
+
+async def test_reads_need_a_snapshot(db):
+    await _item(db, "B-1", "V1", 10, "100")
+    with pytest.raises(AgingError):
+        await aging.aging_summary(db, Subledger.ap, TODAY)
+
+    await aging.refresh_snapshot(db, Subledger.ap, TODAY)
+    summary = await aging.aging_summary(db, Subledger.ap, TODAY)
+    assert (summary.parties, summary.buckets.days_1_30, summary.buckets.total) == (1, Decimal("100.00"), Decimal("100.00"))
+
+
+async def test_past_date_adds_back_later_payments(db):
+    item = await _item(db, "B-1", "V1", 45, "100")
+    await _item(db, "B-2", "V2", 5, "40")
+    await open_items.apply_payment(db, Subledger.ap, item.id, Decimal("100"))
+
+    yesterday = TODAY - datetime.timedelta(days=1)
+    await aging.refresh_snapshot(db, Subledger.ap, yesterday)
+    summary = await aging.aging_summary(db, Subledger.ap, yesterday)
+    assert (summary.items, summary.buckets.days_31_60, summary.buckets.days_1_30) == (2, Decimal("100.00"), Decimal("40.00"))
+
+    await aging.refresh_snapshot(db, Subledger.ap, TODAY)
+    summary = await aging.aging_summary(db, Subledger.ap, TODAY)
+    assert (summary.items, summary.buckets.total) == (1, Decimal("40.00"))
+
+
+async def test_first_refreshes_do_not_collide(db):
+    await _item(db, "B-1", "V1", 10, "100")
+
+    async def refresh():
+        async with AsyncSessionLocal() as session:
+            return (await aging.refresh_snapshot(session, Subledger.ap, TODAY)).as_of
+
+    assert await asyncio.gather(refresh(), refresh()) == [TODAY, TODAY]
+    assert (await aging.aging_summary(db, Subledger.ap, TODAY)).items == 1
+
+
+async def test_reads_apply_changes_made_after_the_snapshot(db):
+    item = await _item(db, "B-1", "V1", 10, "100")
+    await aging.refresh_snapshot(db, Subledger.ap, TODAY)
+    await _item(db, "B-2", "V2", 40, "60")
+    await open_items.apply_payment(db, Subledger.ap, item.id, Decimal("30"))
+
+    await aging.current_run(db, Subledger.ap, TODAY)
+    summary = await aging.aging_summary(db, Subledger.ap, TODAY)
+    assert (summary.parties, summary.buckets.days_1_30, summary.buckets.days_31_60) == (
+        2, Decimal("70.00"), Decimal("60.00"),
+    )
+    # A read still never takes the first snapshot for a date
+    with pytest.raises(AgingError):
+        await aging.current_run(db, Subledger.ap, TODAY - datetime.timedelta(days=1))
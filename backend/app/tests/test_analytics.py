@@ -0,0 +1,56 @@
+# app/tests/test_analytics.py
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.sales import analytics, master, orders
+from app.models.sales.analytics import ALL, ALL_HOURS, SalesOrderRollup, SalesRollup
+from app.schemas.sales.master import CustomerCreate, ProductCreate
+from app.schemas.sales.orders import SalesOrderCreate, SalesOrderLineIn
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _rollups(db):
+    rows = {}
+    for model in (SalesOrderRollup, SalesRollup):
+        table = model.__table__
+        result = await db.execute(select(table).order_by(*table.primary_key.columns))
+        rows[table.name] = [tuple(row) for row in result.all()]
+    return rows
+
+
+async def test_postings_match_a_rebuild(db):
+    customers = [
+        await master.create_customer(db, CustomerCreate(
+            code=f"C{n}", name=f"Customer {n}", customer_group="RETAIL", credit_limit=Decimal("100000"),
+        ))
+        for n in range(2)
+    ]
+    products = [
+        await master.create_product(db, ProductCreate(sku=f"P{n}", name=f"Product {n}", list_price=Decimal("5")))
+        for n in range(3)
+    ]
+    created = []
+    for n in range(6):
+        created.append(await orders.create_order(db, SalesOrderCreate(
+            customer_id=customers[n % 2].id,
+            lines=[
+                SalesOrderLineIn(product_id=products[n % 3].id, quantity=Decimal(n + 1), unit_price=Decimal("5")),
+                SalesOrderLineIn(product_id=products[(n + 1) % 3].id, quantity=Decimal("2"), unit_price=Decimal("7.5")),
+            ],
+        ), "tester"))
+    await orders.cancel_order(db, created[2].id)
+
+    posted = await _rollups(db)
+    assert await analytics.rebuild(db) == 6
+    assert await _rollups(db) == posted
+
+    total = (await db.execute(
+        select(SalesOrderRollup.orders, SalesOrderRollup.revenue).where(
+            SalesOrderRollup.customer_id == ALL, SalesOrderRollup.hour == ALL_HOURS,
+            SalesOrderRollup.grain == "year", SalesOrderRollup.status != "cancelled",
+        )
+    )).all()
+    assert (sum(row.orders for row in total), sum(row.revenue for row in total)) == (5, Decimal("165.00"))
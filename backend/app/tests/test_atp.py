@@ -0,0 +1,77 @@
+# app/tests/test_atp.py
+import datetime
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.crud.sales import master, stock
+from app.models.sales.stock import MovementType
+from app.schemas.sales.master import ProductCreate
+from app.schemas.sales.stock import ATPCheckIn, ATPOrderIn, ATPOrderLine, ReservationCreate, StockMovementCreate
+from app.services.sales import atp
+from app.services.sales.atp import ATPError, Timeline, TimelineCache
+
+D = datetime.date
+KINDS = [kind.value for kind in MovementType]
+
+
+def _timeline(*rows):
+    return Timeline.build([(kind.value, due, Decimal(quantity)) for kind, due, quantity in rows])
+
+
+def test_later_reservation_limits_what_can_be_promised_earlier():
+    timeline = _timeline(
+        (MovementType.receipt, D(2026, 1, 1), 100),
+        (MovementType.reservation, D(2026, 3, 1), 80),
+        (MovementType.planned_receipt, D(2026, 4, 1), 50),
+    )
+    assert timeline.available(D(2026, 2, 1)) == Decimal("20")
+    assert timeline.available(D(2026, 4, 1)) == Decimal("70")
+
+    result = timeline.check(1, Decimal("50"), D(2026, 2, 1))
+    assert (result.can_fulfill, result.shortfall, result.promised_date) == (False, Decimal("30"), D(2026, 4, 1))
+    assert timeline.earliest(Decimal("71"), D(2026, 2, 1)) is None
+
+
+def test_incremental_posts_match_a_rebuild():
+    rng = random.Random(11)
+    rows = [
+        (rng.choice(KINDS), D(2026, 1, 1) + datetime.timedelta(days=rng.randrange(90)), Decimal(rng.randrange(1, 40)))
+        for _ in range(400)
+    ]
+    timeline = Timeline.build(rows[:50])
+    for row in rows[50:]:
+        timeline.post(*row)
+    rebuilt = Timeline.build(rows)
+    for name in Timeline.__slots__:
+        assert getattr(timeline, name) == getattr(rebuilt, name), name
+
+
+@pytest.mark.asyncio
+async def test_cached_timelines_follow_new_movements(db, monkeypatch):
+    monkeypatch.setattr(atp, "timelines", TimelineCache(10))
+    product = await master.create_product(db, ProductCreate(sku="W-1", name="Widget", list_price=Decimal("10")))
+    await stock.create_movement(db, StockMovementCreate(
+        product_id=product.id, movement_type=MovementType.receipt, quantity=Decimal("10"), due_date=D(2026, 1, 1),
+    ), "tester")
+
+    check = ATPCheckIn(product_id=product.id, quantity=Decimal("8"), required_date=D(2026, 2, 1))
+    assert (await atp.check(db, check)).can_fulfill
+
+    await stock.create_reservation(db, ReservationCreate(
+        product_id=product.id, quantity=Decimal("5"), promise_date=D(2026, 3, 1),
+    ), "tester")
+    result = await atp.check(db, check)
+    assert (result.atp_quantity, result.can_fulfill) == (Decimal("5"), False)
+
+    # Repeated products ask for their running total
+    order = await atp.check_order(db, ATPOrderIn(required_date=D(2026, 2, 1), lines=[
+        ATPOrderLine(product_id=product.id, quantity=Decimal("3")),
+        ATPOrderLine(product_id=product.id, quantity=Decimal("3")),
+    ]))
+    assert order.overall_status == "Partial"
+    assert [line.shortfall for line in order.results] == [Decimal("0"), Decimal("1")]
+
+    with pytest.raises(ATPError):
+        await atp.check(db, ATPCheckIn(product_id=999, quantity=Decimal("1"), required_date=D(2026, 2, 1)))
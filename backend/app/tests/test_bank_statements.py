@@ -0,0 +1,39 @@
+# app/tests/test_bank_statements.py
+import io
+from decimal import Decimal
+
+import pytest
+
+from app.services.finance.bank_statements import StatementParseError, parse_csv
+
+
+def _amounts(text: str) -> list[Decimal]:
+    return [record.amount for record in parse_csv(io.BytesIO(text.encode()))]
+
+
+def test_csv_amounts_in_both_separator_conventions():
+    assert _amounts(
+        'Date,Amount,Reference\n'
+        '2026-03-01,"1,234.50",A\n'
+        '2026-03-02,"1.234,50",B\n'
+        '2026-03-03,"-1.234.567,89",C\n'
+        '2026-03-04,"1,23,456.50",D\n'
+        '2026-03-05,"1234,5",E\n'
+        '2026-03-06,"1,234,567",F\n'
+    ) == [
+        Decimal("1234.50"), Decimal("1234.50"), Decimal("-1234567.89"),
+        Decimal("123456.50"), Decimal("1234.5"), Decimal("1234567"),
+    ]
+
+
+def test_debit_and_credit_columns_with_decimal_commas():
+    assert _amounts(
+        'Booking date,Debit,Credit\n'
+        '01/03/2026,"2.500,00",\n'
+        '02/03/2026,,"17,25"\n'
+    ) == [Decimal("-2500.00"), Decimal("17.25")]
+
+
+def test_bad_amount_names_the_line():
+    with pytest.raises(StatementParseError, match="line 3"):
+        _amounts("Date,Amount\n2026-03-01,5\n2026-03-02,n/a\n")
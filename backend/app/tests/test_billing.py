@@ -0,0 +1,83 @@
+# app/tests/test_billing.py
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.crud.sales import billing as billing_crud, master, orders
+from app.models.sales.billing import BillingOutput, BillingRunStatus
+from app.models.sales.orders import SalesOrder, SalesOrderStatus
+from app.schemas.sales.billing import BillingRunCreate
+from app.schemas.sales.master import CustomerCreate, ProductCreate
+from app.schemas.sales.orders import SalesOrderCreate, SalesOrderLineIn
+from app.services.sales import billing
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "BILLING_OUTPUT_DIR", str(tmp_path))
+
+
+async def _run(db):
+    customer = await master.create_customer(db, CustomerCreate(
+        code="C1", name="Customer", customer_group="RETAIL", credit_limit=Decimal("10000"),
+    ))
+    product = await master.create_product(db, ProductCreate(sku="W-1", name="Widget", list_price=Decimal("10")))
+    for quantity in (1, 2):
+        await orders.create_order(db, SalesOrderCreate(
+            customer_id=customer.id,
+            lines=[SalesOrderLineIn(product_id=product.id, quantity=Decimal(quantity), unit_price=Decimal("10"))],
+        ), "tester")
+    return await billing_crud.create_run(db, BillingRunCreate(
+        billing_date=datetime.date.today(), output=BillingOutput.zip,
+    ), "tester")
+
+
+async def test_worker_bills_a_queued_run_once(db, redis):
+    run = await _run(db)
+    assert run.status == BillingRunStatus.queued
+    await billing.enqueue(redis, run.id)
+
+    assert await billing.run_billing(redis, int(await redis.rpop(billing.QUEUE_KEY))) == BillingRunStatus.completed
+    # A second queue entry for the same run does nothing
+    assert await billing.run_billing(redis, run.id) is None
+    await db.refresh(run)
+    assert (run.invoices, run.documents, run.total) == (2, 2, Decimal("30.00"))
+    assert billing.run_path(run).exists()
+    statuses = {order.status for order in (await db.execute(SalesOrder.__table__.select())).all()}
+    assert statuses == {SalesOrderStatus.invoiced}
+    assert not await redis.exists(billing.lock_key(run.id))
+
+
+async def test_sweep_fails_abandoned_runs_for_retry(db, redis):
+    run = await _run(db)
+    run.status = BillingRunStatus.running
+    await db.commit()
+    # Held by a live worker: left alone
+    await redis.set(billing.lock_key(run.id), "token")
+    assert await billing.sweep(redis) == 0
+
+    await redis.delete(billing.lock_key(run.id))
+    assert await billing.sweep(redis) == 1
+    await db.refresh(run)
+    assert (run.status, run.error) == (BillingRunStatus.failed, "Interrupted: the billing worker stopped")
+
+    await billing_crud.retry_run(db, run)
+    assert await billing.run_billing(redis, run.id) == BillingRunStatus.completed
+
+
+async def test_sweep_queues_lost_runs_again(db, redis):
+    run = await _run(db)
+    # Never reached the queue (the enqueue after the commit failed)
+    run.created_at = datetime.datetime.now() - datetime.timedelta(seconds=settings.BILLING_SWEEP_SECONDS + 1)
+    await db.commit()
+    await redis.set(billing.lock_key(run.id), "token")
+    assert await billing.sweep(redis) == 0
+
+    await redis.delete(billing.lock_key(run.id))
+    assert await billing.sweep(redis) == 1
+    assert await billing.sweep(redis) == 0
+    assert await redis.lrange(billing.QUEUE_KEY, 0, -1) == [str(run.id)]
@@ -0,0 +1,117 @@
+# app/tests/test_budgeting.py
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from app.crud.finance import budget as budget_crud, ledger
+from app.models.finance.ledger import AccountType
+from app.schemas.finance.budget import (
+    BudgetCreate, BudgetGrouping, BudgetLineIn, BudgetLinesIn, ForecastMethod, ScenarioAdjustment, ScenarioIn,
+)
+from app.schemas.finance.ledger import AccountCreate, JournalEntryCreate, JournalLineIn
+from app.services.finance import budgeting
+from app.services.finance.budgeting import CubeCache
+
+pytestmark = pytest.mark.asyncio
+
+MONTHS = (202501, 202502, 202503, 202504, 202505, 202506)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cubes(monkeypatch):
+    monkeypatch.setattr(budgeting, "cubes", CubeCache(4))
+
+
+async def _post(db, day, debit, credit, amount, cost_center=None):
+    await ledger.create_entry(db, JournalEntryCreate(entry_date=day, post=True, lines=[
+        JournalLineIn(account_id=debit.id, debit=Decimal(amount), cost_center=cost_center),
+        JournalLineIn(account_id=credit.id, credit=Decimal(amount)),
+    ]), "tester")
+
+
+async def _budget(db):
+    """Expenses 100/200/300 against 150 a month; sales 1000 a month against 900."""
+    bank = await ledger.create_account(db, AccountCreate(code="1000", name="Bank", type=AccountType.bank))
+    sales = await ledger.create_account(db, AccountCreate(code="4000", name="Sales", type=AccountType.income))
+    costs = await ledger.create_account(db, AccountCreate(code="6000", name="Costs", type=AccountType.expense))
+    for month, amount in zip((1, 2, 3), ("100", "200", "300")):
+        await _post(db, datetime.date(2025, month, 10), costs, bank, amount, cost_center="OPS")
+        await _post(db, datetime.date(2025, month, 20), bank, sales, "1000")
+    budget = await budget_crud.create_budget(db, BudgetCreate(name="FY", from_period=MONTHS[0], to_period=MONTHS[-1]), "tester")
+    budget = await budget_crud.set_lines(db, budget.id, BudgetLinesIn(lines=[
+        *(BudgetLineIn(account_id=costs.id, cost_center="OPS", period=period, amount=Decimal("150")) for period in MONTHS),
+        *(BudgetLineIn(account_id=sales.id, period=period, amount=Decimal("900")) for period in MONTHS),
+    ]))
+    return budget, bank, sales, costs
+
+
+def _by_code(rows):
+    return {row.account_code: row for row in rows}
+
+
+async def test_variance_to_date_in_natural_sign(db):
+    budget, _, _, _ = await _budget(db)
+    report = await budgeting.variance_report(db, budget, 202503, BudgetGrouping.account)
+    rows = _by_code(report.rows)
+    assert (rows["6000"].budget, rows["6000"].budget_to_date, rows["6000"].actual_to_date) == (
+        Decimal("900.00"), Decimal("450.00"), Decimal("600.00"),
+    )
+    assert (rows["6000"].variance, rows["6000"].variance_pct) == (Decimal("150.00"), Decimal("33.33"))
+    assert (rows["4000"].actual_to_date, rows["4000"].variance) == (Decimal("3000.00"), Decimal("300.00"))
+
+    by_center = await budgeting.variance_report(db, budget, 202503, BudgetGrouping.cost_center)
+    assert {(row.type, row.cost_center) for row in by_center.rows} == {
+        (AccountType.expense, "OPS"), (AccountType.income, ""),
+    }
+
+
+async def test_moving_average_with_adjustment_and_growth(db):
+    budget, _, _, costs = await _budget(db)
+    cube = await budgeting.load_cube(db, budget)
+    params = ScenarioIn(cutoff=202503, window=2, growth_percent=10,
+                        adjustments=[ScenarioAdjustment(account_id=costs.id, percent=20)])
+    rows = _by_code(budgeting.run_scenario(cube, params).rows)
+    # Run rate (200 + 300) / 2, +20 %, then +10 % compounded per month
+    expected = sum(250 * 1.2 * 1.1 ** n for n in (1, 2, 3))
+    assert rows["6000"].forecast == Decimal(f"{expected:.2f}")
+    assert rows["6000"].outlook == Decimal(f"{600 + expected:.2f}")
+    assert rows["4000"].forecast == Decimal(f"{sum(1000 * 1.1 ** n for n in (1, 2, 3)):.2f}")
+
+
+async def test_exponential_smoothing_matches_the_recursion(db):
+    budget, _, _, _ = await _budget(db)
+    cube = await budgeting.load_cube(db, budget)
+    params = ScenarioIn(cutoff=202503, method=ForecastMethod.exponential_smoothing, alpha=0.3)
+    history = cube.actual[:, :cube.cutoff_index(202503)]
+    outlook = budgeting.forecast(cube, params, 202503)
+    for row in range(len(history)):
+        level = history[row, 0]
+        for value in history[row, 1:]:
+            level = 0.3 * value + 0.7 * level
+        assert outlook[row, -1] == pytest.approx(level)
+
+
+async def test_postings_and_budget_edits_invalidate_cubes_and_scenarios(db, redis):
+    budget, bank, _, costs = await _budget(db)
+    params = ScenarioIn(cutoff=202503)
+    first = json.loads(await budgeting.scenario_json(db, redis, budget, params))
+    assert json.loads(await budgeting.scenario_json(db, redis, budget, params)) == first
+    assert (budgeting.cubes.loads, budgeting.cubes.hits) == (1, 1)
+
+    await _post(db, datetime.date(2025, 3, 28), costs, bank, "90", cost_center="OPS")
+    posted = json.loads(await budgeting.scenario_json(db, redis, budget, params))
+    assert budgeting.cubes.loads == 2
+    assert Decimal(_by_code_json(posted)["6000"]["actual_to_date"]) == Decimal("690.00")
+
+    budget = await budget_crud.set_lines(db, budget.id, BudgetLinesIn(lines=[
+        BudgetLineIn(account_id=costs.id, cost_center="OPS", period=202506, amount=Decimal("450")),
+    ]))
+    edited = json.loads(await budgeting.scenario_json(db, redis, budget, params))
+    assert (budgeting.cubes.loads, edited["version"]) == (3, posted["version"] + 1)
+    assert Decimal(_by_code_json(edited)["6000"]["budget"]) == Decimal("1200.00")
+
+
+def _by_code_json(result):
+    return {row["account_code"]: row for row in result["rows"]}
@@ -0,0 +1,91 @@
+# app/tests/test_cost_allocation.py
+import datetime
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.report_cache import report_cache
+from app.crud.finance import cost_allocation as crud, ledger
+from app.crud.finance.cost_allocation import CostAllocationError
+from app.models.finance.cost_allocation import CostCenterKind
+from app.models.finance.ledger import AccountType
+from app.schemas.finance.cost_allocation import CostCenterCreate, DriverSet
+from app.schemas.finance.ledger import AccountCreate, JournalEntryCreate, JournalLineIn
+from app.services.finance import cost_allocation
+from app.services.finance.cost_allocation import ReciprocalSolver
+
+# IT and HR serve each other and both production centres
+SHARES = np.array([
+    [0.0, 0.2, 0.5, 0.3],  # IT
+    [0.4, 0.0, 0.1, 0.5],  # HR
+    [0.0, 0.0, 0.0, 0.0],  # Assembly
+    [0.0, 0.0, 0.0, 0.0],  # Paint
+])
+DIRECT = np.array([100.0, 60.0, 500.0, 300.0])
+CODES = ["IT", "HR", "ASM", "PNT"]
+CENTERS = [SimpleNamespace(id=k + 1, code=code) for k, code in enumerate(CODES)]
+
+
+def _loaded(shares: np.ndarray) -> np.ndarray:
+    return np.linalg.solve(np.eye(len(shares)) - shares.T, DIRECT)
+
+
+def test_reciprocal_solve_and_rank_one_update_match_a_direct_solve():
+    solver = ReciprocalSolver()
+    assert np.allclose(solver.inverse_for(1, CENTERS, SHARES) @ DIRECT, _loaded(SHARES))
+    loaded = solver.inverse @ DIRECT
+    # Everything ends up in production
+    assert np.isclose((loaded * (1 - SHARES.sum(axis=1))).sum(), DIRECT.sum())
+
+    # HR re-weights its drivers: one row changes, the inverse is updated in place
+    changed = SHARES.copy()
+    changed[1] = [0.7, 0.0, 0.2, 0.1]
+    assert np.allclose(solver.inverse_for(2, CENTERS, changed) @ DIRECT, _loaded(changed))
+    assert solver.stats()["full_inversions"] == 1
+    assert solver.stats()["rank_one_updates"] == 1
+
+
+def test_service_loop_without_a_receiver_is_rejected():
+    closed = np.array([[0.0, 1.0], [1.0, 0.0]])
+    with pytest.raises(CostAllocationError):
+        ReciprocalSolver().inverse_for(1, CENTERS[:2], closed)
+
+
+@pytest.mark.asyncio
+async def test_driver_change_moves_the_cache_to_a_new_version(db, redis, monkeypatch):
+    monkeypatch.setattr(cost_allocation, "solver", ReciprocalSolver())
+    for code, kind in (("IT", CostCenterKind.service), ("HR", CostCenterKind.service),
+                       ("ASM", CostCenterKind.production), ("PNT", CostCenterKind.production)):
+        await crud.create_cost_center(db, CostCenterCreate(code=code, name=code, kind=kind))
+    await crud.set_drivers(db, "IT", DriverSet(receivers={"HR": Decimal("2"), "ASM": Decimal("5"), "PNT": Decimal("3")}))
+    await crud.set_drivers(db, "HR", DriverSet(receivers={"IT": Decimal("4"), "ASM": Decimal("1"), "PNT": Decimal("5")}))
+
+    expense = await ledger.create_account(db, AccountCreate(code="6000", name="Costs", type=AccountType.expense))
+    bank = await ledger.create_account(db, AccountCreate(code="1000", name="Bank", type=AccountType.bank))
+    last_month = datetime.date.today().replace(day=1) - datetime.timedelta(days=1)
+    await ledger.create_entry(db, JournalEntryCreate(entry_date=last_month, post=True, lines=[
+        *(JournalLineIn(account_id=expense.id, debit=Decimal(str(amount)), cost_center=code)
+          for code, amount in zip(CODES, DIRECT)),
+        JournalLineIn(account_id=bank.id, credit=Decimal(str(DIRECT.sum()))),
+    ]), "tester")
+    period = last_month.year * 100 + last_month.month
+
+    before = json.loads(await cost_allocation.allocation_json(db, redis, period))
+    finals = {row["code"]: float(row["final"]) for row in before["rows"]}
+    loaded = _loaded(SHARES)
+    assert finals["ASM"] == pytest.approx(DIRECT[2] + SHARES[0, 2] * loaded[0] + SHARES[1, 2] * loaded[1], abs=0.01)
+    assert Decimal(before["total_final"]) == Decimal(before["total_direct"]) == Decimal("960.00")
+    hits = report_cache.hits
+    assert json.loads(await cost_allocation.allocation_json(db, redis, period)) == before
+    assert report_cache.hits == hits + 1
+
+    version = await crud.set_drivers(db, "HR", DriverSet(receivers={"IT": Decimal("7"), "ASM": Decimal("2"), "PNT": Decimal("1")}))
+    after = json.loads(await cost_allocation.allocation_json(db, redis, period))
+    assert (after["driver_version"], before["driver_version"]) == (version, version - 1)
+    assert after["rows"] != before["rows"]
+    assert cost_allocation.solver.stats()["rank_one_updates"] == 1
+    assert await redis.exists(report_cache._key(f"alloc:{period}:v{version - 1}"))
+    assert await redis.exists(report_cache._key(f"alloc:{period}:v{version}"))
@@ -0,0 +1,82 @@
+# app/tests/test_credit.py
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.sales import master, orders
+from app.models.sales.credit import CreditExposure
+from app.models.sales.orders import SalesOrder, SalesOrderStatus
+from app.schemas.sales.master import CustomerCreate, ProductCreate
+from app.schemas.sales.orders import SalesOrderCreate, SalesOrderLineIn
+from app.services.sales import credit
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _setup(db, limit="1000"):
+    customer = await master.create_customer(db, CustomerCreate(
+        code="C1", name="Customer", customer_group="RETAIL", credit_limit=Decimal(limit),
+    ))
+    product = await master.create_product(db, ProductCreate(sku="W-1", name="Widget", list_price=Decimal("10")))
+    return customer, product
+
+
+async def _order(db, customer, product, amount):
+    return await orders.create_order(db, SalesOrderCreate(
+        customer_id=customer.id,
+        lines=[SalesOrderLineIn(product_id=product.id, quantity=Decimal("1"), unit_price=Decimal(amount))],
+    ), "tester")
+
+
+async def _open_orders(db, customer):
+    return (await db.execute(
+        select(CreditExposure.open_orders).where(CreditExposure.customer_id == customer.id)
+    )).scalar_one()
+
+
+async def test_orders_over_the_limit_go_on_hold(db):
+    customer, product = await _setup(db)
+    first = await _order(db, customer, product, "600")
+    second = await _order(db, customer, product, "500")
+    third = await _order(db, customer, product, "400")
+
+    assert [first.status, second.status, third.status] == [
+        SalesOrderStatus.open, SalesOrderStatus.credit_hold, SalesOrderStatus.open,
+    ]
+    assert await _open_orders(db, customer) == Decimal("1000.00")
+    check = await credit.check_credit(db, customer.id, Decimal("1"))
+    assert (check.allowed, check.available_credit) == (False, Decimal("0.00"))
+
+
+async def test_cancel_frees_headroom_and_release_is_oldest_first(db):
+    customer, product = await _setup(db)
+    first = await _order(db, customer, product, "900")
+    held = [await _order(db, customer, product, amount) for amount in ("300", "200", "150")]
+    assert all(order.status == SalesOrderStatus.credit_hold for order in held)
+
+    await orders.cancel_order(db, first.id)
+    assert await _open_orders(db, customer) == Decimal("0.00")
+
+    await master.update_credit_limit(db, customer, Decimal("520"))
+    result = await credit.release_blocked(db)
+    # Running totals 300 and 500 fit under 520; 650 does not
+    assert (result.released, result.released_amount, result.still_held) == (2, Decimal("500.00"), 1)
+    statuses = dict((await db.execute(select(SalesOrder.id, SalesOrder.status))).all())
+    assert [statuses[order.id] for order in held] == [
+        SalesOrderStatus.open, SalesOrderStatus.open, SalesOrderStatus.credit_hold,
+    ]
+    assert await _open_orders(db, customer) == Decimal("500.00")
+
+
+async def test_rebuild_matches_incremental_exposure(db):
+    customer, product = await _setup(db, limit="10000")
+    for amount in ("120", "80", "45.50"):
+        await _order(db, customer, product, amount)
+    incremental = await _open_orders(db, customer)
+
+    exposure = await db.get(CreditExposure, customer.id)
+    exposure.open_orders = Decimal("0")
+    await db.commit()
+    await credit.rebuild_exposures(db)
+    assert await _open_orders(db, customer) == incremental == Decimal("245.50")
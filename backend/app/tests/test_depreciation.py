@@ -0,0 +1,127 @@
+# app/tests/test_depreciation.py
+import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+
+from app.crud.finance import assets, ledger
+from app.models.finance.assets import AssetStatus, DepreciationMethod, FixedAsset
+from app.models.finance.ledger import AccountType, JournalLine
+from app.schemas.finance.assets import FixedAssetCreate, UsageIn
+from app.schemas.finance.ledger import AccountCreate
+from app.services.finance import depreciation
+from app.services.finance.depreciation import DepreciationError, run_depreciation
+
+
+async def _accounts(db):
+    expense = await ledger.create_account(db, AccountCreate(code="6100", name="Depreciation", type=AccountType.expense))
+    accumulated = await ledger.create_account(db, AccountCreate(code="1590", name="Acc. depreciation", type=AccountType.asset))
+    return expense.id, accumulated.id
+
+
+async def _asset(db, accounts, code, **values):
+    expense_id, accumulated_id = accounts
+    return await assets.create_asset(db, FixedAssetCreate(
+        asset_code=code, name=code, in_service_date=datetime.date(2026, 1, 15),
+        expense_account_id=expense_id, accumulated_account_id=accumulated_id, **values,
+    ))
+
+
+@pytest.mark.asyncio
+async def test_straight_line_spreads_remainder_without_drift(db):
+    accounts = await _accounts(db)
+    asset = await _asset(db, accounts, "SL", cost=Decimal("1000"), useful_life_months=3)
+
+    schedule = await depreciation.asset_schedule(db, asset, 4)
+    assert [row.depreciation for row in schedule.rows] == [
+        Decimal("333.33"), Decimal("333.34"), Decimal("333.33"), Decimal("0.00"),
+    ]
+    assert schedule.rows[-1].book_value == Decimal("0.00")
+
+
+@pytest.mark.asyncio
+async def test_declining_balance_switches_to_straight_line(db):
+    accounts = await _accounts(db)
+    asset = await _asset(
+        db, accounts, "DB", cost=Decimal("1200"), salvage_value=Decimal("200"), useful_life_months=24,
+        method=DepreciationMethod.declining_balance,
+    )
+
+    rows = (await depreciation.asset_schedule(db, asset, 24)).rows
+    # Default rate is double declining: 2 / 2 years = 100% a year
+    assert rows[0].depreciation == Decimal("100.00")
+    assert rows[1].depreciation == Decimal("91.67")
+    amounts = [row.depreciation for row in rows]
+    assert all(a >= b for a, b in zip(amounts, amounts[1:]))
+    assert rows[-1].book_value == Decimal("200.00")
+
+
+@pytest.mark.asyncio
+async def test_run_posts_journal_and_units_of_production(db):
+    accounts = await _accounts(db)
+    await _asset(db, accounts, "SL", cost=Decimal("1200"), useful_life_months=12, cost_center="PLANT")
+    units = await _asset(
+        db, accounts, "UP", cost=Decimal("1000"), salvage_value=Decimal("100"), useful_life_months=60,
+        method=DepreciationMethod.units_of_production, total_units=Decimal("9000"),
+    )
+    await assets.record_usage(db, units.id, UsageIn(period=202601, units=Decimal("450")))
+
+    run = await run_depreciation(db, 202601, "tester")
+    assert (run.asset_count, run.total) == (2, Decimal("145.00"))
+
+    lines = (await db.execute(
+        select(JournalLine.account_id, JournalLine.debit, JournalLine.credit, JournalLine.cost_center)
+        .where(JournalLine.entry_id == run.entry_id)
+        .order_by(JournalLine.id)
+    )).all()
+    expense_id, accumulated_id = accounts
+    assert sorted(lines, key=lambda line: (line.account_id, str(line.cost_center))) == [
+        (expense_id, Decimal("45.00"), Decimal("0.00"), None),
+        (expense_id, Decimal("100.00"), Decimal("0.00"), "PLANT"),
+        (accumulated_id, Decimal("0.00"), Decimal("145.00"), None),
+    ]
+    accumulated = dict((await db.execute(select(FixedAsset.asset_code, FixedAsset.accumulated_depreciation))).all())
+    assert accumulated == {"SL": Decimal("100.00"), "UP": Decimal("45.00")}
+
+
+@pytest.mark.asyncio
+async def test_runs_are_sequential_and_stop_at_salvage(db):
+    accounts = await _accounts(db)
+    asset = await _asset(db, accounts, "SL", cost=Decimal("300"), useful_life_months=2)
+
+    await run_depreciation(db, 202601, "tester")
+    with pytest.raises(DepreciationError, match="already depreciated"):
+        await run_depreciation(db, 202601, "tester")
+    with pytest.raises(DepreciationError, match="next period to run is 202602"):
+        await run_depreciation(db, 202603, "tester")
+
+    await run_depreciation(db, 202602, "tester")
+    run = await run_depreciation(db, 202603, "tester")
+    await db.refresh(asset)
+    assert (asset.accumulated_depreciation, asset.status) == (Decimal("300.00"), AssetStatus.fully_depreciated)
+    assert (run.entry_id, run.total) == (None, Decimal("0.00"))
+
+
+def test_vectorized_period_matches_one_asset_at_a_time():
+    rng = np.random.default_rng(7)
+    size = 500
+    reg = {
+        "method": rng.integers(0, 3, size).astype(np.int8),
+        "cost": rng.integers(10_000, 10_000_000, size).astype(np.float64),
+        "salvage": np.zeros(size),
+        "accumulated": np.zeros(size),
+        "start": rng.integers(24_300, 24_320, size),
+        "life": rng.integers(12, 120, size),
+        "rate": np.full(size, 0.3),
+        "total_units": np.full(size, 1000.0),
+        "units": rng.integers(0, 50, size).astype(np.float64),
+    }
+    month = 24_315
+    batch = depreciation.depreciation_for_period(reg, month)
+    single = [
+        depreciation.depreciation_for_period({name: column[i:i + 1] for name, column in reg.items()}, month)[0]
+        for i in range(size)
+    ]
+    assert batch.tolist() == single
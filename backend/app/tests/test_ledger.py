@@ -0,0 +1,110 @@
+# app/tests/test_ledger.py
+import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.crud.finance import ledger
+from app.models.finance.ledger import AccountPeriodBalance, AccountType
+from app.schemas.finance.ledger import AccountCreate, JournalEntryCreate, JournalLineIn
+from app.services.finance.statements import profit_and_loss
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _accounts(db):
+    cash = await ledger.create_account(db, AccountCreate(code="1000", name="Cash", type=AccountType.cash, opening=Decimal("100")))
+    sales = await ledger.create_account(db, AccountCreate(code="4000", name="Sales", type=AccountType.income))
+    await ledger.create_account(db, AccountCreate(code="3000", name="Capital", type=AccountType.equity, opening=Decimal("-100")))
+    return cash, sales
+
+
+async def _post(db, day, debit_id, credit_id, amount, post=True):
+    return await ledger.create_entry(db, JournalEntryCreate(
+        entry_date=day,
+        lines=[
+            JournalLineIn(account_id=debit_id, debit=Decimal(amount)),
+            JournalLineIn(account_id=credit_id, credit=Decimal(amount)),
+        ],
+        post=post,
+    ), "tester")
+
+
+async def _balances(db, as_of):
+    return {account.code: balance for account, balance in await ledger.account_balances(db, as_of)}
+
+
+async def test_posting_updates_period_balances(db):
+    cash, sales = await _accounts(db)
+    await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "40.00")
+    await _post(db, datetime.date(2026, 3, 20), cash.id, sales.id, "10.00")
+
+    row = await db.get(AccountPeriodBalance, (cash.id, 202603))
+    assert (row.debit, row.credit, row.closing_debit) == (Decimal("50.00"), Decimal("0.00"), Decimal("50.00"))
+    assert await _balances(db, datetime.date(2026, 3, 31)) == {"1000": Decimal("150.00"), "3000": Decimal("-100.00"), "4000": Decimal("-50.00")}
+
+    balance = await ledger.trial_balance(db, datetime.date(2026, 3, 31))
+    assert balance.is_balanced
+    assert balance.total_debit == Decimal("150.00")
+
+
+async def test_backdated_posting_carries_into_later_months(db):
+    cash, sales = await _accounts(db)
+    await _post(db, datetime.date(2026, 5, 10), cash.id, sales.id, "30.00")
+    await _post(db, datetime.date(2026, 3, 10), cash.id, sales.id, "20.00")
+
+    rows = (await db.execute(
+        select(AccountPeriodBalance.period, AccountPeriodBalance.closing_debit)
+        .where(AccountPeriodBalance.account_id == cash.id)
+        .order_by(AccountPeriodBalance.period)
+    )).all()
+    assert rows == [(202603, Decimal("20.00")), (202605, Decimal("50.00"))]
+    assert (await _balances(db, datetime.date(2026, 4, 30)))["1000"] == Decimal("120.00")
+    assert (await _balances(db, datetime.date(2026, 5, 31)))["1000"] == Decimal("150.00")
+
+
+async def test_mid_month_balance_stops_at_as_of(db):
+    cash, sales = await _accounts(db)
+    await _post(db, datetime.date(2026, 2, 27), cash.id, sales.id, "5.00")
+    await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "40.00")
+    await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "2.00")
+    await _post(db, datetime.date(2026, 3, 20), cash.id, sales.id, "10.00")
+
+    assert (await _balances(db, datetime.date(2026, 3, 4)))["1000"] == Decimal("105.00")
+    assert (await _balances(db, datetime.date(2026, 3, 5)))["1000"] == Decimal("147.00")
+    assert (await _balances(db, datetime.date(2026, 3, 19)))["1000"] == Decimal("147.00")
+    assert (await _balances(db, datetime.date(2026, 3, 20)))["1000"] == Decimal("157.00")
+
+
+async def test_void_reverses_balances_and_drafts_do_not_count(db):
+    cash, sales = await _accounts(db)
+    entry = await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "40.00")
+    await _post(db, datetime.date(2026, 3, 6), cash.id, sales.id, "7.00", post=False)
+
+    await ledger.void_entry(db, entry.id)
+    assert await _balances(db, datetime.date(2026, 3, 10)) == {"1000": Decimal("100.00"), "3000": Decimal("-100.00"), "4000": Decimal("0.00")}
+    assert await _balances(db, datetime.date(2026, 3, 31)) == {"1000": Decimal("100.00"), "3000": Decimal("-100.00"), "4000": Decimal("0.00")}
+
+    with pytest.raises(ledger.LedgerError):
+        await ledger.void_entry(db, entry.id)
+
+
+async def test_inactive_account_rejects_posting(db):
+    cash, sales = await _accounts(db)
+    sales.is_active = False
+    await db.commit()
+    with pytest.raises(ledger.LedgerError, match="Inactive"):
+        await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "1.00")
+
+
+async def test_profit_and_loss_over_partial_months(db):
+    cash, sales = await _accounts(db)
+    await _post(db, datetime.date(2026, 2, 27), cash.id, sales.id, "5.00")
+    await _post(db, datetime.date(2026, 3, 5), cash.id, sales.id, "40.00")
+    await _post(db, datetime.date(2026, 3, 20), cash.id, sales.id, "10.00")
+
+    report = await profit_and_loss(db, datetime.date(2026, 2, 28), datetime.date(2026, 3, 19))
+    assert report.total_revenue == Decimal("40.00")
+    report = await profit_and_loss(db, datetime.date(2026, 2, 1), datetime.date(2026, 3, 31))
+    assert report.total_revenue == Decimal("55.00")
@@ -0,0 +1,101 @@
+# app/tests/test_output.py
+import asyncio
+import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.sales.output import OutputChannel, OutputJob, OutputJobStatus, OutputType
+from app.services.sales import output
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _job(db, document_id, **values):
+    job = OutputJob(
+        output_type=OutputType.order_confirmation, channel=OutputChannel.email, document_id=document_id,
+        recipient="buyer@example.com", dedup_key=f"test-{document_id}", **{"attempts": 0, **values},
+    )
+    db.add(job)
+    await db.commit()
+    return job.id
+
+
+async def _status(db, job_id):
+    db.expire_all()
+    return (await db.execute(select(OutputJob.status).where(OutputJob.id == job_id))).scalar_one()
+
+
+async def test_sweep_only_takes_expired_leases(db, redis):
+    now = datetime.datetime.now()
+    working = await _job(db, 1, status=OutputJobStatus.sending, claimed_until=now + datetime.timedelta(minutes=1),
+                         updated_at=now - datetime.timedelta(hours=1))
+    crashed = await _job(db, 2, status=OutputJobStatus.sending, claimed_until=now - datetime.timedelta(seconds=1))
+
+    assert await output.sweep(redis) == 1
+    assert (await _status(db, working), await _status(db, crashed)) == (OutputJobStatus.sending, OutputJobStatus.queued)
+    assert await redis.lrange(output.QUEUE_KEY, 0, -1) == [str(crashed)]
+
+
+async def test_slow_batch_keeps_its_lease(db, redis, monkeypatch):
+    monkeypatch.setattr(settings, "OUTPUT_LEASE_SECONDS", 0.3)
+    swept = []
+
+    async def slow(db, document_ids):
+        # Well past the first lease: only a renewed one keeps the sweep off
+        await asyncio.sleep(0.6)
+        swept.append(await output.sweep(redis))
+        return {}
+
+    monkeypatch.setitem(output.RENDERERS, OutputType.order_confirmation, slow)
+    job_id = await _job(db, 7, status=OutputJobStatus.queued)
+
+    result = await output.process_batch(redis, [job_id])
+    assert swept == [0]
+    # Document 7 does not exist: failed for good, claim released
+    assert (result.failed, await _status(db, job_id)) == (1, OutputJobStatus.failed)
+    assert (await db.execute(select(OutputJob.claimed_until).where(OutputJob.id == job_id))).scalar_one() is None
+
+
+async def test_sweep_leaves_waiting_jobs_alone(db, redis):
+    stale = datetime.datetime.now() - datetime.timedelta(seconds=settings.OUTPUT_SWEEP_SECONDS + 1)
+    waiting = await _job(db, 1, status=OutputJobStatus.queued, updated_at=stale)
+    lost = await _job(db, 2, status=OutputJobStatus.queued, updated_at=stale)
+    await output.enqueue(redis, [waiting])
+
+    assert await output.sweep(redis) == 1
+    assert await output.sweep(redis) == 0
+    assert await redis.lrange(output.QUEUE_KEY, 0, -1) == [str(lost), str(waiting)]
+    assert await output.take(redis, 10, timeout=1) == [waiting, lost]
+    assert await redis.scard(output.QUEUED_KEY) == 0
+
+
+async def test_bad_document_fails_alone_and_gives_up(db, redis, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "OUTPUT_DIR", str(tmp_path))
+
+    async def render(db, document_ids):
+        if 13 in document_ids:
+            raise ValueError("broken template")
+        return {document_id: output.Rendered(subject="S", body="B", filename=f"{document_id}.txt")
+                for document_id in document_ids}
+
+    monkeypatch.setitem(output.RENDERERS, OutputType.order_confirmation, render)
+    good = await _job(db, 12, status=OutputJobStatus.queued)
+    bad = await _job(db, 13, status=OutputJobStatus.queued, attempts=settings.OUTPUT_MAX_ATTEMPTS - 1)
+
+    result = await output.process_batch(redis, [good, bad])
+    assert (result.sent, result.failed) == (1, 1)
+    assert (await _status(db, good), await _status(db, bad)) == (OutputJobStatus.sent, OutputJobStatus.failed)
+    assert (tmp_path / "mail" / f"{good}.eml").exists()
+
+
+async def test_attempts_are_bounded(db, redis):
+    now = datetime.datetime.now()
+    spent = await _job(db, 1, status=OutputJobStatus.queued, attempts=settings.OUTPUT_MAX_ATTEMPTS)
+    assert await output.process_batch(redis, [spent]) == output.BatchResult()
+
+    last = await _job(db, 2, status=OutputJobStatus.sending, attempts=settings.OUTPUT_MAX_ATTEMPTS,
+                      claimed_until=now - datetime.timedelta(seconds=1))
+    assert await output.sweep(redis) == 0
+    assert await _status(db, last) == OutputJobStatus.failed
@@ -0,0 +1,52 @@
+# app/tests/test_period_close.py
+import asyncio
+
+import pytest
+
+from app.crud.finance import close
+from app.models.finance.close import CloseStatus, CloseStepStatus
+from app.schemas.finance.close import CloseRunCreate
+from app.services.finance import period_close
+from app.services.finance.period_close import CloseStep, LockLost
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_lost_lock_stops_a_long_step(db, redis, monkeypatch):
+    cancelled = asyncio.Event()
+
+    async def slow(db, redis, period, user):
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    monkeypatch.setattr(period_close, "STEPS", (CloseStep("slow", "Slow step", (), slow),))
+    run = await close.create_run(db, CloseRunCreate(period=202601), ["slow"], "tester")
+    lost = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.05, lost.set)
+
+    with pytest.raises(LockLost):
+        await asyncio.wait_for(period_close._execute(db, redis, run, lost), timeout=5)
+    assert cancelled.is_set()
+
+
+async def test_steps_run_in_dependency_order(db, redis, monkeypatch):
+    order = []
+
+    def step(name):
+        async def run(db, redis, period, user):
+            order.append(name)
+            return {"period": period}
+        return run
+
+    monkeypatch.setattr(period_close, "STEPS", (
+        CloseStep("b", "B", ("a",), step("b")),
+        CloseStep("a", "A", (), step("a")),
+    ))
+    run = await close.create_run(db, CloseRunCreate(period=202601), ["a", "b"], "tester")
+    assert await period_close._execute(db, redis, run, asyncio.Event()) == CloseStatus.completed
+    assert order == ["a", "b"]
+    steps = await close.get_steps(db, run.id)
+    assert {row.status for row in steps.values()} == {CloseStepStatus.completed}
@@ -0,0 +1,111 @@
+# app/tests/test_pricing.py
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.crud.sales import master, pricing as pricing_crud
+from app.models.sales.pricing import DiscountType, PricingRuleType
+from app.schemas.sales.master import CustomerCreate, ProductCreate
+from app.schemas.sales.pricing import (
+    DiscountSchemeCreate, PricingRuleCreate, QuoteIn, QuoteLineIn, SimulationCase, SimulationIn, Tier,
+)
+from app.services.sales import pricing
+from app.services.sales.pricing import PricingError
+
+pytestmark = pytest.mark.asyncio
+
+DAY = datetime.date(2026, 6, 1)
+VALID = {"valid_from": datetime.date(2026, 1, 1), "valid_to": datetime.date(2026, 12, 31)}
+
+
+@pytest.fixture(autouse=True)
+def fresh_books():
+    # Versions restart with every test database
+    pricing.books._books.clear()
+
+
+async def _setup(db):
+    retail = await master.create_customer(db, CustomerCreate(code="C1", name="Retail", customer_group="RETAIL"))
+    wholesale = await master.create_customer(db, CustomerCreate(code="C2", name="Wholesale", customer_group="WHOLESALE"))
+    widget = await master.create_product(db, ProductCreate(sku="W-1", name="Widget", list_price=Decimal("10.00")))
+    bolt = await master.create_product(db, ProductCreate(sku="B-1", name="Bolt", list_price=Decimal("3.00")))
+    await pricing_crud.create_rule(db, PricingRuleCreate(
+        code="TIER", name="Volume tiers", rule_type=PricingRuleType.tiered_pricing, product_ids=[widget.id],
+        tiers=[
+            Tier(min_qty=Decimal("10"), max_qty=Decimal("49"), discount=Decimal("10")),
+            Tier(min_qty=Decimal("50"), discount=Decimal("20")),
+        ],
+        **VALID,
+    ))
+    await pricing_crud.create_rule(db, PricingRuleCreate(
+        code="WHOLE", name="Wholesale price", rule_type=PricingRuleType.fixed_price, value=Decimal("7.50"),
+        customer_groups=["WHOLESALE"], product_ids=[widget.id], min_quantity=Decimal("100"), **VALID,
+    ))
+    await pricing_crud.create_scheme(db, DiscountSchemeCreate(
+        code="BIG", name="Big order", discount_type=DiscountType.percentage, value=Decimal("5"),
+        min_order_value=Decimal("500"), **VALID,
+    ))
+    await pricing_crud.create_scheme(db, DiscountSchemeCreate(
+        code="B2G1", name="Buy 2 get 1", discount_type=DiscountType.buy_x_get_y, buy_quantity=2, get_quantity=1,
+        product_ids=[bolt.id], **VALID,
+    ))
+    return retail, wholesale, widget, bolt
+
+
+async def _quote(db, customer, *lines):
+    return await pricing.quote(db, QuoteIn(
+        customer_id=customer.id, pricing_date=DAY,
+        lines=[QuoteLineIn(product_id=product.id, quantity=Decimal(quantity)) for product, quantity in lines],
+    ))
+
+
+async def test_quantity_breaks_pick_the_tier(db):
+    retail, _, widget, _ = await _setup(db)
+    quote = await _quote(db, retail, (widget, 9), (widget, 10), (widget, 49), (widget, 50))
+
+    assert [(line.rule_code, line.rule_price) for line in quote.lines] == [
+        (None, Decimal("10.00")), ("TIER", Decimal("9.00")), ("TIER", Decimal("9.00")), ("TIER", Decimal("8.00")),
+    ]
+    # 10 and 49 fall in the same break: resolved once
+    book = await pricing.price_book(db, DAY)
+    assert (book.resolutions, book.reuses) == (3, 1)
+
+
+async def test_lowest_price_wins_and_order_value_discount(db):
+    retail, wholesale, widget, _ = await _setup(db)
+
+    quote = await _quote(db, wholesale, (widget, 100))
+    line = quote.lines[0]
+    assert (line.rule_code, line.rule_price) == ("WHOLE", Decimal("7.50"))
+    assert [(d.code, d.amount) for d in line.discounts] == [("BIG", Decimal("37.50"))]
+    assert quote.total == Decimal("712.50")
+
+    # 9 × 10.00 + 10 × 9.00 stays below the 500 minimum order value
+    quote = await _quote(db, retail, (widget, 9), (widget, 10))
+    assert (quote.order_value, quote.discount_total, quote.total) == (Decimal("180.00"), Decimal("0"), Decimal("180.00"))
+
+
+async def test_buy_x_get_y_and_version_bump(db):
+    retail, _, _, bolt = await _setup(db)
+    line = (await _quote(db, retail, (bolt, 7))).lines[0]
+    assert [(d.code, d.amount) for d in line.discounts] == [("B2G1", Decimal("6.00"))]
+    assert line.amount == Decimal("15.00")
+
+    scheme = (await db.execute(pricing_crud.scheme_list_query())).scalars().all()[-1]
+    await pricing_crud.delete_scheme(db, scheme.id)
+    line = (await _quote(db, retail, (bolt, 7))).lines[0]
+    assert (line.discounts, line.amount) == ([], Decimal("21.00"))
+
+
+async def test_simulation_reports_unknown_inputs(db):
+    retail, _, widget, _ = await _setup(db)
+    result = await pricing.simulate(db, SimulationIn(pricing_date=DAY, cases=[
+        SimulationCase(product_id=widget.id, quantity=Decimal("50"), customer_group="RETAIL"),
+        SimulationCase(product_id=999, quantity=Decimal("1")),
+    ]))
+    assert (result.results[0].final_price, result.results[0].discount_percent) == (Decimal("8.0000"), Decimal("20.00"))
+    assert result.results[1].error == "Unknown or inactive product 999"
+
+    with pytest.raises(PricingError):
+        await pricing.quote(db, QuoteIn(customer_id=999, lines=[QuoteLineIn(product_id=widget.id, quantity=1)]))
@@ -0,0 +1,51 @@
+# app/tests/test_rbac.py
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from httpx import ASGITransport, AsyncClient
+
+from app.api.deps import get_current_user
+from app.constants.roles import ROLES
+from app.core.security import create_access_token
+from app.models.user import User
+from app.services.rbac import RBACMiddleware
+
+
+def _token(user_id: int, role: int) -> str:
+    return create_access_token({"sub": str(user_id), "role": role}, expires_delta=timedelta(minutes=5))
+
+
+async def _endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+@pytest.mark.asyncio
+async def test_middleware_decides_from_the_role_claim():
+    # No db or redis fixture: the middleware must not need either
+    client = AsyncClient(transport=ASGITransport(app=RBACMiddleware(_endpoint, prefix="/api")), base_url="http://t")
+    async with client:
+        async def status(path, role):
+            headers = {} if role is None else {"Authorization": f"Bearer {_token(1, role)}"}
+            return (await client.get(path, headers=headers)).status_code
+
+        assert await status("/api/finance/ledger/accounts/7", ROLES.FINANCE_MANAGER) == 200
+        assert await status("/api/finance/ledger/accounts/7", ROLES.SALES_REP) == 403
+        assert await status("/api/finance/ledger", ROLES.SUPER_ADMIN) == 200
+        assert await status("/api/finance/ledger", 12345) == 401
+        assert await status("/api/finance/ledger", None) == 401
+        # Outside every module: left to the route's own dependencies
+        assert await status("/api/users/me", None) == 200
+
+
+@pytest.mark.asyncio
+async def test_token_from_before_a_role_change_is_rejected(db, redis):
+    user = User(email="fm@example.com", name="FM", hashed_password="x", role=ROLES.SALES_REP)
+    db.add(user)
+    await db.commit()
+
+    assert (await get_current_user(_token(user.id, ROLES.SALES_REP), db, redis)).id == user.id
+    with pytest.raises(HTTPException) as raised:
+        await get_current_user(_token(user.id, ROLES.FINANCE_MANAGER), db, redis)
+    assert raised.value.status_code == 401
@@ -0,0 +1,149 @@
+# app/tests/test_reconciliation.py
+import datetime
+import io
+import random
+from decimal import Decimal
+
+import pytest
+
+from app.crud.finance import bank as bank_crud, ledger
+from app.models.finance.bank import StatementFormat
+from app.models.finance.ledger import AccountType
+from app.schemas.finance.bank import ReconciliationRules
+from app.schemas.finance.ledger import AccountCreate, JournalEntryCreate, JournalLineIn
+from app.services.finance.reconciliation import Candidate, _groups, match_lines, unmatched_residue
+
+DAY = 740_000
+
+
+def _greedy(bank, gl, window, tolerance):
+    """One-to-one passes by brute force, same order and tie-breaks as the indexes."""
+    free = list(gl)
+    matches = []
+    for rule, limit in (("amount_date", 0), ("tolerance", tolerance)):
+        if rule == "tolerance" and not tolerance:
+            break
+        for line in sorted(bank, key=lambda c: (c.day, c.id)):
+            if any(line.id in bank_ids for _, bank_ids, _ in matches):
+                continue
+            options = [
+                g for g in free
+                if abs(g.cents - line.cents) <= limit and abs(g.day - line.day) <= window
+                and (g.cents > 0) == (line.cents > 0)
+            ]
+            if options:
+                best = min(options, key=lambda g: (
+                    abs(g.cents - line.cents), abs(g.day - line.day), g.day < line.day,
+                    -g.id if g.day < line.day else g.id,
+                ))
+                free.remove(best)
+                matches.append((rule, [line.id], [best.id]))
+    return matches
+
+
+def _rescanning_groups(singles, pool, window, tolerance, max_size):
+    """Many-to-one by rescanning every option for every line."""
+    taken, groups = set(), []
+    for single in singles:
+        inflow = single.cents > 0
+        options = [[c for c in pool if single.reference and c.reference == single.reference
+                    and abs(c.day - single.day) <= window and (c.cents > 0) == inflow]]
+        for offset in sorted(range(-window, window + 1), key=abs):
+            options.append([c for c in pool if c.day == single.day + offset and (c.cents > 0) == inflow])
+        for option in options:
+            group = [c for c in option if c.id not in taken]
+            if 2 <= len(group) <= max_size and abs(sum(c.cents for c in group) - single.cents) <= tolerance:
+                taken.update(c.id for c in group)
+                groups.append(("many_to_one", [single.id], [c.id for c in group]))
+                break
+    return groups
+
+
+def test_passes_run_strictest_first():
+    bank = [
+        Candidate(1, DAY, 10_000, "INV7"),
+        Candidate(2, DAY, 2_500, ""),
+        Candidate(3, DAY + 1, 9_990, ""),
+        Candidate(4, DAY + 2, 30_000, ""),
+    ]
+    gl = [
+        Candidate(11, DAY - 1, 10_000, ""),
+        Candidate(12, DAY + 2, 10_000, "INV7"),
+        Candidate(13, DAY + 3, 2_500, ""),
+        Candidate(14, DAY, 10_000, ""),
+        Candidate(15, DAY + 3, 20_000, ""),
+        Candidate(16, DAY + 3, 10_000, ""),
+    ]
+    rules = ReconciliationRules(amount_tolerance=Decimal("0.50"))
+    assert match_lines(bank, gl, rules) == [
+        ("reference", [1], [12]),
+        ("amount_date", [2], [13]),
+        ("tolerance", [3], [14]),
+        ("many_to_one", [4], [15, 16]),
+    ]
+
+
+def test_indexes_agree_with_brute_force():
+    rng = random.Random(5)
+    for _ in range(20):
+        bank = [Candidate(i, DAY + rng.randrange(30), rng.choice([-1, 1]) * rng.randrange(1, 40) * 25, "") for i in range(150)]
+        gl = [Candidate(i, DAY + rng.randrange(30), rng.choice([-1, 1]) * rng.randrange(1, 40) * 25, "") for i in range(150)]
+        rules = ReconciliationRules(amount_tolerance=Decimal("0.50"), use_reference=False, many_to_one=False)
+        assert match_lines(bank, gl, rules) == _greedy(bank, gl, rules.date_window_days, 50)
+
+
+def test_crowded_amount_matches_every_line():
+    # Thousands of identical payments on one day: lookups must not walk
+    # over the ones already matched
+    bank = [Candidate(i, DAY, -4_999, "") for i in range(5000)]
+    gl = [Candidate(i, DAY + i % 2, -4_999, "") for i in range(5000)]
+    rules = ReconciliationRules(use_reference=False, many_to_one=False)
+    matches = match_lines(bank, gl, rules)
+    assert len(matches) == 5000
+    assert len({gl_ids[0] for _, _, gl_ids in matches}) == 5000
+
+
+def test_groups_agree_with_a_rescan():
+    rng = random.Random(11)
+    for _ in range(30):
+        pool = [Candidate(i, DAY + rng.randrange(6), rng.choice([-1, 1]) * rng.randrange(1, 6) * 1_000,
+                          rng.choice(["", "B1", "B2"])) for i in range(40)]
+        singles = [Candidate(100 + i, DAY + rng.randrange(6), rng.choice([-1, 1]) * rng.randrange(2, 12) * 1_000
+                             + rng.randrange(-15, 15), rng.choice(["", "B1", "B2"])) for i in range(20)]
+        taken_pool = {c.id for c in pool if rng.random() < 0.2}
+        groups = [
+            ("many_to_one", [single.id], [c.id for c in group])
+            for single, group in _groups(singles, pool, set(), set(taken_pool), 3, 10, 4)
+        ]
+        free = [c for c in pool if c.id not in taken_pool]
+        assert groups == _rescanning_groups(singles, free, 3, 10, 4)
+
+
+def test_busy_day_groups_without_rescans():
+    # One deposit slip settling 200 payments, behind 5000 lines of the same
+    # day that fit nothing
+    gl = [Candidate(i, DAY, 100, "") for i in range(200)]
+    bank = [Candidate(10_000 + i, DAY, 7, "") for i in range(5000)] + [Candidate(20_000, DAY, 20_000, "")]
+    gl += [Candidate(1_000 + i, DAY + 1, 3, "") for i in range(2)]
+    rules = ReconciliationRules(use_reference=False, date_window_days=0, max_group_size=200)
+    matches = match_lines(bank, gl, rules)
+    assert matches == [("many_to_one", [20_000], list(range(200)))]
+
+
+@pytest.mark.asyncio
+async def test_residue_lists_are_capped_but_totals_are_not(db):
+    cash = await ledger.create_account(db, AccountCreate(code="1000", name="Cash", type=AccountType.cash))
+    sales = await ledger.create_account(db, AccountCreate(code="4000", name="Sales", type=AccountType.income))
+    csv = "Date,Amount\n" + "".join(f"2026-03-0{day},{day}.50\n" for day in range(1, 6))
+    await bank_crud.import_statement(db, cash.id, StatementFormat.csv, "s.csv", io.BytesIO(csv.encode()), "tester")
+    for day in range(1, 4):
+        await ledger.create_entry(db, JournalEntryCreate(entry_date=datetime.date(2026, 3, day), lines=[
+            JournalLineIn(account_id=cash.id, debit=Decimal(day * 10)),
+            JournalLineIn(account_id=sales.id, credit=Decimal(day * 10)),
+        ], post=True), "tester")
+
+    residue = await unmatched_residue(db, cash.id, limit=2)
+    assert [line.booking_date.day for line in residue.bank_lines] == [1, 2]
+    assert [line.entry_date.day for line in residue.gl_lines] == [1, 2]
+    assert (residue.bank_count, residue.bank_total) == (5, Decimal("17.50"))
+    assert (residue.gl_count, residue.gl_total) == (3, Decimal("60.00"))
@@ -0,0 +1,43 @@
+# app/tests/test_report_cache.py
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.report_cache import TaggedCache
+from app.crud.finance import ledger
+from app.models.finance.ledger import AccountType
+from app.schemas.finance.ledger import AccountCreate
+from app.services.finance import statements
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_fill_racing_an_invalidation_is_not_stored(db, redis):
+    cache = TaggedCache("test", 60)
+
+    async def stale(_):
+        # A posting lands while the report is being built
+        await cache.invalidate(redis, ["gl:period:202601"])
+        return "before"
+
+    async def fresh(_):
+        return "after"
+
+    assert await cache.get_or_set(redis, "pnl", ["gl:period:202601"], stale) == "before"
+    assert await cache.get_or_set(redis, "pnl", ["gl:period:202601"], fresh) == "after"
+    assert await cache.get_or_set(redis, "pnl", ["gl:period:202601"], stale) == "after"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+async def test_new_account_drops_cached_balance_sheets(db, redis):
+    as_of = datetime.date.today().replace(day=1) - datetime.timedelta(days=1)
+    await ledger.create_account(db, AccountCreate(code="1000", name="Cash", type=AccountType.cash, opening=Decimal("100")))
+    await ledger.create_account(db, AccountCreate(code="3000", name="Capital", type=AccountType.equity, opening=Decimal("-100")))
+    before = await statements.balance_sheet_json(db, redis, as_of)
+
+    await ledger.create_account(db, AccountCreate(code="1100", name="Bank", type=AccountType.bank, opening=Decimal("50")))
+    assert await statements.balance_sheet_json(db, redis, as_of) == before
+    await statements.invalidate_for_accounts(redis)
+    after = await statements.balance_sheet_json(db, redis, as_of)
+    assert after != before and '"1100"' in after
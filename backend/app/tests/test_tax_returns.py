@@ -0,0 +1,83 @@
+# app/tests/test_tax_returns.py
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.crud.finance import open_items, tax
+from app.models.finance.open_items import Subledger
+from app.models.finance.tax import ReturnFormat, TaxReturnStatus
+from app.schemas.finance.open_items import OpenItemCreate
+from app.schemas.finance.tax import TaxLineIn, TaxReturnCreate
+from app.services.finance import tax_returns
+
+pytestmark = pytest.mark.asyncio
+
+TODAY = datetime.date.today()
+
+
+@pytest.fixture(autouse=True)
+def return_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TAX_RETURN_DIR", str(tmp_path))
+
+
+async def _return(db):
+    await open_items.create_item(db, Subledger.ap, OpenItemCreate(
+        party_code="V1", document_number="B-1", issue_date=TODAY, due_date=TODAY, amount=Decimal("118"),
+        tax_lines=[TaxLineIn(tax_code="GST18", rate=Decimal("18"), place_of_supply="KA",
+                             taxable_amount=Decimal("100"), tax_amount=Decimal("18"))],
+    ))
+    return await tax.create_return(db, TaxReturnCreate(from_date=TODAY, to_date=TODAY, format=ReturnFormat.json), "tester")
+
+
+async def test_worker_writes_a_queued_return_once(db, redis):
+    tax_return = await _return(db)
+    assert tax_return.status == TaxReturnStatus.queued
+    await tax_returns.enqueue(redis, tax_return.id)
+
+    return_id = int(await redis.rpop(tax_returns.QUEUE_KEY))
+    assert await tax_returns.run_return(redis, return_id) == TaxReturnStatus.completed
+    # A second queue entry for the same return does nothing
+    assert await tax_returns.run_return(redis, return_id) is None
+    await db.refresh(tax_return)
+    assert (tax_return.lines, tax_return.input_taxable, tax_return.input_tax) == (1, Decimal("100"), Decimal("18"))
+    with open(tax_returns.return_path(tax_return)) as f:
+        assert [row["document_number"] for row in json.load(f)["documents"]] == ["B-1"]
+    assert not await redis.exists(tax_returns.lock_key(return_id))
+
+
+async def test_sweep_fails_abandoned_returns_for_retry(db, redis):
+    tax_return = await _return(db)
+    tax_return.status = TaxReturnStatus.running
+    await db.commit()
+    # Held by a live worker: left alone
+    await redis.set(tax_returns.lock_key(tax_return.id), "token")
+    assert await tax_returns.sweep(redis) == 0
+
+    await redis.delete(tax_returns.lock_key(tax_return.id))
+    assert await tax_returns.sweep(redis) == 1
+    await db.refresh(tax_return)
+    assert (tax_return.status, tax_return.error) == (
+        TaxReturnStatus.failed, "Interrupted: the tax return worker stopped",
+    )
+
+    await tax.retry_return(db, tax_return)
+    with pytest.raises(tax.TaxReturnError):
+        await tax.retry_return(db, tax_return)
+    assert await tax_returns.run_return(redis, tax_return.id) == TaxReturnStatus.completed
+
+
+async def test_sweep_queues_lost_returns_again(db, redis):
+    tax_return = await _return(db)
+    # Never reached the queue (the enqueue after the commit failed)
+    tax_return.created_at = datetime.datetime.now() - datetime.timedelta(seconds=settings.TAX_RETURN_SWEEP_SECONDS + 1)
+    await db.commit()
+    await redis.set(tax_returns.lock_key(tax_return.id), "token")
+    assert await tax_returns.sweep(redis) == 0
+
+    await redis.delete(tax_returns.lock_key(tax_return.id))
+    assert await tax_returns.sweep(redis) == 1
+    assert await tax_returns.sweep(redis) == 0
+    assert await redis.lrange(tax_returns.QUEUE_KEY, 0, -1) == [str(tax_return.id)]
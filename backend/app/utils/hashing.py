@@ -0,0 +1,108 @@
+# app/utils/hashing.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.core.security import pwd_context
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing queue is full")
+        self.retry_after = retry_after
+
+
+# ------------------------------------------------------------------
+# Bounded bcrypt executor
+# ------------------------------------------------------------------
+class PasswordHasher:
+    """
+    Runs bcrypt in a small thread pool (bcrypt releases the GIL), so a
+    login storm only occupies ``workers`` threads instead of the event loop.
+    At most ``workers + queue_depth`` calls may be in flight; the rest are
+    rejected immediately rather than piling up behind each other.
+    """
+
+    def __init__(self, workers: int, queue_depth: int, retry_after: int):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+
+        self.completed = 0
+        self.rejected = 0
+        self.rehashed = 0
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        if self._in_flight >= self.workers + self.queue_depth:
+            self.rejected += 1
+            raise PasswordHashingBusy(self.retry_after)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bcrypt"
+            )
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, fn, *args
+            )
+        finally:
+            self._in_flight -= 1
+            self.completed += 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(pwd_context.verify, password, hashed_password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """Verify; on success also return a new hash if the stored one uses fewer rounds."""
+        verified, new_hash = await self._run(
+            pwd_context.verify_and_update, password, hashed_password
+        )
+        if new_hash is not None:
+            self.rehashed += 1
+        return verified, new_hash
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queue_depth": self.queue_depth,
+            "in_flight": self._in_flight,
+            "queued": max(0, self._in_flight - self.workers),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "rehashed": self.rehashed,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_depth=settings.PASSWORD_HASH_QUEUE_DEPTH,
+    retry_after=settings.PASSWORD_HASH_RETRY_AFTER_SECONDS,
+)
+
+
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Server busy, please retry shortly."},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
@@ -0,0 +1,108 @@
+# benchmarks/aging.py
+"""
+AR aging: full snapshot rebuild vs. intraday refresh after a few payments.
+
+Seeds open items straight into the configured database (default: a temp
+SQLite file; pass --database-url for Postgres, where the numbers matter):
+
+    python benchmarks/aging.py --items 200000 --parties 5000 --changed 200
+    python benchmarks/aging.py --database-url postgresql+psycopg://... --items 2000000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert, update
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.open_items import OpenItem, OpenItemStatus, Subledger
+    from app.services.finance.aging import refresh_snapshot
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    as_of = datetime.date.today()
+    # Seeded items last changed yesterday, so only --changed count as new
+    yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        for offset in range(0, args.items, 10_000):
+            rows = []
+            for n in range(offset, min(offset + 10_000, args.items)):
+                due = as_of - datetime.timedelta(days=rng.randint(-30, 180))
+                amount = rng.randint(100, 1_000_000) / 100
+                rows.append({
+                    "ledger": Subledger.ar,
+                    "party_code": f"C{rng.randint(1, args.parties)}",
+                    "document_number": f"BENCH-{n}",
+                    "issue_date": due - datetime.timedelta(days=30),
+                    "due_date": due,
+                    "amount": amount,
+                    "balance": amount,
+                    "status": OpenItemStatus.open,
+                    "updated_at": yesterday,
+                })
+            await db.execute(insert(OpenItem), rows)
+        await db.commit()
+    seed_seconds = time.perf_counter() - started
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        await refresh_snapshot(db, Subledger.ar, as_of, full=True)
+        full_seconds = time.perf_counter() - started
+
+        changed = rng.sample(range(1, args.items + 1), args.changed)
+        await db.execute(
+            update(OpenItem)
+            .where(OpenItem.id.in_(changed))
+            .values(balance=0, status=OpenItemStatus.paid)
+        )
+        await db.commit()
+
+        started = time.perf_counter()
+        await refresh_snapshot(db, Subledger.ar, as_of)
+        incremental_seconds = time.perf_counter() - started
+
+    await dispose_engines()
+    return {
+        "items": args.items,
+        "parties": args.parties,
+        "changed_items": args.changed,
+        "seed_s": round(seed_seconds, 3),
+        "full_snapshot_s": round(full_seconds, 3),
+        "incremental_refresh_s": round(incremental_seconds, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="AR aging snapshot benchmark")
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--parties", type=int, default=5_000)
+    parser.add_argument("--changed", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/aging.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# benchmarks/atp.py
+"""
+Available-to-promise over a synthetic stock ledger: an order-entry
+session of single and whole-order checks, with reservations posted in
+between. Compares the in-place timelines against filtering the whole
+movement list per check, as the ATP page did.
+
+    python benchmarks/atp.py --products 5000 --movements 500000
+    python benchmarks/atp.py --database-url postgresql+psycopg://... --checks 1000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+TODAY = datetime.date(2026, 11, 1)
+
+
+def scan_check(movements, product_id, quantity, required_date):
+    """One pass over every movement per check (the ATP page's committed/planned receipt filters)."""
+    on_hand = committed = planned = Decimal(0)
+    for movement_product, kind, due_date, movement_quantity in movements:
+        if movement_product != product_id:
+            continue
+        if kind == "receipt":
+            on_hand += movement_quantity
+        elif kind == "issue":
+            on_hand -= movement_quantity
+        elif kind == "reservation":
+            committed += movement_quantity
+        elif due_date <= required_date:
+            planned += movement_quantity
+    return on_hand - committed + planned >= quantity
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert, select
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.sales.master import Product
+    from app.models.sales.stock import MovementType, StockMovement
+    from app.schemas.sales.stock import ATPCheckIn, ATPOrderIn, StockMovementCreate
+    from app.crud.sales.stock import create_movement
+    from app.services.sales import atp
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    kinds = [MovementType.receipt] * 2 + [MovementType.issue, MovementType.planned_receipt] + [MovementType.reservation] * 3
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Product), [
+            {"id": n + 1, "sku": f"SKU{n:06d}", "name": f"Product {n}", "list_price": 10} for n in range(args.products)
+        ])
+        rows = [
+            {"product_id": rng.randint(1, args.products), "movement_type": rng.choice(kinds),
+             "quantity": rng.randint(1, 50), "due_date": TODAY + datetime.timedelta(days=rng.randint(-30, 120))}
+            for _ in range(args.movements)
+        ]
+        for offset in range(0, len(rows), 20_000):
+            await db.execute(insert(StockMovement), rows[offset:offset + 20_000])
+        await db.commit()
+
+        movements = [
+            (product_id, kind.value, due_date, quantity)
+            for product_id, kind, due_date, quantity in (await db.execute(select(
+                StockMovement.product_id, StockMovement.movement_type, StockMovement.due_date, StockMovement.quantity,
+            ))).all()
+        ]
+
+    # Hot products: order entry keeps asking about the same few hundred
+    hot = rng.sample(range(1, args.products + 1), min(args.products, args.hot_products))
+    checks = [
+        (rng.choice(hot), Decimal(rng.randint(1, 200)), TODAY + datetime.timedelta(days=rng.randint(0, 60)))
+        for _ in range(args.checks)
+    ]
+
+    scan_ms = []
+    for product_id, quantity, required_date in checks[:args.scan_checks]:
+        started = time.perf_counter()
+        scan_check(movements, product_id, quantity, required_date)
+        scan_ms.append((time.perf_counter() - started) * 1000)
+
+    check_ms, post_ms = [], []
+    async with AsyncSessionLocal() as db:
+        for n, (product_id, quantity, required_date) in enumerate(checks):
+            started = time.perf_counter()
+            result = await atp.check(db, ATPCheckIn(product_id=product_id, quantity=quantity, required_date=required_date))
+            check_ms.append((time.perf_counter() - started) * 1000)
+            if n % args.reserve_every == 0:
+                started = time.perf_counter()
+                await create_movement(db, StockMovementCreate(
+                    product_id=product_id, movement_type=MovementType.reservation, quantity=quantity,
+                    due_date=result.promised_date or required_date,
+                ), user="bench")
+                post_ms.append((time.perf_counter() - started) * 1000)
+
+        order_ms = []
+        for _ in range(args.orders):
+            order_in = ATPOrderIn(required_date=TODAY + datetime.timedelta(days=14), lines=[
+                {"product_id": rng.choice(hot), "quantity": rng.randint(1, 100)} for _ in range(args.lines)
+            ])
+            started = time.perf_counter()
+            await atp.check_order(db, order_in)
+            order_ms.append((time.perf_counter() - started) * 1000)
+
+    await dispose_engines()
+    stats = atp.timelines.stats()
+    return {
+        "products": args.products,
+        "movements": args.movements,
+        "scan_checks": len(scan_ms),
+        "scan_ms_per_check": round(statistics.median(scan_ms), 3),
+        "checks": len(check_ms),
+        "timeline_first_check_ms": round(check_ms[0], 3),
+        "timeline_ms_per_check": round(statistics.median(check_ms), 3),
+        "reservation_post_ms": round(statistics.median(post_ms), 3),
+        "orders": args.orders,
+        "lines_per_order": args.lines,
+        "order_check_ms": round(statistics.median(order_ms), 3),
+        "timelines_loaded": stats["loads"],
+        "movements_applied_in_place": stats["applied"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Available-to-promise timelines vs. movement scans")
+    parser.add_argument("--products", type=int, default=5000)
+    parser.add_argument("--movements", type=int, default=500_000)
+    parser.add_argument("--hot-products", type=int, default=300)
+    parser.add_argument("--checks", type=int, default=500)
+    parser.add_argument("--scan-checks", type=int, default=50)
+    parser.add_argument("--reserve-every", type=int, default=5)
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=21)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/atp.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+# benchmarks/billing.py
+"""
+Month-end billing run over synthetic open orders: the bulk run (batched
+invoice/open-item/status/exposure statements, then PDFs rendered across
+the process pool into a ZIP) against invoicing one order at a time the
+way the invoice page did – number, AR item, status change and commit per
+order – timed on a sample and extrapolated.
+
+    python benchmarks/billing.py --orders 50000
+    python benchmarks/billing.py --database-url postgresql+psycopg://... --orders 50000 --workers 8
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+BILLING_DATE = datetime.date(2026, 10, 31)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import func, insert, select, update
+
+    from app.core.config import settings
+    from app.crud.finance.open_items import create_item
+    from app.crud.sales import analytics as rollups
+    from app.crud.sales import credit
+    from app.crud.sales.billing import create_run
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.open_items import Subledger
+    from app.models.sales.credit import CreditExposure
+    from app.models.sales.master import Customer, Product
+    from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+    from app.schemas.finance.open_items import OpenItemCreate
+    from app.schemas.sales.billing import BillingRunCreate
+    from app.services.numbering import document_numbers
+    from app.services.sales import billing
+
+    settings.BILLING_OUTPUT_DIR = args.output_dir
+    if args.workers:
+        settings.BILLING_WORKERS = args.workers
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    first_day = BILLING_DATE.replace(day=1)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Customer), [
+            {"id": n, "code": f"C{n:06d}", "name": f"Customer {n} Trading Co.", "customer_group": "retail"}
+            for n in range(1, args.customers + 1)
+        ])
+        await db.execute(insert(Product), [
+            {"id": n, "sku": f"SKU{n:06d}", "name": f"Product {n}", "list_price": 10} for n in range(1, args.products + 1)
+        ])
+        orders, lines = [], []
+        for order_id in range(1, args.orders + 1):
+            total = Decimal(0)
+            for line_no in range(1, rng.randint(1, 2 * args.lines - 1) + 1):
+                quantity, price = rng.randint(1, 20), Decimal(rng.randint(100, 10_000)) / 100
+                amount = quantity * price
+                total += amount
+                lines.append({"order_id": order_id, "line_no": line_no, "product_id": rng.randint(1, args.products),
+                              "quantity": quantity, "unit_price": price, "amount": amount})
+            orders.append({
+                "id": order_id, "order_number": f"SO{order_id:08d}", "customer_id": rng.randint(1, args.customers),
+                "order_date": first_day + datetime.timedelta(days=rng.randrange(BILLING_DATE.day)),
+                "status": SalesOrderStatus.open, "total": total,
+            })
+        for offset in range(0, len(orders), 20_000):
+            await db.execute(insert(SalesOrder), orders[offset:offset + 20_000])
+        for offset in range(0, len(lines), 20_000):
+            await db.execute(insert(SalesOrderLine), lines[offset:offset + 20_000])
+        open_orders = {}
+        for order in orders:
+            open_orders[order["customer_id"]] = open_orders.get(order["customer_id"], 0) + order["total"]
+        await db.execute(insert(CreditExposure), [
+            {"customer_id": n, "open_orders": open_orders.get(n, 0)} for n in range(1, args.customers + 1)
+        ])
+        await db.commit()
+        await rollups.rebuild(db)
+
+        # One order at a time: number, AR item, status, exposure, commit
+        started = time.perf_counter()
+        for order in orders[:args.baseline_orders]:
+            number = await document_numbers.next_number("INV", year=BILLING_DATE.year)
+            await rollups.post_orders(db, [order["id"]], -1)
+            await db.execute(
+                update(SalesOrder).where(SalesOrder.id == order["id"]).values(status=SalesOrderStatus.invoiced)
+            )
+            await rollups.post_orders(db, [order["id"]])
+            await credit.shift_orders(db, order["customer_id"], -order["total"])
+            await create_item(db, Subledger.ar, OpenItemCreate(
+                party_code=f"C{order['customer_id']:06d}", document_number=number, issue_date=BILLING_DATE,
+                due_date=BILLING_DATE + datetime.timedelta(days=30), amount=order["total"],
+            ))
+        per_order_ms = (time.perf_counter() - started) * 1000 / max(args.baseline_orders, 1)
+
+        run = await create_run(db, BillingRunCreate(billing_date=BILLING_DATE), user="bench")
+        started = time.perf_counter()
+        await billing.bill_orders(db, run)
+        bill_s = time.perf_counter() - started
+        started = time.perf_counter()
+        documents = await billing.write_documents(db, run)
+        render_s = time.perf_counter() - started
+        still_open = (await db.execute(
+            select(func.count()).select_from(SalesOrder).where(SalesOrder.status == SalesOrderStatus.open)
+        )).scalar_one()
+        path = billing.run_path(run)
+
+    billing.shutdown_pool()
+    await dispose_engines()
+    return {
+        "orders": args.orders,
+        "order_lines": len(lines),
+        "cpus": os.cpu_count(),
+        "render_workers": settings.BILLING_WORKERS,
+        "one_at_a_time_ms_per_order": round(per_order_ms, 3),
+        "one_at_a_time_est_s": round(per_order_ms * (args.orders - args.baseline_orders) / 1000, 1),
+        "run_invoices": run.invoices,
+        "run_bill_s": round(bill_s, 2),
+        "run_render_s": round(render_s, 2),
+        "run_total_s": round(bill_s + render_s, 2),
+        "documents": documents,
+        "archive_mb": round(path.stat().st_size / 2**20, 1),
+        "orders_left_open": still_open,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk billing run vs. invoicing order by order")
+    parser.add_argument("--orders", type=int, default=50_000)
+    parser.add_argument("--customers", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=3, help="average lines per order")
+    parser.add_argument("--baseline-orders", type=int, default=300, help="orders invoiced one at a time first")
+    parser.add_argument("--workers", type=int, help="render processes (default: BILLING_WORKERS)")
+    parser.add_argument("--seed", type=int, default=24)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    args.output_dir = os.path.join(scratch, "invoices")
+    os.environ["DATABASE_URL_OVERRIDE"] = args.database_url or f"sqlite+aiosqlite:///{scratch}/billing.db"
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
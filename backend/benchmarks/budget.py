@@ -0,0 +1,140 @@
+# benchmarks/budget.py
+"""
+Budget vs. actual over a synthetic account × cost centre × month cube:
+cube load, variance report, and a planning session of distinct what-if
+scenarios computed on the loaded cube.
+
+    python benchmarks/budget.py --accounts 200 --cost-centers 50
+    python benchmarks/budget.py --database-url postgresql+psycopg://... --accounts 1000 --cost-centers 200
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.budget import Budget, BudgetLine
+    from app.models.finance.ledger import Account, AccountType, JournalEntry, JournalLine, JournalStatus
+    from app.schemas.finance.budget import BudgetGrouping, ForecastMethod, ScenarioIn, ScenarioAdjustment
+    from app.services.finance import budgeting
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    centers = [f"CC{n:03d}" for n in range(args.cost_centers)]
+    budget_months = [202601 + n for n in range(12)]
+    history_months = [202501 + n for n in range(12)] + budget_months[:9]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Account), [
+            {"id": n + 1, "code": f"{6000 + n}", "name": f"Account {n}",
+             "type": AccountType.income if n % 10 == 0 else AccountType.expense}
+            for n in range(args.accounts)
+        ])
+        await db.execute(insert(Budget), [{"id": 1, "name": "FY26", "from_period": 202601, "to_period": 202612, "version": 1}])
+        lines = [
+            {"budget_id": 1, "account_id": account, "cost_center": center, "period": period,
+             "amount": rng.randint(1_000, 100_000)}
+            for account in range(1, args.accounts + 1)
+            for center in centers
+            for period in budget_months
+        ]
+        for offset in range(0, len(lines), 20_000):
+            await db.execute(insert(BudgetLine), lines[offset:offset + 20_000])
+
+        entry_id, journal = 0, []
+        for period in history_months:
+            entry_id += 1
+            await db.execute(insert(JournalEntry), [{
+                "id": entry_id, "entry_number": f"BENCH-{entry_id}", "status": JournalStatus.posted,
+                "entry_date": datetime.date(period // 100, period % 100, 15),
+            }])
+            for _ in range(args.lines_per_month):
+                journal.append({
+                    "entry_id": entry_id, "account_id": rng.randint(1, args.accounts),
+                    "cost_center": rng.choice(centers), "debit": rng.randint(100, 10_000), "credit": 0,
+                })
+            await db.execute(insert(JournalLine), journal)
+            journal = []
+        await db.commit()
+
+    def timed(fn, *a):
+        started = time.perf_counter()
+        result = fn(*a)
+        return result, (time.perf_counter() - started) * 1000
+
+    async with AsyncSessionLocal() as db:
+        budget = await db.get(Budget, 1)
+        started = time.perf_counter()
+        cube = await budgeting.load_cube(db, budget)
+        load_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        await budgeting.load_cube(db, budget)
+        reuse_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        await budgeting.variance_report(db, budget, 202609, BudgetGrouping.account)
+        variance_ms = (time.perf_counter() - started) * 1000
+
+    scenario_ms = []
+    for n in range(args.scenarios):
+        params = ScenarioIn(
+            cutoff=202609,
+            method=ForecastMethod.exponential_smoothing if n % 2 else ForecastMethod.moving_average,
+            window=1 + n % 6,
+            alpha=0.2 + (n % 7) / 10,
+            growth_percent=n % 5 - 2,
+            adjustments=[ScenarioAdjustment(cost_center=rng.choice(centers), percent=rng.randint(-20, 20))],
+            group_by=list(BudgetGrouping)[n % 3],
+        )
+        _, ms = timed(lambda: budgeting.run_scenario(cube, params).model_dump_json())
+        scenario_ms.append(ms)
+
+    await dispose_engines()
+    return {
+        "rows": len(cube.cost_centers),
+        "months": len(cube.periods),
+        "budget_lines": len(lines),
+        "journal_lines": args.lines_per_month * len(history_months),
+        "cube_load_s": round(load_seconds, 3),
+        "cube_reuse_ms": round(reuse_ms, 2),
+        "variance_report_ms": round(variance_ms, 2),
+        "scenarios": args.scenarios,
+        "scenario_ms_median": round(statistics.median(scenario_ms), 2),
+        "scenario_ms_max": round(max(scenario_ms), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Budget vs. actual and scenario benchmark")
+    parser.add_argument("--accounts", type=int, default=200)
+    parser.add_argument("--cost-centers", type=int, default=50)
+    parser.add_argument("--lines-per-month", type=int, default=20_000)
+    parser.add_argument("--scenarios", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=18)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/budget.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+# benchmarks/common.py
+"""Helpers shared by the benchmark scripts."""
+import statistics
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list[float], elapsed: float) -> dict:
+    """Throughput and latency percentiles (samples in milliseconds)."""
+    return {
+        "ops": len(samples),
+        "throughput_ops": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+    }
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/auth/login", data={"username": email, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
@@ -0,0 +1,113 @@
+# benchmarks/cost_allocation.py
+"""
+Reciprocal allocation: first solve, re-solve after one driver change,
+and another period on the same drivers.
+
+    python benchmarks/cost_allocation.py --centers 2000 --receivers 12
+    python benchmarks/cost_allocation.py --database-url postgresql+psycopg://... --centers 5000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert
+
+    from app.crud.finance.cost_allocation import set_drivers
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.cost_allocation import AllocationDriver, CostCenter, CostCenterKind
+    from app.models.finance.ledger import Account, AccountType, JournalEntry, JournalLine, JournalStatus
+    from app.schemas.finance.cost_allocation import DriverSet
+    from app.services.finance import cost_allocation
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    service_count = int(args.centers * args.service_share)
+    ids = list(range(1, args.centers + 1))
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(CostCenter), [
+            {
+                "id": i, "code": f"CC{i:05d}", "name": f"Centre {i}",
+                "kind": CostCenterKind.service if i <= service_count else CostCenterKind.production,
+                "is_active": True,
+            }
+            for i in ids
+        ])
+        drivers = []
+        for sender in range(1, service_count + 1):
+            for receiver in rng.sample([i for i in ids if i != sender], args.receivers):
+                drivers.append({"sender_id": sender, "receiver_id": receiver, "quantity": rng.randint(1, 100)})
+        await db.execute(insert(AllocationDriver), drivers)
+
+        await db.execute(insert(Account), [{"id": 1, "code": "6000", "name": "Overhead", "type": AccountType.expense}])
+        for n, period in enumerate((args.period, args.period - 1)):
+            day = datetime.date(period // 100, period % 100, 15)
+            await db.execute(insert(JournalEntry), [{
+                "id": n + 1, "entry_number": f"BENCH-{n}", "entry_date": day, "status": JournalStatus.posted,
+            }])
+            await db.execute(insert(JournalLine), [
+                {"entry_id": n + 1, "account_id": 1, "debit": rng.randint(100, 100_000), "credit": 0, "cost_center": f"CC{i:05d}"}
+                for i in ids
+            ])
+        await db.commit()
+
+    async def timed(coro):
+        started = time.perf_counter()
+        result = await coro
+        return result, round(time.perf_counter() - started, 4)
+
+    async with AsyncSessionLocal() as db:
+        first, first_seconds = await timed(cost_allocation.allocate(db, args.period))
+
+        receivers = {f"CC{i:05d}": 7 for i in rng.sample(ids[1:], args.receivers)}
+        await set_drivers(db, "CC00001", DriverSet(receivers=receivers))
+        changed, changed_seconds = await timed(cost_allocation.allocate(db, args.period))
+        _, other_period_seconds = await timed(cost_allocation.allocate(db, args.period - 1))
+
+    await dispose_engines()
+    return {
+        "centers": args.centers,
+        "service_centers": service_count,
+        "drivers": len(drivers),
+        "first_allocation_s": first_seconds,
+        "after_one_driver_change_s": changed_seconds,
+        "other_period_same_drivers_s": other_period_seconds,
+        "total_direct": str(first.total_direct),
+        "total_final": str(changed.total_final),
+        "solver": cost_allocation.solver.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reciprocal cost allocation benchmark")
+    parser.add_argument("--centers", type=int, default=2000)
+    parser.add_argument("--service-share", type=float, default=0.6)
+    parser.add_argument("--receivers", type=int, default=12)
+    parser.add_argument("--period", type=int, default=202608)
+    parser.add_argument("--seed", type=int, default=16)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/allocation.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
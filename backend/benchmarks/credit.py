@@ -0,0 +1,160 @@
+# benchmarks/credit.py
+"""
+Credit checks over a synthetic customer base: the exposure-table lookup
+against summing the customer's unpaid invoices and averaging its payment
+history per check, as the credit page did. Also times the bulk release
+of held orders after the limits are raised.
+
+    python benchmarks/credit.py --customers 5000 --invoices 500000
+    python benchmarks/credit.py --database-url postgresql+psycopg://... --held-orders 50000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+TODAY = datetime.date(2026, 11, 1)
+
+
+def scan_check(invoices, payments, code, limit, amount):
+    """One pass over every invoice and payment per check."""
+    exposure = sum((balance for party_code, balance, paid in invoices if party_code == code and not paid), Decimal(0))
+    days = [late for party_code, late in payments if party_code == code]
+    avg_days = sum(days) / len(days) if days else 0
+    return exposure + amount <= limit, avg_days
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert, select, update
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.open_items import OpenItem, OpenItemStatus, Subledger
+    from app.models.sales.credit import CreditExposure
+    from app.models.sales.master import Customer
+    from app.models.sales.orders import SalesOrder, SalesOrderStatus
+    from app.services.sales import credit
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    limits = {n + 1: Decimal(rng.randint(50, 500) * 1000) for n in range(args.customers)}
+    invoices, payments, items = [], [], []
+    for n in range(args.invoices):
+        customer_id = rng.randint(1, args.customers)
+        amount = Decimal(rng.randint(100, 20_000))
+        paid = rng.random() < 0.8
+        due_date = TODAY - datetime.timedelta(days=rng.randint(0, 365))
+        invoices.append((f"C{customer_id:06d}", Decimal(0) if paid else amount, paid))
+        if paid:
+            payments.append((f"C{customer_id:06d}", rng.randint(0, 90)))
+        items.append({
+            "ledger": Subledger.ar, "party_code": f"C{customer_id:06d}", "document_number": f"INV{n:08d}",
+            "issue_date": due_date - datetime.timedelta(days=30), "due_date": due_date, "amount": amount,
+            "balance": Decimal(0) if paid else amount, "status": OpenItemStatus.paid if paid else OpenItemStatus.open,
+        })
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Customer), [
+            {"id": customer_id, "code": f"C{customer_id:06d}", "name": f"Customer {customer_id}",
+             "customer_group": "retail", "credit_limit": limit}
+            for customer_id, limit in limits.items()
+        ])
+        await db.execute(insert(CreditExposure), [{"customer_id": customer_id} for customer_id in limits])
+        for offset in range(0, len(items), 20_000):
+            await db.execute(insert(OpenItem), items[offset:offset + 20_000])
+        orders = [
+            {"order_number": f"SO{n:08d}", "customer_id": rng.randint(1, args.customers), "order_date": TODAY,
+             "status": SalesOrderStatus.credit_hold, "total": Decimal(rng.randint(100, 5000))}
+            for n in range(args.held_orders)
+        ]
+        for offset in range(0, len(orders), 20_000):
+            await db.execute(insert(SalesOrder), orders[offset:offset + 20_000])
+        await db.commit()
+
+        started = time.perf_counter()
+        await credit.rebuild_exposures(db)
+        rebuild_ms = (time.perf_counter() - started) * 1000
+
+        checks = [(rng.randint(1, args.customers), Decimal(rng.randint(100, 50_000))) for _ in range(args.checks)]
+        scan_ms = []
+        for customer_id, amount in checks[:args.scan_checks]:
+            started = time.perf_counter()
+            scan_check(invoices, payments, f"C{customer_id:06d}", limits[customer_id], amount)
+            scan_ms.append((time.perf_counter() - started) * 1000)
+
+        check_ms = []
+        for customer_id, amount in checks:
+            started = time.perf_counter()
+            await credit.check_credit(db, customer_id, amount)
+            check_ms.append((time.perf_counter() - started) * 1000)
+        # Both paths agree on the decision
+        mismatches = 0
+        for customer_id, amount in checks[:args.scan_checks]:
+            allowed, _ = scan_check(invoices, payments, f"C{customer_id:06d}", limits[customer_id], amount)
+            mismatches += allowed != (await credit.check_credit(db, customer_id, amount)).allowed
+
+        started = time.perf_counter()
+        summary = await credit.summary(db)
+        summary_ms = (time.perf_counter() - started) * 1000
+
+        # Raise every limit, then release the held orders in one job
+        await db.execute(update(Customer).values(credit_limit=Customer.credit_limit * 10))
+        await db.commit()
+        started = time.perf_counter()
+        released = await credit.release_blocked(db)
+        release_ms = (time.perf_counter() - started) * 1000
+        open_orders = (await db.execute(select(CreditExposure.open_orders))).scalars().all()
+
+    await dispose_engines()
+    return {
+        "customers": args.customers,
+        "invoices": args.invoices,
+        "scan_checks": len(scan_ms),
+        "scan_ms_per_check": round(statistics.median(scan_ms), 3),
+        "checks": len(check_ms),
+        "exposure_ms_per_check": round(statistics.median(check_ms), 3),
+        "decision_mismatches": mismatches,
+        "summary_ms": round(summary_ms, 3),
+        "rebuild_ms": round(rebuild_ms, 3),
+        "held_orders": args.held_orders,
+        "released": released.released,
+        "still_held": released.still_held,
+        "release_ms": round(release_ms, 3),
+        "released_amount_matches": sum(open_orders, Decimal(0)) == released.released_amount,
+        "held_before_release": summary.held_orders,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Credit exposure lookups vs. invoice scans")
+    parser.add_argument("--customers", type=int, default=5000)
+    parser.add_argument("--invoices", type=int, default=500_000)
+    parser.add_argument("--held-orders", type=int, default=50_000)
+    parser.add_argument("--checks", type=int, default=1000)
+    parser.add_argument("--scan-checks", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=22)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/credit.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/depreciation.py
+"""
+Monthly depreciation run over a synthetic asset register.
+
+Seeds assets straight into the configured database (default: a temp
+SQLite file; pass --database-url for Postgres, where the numbers matter):
+
+    python benchmarks/depreciation.py --assets 200000
+    python benchmarks/depreciation.py --database-url postgresql+psycopg://... --assets 1000000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert
+
+    from app.core.config import settings
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.assets import AssetStatus, DepreciationMethod, FixedAsset
+    from app.models.finance.ledger import Account, AccountType
+    from app.services.finance import depreciation
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    methods = list(DepreciationMethod)
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Account), [
+            {"code": "6100", "name": "Depreciation expense", "type": AccountType.expense},
+            {"code": "1590", "name": "Accumulated depreciation", "type": AccountType.asset},
+        ])
+        for offset in range(0, args.assets, 10_000):
+            rows = []
+            for n in range(offset, min(offset + 10_000, args.assets)):
+                cost = rng.randint(10_000, 5_000_000) / 100
+                rows.append({
+                    "asset_code": f"FA-{n}",
+                    "name": f"Asset {n}",
+                    "cost_center": f"CC{rng.randint(1, 40)}",
+                    "cost": cost,
+                    "salvage_value": round(cost * 0.05, 2),
+                    "in_service_date": datetime.date(2020, 1, 1) + datetime.timedelta(days=rng.randint(0, 2000)),
+                    "method": rng.choice(methods),
+                    "useful_life_months": rng.choice([36, 60, 120]),
+                    "total_units": 100_000,
+                    "expense_account_id": 1,
+                    "accumulated_account_id": 2,
+                    "accumulated_depreciation": 0,
+                    "status": AssetStatus.active,
+                })
+            await db.execute(insert(FixedAsset), rows)
+        await db.commit()
+    seed_seconds = time.perf_counter() - started
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        reg = await depreciation.load_register(db, args.period)
+        load_seconds = time.perf_counter() - started
+
+    month = depreciation.month_index(args.period)
+    started = time.perf_counter()
+    inline = depreciation.depreciation_for_period({k: reg[k] for k in depreciation.COMPUTE_COLUMNS}, month)
+    inline_seconds = time.perf_counter() - started
+
+    settings.DEPRECIATION_CHUNK_SIZE = max(1, args.assets // settings.DEPRECIATION_WORKERS)
+    await depreciation.compute_period(reg, month)  # warm the pool up
+    started = time.perf_counter()
+    pooled = await depreciation.compute_period(reg, month)
+    pool_seconds = time.perf_counter() - started
+    assert (pooled == inline).all()
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        result = await depreciation.run_depreciation(db, args.period, "bench")
+        run_seconds = time.perf_counter() - started
+        total = str(result.total)
+
+    depreciation.shutdown_pool()
+    await dispose_engines()
+    return {
+        "assets": args.assets,
+        "seed_s": round(seed_seconds, 3),
+        "load_register_s": round(load_seconds, 3),
+        "compute_inline_s": round(inline_seconds, 4),
+        "compute_pool_s": round(pool_seconds, 4),
+        "pool_workers": settings.DEPRECIATION_WORKERS,
+        "full_run_s": round(run_seconds, 3),
+        "total": total,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Depreciation run benchmark")
+    parser.add_argument("--assets", type=int, default=200_000)
+    parser.add_argument("--period", type=int, default=202610)
+    parser.add_argument("--seed", type=int, default=15)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/depreciation.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
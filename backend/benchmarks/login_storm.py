@@ -0,0 +1,109 @@
+# benchmarks/login_storm.py
+"""
+Load test: /users/me latency while a burst of logins runs concurrently.
+
+Start the API with the login limiter off so the storm is not throttled:
+
+    RATE_LIMIT_ENABLED=false uvicorn app.main:app --port 8000
+    python benchmarks/login_storm.py --logins 400 --login-concurrency 64
+
+The report shows /users/me percentiles for a quiet phase and for the storm
+phase; with bcrypt in the worker pool the two should stay close, and any
+logins beyond PASSWORD_HASH_WORKERS + PASSWORD_HASH_QUEUE_DEPTH come back
+as 503 instead of stalling the event loop.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+
+import httpx
+
+from common import login, percentile
+
+
+async def sample_users_me(
+    client: httpx.AsyncClient, headers: dict, stop: asyncio.Event, interval: float
+) -> list[float]:
+    samples: list[float] = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/users/me", headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+        await asyncio.sleep(interval)
+    return samples
+
+
+def summarize(samples: list[float]) -> dict:
+    return {
+        "samples": len(samples),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+        token = await login(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # Quiet phase
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_users_me(client, headers, stop, args.interval))
+        await asyncio.sleep(args.quiet_seconds)
+        stop.set()
+        quiet = await sampler
+
+        # Storm phase
+        statuses: Counter = Counter()
+        remaining = args.logins
+
+        async def login_worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.post(
+                    "/auth/login",
+                    data={"username": args.email, "password": args.password},
+                )
+                statuses[response.status_code] += 1
+
+        stop = asyncio.Event()
+        sampler = asyncio.create_task(sample_users_me(client, headers, stop, args.interval))
+        started = time.perf_counter()
+        await asyncio.gather(*(login_worker() for _ in range(args.login_concurrency)))
+        storm_seconds = time.perf_counter() - started
+        stop.set()
+        storm = await sampler
+
+    return {
+        "users_me_quiet": summarize(quiet),
+        "users_me_during_storm": summarize(storm),
+        "logins": {
+            "total": args.logins,
+            "concurrency": args.login_concurrency,
+            "seconds": round(storm_seconds, 2),
+            "status_codes": dict(statuses),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000/api/v1")
+    parser.add_argument("--email", default="admin@nextgen.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--login-concurrency", type=int, default=64)
+    parser.add_argument("--quiet-seconds", type=float, default=5)
+    parser.add_argument("--interval", type=float, default=0.01)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
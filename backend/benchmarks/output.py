@@ -0,0 +1,198 @@
+# benchmarks/output.py
+"""
+Document output over synthetic orders. First the cost on saving an
+order: no output conditions, conditions determined and queued (what
+``create_order`` does now), and confirmations rendered and written on
+the spot as a synchronous send would. Then the worker draining queued
+confirmations with the file sinks, one job per batch against full
+batches.
+
+    python benchmarks/output.py --jobs 20000
+    python benchmarks/output.py --database-url postgresql+psycopg://... --batch-size 200
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+ORDER_DATE = datetime.date(2026, 10, 1)
+CONDITIONS = [
+    {"output_type": "order_confirmation", "channel": "email", "recipient": "orders@example.com"},
+    {"output_type": "order_confirmation", "channel": "email", "recipient": "key-accounts@example.com",
+     "customer_groups": ["Premium", "Enterprise"]},
+    {"output_type": "order_confirmation", "channel": "file", "recipient": "warehouse", "regions": ["North"]},
+    {"output_type": "order_confirmation", "channel": "file", "recipient": "large-orders", "min_amount": "500"},
+]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from fakeredis.aioredis import FakeRedis
+    from sqlalchemy import func, insert, select
+
+    from app.core.config import settings
+    from app.crud.sales import output as determination
+    from app.crud.sales.orders import create_order
+    from app.crud.sales.output import OutputSubject
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.sales.credit import CreditExposure
+    from app.models.sales.master import Customer, Product
+    from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+    from app.models.sales.output import OutputJob, OutputJobStatus, OutputType
+    from app.schemas.sales.orders import SalesOrderCreate
+    from app.schemas.sales.output import OutputConditionCreate
+    from app.services.sales import output
+
+    settings.OUTPUT_DIR = args.output_dir
+    settings.OUTPUT_EMAIL_SINK = "file"
+    redis = FakeRedis(decode_responses=True)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    groups, regions = ["Basic", "Standard", "Premium", "Enterprise"], ["North", "South", "East", "West"]
+    customers = [
+        {"id": n, "code": f"C{n:06d}", "name": f"Customer {n}", "customer_group": rng.choice(groups),
+         "region": rng.choice(regions)}
+        for n in range(1, args.customers + 1)
+    ]
+
+    def order_in() -> SalesOrderCreate:
+        return SalesOrderCreate.model_validate({
+            "customer_id": rng.randint(1, args.customers), "order_date": ORDER_DATE,
+            "lines": [
+                {"product_id": rng.randint(1, args.products), "quantity": rng.randint(1, 20),
+                 "unit_price": Decimal(rng.randint(100, 10_000)) / 100}
+                for _ in range(rng.randint(1, 2 * args.lines - 1))
+            ],
+        })
+
+    async def save_orders(db, count: int, after=None) -> float:
+        """Median ms per saved order (plus ``after`` per order, as a synchronous send would)."""
+        timings = []
+        for _ in range(count):
+            started = time.perf_counter()
+            order = await create_order(db, order_in(), user="bench")
+            if after is not None:
+                await after(db, order)
+            timings.append((time.perf_counter() - started) * 1000)
+            db.info.pop(determination.SCHEDULED, None)
+        return statistics.median(timings)
+
+    async def send_now(db, order) -> None:
+        job_ids = db.info.pop(determination.SCHEDULED, [])
+        await output.process_batch(redis, job_ids)
+
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Customer), customers)
+        await db.execute(insert(CreditExposure), [{"customer_id": c["id"]} for c in customers])
+        await db.execute(insert(Product), [
+            {"id": n, "sku": f"SKU{n:06d}", "name": f"Product {n}", "list_price": 10} for n in range(1, args.products + 1)
+        ])
+        await db.commit()
+
+        no_conditions_ms = await save_orders(db, args.saves)
+        for condition in CONDITIONS:
+            await determination.create_condition(db, OutputConditionCreate.model_validate(condition))
+        queued_ms = await save_orders(db, args.saves)
+        synchronous_ms = await save_orders(db, args.saves, after=send_now)
+
+        # Worker: confirmations for bulk-loaded orders, queued in one event
+        first_id = (await db.execute(select(func.max(SalesOrder.id)))).scalar_one() + 1
+        orders, lines = [], []
+        for order_id in range(first_id, first_id + args.jobs):
+            customer = rng.choice(customers)
+            total = Decimal(0)
+            for line_no in range(1, rng.randint(1, 2 * args.lines - 1) + 1):
+                quantity, price = rng.randint(1, 20), Decimal(rng.randint(100, 10_000)) / 100
+                total += quantity * price
+                lines.append({"order_id": order_id, "line_no": line_no, "product_id": rng.randint(1, args.products),
+                              "quantity": quantity, "unit_price": price, "amount": quantity * price})
+            orders.append({
+                "id": order_id, "order_number": f"SO{order_id:08d}", "customer_id": customer["id"],
+                "order_date": ORDER_DATE, "region": customer["region"], "status": SalesOrderStatus.open,
+                "total": total,
+            })
+        for offset in range(0, len(orders), 20_000):
+            await db.execute(insert(SalesOrder), orders[offset:offset + 20_000])
+        for offset in range(0, len(lines), 20_000):
+            await db.execute(insert(SalesOrderLine), lines[offset:offset + 20_000])
+        by_id = {c["id"]: c for c in customers}
+        started = time.perf_counter()
+        jobs = await determination.schedule(db, OutputType.order_confirmation, [
+            OutputSubject(o["id"], o["customer_id"], by_id[o["customer_id"]]["customer_group"], o["region"], o["total"])
+            for o in orders
+        ])
+        await db.commit()
+        await output.enqueue_scheduled(redis, db)
+        schedule_s = time.perf_counter() - started
+
+    async def drain(batch_size: int, limit: int) -> tuple[int, float]:
+        done, started = 0, time.perf_counter()
+        while done < limit:
+            job_ids = await output.take(redis, batch_size, timeout=1)
+            if not job_ids:
+                break
+            done += sum(vars(await output.process_batch(redis, job_ids)).values())
+        return done, time.perf_counter() - started
+
+    single_jobs, single_s = await drain(1, args.baseline_jobs)
+    batched_jobs, batched_s = await drain(args.batch_size, jobs)
+    async with AsyncSessionLocal() as db:
+        statuses = dict((await db.execute(
+            select(OutputJob.status, func.count()).group_by(OutputJob.status)
+        )).all())
+
+    await redis.aclose()
+    await dispose_engines()
+    return {
+        "cpus": os.cpu_count(),
+        "save_order_ms_no_conditions": round(no_conditions_ms, 2),
+        "save_order_ms_output_queued": round(queued_ms, 2),
+        "save_order_ms_output_sent_inline": round(synchronous_ms, 2),
+        "bulk_orders": args.jobs,
+        "bulk_jobs_scheduled": jobs,
+        "bulk_schedule_s": round(schedule_s, 2),
+        "worker_batch_1_jobs_per_s": round(single_jobs / single_s, 1),
+        "worker_batch_size": args.batch_size,
+        "worker_batched_jobs_per_s": round(batched_jobs / batched_s, 1),
+        "worker_batched_s": round(batched_s, 2),
+        "jobs": {status.value: statuses.get(status, 0) for status in OutputJobStatus},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Output determination on save and the output worker")
+    parser.add_argument("--jobs", type=int, default=20_000, help="orders whose confirmations the worker sends")
+    parser.add_argument("--saves", type=int, default=200, help="orders saved per variant")
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=3, help="average lines per order")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--baseline-jobs", type=int, default=2000, help="jobs sent one per batch first")
+    parser.add_argument("--seed", type=int, default=25)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    args.output_dir = os.path.join(scratch, "output")
+    os.environ["DATABASE_URL_OVERRIDE"] = args.database_url or f"sqlite+aiosqlite:///{scratch}/output.db"
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+# benchmarks/pricing.py
+"""
+Order pricing over a synthetic condition master: the compiled price book
+(indexed candidates, memoized quantity breaks) against the full scan of
+every rule and scheme per line that the Sales page used to do. Both
+paths share the price arithmetic, so their totals must agree.
+
+    python benchmarks/pricing.py --rules 5000 --schemes 2000 --products 10000
+    python benchmarks/pricing.py --database-url postgresql+psycopg://... --orders 100
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+GROUPS = ["Basic", "Standard", "Premium", "Enterprise"]
+PRICING_DATE = datetime.date(2026, 6, 1)
+
+
+def naive_quote(pricing, rules, schemes, group, products, lines):
+    """Per line: every condition's scope, dates and quantity checked in turn."""
+    from app.crud.finance.ledger import CENT, ZERO
+
+    def applies(condition, product_id):
+        return (
+            condition.is_active and condition.valid_from <= PRICING_DATE <= condition.valid_to
+            and (not condition.product_ids or product_id in condition.product_ids)
+            and (not condition.customer_groups or group in condition.customer_groups)
+        )
+
+    resolutions = []
+    for product_id, quantity in lines:
+        list_price = products[product_id]
+        matched_rules = [pricing._rule_condition(rule) for rule in rules if applies(rule, product_id)]
+        matched_schemes = [pricing._scheme_condition(scheme) for scheme in schemes if applies(scheme, product_id)]
+        slot = pricing._slot(sorted(matched_rules, key=lambda c: c.id), sorted(matched_schemes, key=lambda c: c.id))
+        resolutions.append(pricing._resolve(slot, list_price, quantity))
+    order_value = sum(((r.rule_price * q).quantize(CENT) for r, (_, q) in zip(resolutions, lines)), ZERO)
+    return sum((pricing.apply_discounts(r, q, order_value)[0] for r, (_, q) in zip(resolutions, lines)), ZERO)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from sqlalchemy import insert, select
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.sales.master import Customer, Product
+    from app.models.sales.pricing import DiscountScheme, DiscountType, PricingRule, PricingRuleType, PricingVersion
+    from app.schemas.sales.pricing import QuoteIn
+    from app.services.sales import pricing
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    start, end = datetime.date(2026, 1, 1), datetime.date(2026, 12, 31)
+
+    def scope():
+        # Mostly product-specific conditions, some catalogue-wide ones
+        products = [] if rng.random() < 0.05 else rng.sample(range(1, args.products + 1), rng.randint(1, 5))
+        groups = [] if rng.random() < 0.5 else rng.sample(GROUPS, rng.randint(1, 2))
+        return {"product_ids": products, "customer_groups": groups, "valid_from": start, "valid_to": end}
+
+    def tiers():
+        return [
+            {"min_qty": "1", "max_qty": "9", "discount": "2"},
+            {"min_qty": "10", "max_qty": "49", "discount": "5"},
+            {"min_qty": "50", "max_qty": None, "discount": str(rng.randint(8, 15))},
+        ]
+
+    rule_types, scheme_types = list(PricingRuleType), list(DiscountType)
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Customer), [
+            {"id": n + 1, "code": f"C{n:05d}", "name": f"Customer {n}", "customer_group": GROUPS[n % 4]}
+            for n in range(args.customers)
+        ])
+        await db.execute(insert(Product), [
+            {"id": n + 1, "sku": f"SKU{n:06d}", "name": f"Product {n}", "list_price": rng.randint(100, 50_000) / 100}
+            for n in range(args.products)
+        ])
+        rules = []
+        for n in range(args.rules):
+            rule_type = rule_types[n % len(rule_types)]
+            rules.append({
+                "id": n + 1, "code": f"R{n:05d}", "name": f"Rule {n}", "rule_type": rule_type,
+                "value": rng.randint(1, 100) if rule_type == PricingRuleType.fixed_price else rng.randint(1, 25),
+                "tiers": tiers() if rule_type == PricingRuleType.tiered_pricing else [],
+                "min_quantity": rng.choice([None, None, 5, 20]), "max_quantity": rng.choice([None, None, 100]),
+                "priority": rng.randint(1, 200), **scope(),
+            })
+        await db.execute(insert(PricingRule), rules)
+        schemes = []
+        for n in range(args.schemes):
+            discount_type = scheme_types[n % len(scheme_types)]
+            schemes.append({
+                "id": n + 1, "code": f"D{n:05d}", "name": f"Scheme {n}", "discount_type": discount_type,
+                "value": rng.randint(1, 10), "buy_quantity": 3, "get_quantity": 1,
+                "tiers": tiers() if discount_type == DiscountType.volume_discount else [],
+                "min_quantity": rng.choice([None, 2, 10]), "min_order_value": rng.choice([None, 500, 5000]),
+                **scope(),
+            })
+        await db.execute(insert(DiscountScheme), schemes)
+        await db.execute(insert(PricingVersion), [{"id": 1, "version": 1}])
+        await db.commit()
+
+    # Orders draw from a catalogue subset with the usual pack quantities
+    catalogue = rng.sample(range(1, args.products + 1), min(args.products, args.catalogue))
+    orders = [
+        (rng.randint(1, args.customers), [
+            (rng.choice(catalogue), Decimal(rng.choice([1, 2, 5, 10, 12, 24, 50, 100])))
+            for _ in range(args.lines)
+        ])
+        for _ in range(args.orders)
+    ]
+
+    async with AsyncSessionLocal() as db:
+        all_rules = (await db.execute(select(PricingRule))).scalars().all()
+        all_schemes = (await db.execute(select(DiscountScheme))).scalars().all()
+        customers = dict((await db.execute(select(Customer.id, Customer.customer_group))).all())
+        products = dict((await db.execute(select(Product.id, Product.list_price))).all())
+
+        naive_ms, naive_totals = [], []
+        for customer_id, lines in orders[:args.naive_orders]:
+            started = time.perf_counter()
+            naive_totals.append(naive_quote(pricing, all_rules, all_schemes, customers[customer_id], products, lines))
+            naive_ms.append((time.perf_counter() - started) * 1000)
+
+        compiled_ms, compiled_totals = [], []
+        for customer_id, lines in orders:
+            quote_in = QuoteIn(
+                customer_id=customer_id, pricing_date=PRICING_DATE,
+                lines=[{"product_id": product_id, "quantity": quantity} for product_id, quantity in lines],
+            )
+            started = time.perf_counter()
+            compiled_totals.append((await pricing.quote(db, quote_in)).total)
+            compiled_ms.append((time.perf_counter() - started) * 1000)
+
+    await dispose_engines()
+    book_stats = pricing.books.stats()
+    return {
+        "rules": args.rules,
+        "schemes": args.schemes,
+        "products": args.products,
+        "lines_per_order": args.lines,
+        "naive_orders": len(naive_ms),
+        "naive_ms_per_order": round(statistics.median(naive_ms), 2),
+        "compiled_orders": len(compiled_ms),
+        "compile_s": book_stats["compile_seconds_avg"],
+        "compiled_first_order_ms": round(compiled_ms[0], 2),
+        "compiled_ms_per_order": round(statistics.median(compiled_ms[1:] or compiled_ms), 2),
+        "resolutions": book_stats["books"][0]["resolutions"],
+        "reuses": book_stats["books"][0]["reuses"],
+        "totals_match": naive_totals == compiled_totals[:len(naive_totals)],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compiled price book vs. full condition scan")
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--rules", type=int, default=5000)
+    parser.add_argument("--schemes", type=int, default=2000)
+    parser.add_argument("--catalogue", type=int, default=2000)
+    parser.add_argument("--orders", type=int, default=50)
+    parser.add_argument("--naive-orders", type=int, default=3)
+    parser.add_argument("--lines", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=20)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/pricing.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/rate_limiter.py
+"""
+Per-decision latency of the rate limiter against the configured Redis.
+
+    python benchmarks/rate_limiter.py --hits 50000 --concurrency 64
+
+Stop Redis (or point REDIS_PORT at a closed port) to measure the local
+token-bucket fallback instead; the report says which backend decided.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.rate_limit import RateLimitExceeded, RateLimiter, RateLimitRule  # noqa: E402
+from app.core.redis import close_redis, init_redis  # noqa: E402
+from common import percentile  # noqa: E402
+
+
+async def run(args: argparse.Namespace) -> dict:
+    await init_redis()
+    limiter = RateLimiter(
+        {"bench": [RateLimitRule("account", 1_000_000, 60), RateLimitRule("ip", 1_000_000, 60)]}
+    )
+    samples: list[float] = []
+    remaining = args.hits
+
+    async def worker(worker_id: int) -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await limiter.hit("bench", ip=f"10.0.{worker_id}.1", account=f"user{remaining % 500}")
+            except RateLimitExceeded:
+                pass
+            samples.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await close_redis()
+
+    return {
+        "backend": limiter.stats()["backend"],
+        "hits": len(samples),
+        "decisions_per_second": round(len(samples) / elapsed, 1),
+        "p50_ms": round(percentile(samples, 50), 4),
+        "p99_ms": round(percentile(samples, 99), 4),
+        "stats": limiter.stats(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--hits", type=int, default=50_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/rbac_trie.py
+"""
+Microbenchmark: compiled RBAC trie vs. the old exact-path dict lookup.
+
+Checks every MODULE_ACCESS entry plus ten thousand synthetic routes
+(nested module paths, unknown modules) for every role:
+
+    python benchmarks/rbac_trie.py --routes 10000 --repeat 5
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.config.module_access import MODULE_ACCESS  # noqa: E402
+from app.constants.roles import ROLES  # noqa: E402
+from app.services.rbac import AccessTrie  # noqa: E402
+
+
+def legacy_allows(user_role: int, path: str) -> bool:
+    """Previous enforce_access logic (exact path, list membership)."""
+    if user_role == ROLES.SUPER_ADMIN:
+        return True
+    return user_role in MODULE_ACCESS.get(path, [])
+
+
+def synthetic_routes(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    prefixes = [path for path in MODULE_ACCESS if path != "/"]
+    routes = list(MODULE_ACCESS)
+    while len(routes) < count + len(MODULE_ACCESS):
+        kind = rng.random()
+        if kind < 0.6:  # nested resource under a module
+            depth = rng.randint(1, 3)
+            tail = "/".join(str(rng.randint(1, 10_000)) for _ in range(depth))
+            routes.append(f"{rng.choice(prefixes)}/{tail}")
+        elif kind < 0.8:  # the module root itself
+            routes.append(rng.choice(prefixes))
+        else:  # unknown module
+            routes.append(f"/unknown{rng.randint(1, 500)}/items/{rng.randint(1, 10_000)}")
+    return routes
+
+
+def time_checks(check, routes: list[str], repeat: int) -> float:
+    roles = list(ROLES)
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for path in routes:
+            for role in roles:
+                check(role, path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--routes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    trie = AccessTrie(MODULE_ACCESS)
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    routes = synthetic_routes(args.routes, args.seed)
+    checks = len(routes) * len(ROLES)
+    legacy = time_checks(legacy_allows, routes, args.repeat)
+    compiled = time_checks(trie.allows, routes, args.repeat)
+    nested = [r for r in routes if r not in MODULE_ACCESS]
+
+    print(json.dumps({
+        "module_access_entries": len(MODULE_ACCESS),
+        "routes": len(routes),
+        "checks": checks,
+        "trie_compile_ms": round(compile_ms, 3),
+        "legacy_ns_per_check": round(legacy / checks * 1e9, 1),
+        "trie_ns_per_check": round(compiled / checks * 1e9, 1),
+        # The legacy lookup denies every nested path; the trie resolves them
+        "nested_paths_matched_legacy": sum(1 for r in nested if r in MODULE_ACCESS),
+        "nested_paths_matched_trie": sum(1 for r in nested if trie.lookup(r) is not None),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# benchmarks/sales_analytics.py
+"""
+Sales analytics dashboard over three years of synthetic orders: the
+rollups (uncached and Redis-cached) against computing the same figures
+from the full order list, as the analytics page did. Also times the
+rollup posting that order entry now pays per order.
+
+    python benchmarks/sales_analytics.py --orders 300000
+    python benchmarks/sales_analytics.py --database-url postgresql+psycopg://... --orders 1000000
+"""
+import argparse
+import asyncio
+import datetime
+import heapq
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+TODAY = datetime.date(2026, 10, 31)
+REGIONS = ["North", "South", "East", "West", "Central", None]
+
+
+def scan_dashboard(orders, lines, from_date, to_date, top):
+    """Every figure from the full order list, one pass per section like the page's useMemo blocks."""
+    selected = [order for order in orders if from_date <= order[1] <= to_date]
+    booked = [order for order in selected if order[4] != "cancelled"]
+    revenue = sum((order[5] for order in booked), Decimal(0))
+    by_customer = {}
+    for order in booked:
+        totals = by_customer.setdefault(order[2], [Decimal(0), 0])
+        totals[0] += order[5]
+        totals[1] += 1
+    monthly = {}
+    for order in booked:
+        totals = monthly.setdefault(order[1].replace(day=1), [Decimal(0), 0, set()])
+        totals[0] += order[5]
+        totals[1] += 1
+        totals[2].add(order[2])
+    booked_ids = {order[0] for order in booked}
+    by_product = {}
+    for order_id, product_id, quantity, amount in lines:
+        if order_id in booked_ids:
+            totals = by_product.setdefault(product_id, [Decimal(0), Decimal(0)])
+            totals[0] += amount
+            totals[1] += quantity
+    status, hourly = {}, [0] * 24
+    for order in selected:
+        status[order[4]] = status.get(order[4], 0) + 1
+    for order in booked:
+        hourly[order[6]] += 1
+    return {
+        "revenue": revenue,
+        "orders": len(selected),
+        "customers": len(by_customer),
+        "top_products": [product_id for product_id, _ in heapq.nlargest(top, by_product.items(), key=lambda kv: kv[1][0])],
+        "monthly": {month: totals[0] for month, totals in sorted(monthly.items())[-12:]},
+        "status": status,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from fakeredis.aioredis import FakeRedis
+    from sqlalchemy import func, insert, select
+
+    from app.db.session import AsyncSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.sales.analytics import SalesOrderRollup, SalesRollup
+    from app.models.sales.master import Customer, Product
+    from app.models.sales.orders import SalesOrder, SalesOrderLine, SalesOrderStatus
+    from app.schemas.sales.orders import SalesOrderCreate
+    from app.crud.sales import analytics as rollups
+    from app.crud.sales.orders import create_order
+    from app.services.sales import analytics
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    rng = random.Random(args.seed)
+    first_day = TODAY - datetime.timedelta(days=3 * 365 - 1)
+    statuses = [SalesOrderStatus.delivered] * 6 + [SalesOrderStatus.invoiced] * 10 + [
+        SalesOrderStatus.open, SalesOrderStatus.credit_hold, SalesOrderStatus.cancelled,
+    ]
+    regions = {customer_id: rng.choice(REGIONS) for customer_id in range(1, args.customers + 1)}
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(Customer), [
+            {"id": customer_id, "code": f"C{customer_id:06d}", "name": f"Customer {customer_id}",
+             "customer_group": "retail", "region": region}
+            for customer_id, region in regions.items()
+        ])
+        await db.execute(insert(Product), [
+            {"id": n + 1, "sku": f"SKU{n:06d}", "name": f"Product {n}", "list_price": 10} for n in range(args.products)
+        ])
+        orders, lines = [], []
+        for order_id in range(1, args.orders + 1):
+            day = first_day + datetime.timedelta(days=rng.randrange(3 * 365))
+            customer_id = rng.randint(1, args.customers)
+            total = Decimal(0)
+            for line_no in range(1, rng.randint(1, 2 * args.lines - 1) + 1):
+                quantity, price = rng.randint(1, 20), Decimal(rng.randint(100, 10_000)) / 100
+                amount = quantity * price
+                total += amount
+                lines.append({"order_id": order_id, "line_no": line_no, "product_id": rng.randint(1, args.products),
+                              "quantity": quantity, "unit_price": price, "amount": amount})
+            orders.append({
+                "id": order_id, "order_number": f"SO{order_id:08d}", "customer_id": customer_id, "order_date": day,
+                "region": regions[customer_id], "status": rng.choice(statuses), "total": total,
+                "created_at": datetime.datetime.combine(day, datetime.time(rng.choice(range(6, 22)), rng.randrange(60))),
+            })
+        for offset in range(0, len(orders), 20_000):
+            await db.execute(insert(SalesOrder), orders[offset:offset + 20_000])
+        for offset in range(0, len(lines), 20_000):
+            await db.execute(insert(SalesOrderLine), lines[offset:offset + 20_000])
+        await db.commit()
+
+        started = time.perf_counter()
+        await rollups.rebuild(db)
+        rebuild_s = time.perf_counter() - started
+        rollup_rows = sum([
+            (await db.execute(select(func.count()).select_from(model))).scalar_one()
+            for model in (SalesOrderRollup, SalesRollup)
+        ])
+
+        # What the page had to fetch and fold on every load
+        started = time.perf_counter()
+        order_list = [
+            (order_id, day, customer_id, region, status.value, total, created_at.hour)
+            for order_id, day, customer_id, region, status, total, created_at in (await db.execute(select(
+                SalesOrder.id, SalesOrder.order_date, SalesOrder.customer_id, SalesOrder.region,
+                SalesOrder.status, SalesOrder.total, SalesOrder.created_at,
+            ))).all()
+        ]
+        line_list = (await db.execute(select(
+            SalesOrderLine.order_id, SalesOrderLine.product_id, SalesOrderLine.quantity, SalesOrderLine.amount,
+        ))).all()
+        fetch_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        scanned = scan_dashboard(order_list, line_list, first_day, TODAY, args.top)
+        scan_ms = (time.perf_counter() - started) * 1000
+
+        full = await analytics.dashboard(db, first_day, TODAY, analytics.Scope(), args.top)
+        matches = (
+            full.metrics.total_revenue == scanned["revenue"]
+            and full.metrics.total_orders == scanned["orders"]
+            and full.metrics.unique_customers == scanned["customers"]
+            and [product.product_id for product in full.top_products] == scanned["top_products"]
+            and {point.month: point.revenue for point in full.monthly} == scanned["monthly"]
+            and {row.status.value: row.orders for row in full.status} == scanned["status"]
+        )
+
+        scopes = [
+            analytics.Scope(),
+            analytics.Scope(region="North"),
+            analytics.Scope(customer_id=rng.randint(1, args.customers)),
+            analytics.Scope(product_id=rng.randint(1, args.products)),
+            analytics.Scope(region="South", product_id=rng.randint(1, args.products)),
+        ]
+        dashboard_ms = {}
+        for scope in scopes:
+            timings = []
+            for _ in range(args.repeats):
+                started = time.perf_counter()
+                await analytics.dashboard(db, first_day, TODAY, scope, args.top)
+                timings.append((time.perf_counter() - started) * 1000)
+            label = ",".join(f"{name}={value}" for name, value in vars(scope).items() if value is not None) or "all"
+            dashboard_ms[label] = round(statistics.median(timings), 3)
+
+        redis = FakeRedis(decode_responses=True)
+        await analytics.dashboard_json(db, redis, first_day, TODAY, scopes[0], args.top)
+        cached_ms = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            await analytics.dashboard_json(db, redis, first_day, TODAY, scopes[0], args.top)
+            cached_ms.append((time.perf_counter() - started) * 1000)
+
+        # Order entry: the rollup postings inside create_order
+        post_ms = []
+        for _ in range(args.new_orders):
+            order_in = SalesOrderCreate(customer_id=rng.randint(1, args.customers), order_date=TODAY, lines=[
+                {"product_id": rng.randint(1, args.products), "quantity": rng.randint(1, 20), "unit_price": 10}
+                for _ in range(args.lines)
+            ])
+            started = time.perf_counter()
+            await create_order(db, order_in, user="bench")
+            post_ms.append((time.perf_counter() - started) * 1000)
+
+    await dispose_engines()
+    return {
+        "orders": args.orders,
+        "order_lines": len(line_list),
+        "rollup_rows": rollup_rows,
+        "rollup_rebuild_s": round(rebuild_s, 2),
+        "scan_fetch_ms": round(fetch_ms, 1),
+        "scan_compute_ms": round(scan_ms, 1),
+        "rollup_dashboard_ms": dashboard_ms,
+        "cached_dashboard_ms": round(statistics.median(cached_ms), 3),
+        "figures_match_scan": matches,
+        "create_order_ms": round(statistics.median(post_ms), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sales analytics rollups vs. full order scans")
+    parser.add_argument("--orders", type=int, default=300_000)
+    parser.add_argument("--customers", type=int, default=2000)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--lines", type=int, default=3, help="average lines per order")
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--new-orders", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=23)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/sales_analytics.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
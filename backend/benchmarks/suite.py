@@ -0,0 +1,294 @@
+# benchmarks/suite.py
+"""
+Reproducible hot-path benchmark: login, /users/me, user CRUD, PR create/list.
+
+In-process (default) – the app runs inside this process behind
+httpx.ASGITransport, with SQLite (aiosqlite) and fakeredis standing in for
+Postgres and Redis:
+
+    python benchmarks/suite.py --output benchmarks/results/baseline.json
+
+Against a running server on local Postgres/Redis (start it with
+RATE_LIMIT_ENABLED=false so the login scenario is not throttled):
+
+    python benchmarks/suite.py --base-url http://127.0.0.1:8000 --output run.json
+
+Diff a run against a stored one:
+
+    python benchmarks/suite.py --baseline benchmarks/results/baseline.json
+
+Run from the backend directory (the app reads .env from the cwd).
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+import httpx
+
+from common import summarize
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+ADMIN = ("admin@nextgen.com", "admin123")
+
+
+# ------------------------------------------------------------------
+# 1. Scenarios – one call is one measured operation
+# ------------------------------------------------------------------
+class Context:
+    def __init__(self, api: str, headers: dict):
+        self.api = api
+        self.headers = headers
+        self.counter = itertools.count()
+        self.run_id = int(time.time())
+
+
+async def scenario_login(client: httpx.AsyncClient, ctx: Context) -> None:
+    response = await client.post(
+        f"{ctx.api}/auth/login", data={"username": ADMIN[0], "password": ADMIN[1]}
+    )
+    response.raise_for_status()
+
+
+async def scenario_users_me(client: httpx.AsyncClient, ctx: Context) -> None:
+    response = await client.get(f"{ctx.api}/users/me", headers=ctx.headers)
+    response.raise_for_status()
+
+
+async def scenario_user_crud(client: httpx.AsyncClient, ctx: Context) -> None:
+    n = next(ctx.counter)
+    response = await client.post(
+        f"{ctx.api}/users/",
+        headers=ctx.headers,
+        json={
+            "email": f"bench{ctx.run_id}-{n}@example.com",
+            "name": f"Bench {n}",
+            "password": "bench123",
+            "role": 99,
+        },
+    )
+    response.raise_for_status()
+    user_id = response.json()["id"]
+    response = await client.put(
+        f"{ctx.api}/users/{user_id}", headers=ctx.headers, json={"name": f"Bench {n}b"}
+    )
+    response.raise_for_status()
+    response = await client.delete(f"{ctx.api}/users/{user_id}", headers=ctx.headers)
+    response.raise_for_status()
+
+
+async def scenario_pr_create(client: httpx.AsyncClient, ctx: Context) -> None:
+    response = await client.post(
+        f"{ctx.api}/procurement/pr/",
+        headers=ctx.headers,
+        json={
+            "dept": "Maintenance",
+            "items": [
+                {"name": "Bearing 6204", "qty": 10, "price": 85.5},
+                {"name": "V-belt A42", "qty": 4, "price": 240.0},
+            ],
+        },
+    )
+    response.raise_for_status()
+
+
+async def scenario_pr_list(client: httpx.AsyncClient, ctx: Context) -> None:
+    response = await client.get(f"{ctx.api}/procurement/pr/", headers=ctx.headers, params={"limit": 50})
+    response.raise_for_status()
+
+
+SCENARIOS: dict[str, Callable[[httpx.AsyncClient, Context], Awaitable[None]]] = {
+    "login": scenario_login,
+    "users_me": scenario_users_me,
+    "user_crud": scenario_user_crud,
+    "pr_create": scenario_pr_create,
+    "pr_list": scenario_pr_list,
+}
+
+
+# ------------------------------------------------------------------
+# 2. Drivers
+# ------------------------------------------------------------------
+async def measure(op, client, ctx, requests: int, concurrency: int) -> dict:
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                await op(client, ctx)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            samples.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    result = summarize(samples, elapsed) if samples else {"ops": 0}
+    result["errors"] = errors
+    return result
+
+
+async def measure_allocations(op, client, ctx, samples: int) -> int:
+    """Mean peak bytes allocated (Python heap, this process) per operation."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            await op(client, ctx)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return round(sum(peaks) / len(peaks))
+
+
+def prepare_in_process(bcrypt_rounds: int):
+    """Import the app configured for SQLite + fakeredis; returns (app, api prefix)."""
+    workdir = tempfile.mkdtemp(prefix="erp-bench-")
+    os.environ.setdefault("DATABASE_URL_OVERRIDE", f"sqlite+aiosqlite:///{workdir}/bench.db")
+    os.environ.setdefault("STARTUP_SCHEMA_MODE", "recreate")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    os.environ.setdefault("BCRYPT_ROUNDS", str(bcrypt_rounds))
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    from fakeredis import FakeServer
+    from fakeredis.aioredis import FakeRedis
+
+    import app.core.redis as core_redis
+    import app.main as main
+
+    server = FakeServer()
+
+    async def init_fake_redis():
+        core_redis.redis_client = FakeRedis(server=server, decode_responses=True)
+
+    main.init_redis = init_fake_redis
+    return main.app, main.settings.API_V1_STR
+
+
+async def run(args: argparse.Namespace) -> dict:
+    scenarios = args.scenarios or list(SCENARIOS)
+    app = None
+    if args.base_url:
+        transport, base_url, api = None, args.base_url, args.api_prefix
+    else:
+        app, api = prepare_in_process(args.bcrypt_rounds)
+        await app.router.startup()
+        transport, base_url = httpx.ASGITransport(app=app), "http://bench"
+
+    results = {}
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=120) as client:
+            response = await client.post(
+                f"{api}/auth/login", data={"username": ADMIN[0], "password": ADMIN[1]}
+            )
+            response.raise_for_status()
+            token = response.json()["access_token"]
+            ctx = Context(api, {"Authorization": f"Bearer {token}"})
+
+            for name in scenarios:
+                op = SCENARIOS[name]
+                for _ in range(args.warmup):
+                    await op(client, ctx)
+                results[name] = await measure(op, client, ctx, args.requests, args.concurrency)
+                if app is not None and args.alloc_samples:
+                    results[name]["alloc_peak_bytes_per_op"] = await measure_allocations(
+                        op, client, ctx, args.alloc_samples
+                    )
+                print(f"{name:>10}: {json.dumps(results[name])}", file=sys.stderr)
+    finally:
+        if app is not None:
+            await app.router.shutdown()
+
+    return {
+        "meta": {
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "git_commit": _git_commit(),
+            "target": args.base_url or "in-process (sqlite + fakeredis)",
+            "python": platform.python_version(),
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "bcrypt_rounds": None if args.base_url else args.bcrypt_rounds,
+        },
+        "scenarios": results,
+    }
+
+
+# ------------------------------------------------------------------
+# 3. Storage and diff
+# ------------------------------------------------------------------
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, baseline: dict) -> str:
+    metrics = ["throughput_ops", "p50_ms", "p95_ms", "p99_ms", "alloc_peak_bytes_per_op"]
+    lines = [f"{'scenario':<12}{'metric':<26}{'baseline':>12}{'current':>12}{'change':>10}"]
+    for name, result in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        for metric in metrics:
+            if metric not in result or metric not in before or not before[metric]:
+                continue
+            change = (result[metric] - before[metric]) / before[metric] * 100
+            lines.append(
+                f"{name:<12}{metric:<26}{before[metric]:>12}{result[metric]:>12}{change:>+9.1f}%"
+            )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", help="Benchmark a running server instead of in-process")
+    parser.add_argument("--api-prefix", default="/api/v1")
+    parser.add_argument("--scenarios", nargs="*", choices=list(SCENARIOS))
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--alloc-samples", type=int, default=50)
+    parser.add_argument("--bcrypt-rounds", type=int, default=12)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / f"{datetime.datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}", file=sys.stderr)
+
+    if args.baseline:
+        print(compare(report, json.loads(args.baseline.read_text())))
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/tax_return.py
+"""
+Tax return generation over a synthetic quarter of invoice tax lines:
+wall time and peak Python memory (tracemalloc, measured on a second
+pass) at growing line counts. Flat peak memory across sizes is the point.
+
+    python benchmarks/tax_return.py --lines 100000 1000000
+    python benchmarks/tax_return.py --database-url postgresql+psycopg://... --lines 10000000
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+TAX_CODES = [("GST5", 5), ("GST12", 12), ("GST18", 18), ("GST28", 28), ("IGST18", 18)]
+LINES_PER_INVOICE = 4
+
+
+async def seed(lines: int, offset: int, rng: random.Random) -> None:
+    from sqlalchemy import insert
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.finance.open_items import OpenItem, OpenItemStatus, Subledger
+    from app.models.finance.tax import InvoiceTaxLine
+
+    invoices = lines // LINES_PER_INVOICE
+    async with AsyncSessionLocal() as db:
+        for start in range(offset, offset + invoices, 5_000):
+            items, tax_lines = [], []
+            for n in range(start, min(start + 5_000, offset + invoices)):
+                issued = datetime.date(2026, 4, 1) + datetime.timedelta(days=rng.randint(0, 90))
+                items.append({
+                    "id": n + 1, "ledger": Subledger.ar if n % 3 else Subledger.ap,
+                    "party_code": f"P{n % 5000}", "document_number": f"INV-{n}",
+                    "issue_date": issued, "due_date": issued, "amount": 1, "balance": 1,
+                    "status": OpenItemStatus.open,
+                })
+                for _ in range(LINES_PER_INVOICE):
+                    tax_code, rate = rng.choice(TAX_CODES)
+                    taxable = rng.randint(100, 1_000_000) / 100
+                    tax_lines.append({
+                        "open_item_id": n + 1, "tax_code": tax_code, "rate": rate,
+                        "place_of_supply": f"{rng.randint(1, 37):02d}",
+                        "taxable_amount": taxable, "tax_amount": round(taxable * rate / 100, 2),
+                    })
+            await db.execute(insert(OpenItem), items)
+            await db.execute(insert(InvoiceTaxLine), tax_lines)
+        await db.commit()
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from app.db.session import ReadSessionLocal, dispose_engines, engine
+    from app.models import Base
+    from app.models.finance.tax import ReturnFormat
+    from app.services.finance.tax_returns import write_return
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def generate(fmt: ReturnFormat, path: Path) -> dict:
+        with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+            async with ReadSessionLocal() as db:
+                return await write_return(db, datetime.date(2026, 4, 1), datetime.date(2026, 6, 30), fmt, out)
+
+    rng = random.Random(args.seed)
+    out_dir = Path(tempfile.mkdtemp())
+    runs, seeded = [], 0
+    for lines in sorted(args.lines):
+        await seed(lines - seeded, seeded // LINES_PER_INVOICE, rng)
+        seeded = lines
+        for fmt in ReturnFormat:
+            path = out_dir / f"return-{lines}.{fmt.value}"
+            started = time.perf_counter()
+            counters = await generate(fmt, path)
+            seconds = time.perf_counter() - started
+            # Separate pass: tracemalloc slows the loop several times over
+            tracemalloc.start()
+            await generate(fmt, Path(os.devnull))
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            runs.append({
+                "lines": counters["lines"],
+                "format": fmt.value,
+                "seconds": round(seconds, 2),
+                "lines_per_s": int(counters["lines"] / seconds),
+                "peak_python_mb": round(peak / 2**20, 1),
+                "file_mb": round(path.stat().st_size / 2**20, 1),
+                "output_tax": str(counters["output_tax"]),
+            })
+
+    await dispose_engines()
+    return {"runs": runs}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Streaming tax return benchmark")
+    parser.add_argument("--lines", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--seed", type=int, default=17)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+
+    database_url = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/tax.db"
+    os.environ["DATABASE_URL_OVERRIDE"] = database_url
+    if args.batch_size:
+        os.environ["TAX_RETURN_BATCH_SIZE"] = str(args.batch_size)
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/users_me_latency.py
+"""
+p50/p95/p99 latency of GET /users/me against a running API.
+
+Run it twice to compare the principal cache tiers, e.g.
+
+    # before: in-process tier disabled, every request hits Redis
+    PRINCIPAL_CACHE_TTL_SECONDS=0 uvicorn app.main:app --port 8000
+    python benchmarks/users_me_latency.py --label redis-only
+
+    # after: default settings
+    uvicorn app.main:app --port 8000
+    python benchmarks/users_me_latency.py --label two-tier
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from common import login, percentile
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+        token = await login(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        for _ in range(args.warmup):
+            await client.get("/users/me", headers=headers)
+
+        samples: list[float] = []
+        remaining = args.requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                response = await client.get("/users/me", headers=headers)
+                samples.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "label": args.label,
+        "requests": len(samples),
+        "concurrency": args.concurrency,
+        "throughput_rps": round(len(samples) / elapsed, 1),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000/api/v1")
+    parser.add_argument("--email", default="admin@nextgen.com")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--label", default="run")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()